@@ -0,0 +1,84 @@
+"""
+Benchmark of the compact callback data codec against JSON, with a round trip check.
+Run from the project root with: python -m benchmarks.callback_data_benchmark
+"""
+
+import json
+import timeit
+
+from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
+from src.utils.callback_data_utils import decode_callback_data, encode_callback_data
+
+# Typical keyboard info, as built by Keyboard.create_callback_data
+PAYLOADS: dict[str, dict] = {
+    "screen": {ReservedKeyboardKeys.SCREEN: 12},
+    "item": {
+        ReservedKeyboardKeys.SCREEN: 34,
+        ReservedKeyboardKeys.PREVIOUS_SCREEN: [1, 5, 33],
+        ReservedKeyboardKeys.DEFAULT_PRIMARY_KEY: 123456,
+        ReservedKeyboardKeys.AUTHORIZED_USERS: [1234, 56789],
+    },
+    "list page": {
+        ReservedKeyboardKeys.SCREEN: 41,
+        ReservedKeyboardKeys.PREVIOUS_SCREEN: [1, 40],
+        ReservedKeyboardKeys.PAGE: 3,
+        ReservedKeyboardKeys.CURSOR: "2024-05-01 10:00:00|987654",
+        ReservedKeyboardKeys.FILTER: 2,
+        "custom": True,
+    },
+}
+
+# Edge cases that must survive the round trip too
+ROUND_TRIP_PAYLOADS: list[dict] = list(PAYLOADS.values()) + [
+    {},
+    {"a": None, "b": False, "c": True, "d": 0, "e": 247, "f": 248},
+    {"neg": -1, "min": -(2**63), "max": 2**63 - 1, "float": -1.5},
+    {"text": "", "unicode": "Ruffy 🏴‍☠️ è", "nested": {"list": [[], [1, {"x": None}]]}},
+    {"unknown key longer than the known ones": [ReservedKeyboardKeys.SCREEN, "sc"]},
+]
+
+NUMBER = 100_000
+
+
+def check_round_trip() -> None:
+    """
+    Check that every payload is decoded as it was encoded, and that JSON data sent before the
+    compact format is still decoded
+    :return: None
+    """
+
+    for payload in ROUND_TRIP_PAYLOADS:
+        decoded = decode_callback_data(encode_callback_data(payload))
+        assert decoded == payload, f"Round trip failed: {payload} != {decoded}"
+
+        legacy = json.dumps(payload, separators=(",", ":"))
+        assert decode_callback_data(legacy) == json.loads(legacy), f"JSON failed: {legacy}"
+
+
+def run_benchmark() -> None:
+    """
+    Print the size and the encode and decode time of each payload, compact and JSON
+    :return: None
+    """
+
+    print(f"{'payload':<12}{'format':<10}{'size':>6}{'encode µs':>12}{'decode µs':>12}")
+    for name, payload in PAYLOADS.items():
+        compact = encode_callback_data(payload)
+        legacy = json.dumps(payload, separators=(",", ":"))
+
+        for format_name, data, encode, decode in (
+            ("compact", compact, encode_callback_data, decode_callback_data),
+            ("json", legacy, lambda p: json.dumps(p, separators=(",", ":")), json.loads),
+        ):
+            encode_time = timeit.timeit(lambda: encode(payload), number=NUMBER)
+            decode_time = timeit.timeit(lambda: decode(data), number=NUMBER)
+            print(
+                f"{name:<12}{format_name:<10}{len(data):>6}"
+                f"{encode_time / NUMBER * 1e6:>12.2f}{decode_time / NUMBER * 1e6:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    check_round_trip()
+    print("Round trip OK")
+    run_benchmark()
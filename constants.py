@@ -10,6 +10,7 @@ TG_DEFAULT_PARSE_MODE = TG_PARSE_MODE_MARKDOWN
 TG_DEFAULT_IMAGE_COMPRESSION_QUALITY = 80
 TG_PROFILE_PHOTO_EXTENSION = "jpg"
 TG_KEYBOARD_DATA_MAX_LEN = 64
+TG_DELETE_MESSAGES_MAX_COUNT = 100  # Max messages deleted in a single request
 
 TEMP_DIR = os.path.join(ROOT_DIR, "temp")
 ASSETS_DIR = os.path.join(ROOT_DIR, "assets")
@@ -17,6 +18,7 @@ ASSETS_IMAGES_DIR = os.path.join(ASSETS_DIR, "images")
 ASSETS_SAVED_MEDIA_DIR = os.path.join(ASSETS_IMAGES_DIR, "saved_media")
 ASSETS_FONTS_DIR = os.path.join(ASSETS_DIR, "fonts")
 ASSETS_ITEMS_DIR = os.path.join(ASSETS_DIR, "items")
+CONTEXT_PERSISTENCE_FILE = os.path.join(ROOT_DIR, "context_data.sqlite3")
 
 # Command
 STANDARD_SPLIT_CHAR = "|"
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import sys
@@ -8,23 +9,50 @@ from telegram import Update
 from telegram.ext import (
     Application,
     CommandHandler,
+    ChatMemberHandler,
     MessageHandler,
     filters,
     Defaults,
     CallbackQueryHandler,
+    CallbackContext,
     ContextTypes,
-    AIORateLimiter,
     InlineQueryHandler,
 )
 
 import constants as c
 import resources.Environment as Env
+from resources.ContextPersistence import ContextPersistence
 from src.chat.manage_message import (
     manage_regular as manage_regular_message,
     manage_callback as manage_callback_message,
 )
+from src.model.BaseModel import db_obj
+from src.model.wiki.SupabaseRest import preload_wiki_data
+from src.service.activity_service import flush_activity
+from src.service.bounty_service import resume_reset_bounty
+from src.service.chat_member_service import update_chat_member_cache
+from src.service.game_scheduler_service import start_game_scheduler, stop_game_scheduler
+from src.service.group_service import load_feature_index
+from src.service.image_render_service import start_render_pool, stop_render_pool
 from src.service.message_service import full_message_send
+from src.service.notification_service import start_notification_outbox, stop_notification_outbox
+from src.service.metrics_service import (
+    MetricsRateLimiter,
+    start_metrics_server,
+    stop_metrics_server,
+)
 from src.service.timer_service import set_timers
+from src.service.user_stats_service import init_user_stats
+
+
+class BotApplication(Application):
+    """
+    Application whose tasks check out a database connection, waiting for one to be free, instead
+    of connecting lazily and failing if the pool is exhausted
+    """
+
+    def create_task(self, coroutine, update: object = None, *, name: str = None) -> asyncio.Task:
+        return super().create_task(db_obj.run_with_connection(coroutine), update, name=name)
 
 
 async def chat_id(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -54,9 +82,47 @@ async def post_init(application: Application) -> None:
     :param application: the application
     :return: None
     """
+    load_feature_index()
+    preload_wiki_data()
+    start_render_pool()
+
+    # Build the user stats from the history, if not built yet. Awaited since updates must not be
+    # handled before, but run in the executor so the rebuild doesn't block the event loop
+    async with db_obj.connection():
+        await db_obj.run_in_executor(init_user_stats)
+
+    if Env.METRICS_SERVER_ENABLED.get_bool():
+        await start_metrics_server(
+            application, Env.METRICS_SERVER_HOST.get(), Env.METRICS_SERVER_PORT.get_int()
+        )
+
     await application.job_queue.start()
     await set_timers(application)
 
+    # Complete the bounty reset interrupted by a restart, if any
+    application.create_task(resume_reset_bounty(CallbackContext(application)))
+
+    # Run game hints, countdowns, timeouts and auto moves, including the ones due during a restart
+    start_game_scheduler(application)
+
+    # Send the notifications, including the ones not sent before a restart
+    start_notification_outbox(application)
+
+
+async def post_shutdown(application: Application) -> None:
+    """
+    Post shutdown
+    :param application: the application
+    :return: None
+    """
+    # Write the activity tracked since the last flush
+    flush_activity()
+
+    await stop_metrics_server()
+    stop_render_pool()
+    stop_game_scheduler()
+    stop_notification_outbox()
+
 
 def main() -> None:
     """
@@ -109,18 +175,36 @@ def main() -> None:
 
     defaults = Defaults(parse_mode=c.TG_DEFAULT_PARSE_MODE, tzinfo=ZoneInfo(Env.TZ.get()))
 
-    application = (
+    application_builder = (
         Application.builder()
+        .application_class(BotApplication)
         .token(Env.BOT_TOKEN.get())
         .post_init(post_init)
+        .post_shutdown(post_shutdown)
         .defaults(defaults)
-        .rate_limiter(AIORateLimiter())
-        .build()
+        # Also records the Telegram API requests metrics
+        .rate_limiter(MetricsRateLimiter())
     )
 
+    # Keep context data across restarts
+    if Env.ENABLE_CONTEXT_PERSISTENCE.get_bool():
+        application_builder.persistence(
+            ContextPersistence(
+                c.CONTEXT_PERSISTENCE_FILE,
+                update_interval=Env.CONTEXT_PERSISTENCE_UPDATE_INTERVAL_SECONDS.get_int(),
+            )
+        )
+
+    application = application_builder.build()
+
     # Chat id handler
     application.add_handler(CommandHandler("chatid", chat_id))
 
+    # Chat member handler, keeps the chat member cache up to date
+    application.add_handler(
+        ChatMemberHandler(update_chat_member_cache, ChatMemberHandler.ANY_CHAT_MEMBER)
+    )
+
     # Regular message handler
     application.add_handler(MessageHandler(filters.ALL, manage_regular_message))
 
@@ -133,7 +217,15 @@ def main() -> None:
     # Activate timers
     logging.getLogger("apscheduler.executors.default").propagate = False
 
-    application.run_polling(drop_pending_updates=Env.BOT_DROP_PENDING_UPDATES.get_bool())
+    # Chat member updates are sent only if requested, reactions are still not needed
+    application.run_polling(
+        drop_pending_updates=Env.BOT_DROP_PENDING_UPDATES.get_bool(),
+        allowed_updates=[
+            update_type
+            for update_type in Update.ALL_TYPES
+            if update_type not in (Update.MESSAGE_REACTION, Update.MESSAGE_REACTION_COUNT)
+        ],
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,266 @@
+import io
+import logging
+import pickle
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from telegram import Bot, TelegramObject
+from telegram.ext import BasePersistence, PersistenceInput
+
+from src.utils.context_utils import (
+    get_context_data_last_updated,
+    get_context_data_max_ttl_seconds,
+    remove_expired_context_data,
+)
+
+BOT_DATA_OWNER_ID = 0
+# Saved instead of the bot, which can't be pickled
+BOT_PERSISTENT_ID = "bot"
+
+
+def load_telegram_object(cls: type[TelegramObject], state: dict, bot: Bot) -> TelegramObject:
+    """
+    Recreate a pickled telegram object, with the current bot
+    :param cls: The class of the object
+    :param state: The state of the object
+    :param bot: The bot
+    :return: The object
+    """
+
+    telegram_object = cls.__new__(cls)
+    telegram_object.__setstate__(state)
+    telegram_object.set_bot(bot)
+    return telegram_object
+
+
+class ContextPickler(pickle.Pickler):
+    """
+    Pickles the context data, saving a reference to the bot instead of the bot itself, also for
+    the telegram objects that have it set
+    """
+
+    def __init__(self, bot: Bot, file: io.BytesIO):
+        super().__init__(file)
+        self.bot = bot
+
+    def persistent_id(self, obj: object) -> str | None:
+        return BOT_PERSISTENT_ID if isinstance(obj, Bot) else None
+
+    def reducer_override(self, obj: object):
+        if not isinstance(obj, TelegramObject):
+            return NotImplemented
+
+        # The state doesn't include the bot, so it's passed to be set again when loading
+        return load_telegram_object, (obj.__class__, obj.__getstate__(), self.bot)
+
+
+class ContextUnpickler(pickle.Unpickler):
+    """
+    Unpickles the context data pickled by ContextPickler, with the current bot
+    """
+
+    def __init__(self, bot: Bot, file: io.BytesIO):
+        super().__init__(file)
+        self.bot = bot
+
+    def persistent_load(self, pid: str) -> Bot:
+        if pid != BOT_PERSISTENT_ID:
+            raise pickle.UnpicklingError(f"Unknown persistent id: {pid}")
+
+        return self.bot
+
+
+class ContextPersistence(BasePersistence[dict, dict, dict]):
+    """
+    Persists the bot and user context data in a local SQLite database, so that long keyboards,
+    inline queries and other context data survive a restart.
+    User data is loaded lazily, the first time an update of the user is processed, and expired
+    entries are never loaded
+    """
+
+    def __init__(self, filepath: str, update_interval: float = 60):
+        super().__init__(
+            store_data=PersistenceInput(
+                bot_data=True, chat_data=False, user_data=True, callback_data=False
+            ),
+            update_interval=update_interval,
+        )
+
+        self.connection = sqlite3.connect(filepath, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS context_data ("
+            " owner_type TEXT NOT NULL,"
+            " owner_id INTEGER NOT NULL,"
+            " data BLOB NOT NULL,"
+            " last_updated REAL NOT NULL,"
+            " PRIMARY KEY (owner_type, owner_id))"
+        )
+        self.connection.commit()
+        self.lock = threading.Lock()
+
+        # Users whose stored data has been merged in the in-memory user data
+        self.loaded_user_ids: set[int] = set()
+
+    def load(self, owner_type: str, owner_id: int) -> dict:
+        """
+        Load the stored context data of an owner, without the expired entries
+        :param owner_type: The owner type, "bot" or "user"
+        :param owner_id: The owner id
+        :return: The context data, empty if not stored
+        """
+
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT data FROM context_data WHERE owner_type = ? AND owner_id = ?",
+                (owner_type, owner_id),
+            ).fetchone()
+
+        if row is None:
+            return {}
+
+        try:
+            data: dict = ContextUnpickler(self.bot, io.BytesIO(row[0])).load()
+        except Exception as e:
+            logging.error(f"Failed to load {owner_type} {owner_id} context data: {e}")
+            return {}
+
+        remove_expired_context_data(data)
+        return data
+
+    def save(self, owner_type: str, owner_id: int, data: dict) -> None:
+        """
+        Save the context data of an owner, deleting it if empty
+        :param owner_type: The owner type, "bot" or "user"
+        :param owner_id: The owner id
+        :param data: The context data
+        :return: None
+        """
+
+        if len(data) == 0:
+            self.delete(owner_type, owner_id)
+            return
+
+        try:
+            buffer = io.BytesIO()
+            ContextPickler(self.bot, buffer).dump(data)
+        except Exception as e:
+            logging.error(f"Failed to save {owner_type} {owner_id} context data: {e}")
+            return
+
+        with self.lock:
+            self.connection.execute(
+                "REPLACE INTO context_data (owner_type, owner_id, data, last_updated)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    owner_type,
+                    owner_id,
+                    buffer.getvalue(),
+                    get_context_data_last_updated(data).timestamp(),
+                ),
+            )
+            self.connection.commit()
+
+    def delete(self, owner_type: str, owner_id: int) -> None:
+        """
+        Delete the stored context data of an owner
+        :param owner_type: The owner type, "bot" or "user"
+        :param owner_id: The owner id
+        :return: None
+        """
+
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM context_data WHERE owner_type = ? AND owner_id = ?",
+                (owner_type, owner_id),
+            )
+            self.connection.commit()
+
+    def delete_expired(self) -> None:
+        """
+        Delete the stored context data of the owners whose entries are all expired
+        :return: None
+        """
+
+        expire_date = datetime.now() - timedelta(seconds=get_context_data_max_ttl_seconds())
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM context_data WHERE last_updated < ?", (expire_date.timestamp(),)
+            )
+            self.connection.commit()
+
+    def unload_user_data(self, user_id: int, user_data: dict) -> None:
+        """
+        Save the context data of a user and remove it from memory, it will be loaded again on the
+        next update of the user
+        :param user_id: The user id
+        :param user_data: The in-memory user data
+        :return: None
+        """
+
+        self.save("user", user_id, user_data)
+        user_data.clear()
+        self.loaded_user_ids.discard(user_id)
+
+    async def get_bot_data(self) -> dict:
+        return self.load("bot", BOT_DATA_OWNER_ID)
+
+    async def get_user_data(self) -> dict[int, dict]:
+        # Loaded lazily in refresh_user_data
+        return {}
+
+    async def get_chat_data(self) -> dict[int, dict]:
+        return {}
+
+    async def get_callback_data(self) -> None:
+        return None
+
+    async def get_conversations(self, name: str) -> dict:
+        return {}
+
+    async def update_bot_data(self, data: dict) -> None:
+        self.save("bot", BOT_DATA_OWNER_ID, data)
+
+    async def update_user_data(self, user_id: int, data: dict) -> None:
+        if user_id not in self.loaded_user_ids:
+            # Set before the stored data was loaded, don't overwrite it
+            data = self.load("user", user_id) | data
+
+        self.save("user", user_id, data)
+
+    async def update_chat_data(self, chat_id: int, data: dict) -> None:
+        pass
+
+    async def update_callback_data(self, data) -> None:
+        pass
+
+    async def update_conversation(self, name: str, key: tuple, new_state: object) -> None:
+        pass
+
+    async def drop_user_data(self, user_id: int) -> None:
+        self.delete("user", user_id)
+        self.loaded_user_ids.discard(user_id)
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        pass
+
+    async def refresh_user_data(self, user_id: int, user_data: dict) -> None:
+        if user_id in self.loaded_user_ids:
+            return
+
+        for key, value in self.load("user", user_id).items():
+            user_data.setdefault(key, value)
+
+        self.loaded_user_ids.add(user_id)
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: dict) -> None:
+        pass
+
+    async def refresh_bot_data(self, bot_data: dict) -> None:
+        pass
+
+    async def flush(self) -> None:
+        with self.lock:
+            self.connection.close()
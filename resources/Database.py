@@ -1,35 +1,234 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import time
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
 
-from peewee import *
+from peewee import _ConnectionState
+from playhouse.pool import PooledMySQLDatabase, MaxConnectionsExceeded
 from playhouse.shortcuts import ReconnectMixin
 
 import resources.Environment as Env
 
+T = TypeVar("T")
 
-class ReconnectMySQLDatabase(ReconnectMixin, MySQLDatabase, ABC):
-    pass
+
+class TaskConnectionState(_ConnectionState):
+    """
+    Connection state owned by a single asyncio task (or by a thread when no loop is running)
+    """
+
+    def __init__(self, task: asyncio.Task | None):
+        self.task = task
+        # If the task holds a checkout from Database.connection
+        self.checked_out = False
+        super().__init__()
+
+
+_connection_state: ContextVar[TaskConnectionState | None] = ContextVar(
+    "db_connection_state", default=None
+)
+
+
+class TaskLocalConnectionState:
+    """
+    Peewee connection state proxy that resolves to the state of the current asyncio task.
+    Peewee keeps its state per thread, but all updates run as tasks on the same thread, so
+    without this they would share (and close) the same connection
+    """
+
+    def __init__(self, db: "ReconnectPooledMySQLDatabase"):
+        object.__setattr__(self, "_db", db)
+
+    def get_state(self) -> TaskConnectionState:
+        """
+        Get the connection state of the current task, creating it if necessary
+        :return: The connection state
+        """
+
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:  # No running loop, executor thread or startup
+            task = None
+
+        state = _connection_state.get()
+        # Tasks inherit the context of the task that created them, so the state may belong to
+        # the parent task
+        if state is None or (task is not None and state.task is not task):
+            state = TaskConnectionState(task)
+            _connection_state.set(state)
+            if task is not None:
+                task.add_done_callback(lambda _: self._db.release_state(state))
+
+        return state
+
+    def __getattr__(self, name):
+        return getattr(self.get_state(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.get_state(), name, value)
+
+
+class ReconnectPooledMySQLDatabase(ReconnectMixin, PooledMySQLDatabase, ABC):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._state = TaskLocalConnectionState(self)
+
+        self.checkouts_count = 0
+        self.exhausted_count = 0
+        self.leaked_count = 0
+
+        # Called after each query with the query and its duration in seconds
+        self.query_hooks: list[Callable[[str, float], None]] = []
+
+    def execute_sql(self, sql, params=None, commit=None):
+        start = time.perf_counter()
+        try:
+            return super().execute_sql(sql, params, commit)
+        finally:
+            duration = time.perf_counter() - start
+            for hook in self.query_hooks:
+                hook(sql, duration)
+
+    def _connect(self):
+        try:
+            conn = super()._connect()
+        except MaxConnectionsExceeded:
+            self.exhausted_count += 1
+            logging.warning(f"Database pool exhausted: {self.get_metrics()}")
+            raise
+
+        self.checkouts_count += 1
+        return conn
+
+    def release_state(self, state: TaskConnectionState) -> None:
+        """
+        Return the connection of a finished task to the pool, in case it was opened lazily and
+        never closed
+        :param state: The connection state of the finished task
+        :return: None
+        """
+
+        if state.closed:
+            return
+
+        self.leaked_count += 1
+        try:
+            self._close(state.conn)
+        finally:
+            state.reset()
+
+    def get_metrics(self) -> dict[str, int]:
+        """
+        Get the pool metrics
+        :return: The pool metrics
+        """
+
+        return {
+            "max_connections": self._max_connections,
+            "in_use": len(self._in_use),
+            "idle": len(self._connections),
+            "checkouts": self.checkouts_count,
+            "exhausted": self.exhausted_count,
+            "released_by_task_end": self.leaked_count,
+        }
 
 
 class Database:
     def __init__(self):
-        self.db = ReconnectMySQLDatabase(
+        max_connections = Env.DB_POOL_MAX_CONNECTIONS.get_int()
+        self.db = ReconnectPooledMySQLDatabase(
             Env.DB_NAME.get(),
             host=Env.DB_HOST.get(),
             port=Env.DB_PORT.get_int(),
             user=Env.DB_USER.get(),
             password=Env.DB_PASSWORD.get(),
             charset="utf8mb4",
+            # Room for background tasks that connect lazily outside a checkout
+            max_connections=max_connections + Env.DB_POOL_MAX_OVERFLOW.get_int(),
+            stale_timeout=Env.DB_POOL_STALE_TIMEOUT_SECONDS.get_int(),
         )
 
-    def get_db(self):
+        # Bounds concurrent checkouts without blocking the event loop while waiting
+        self.checkout_semaphore = asyncio.Semaphore(max_connections)
+
+        # Blocking queries are run here, so a slow query doesn't stall the event loop
+        self.executor = ThreadPoolExecutor(
+            max_workers=Env.DB_EXECUTOR_MAX_WORKERS.get_int(), thread_name_prefix="db"
+        )
+
+    def get_db(self) -> ReconnectPooledMySQLDatabase:
         if self.db.is_connection_usable():
             return self.db
 
         self.db.connect()
         return self.db
 
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[ReconnectPooledMySQLDatabase]:
+        """
+        Check out a pooled connection for the current task, returning it to the pool on exit.
+        Waits if all the connections are checked out, and can be nested in the same task
+        :return: The database
+        """
+
+        state: TaskConnectionState = self.db._state.get_state()
+        if state.checked_out:
+            yield self.db
+            return
+
+        async with self.checkout_semaphore:
+            state.checked_out = True
+            opened = self.db.connect(reuse_if_open=True)
+            try:
+                yield self.db
+            finally:
+                state.checked_out = False
+                if opened and not self.db.is_closed():
+                    self.db.close()
+
+    async def run_with_connection(self, coroutine: Awaitable[T]) -> T:
+        """
+        Run a coroutine with a connection checked out, for tasks that would otherwise connect
+        without waiting for a free connection
+        :param coroutine: The coroutine
+        :return: The result of the coroutine
+        """
+
+        async with self.connection():
+            return await coroutine
+
+    async def run_in_executor(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a blocking database call in the database executor, using the connection of the
+        current task
+        :param func: The function to run
+        :param args: The positional arguments
+        :param kwargs: The keyword arguments
+        :return: The result of the function
+        """
+
+        # Bind the connection state to the current task before copying the context, else the
+        # executor thread would open a connection that no task owns
+        self.db._state.get_state()
+        context = contextvars.copy_context()
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, functools.partial(context.run, func, *args, **kwargs)
+        )
+
+    def get_pool_metrics(self) -> dict[str, int]:
+        """
+        Get the connection pool metrics
+        :return: The pool metrics
+        """
+
+        return self.db.get_metrics()
+
     def close(self):
         self.db.close()
-
-    def __del__(self):
-        self.close()
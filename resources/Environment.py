@@ -129,6 +129,14 @@ DB_USER = Environment("DB_USER")
 DB_PASSWORD = Environment("DB_PASSWORD")
 # Log queries
 DB_LOG_QUERIES = Environment("DB_LOG_QUERIES", default_value="False")
+# Maximum connections checked out at the same time by updates and timers. Default: 20
+DB_POOL_MAX_CONNECTIONS = Environment("DB_POOL_MAX_CONNECTIONS", default_value="20")
+# Extra connections for background tasks that connect outside a checkout. Default: 10
+DB_POOL_MAX_OVERFLOW = Environment("DB_POOL_MAX_OVERFLOW", default_value="10")
+# How many blocking queries can run at the same time outside the event loop. Default: 10
+DB_EXECUTOR_MAX_WORKERS = Environment("DB_EXECUTOR_MAX_WORKERS", default_value="10")
+# After how many seconds should an idle pooled connection be recycled. Default: 300
+DB_POOL_STALE_TIMEOUT_SECONDS = Environment("DB_POOL_STALE_TIMEOUT_SECONDS", default_value="300")
 
 # TELEGRAM CHAT
 # Limit interaction to authorized users
@@ -150,6 +158,42 @@ UPDATES_CHAT_ID = Environment("UPDATES_CHAT_ID")
 # Support group id
 SUPPORT_GROUP_LINK = Environment("SUPPORT_GROUP_LINK", default_value="https://t.me/bountysystem")
 
+# CONTEXT DATA
+# Save the bot and user context data on disk, so it survives restarts. Default: True
+ENABLE_CONTEXT_PERSISTENCE = Environment("ENABLE_CONTEXT_PERSISTENCE", default_value="True")
+# How often the changed context data is written to disk. Default: 60 seconds
+CONTEXT_PERSISTENCE_UPDATE_INTERVAL_SECONDS = Environment(
+    "CONTEXT_PERSISTENCE_UPDATE_INTERVAL_SECONDS", default_value="60"
+)
+# After how much time unchanged context data expires. Default: 1 day
+CONTEXT_DATA_TTL_SECONDS = Environment("CONTEXT_DATA_TTL_SECONDS", default_value="86400")
+# After how much time the data of long keyboards and inline queries expires. Default: 7 days
+CONTEXT_DATA_KEYBOARD_TTL_SECONDS = Environment(
+    "CONTEXT_DATA_KEYBOARD_TTL_SECONDS", default_value="604800"
+)
+# Maximum users whose context data is kept in memory, the least recent are unloaded. Default: 10000
+CONTEXT_DATA_MAX_USERS = Environment("CONTEXT_DATA_MAX_USERS", default_value="10000")
+
+# KEYBOARD STATE
+# After how much time the saved data of keyboards too long to be sent expires. Default: 7 days
+KEYBOARD_STATE_TTL_SECONDS = Environment("KEYBOARD_STATE_TTL_SECONDS", default_value="604800")
+# Maximum saved keyboard states, the ones expiring first are deleted. Default: 1000000
+KEYBOARD_STATE_MAX_COUNT = Environment("KEYBOARD_STATE_MAX_COUNT", default_value="1000000")
+# Maximum keyboard states kept in memory. Default: 10000
+KEYBOARD_STATE_CACHE_SIZE = Environment("KEYBOARD_STATE_CACHE_SIZE", default_value="10000")
+
+# BROADCAST
+# How many group chats a feature broadcast sends to at the same time. Default: 10
+BROADCAST_MAX_CONCURRENCY = Environment("BROADCAST_MAX_CONCURRENCY", default_value="10")
+# How many times a broadcast message is retried when Telegram flood control is hit. Default: 3
+BROADCAST_MAX_RETRIES = Environment("BROADCAST_MAX_RETRIES", default_value="3")
+
+# AUTO DELETE
+# How many delete requests auto delete sends at the same time. Default: 5
+AUTO_DELETE_MAX_CONCURRENCY = Environment("AUTO_DELETE_MAX_CONCURRENCY", default_value="5")
+# How many due messages are loaded at a time while auto deleting. Default: 5000
+AUTO_DELETE_FETCH_SIZE = Environment("AUTO_DELETE_FETCH_SIZE", default_value="5000")
+
 # TgRest Channel ID
 TG_REST_CHANNEL_ID = Environment("TG_REST_CHANNEL_ID", can_be_empty=True)
 
@@ -186,6 +230,12 @@ REDDIT_MEME_PIECE_SUBREDDIT = Environment("REDDIT_MEME_PIECE_SUBREDDIT", default
 SUPABASE_REST_URL = Environment("SUPABASE_REST_URL", can_be_empty=True)
 # Supabase API key
 SUPABASE_API_KEY = Environment("SUPABASE_API_KEY", can_be_empty=True)
+# How long the wiki data is used before being refreshed in the background. Default: 3600 (1 hour)
+SUPABASE_CACHE_TTL_SECONDS = Environment("SUPABASE_CACHE_TTL_SECONDS", default_value="3600")
+# Timeout of the requests to the Supabase rest api. Default: 10
+SUPABASE_REQUEST_TIMEOUT_SECONDS = Environment(
+    "SUPABASE_REQUEST_TIMEOUT_SECONDS", default_value="10"
+)
 
 # SENTRY
 # Enable Sentry
@@ -205,6 +255,70 @@ SENTRY_LOG_LEVEL = Environment("SENTRY_LOG_LEVEL", default_value="INFO")
 # Sentry log event level. Default: INFO
 SENTRY_LOG_EVENT_LEVEL = Environment("SENTRY_LOG_EVENT_LEVEL", default_value="INFO")
 
+# METRICS
+# Expose the metrics in the Prometheus text format on /metrics. Default: False
+METRICS_SERVER_ENABLED = Environment("METRICS_SERVER_ENABLED", default_value="False")
+# Host the metrics server listens on. Default: 127.0.0.1
+METRICS_SERVER_HOST = Environment("METRICS_SERVER_HOST", default_value="127.0.0.1")
+# Port the metrics server listens on. Default: 9090
+METRICS_SERVER_PORT = Environment("METRICS_SERVER_PORT", default_value="9090")
+
+# IMAGE RENDER
+# How many processes render game images outside the event loop. Default: 2
+IMAGE_RENDER_PROCESS_POOL_SIZE = Environment("IMAGE_RENDER_PROCESS_POOL_SIZE", default_value="2")
+# How many rendered game images are kept for reuse. Default: 500
+IMAGE_RENDER_CACHE_SIZE = Environment("IMAGE_RENDER_CACHE_SIZE", default_value="500")
+# How many users' last bounty poster is kept for reuse. Default: 1000
+BOUNTY_POSTER_CACHE_SIZE = Environment("BOUNTY_POSTER_CACHE_SIZE", default_value="1000")
+# Max disk space of kept bounty posters not yet uploaded, in MB. Default: 100
+BOUNTY_POSTER_CACHE_MAX_DISK_SIZE_MB = Environment(
+    "BOUNTY_POSTER_CACHE_MAX_DISK_SIZE_MB", default_value="100"
+)
+
+# CHAT MEMBER CACHE
+# How long a chat member is kept, in seconds. Default: 10 minutes
+CHAT_MEMBER_CACHE_TTL_SECONDS = Environment("CHAT_MEMBER_CACHE_TTL_SECONDS", default_value="600")
+# How many chat members are kept. Default: 100000
+CHAT_MEMBER_CACHE_SIZE = Environment("CHAT_MEMBER_CACHE_SIZE", default_value="100000")
+# How long the administrators of a chat are kept, in seconds. Default: 10 minutes
+CHAT_ADMINISTRATORS_CACHE_TTL_SECONDS = Environment(
+    "CHAT_ADMINISTRATORS_CACHE_TTL_SECONDS", default_value="600"
+)
+
+# NOTIFICATION OUTBOX
+# How many users are sent notifications at the same time. Default: 5
+NOTIFICATION_OUTBOX_SENDERS = Environment("NOTIFICATION_OUTBOX_SENDERS", default_value="5")
+# Max notifications sent per second, leaving room for the other messages. Default: 15
+NOTIFICATION_OUTBOX_MAX_PER_SECOND = Environment(
+    "NOTIFICATION_OUTBOX_MAX_PER_SECOND", default_value="15"
+)
+# How many notifications are loaded at once. Default: 500
+NOTIFICATION_OUTBOX_BATCH_SIZE = Environment("NOTIFICATION_OUTBOX_BATCH_SIZE", default_value="500")
+# How often to check for notifications to retry, in seconds. Default: 5
+NOTIFICATION_OUTBOX_POLL_SECONDS = Environment(
+    "NOTIFICATION_OUTBOX_POLL_SECONDS", default_value="5"
+)
+# How many times a notification is tried before giving up. Default: 5
+NOTIFICATION_OUTBOX_MAX_ATTEMPTS = Environment(
+    "NOTIFICATION_OUTBOX_MAX_ATTEMPTS", default_value="5"
+)
+# Seconds before the first retry of a failed notification, doubled at each retry. Default: 30
+NOTIFICATION_OUTBOX_RETRY_SECONDS = Environment(
+    "NOTIFICATION_OUTBOX_RETRY_SECONDS", default_value="30"
+)
+
+# LIST COUNT CACHE
+# How long the items count of a list is reused while browsing its pages, in seconds. Default: 5
+# minutes
+LIST_COUNT_CACHE_TTL_SECONDS = Environment("LIST_COUNT_CACHE_TTL_SECONDS", default_value="300")
+# How many lists' items count are kept. Default: 10000
+LIST_COUNT_CACHE_SIZE = Environment("LIST_COUNT_CACHE_SIZE", default_value="10000")
+
+# USER STATS
+# Compute the stats of all users again from the whole history at startup, they are always
+# computed if there are none yet. Default: False
+USER_STATS_REBUILD_ON_STARTUP = Environment("USER_STATS_REBUILD_ON_STARTUP", default_value="False")
+
 # TIMERS
 # Check for files to clean up. Default: 12 hours
 CRON_TEMP_DIR_CLEANUP = Environment("CRON_TEMP_DIR_CLEANUP", default_value="0 */12 * * *")
@@ -470,6 +584,48 @@ SHOULD_RUN_ON_STARTUP_MINUTE_TASKS = Environment(
     "SHOULD_RUN_ON_STARTUP_MINUTE_TASKS", default_value="False"
 )
 
+# Write the tracked user and group activity. Default: Every 10 seconds
+CRON_FLUSH_ACTIVITY = Environment("CRON_FLUSH_ACTIVITY", default_value="10")
+ENABLE_TIMER_FLUSH_ACTIVITY = Environment("ENABLE_TIMER_FLUSH_ACTIVITY", default_value="True")
+SHOULD_LOG_TIMER_FLUSH_ACTIVITY = Environment(
+    "SHOULD_LOG_TIMER_FLUSH_ACTIVITY", default_value="False"
+)
+SHOULD_RUN_ON_STARTUP_FLUSH_ACTIVITY = Environment(
+    "SHOULD_RUN_ON_STARTUP_FLUSH_ACTIVITY", default_value="False"
+)
+
+# Remove expired context data and unload inactive users from memory. Default: Every 10 minutes
+CRON_CLEAN_CONTEXT_DATA = Environment("CRON_CLEAN_CONTEXT_DATA", default_value="*/10 * * * *")
+ENABLE_TIMER_CLEAN_CONTEXT_DATA = Environment(
+    "ENABLE_TIMER_CLEAN_CONTEXT_DATA", default_value="True"
+)
+SHOULD_LOG_TIMER_CLEAN_CONTEXT_DATA = Environment(
+    "SHOULD_LOG_TIMER_CLEAN_CONTEXT_DATA", default_value="False"
+)
+SHOULD_RUN_ON_STARTUP_CLEAN_CONTEXT_DATA = Environment(
+    "SHOULD_RUN_ON_STARTUP_CLEAN_CONTEXT_DATA", default_value="False"
+)
+
+# Delete the expired keyboard states. Default: Every hour
+CRON_CLEAN_KEYBOARD_STATES = Environment("CRON_CLEAN_KEYBOARD_STATES", default_value="0 * * * *")
+ENABLE_TIMER_CLEAN_KEYBOARD_STATES = Environment(
+    "ENABLE_TIMER_CLEAN_KEYBOARD_STATES", default_value="True"
+)
+SHOULD_LOG_TIMER_CLEAN_KEYBOARD_STATES = Environment(
+    "SHOULD_LOG_TIMER_CLEAN_KEYBOARD_STATES", default_value="False"
+)
+SHOULD_RUN_ON_STARTUP_CLEAN_KEYBOARD_STATES = Environment(
+    "SHOULD_RUN_ON_STARTUP_CLEAN_KEYBOARD_STATES", default_value="False"
+)
+
+# Log a summary of the metrics. Default: Every hour
+CRON_LOG_METRICS = Environment("CRON_LOG_METRICS", default_value="0 * * * *")
+ENABLE_TIMER_LOG_METRICS = Environment("ENABLE_TIMER_LOG_METRICS", default_value="False")
+SHOULD_LOG_TIMER_LOG_METRICS = Environment("SHOULD_LOG_TIMER_LOG_METRICS", default_value="False")
+SHOULD_RUN_ON_STARTUP_LOG_METRICS = Environment(
+    "SHOULD_RUN_ON_STARTUP_LOG_METRICS", default_value="False"
+)
+
 # How much time should temp files be kept before they are deleted. Default: 6 hours
 TEMP_DIR_CLEANUP_TIME_SECONDS = Environment("TEMP_DIR_CLEANUP_TIME_SECONDS", default_value="21600")
 
@@ -593,6 +749,14 @@ GAME_INACTIVE_TIME_SINCE_START_MINUTES = Environment(
 # After how much time should a global game be considered inactive if an opponent has not yet accepted it in hours.
 # Default: 12 hours
 GAME_GLOBAL_INACTIVE_HOURS = Environment("GAME_GLOBAL_INACTIVE_HOURS", default_value="12")
+# Seconds before retrying a game event that failed to run, doubled at each retry. Default: 30
+GAME_SCHEDULED_EVENT_RETRY_SECONDS = Environment(
+    "GAME_SCHEDULED_EVENT_RETRY_SECONDS", default_value="30"
+)
+# Maximum seconds between the retries of a game event that failed to run. Default: 10 minutes
+GAME_SCHEDULED_EVENT_MAX_RETRY_SECONDS = Environment(
+    "GAME_SCHEDULED_EVENT_MAX_RETRY_SECONDS", default_value="600"
+)
 
 # One Piece Wiki URL
 ONE_PIECE_WIKI_URL = Environment(
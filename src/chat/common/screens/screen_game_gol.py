@@ -1,4 +1,3 @@
-import asyncio
 import json
 
 from telegram import Update
@@ -9,10 +8,12 @@ import resources.phrases as phrases
 from src.model.Game import Game
 from src.model.User import User
 from src.model.enums.Emoji import Emoji
+from src.model.enums.GameScheduledEventType import GameScheduledEventType
 from src.model.game.GameOutcome import GameOutcome
 from src.model.game.guessorlife.GuessOrLife import GuessOrLife, PlayerType, PlayerInfo
 from src.model.wiki.SupabaseRest import SupabaseRest
 from src.model.wiki.Terminology import Terminology
+from src.service.game_scheduler_service import schedule_game_event
 from src.service.game_service import (
     save_game,
     get_players,
@@ -293,13 +294,19 @@ async def run_game(
         # Set private screen for input
         context.application.create_task(set_user_private_screen(u, game))
 
-    if not schedule_next_send:
-        return
+    if schedule_next_send:
+        schedule_game_event(game, user, GameScheduledEventType.HINT, hint_wait_seconds)
+
 
-    await asyncio.sleep(hint_wait_seconds)
+async def run_scheduled_hint(context: ContextTypes.DEFAULT_TYPE, game: Game, user: User) -> None:
+    """
+    Issue the next life when its time is up, if the game is still ongoing
+    :param context: The context
+    :param game: The game
+    :param user: The user the life is for
+    :return: None
+    """
 
-    # Refresh game, resend only if it's still ongoing
-    game: Game = Game.get_by_id(game.id)
     if game.is_finished():
         return
 
@@ -313,7 +320,7 @@ async def run_game(
         return
 
     # Issue life
-    if not issue_life_if_possible(game, user):
+    if not await issue_life_if_possible(game, user):
         return
 
     await run_game(context, game, user)
@@ -421,7 +428,7 @@ async def validate_answer(
     )
 
 
-def issue_life_if_possible(game: Game, user: User) -> bool:
+async def issue_life_if_possible(game: Game, user: User) -> bool:
     """
     Issue a life if possible, saving the game
     :param game: The game
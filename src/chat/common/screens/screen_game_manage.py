@@ -1,4 +1,5 @@
 import logging
+from typing import Callable
 
 from telegram import Update
 from telegram.ext import ContextTypes
@@ -7,20 +8,28 @@ import resources.Environment as Env
 from src.chat.common.screens.screen_game_gol import (
     get_boards as get_boards_gol,
     run_game as run_game_gol,
+    run_scheduled_hint as run_scheduled_hint_gol,
     issue_life_if_possible as issue_hint_if_possible_gol,
 )
 from src.chat.common.screens.screen_game_pr import (
     run_game as run_game_pr,
+    run_scheduled_hint as run_scheduled_hint_pr,
     issue_hint_if_possible as issue_hint_if_possible_pr,
 )
-from src.chat.common.screens.screen_game_rps import manage as manage_rps
-from src.chat.common.screens.screen_game_rr import manage as manage_rr
+from src.chat.common.screens.screen_game_rps import (
+    manage as manage_rps,
+    auto_move as auto_move_rps,
+)
+from src.chat.common.screens.screen_game_rr import manage as manage_rr, auto_move as auto_move_rr
 from src.chat.common.screens.screen_game_shambles_ww import (
     run_game as run_game_shambles_ww,
+    run_scheduled_hint as run_scheduled_hint_shambles_ww,
     reduce_level_if_possible as issue_hint_if_possible_shambles_ww,
 )
 from src.model.Game import Game
+from src.model.GameScheduledEvent import GameScheduledEvent
 from src.model.User import User
+from src.model.enums.GameScheduledEventType import GameScheduledEventType
 from src.model.enums.GameStatus import GameStatus
 from src.model.enums.Screen import Screen
 from src.model.error.GroupChatError import GroupChatException, GroupChatError
@@ -37,6 +46,7 @@ from src.service.game_service import (
     challenger_has_finished_or_opponent_timeout,
     get_generic_boards_for_guess_game,
     enqueue_timeout_opponent_guess_game,
+    timeout_opponent_guess_game,
 )
 
 
@@ -133,8 +143,6 @@ async def dispatch_game(
         if game.is_opponent(user):
             context.application.create_task(enqueue_timeout_opponent_guess_game(context, game))
 
-    context.application.create_task(restart_hint_thread_if_down(context, game, user=user))
-
     game_type: GameType = GameType(game.type)
     match game_type:
         case GameType.ROCK_PAPER_SCISSORS:
@@ -159,88 +167,219 @@ async def dispatch_game(
             raise GroupChatException(GroupChatError.INVALID_GAME)
 
 
-async def restart_hint_thread_if_down(
-    context: ContextTypes.DEFAULT_TYPE, game: Game, user: User = None
+async def run_scheduled_event(
+    context: ContextTypes.DEFAULT_TYPE, event: GameScheduledEvent
+) -> None:
+    """
+    Run a due game event
+    :param context: The context object
+    :param event: The event
+    :return: None
+    """
+
+    game: Game = event.game
+    user: User = event.user
+    data: dict = event.get_data()
+
+    match event.get_type():
+        case GameScheduledEventType.HINT:
+            await run_scheduled_hint(context, game, user)
+
+        case GameScheduledEventType.COUNTDOWN_TO_START:
+            await guess_game_countdown_to_start(
+                get_scheduled_update(context, data),
+                context,
+                game,
+                data["remaining_seconds"],
+                get_run_game_function(game),
+                user,
+            )
+
+        case GameScheduledEventType.OPPONENT_TIMEOUT:
+            # Game already ended
+            if game.is_finished():
+                return
+
+            await timeout_opponent_guess_game(context, game)
+
+        case GameScheduledEventType.AUTO_MOVE:
+            await run_auto_move(context, game, user, data)
+
+        case _:
+            raise ValueError(f"Unsupported game event type: {event.type}")
+
+
+def get_scheduled_update(context: ContextTypes.DEFAULT_TYPE, data: dict) -> Update | None:
+    """
+    Get the update a game event was scheduled from
+    :param context: The context object
+    :param data: The event data
+    :return: The update
+    """
+
+    if data.get("update") is None:
+        return None
+
+    return Update.de_json(data["update"], context.bot)
+
+
+def get_run_game_function(game: Game) -> Callable:
+    """
+    Get the function that sends the game to a player of a guess game
+    :param game: The game object
+    :return: The function
+    """
+
+    match game.get_type():
+        case GameType.GUESS_OR_LIFE:
+            return run_game_gol
+
+        case GameType.PUNK_RECORDS:
+            return run_game_pr
+
+        case GameType.SHAMBLES | GameType.WHOS_WHO:
+            return run_game_shambles_ww
+
+        case _:
+            raise ValueError(f"Unsupported game type: {game.get_type()}")
+
+
+async def run_auto_move(
+    context: ContextTypes.DEFAULT_TYPE, game: Game, user: User, data: dict
 ) -> None:
     """
-    Restart the hint thread if it's down
+    Run an auto move
+    :param context: The context object
+    :param game: The game object
+    :param user: The user to move for
+    :param data: The event data
+    :return: None
+    """
+
+    # Game already ended
+    if game.is_finished():
+        return
+
+    match game.get_type():
+        case GameType.ROCK_PAPER_SCISSORS:
+            auto_move_function = auto_move_rps
+
+        case GameType.RUSSIAN_ROULETTE:
+            auto_move_function = auto_move_rr
+
+        case _:
+            raise ValueError(f"Unsupported game type: {game.get_type()}")
+
+    # Game state when the auto move was enqueued
+    previous_game: Game = Game.get_by_id(game.id)
+    previous_game.board = data["board"]
+    previous_game.opponent_board = data["opponent_board"]
+
+    await auto_move_function(
+        get_scheduled_update(context, data),
+        context,
+        game,
+        user,
+        data["message_id"],
+        previous_game,
+    )
+
+
+async def run_scheduled_hint(context: ContextTypes.DEFAULT_TYPE, game: Game, user: User) -> None:
+    """
+    Issue the next hint of a guess game
     :param context: The context object
     :param game: The game object
     :param user: The user
     :return: None
     """
 
-    if not game.is_guess_based():
+    # Run late, for example after a restart
+    if await issue_missed_hints(context, game, user):
         return
 
+    match game.get_type():
+        case GameType.GUESS_OR_LIFE:
+            await run_scheduled_hint_gol(context, game, user)
+
+        case GameType.PUNK_RECORDS:
+            await run_scheduled_hint_pr(context, game, user)
+
+        case GameType.SHAMBLES | GameType.WHOS_WHO:
+            await run_scheduled_hint_shambles_ww(context, game, user)
+
+        case _:
+            raise ValueError(f"Unsupported game type: {game.get_type()}")
+
+
+async def issue_missed_hints(context: ContextTypes.DEFAULT_TYPE, game: Game, user: User) -> bool:
+    """
+    Issue all the hints that should have been issued while the bot was down, then send the game
+    and schedule the next hint at its original time
+    :param context: The context object
+    :param game: The game object
+    :param user: The user
+    :return: True if hints were missed and issued
+    """
+
     if game.is_finished():
-        return
+        return False
 
     match game.get_type():
         case GameType.GUESS_OR_LIFE:
             issue_hint_if_possible_function = issue_hint_if_possible_gol
-            run_game_function = run_game_gol
 
         case GameType.PUNK_RECORDS:
             issue_hint_if_possible_function = issue_hint_if_possible_pr
-            run_game_function = run_game_pr
 
         case GameType.SHAMBLES | GameType.WHOS_WHO:
             issue_hint_if_possible_function = issue_hint_if_possible_shambles_ww
-            run_game_function = run_game_shambles_ww
 
         case _:
             raise ValueError(f"Unsupported game type: {game.get_type()}")
 
-    # No user given (so from timer), if is global game, then also try restarting for opponent
-    if user is None and game.is_global() and game.has_opponent():
-        context.application.create_task(restart_hint_thread_if_down(context, game, game.opponent))
-
-    if user is None:
-        user = game.challenger
-
     # User is challenger and they have finished
-    if game.is_global() and user and game.is_challenger(user) and game.challenger_has_finished():
-        return
+    if game.is_global() and game.is_challenger(user) and game.challenger_has_finished():
+        return False
 
     last_hint_date = (
         game.last_hint_opponent_date
-        if game.is_global() and user and game.is_opponent(user)
+        if game.is_global() and game.is_opponent(user)
         else game.last_hint_date
     )
 
     hint_every_seconds = game.get_seconds_for_every_hint()
 
-    # Give a 10-second margin in case in the same moment the hint is being issued by the regular thread
+    # Give a 10-second margin, the dispatcher can run the event slightly late
     if last_hint_date is None or datetime_is_after(
         get_datetime_in_future_seconds(hint_every_seconds + 10, start_time=last_hint_date)
     ):
-        return
+        return False
 
     seconds_since_last_hint = get_elapsed_seconds(last_hint_date)
     hints_to_issue, hint_seconds_remaining = divmod(seconds_since_last_hint, hint_every_seconds)
 
     # Issue all missing hints
     for _ in range(hints_to_issue):
-        if not issue_hint_if_possible_function(game, user):
+        if not await issue_hint_if_possible_function(game, user):
             if _ == 0:  # No hints were issued
-                return
+                return True
             break
 
     game.thread_restart_count += 1
     game.save()
 
     logging.info(
-        f"Restart hint thread for game {game.id} after {seconds_since_last_hint} seconds delay and {hints_to_issue} "
-        f"missed hints for user {user.id}"
+        f"Issued missed hints for game {game.id} after {seconds_since_last_hint} seconds delay and "
+        f"{hints_to_issue} missed hints for user {user.id}"
     )
 
     # Send message, waiting the remaining amount of time till the next hint
-    context.application.create_task(
-        run_game_function(
-            context,
-            game,
-            user,
-            hint_wait_seconds=(hint_every_seconds - hint_seconds_remaining),
-        )
+    await get_run_game_function(game)(
+        context,
+        game,
+        user,
+        hint_wait_seconds=(hint_every_seconds - hint_seconds_remaining),
     )
+
+    return True
@@ -1,5 +1,3 @@
-import asyncio
-
 from telegram import Update
 from telegram.ext import ContextTypes
 
@@ -7,8 +5,10 @@ import resources.phrases as phrases
 from src.model.Game import Game
 from src.model.User import User
 from src.model.enums.Emoji import Emoji
+from src.model.enums.GameScheduledEventType import GameScheduledEventType
 from src.model.game.GameOutcome import GameOutcome
 from src.model.game.punkrecords.PunkRecords import PunkRecords, RevealedDetail
+from src.service.game_scheduler_service import schedule_game_event
 from src.service.game_service import (
     set_user_private_screen,
     save_game,
@@ -142,7 +142,7 @@ async def run_game(
     new_detail = None
     # First iteration, do not reveal new detail or hint
     if not is_first_run:
-        issue_hint_if_possible(game, user)
+        await issue_hint_if_possible(game, user)
         board: PunkRecords = get_player_board(game, user)
 
     if board.revealed_letters_count > 0:
@@ -177,17 +177,24 @@ async def run_game(
         # Set private screen for input
         context.application.create_task(set_user_private_screen(u, game))
 
-    if not schedule_next_send:
-        return
+    if schedule_next_send:
+        schedule_game_event(game, user, GameScheduledEventType.HINT, hint_wait_seconds)
 
-    await asyncio.sleep(hint_wait_seconds)
 
-    # Refresh game, resend only if it's still ongoing
-    game: Game = Game.get_by_id(game.id)
+async def run_scheduled_hint(context: ContextTypes.DEFAULT_TYPE, game: Game, user: User) -> None:
+    """
+    Reveal the next detail or hint when its time is up, if the game is still ongoing
+    :param context: The context
+    :param game: The game
+    :param user: The user the hint is for
+    :return: None
+    """
 
     if not await should_proceed_after_hint_sleep(context, game, user):
         return
 
+    board: PunkRecords = get_player_board(game, user)
+
     # Revealed all details and all letters
     if board.have_revealed_all_letters() and not board.can_reveal_detail():
         return
@@ -228,7 +235,7 @@ async def validate_answer(
     await end_text_based_game(context, game, outcome, user, winner_text, loser, loser_text)
 
 
-def issue_hint_if_possible(game: Game, user: User) -> bool:
+async def issue_hint_if_possible(game: Game, user: User) -> bool:
     """
     Issue a hint if possible, saving the game
     :param game: The game
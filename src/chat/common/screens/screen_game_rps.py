@@ -198,26 +198,14 @@ async def manage(
                     should_auto_move_opponent = True
 
             if should_auto_move_challenger:
-                context.application.create_task(
-                    enqueue_auto_move(
-                        update, context, game, game.challenger, auto_move, message.id
-                    )
-                )
+                enqueue_auto_move(update, game, game.challenger, message.id)
 
             if should_auto_move_opponent:
                 extra_wait_time = (
                     0 if not should_auto_move_challenger else 5
                 )  # To avoid overlapping message edits
-                context.application.create_task(
-                    enqueue_auto_move(
-                        update,
-                        context,
-                        game,
-                        game.opponent,
-                        auto_move,
-                        message.id,
-                        extra_wait_time=extra_wait_time,
-                    )
+                enqueue_auto_move(
+                    update, game, game.opponent, message.id, extra_wait_time=extra_wait_time
                 )
 
     except BadRequest:
@@ -206,11 +206,7 @@ async def manage(
     # Auto-move
     if not board.is_finished():
         # Group game, arriving from opponent confirmation, auto move for both
-        context.application.create_task(
-            enqueue_auto_move(
-                update, context, game, board.get_user_turn(game), auto_move, message.id
-            )
-        )
+        enqueue_auto_move(update, game, board.get_user_turn(game), message.id)
 
 
 async def get_all_boards(game: Game, user: User) -> [GameBoard, GameBoard, GameBoard, GameBoard]:
@@ -1,15 +1,15 @@
-import asyncio
-
 from telegram.ext import ContextTypes
 
 import resources.phrases as phrases
 from src.model.Game import Game
 from src.model.User import User
+from src.model.enums.GameScheduledEventType import GameScheduledEventType
 from src.model.enums.SavedMedia import SavedMedia
 from src.model.enums.SavedMediaType import SavedMediaType
 from src.model.game.GameType import GameType
 from src.model.game.shambles.Shambles import Shambles
 from src.model.game.whoswho.WhosWho import WhosWho
+from src.service.game_scheduler_service import schedule_game_event
 from src.service.game_service import (
     set_user_private_screen,
     save_game,
@@ -96,25 +96,30 @@ async def run_game(
         # Set private screen for input
         context.application.create_task(set_user_private_screen(u, game))
 
-    if not schedule_next_send:
-        return
+    if schedule_next_send:
+        schedule_game_event(game, user, GameScheduledEventType.HINT, hint_wait_seconds)
 
-    await asyncio.sleep(hint_wait_seconds)
 
-    # Refresh game, resend only if it's still ongoing
-    game = Game.get_by_id(game.id)
+async def run_scheduled_hint(context: ContextTypes.DEFAULT_TYPE, game: Game, user: User) -> None:
+    """
+    Reduce the level when its time is up, if the game is still ongoing
+    :param context: The context
+    :param game: The game
+    :param user: The user the image is for
+    :return: None
+    """
 
     if not await should_proceed_after_hint_sleep(context, game, user):
         return
 
     # Reduce level
-    if not reduce_level_if_possible(game, user):
+    if not await reduce_level_if_possible(game, user):
         return
 
     await run_game(context, game, user)
 
 
-def reduce_level_if_possible(game: Game, user: User) -> bool:
+async def reduce_level_if_possible(game: Game, user: User) -> bool:
     """
     Issue a hint if possible, saving the game
     :param game: The game
@@ -127,7 +132,12 @@ def reduce_level_if_possible(game: Game, user: User) -> bool:
         return False
 
     if board.can_reduce_level():
-        board.reduce_level()
+        # Render outside the event loop
+        board.reduce_level(should_set_image=False)
+        if isinstance(board, Shambles):
+            await board.set_grid_image_async()
+        else:
+            await board.set_blurred_image_async()
     else:
         board.revealed_letters_count += 1
 
@@ -1,6 +1,6 @@
 import datetime
 
-from telegram import Update
+from telegram import Update, Message
 from telegram.ext import ContextTypes
 
 import resources.Environment as Env
@@ -21,8 +21,9 @@ from src.model.enums.MessageSource import MessageSource
 from src.model.enums.SavedMedia import SavedMedia
 from src.model.enums.SavedMediaType import SavedMediaType
 from src.model.error.GroupChatError import GroupChatError, GroupChatException
+from src.model.pojo.BountyPoster import BountyPoster
 from src.model.pojo.Keyboard import Keyboard
-from src.service.bounty_poster_service import get_bounty_poster
+from src.service.bounty_poster_service import get_bounty_poster, set_bounty_poster_file_id
 from src.service.crew_service import get_crew_abilities_text, get_crew_name_with_deeplink
 from src.service.date_service import get_remaining_duration
 from src.service.devil_fruit_service import get_devil_fruit_abilities_text
@@ -327,12 +328,15 @@ async def send_bounty_poster(
     reply_to_message_id: int = None,
     send_in_private_chat=False,
 ) -> None:
-    poster_path = await get_bounty_poster(update, user)
+    bounty_poster: BountyPoster = await get_bounty_poster(update, user)
     poster: SavedMedia = SavedMedia(media_type=SavedMediaType.PHOTO)
-    with open(poster_path, "rb") as media_id:
-        poster.media_id = media_id.read()
+    if bounty_poster.file_id is not None:  # Already uploaded, send by id
+        poster.media_id = bounty_poster.file_id
+    else:
+        with open(bounty_poster.path, "rb") as media_id:
+            poster.media_id = media_id.read()
 
-    await full_media_send(
+    message: Message | bool = await full_media_send(
         context,
         saved_media=poster,
         update=update,
@@ -343,6 +347,9 @@ async def send_bounty_poster(
         send_in_private_chat=send_in_private_chat,
     )
 
+    if bounty_poster.file_id is None and isinstance(message, Message):
+        set_bounty_poster_file_id(bounty_poster, message.photo[-1].file_id)
+
 
 def should_send_poster(user: User, group_chat: GroupChat, is_own_status: bool) -> bool:
     """
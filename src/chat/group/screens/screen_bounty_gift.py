@@ -24,6 +24,7 @@ from src.service.bounty_service import (
 from src.service.devil_fruit_service import get_ability_value
 from src.service.message_service import full_message_send, get_yes_no_keyboard
 from src.service.notification_service import send_notification
+from src.service.user_stats_service import add_bounty_gift_stats
 from src.utils.math_utils import get_value_from_percentage
 from src.utils.string_utils import get_belly_formatted
 
@@ -245,6 +246,7 @@ async def keyboard_interaction(
     bounty_gift.tax_percentage = tax_percentage
     bounty_gift.status = BountyGiftStatus.CONFIRMED
     bounty_gift.save()
+    add_bounty_gift_stats(bounty_gift)
 
     # Update sender
     sender.bounty_gift_tax += Env.BOUNTY_GIFT_TAX_INCREASE.get_int()
@@ -6,14 +6,19 @@ from telegram.ext import ContextTypes
 import constants as c
 import resources.phrases as phrases
 from src.model.GroupChat import GroupChat
-from src.model.GroupChatEnabledDisabledFeature import GroupChatEnabledDisabledFeature
 from src.model.GroupChatEnabledFeaturePin import GroupChatEnabledFeaturePin
 from src.model.enums.Emoji import Emoji
 from src.model.enums.Feature import Feature
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
 from src.model.enums.Screen import Screen
 from src.model.pojo.Keyboard import Keyboard
-from src.service.group_service import is_main_group, get_group_or_topic_text
+from src.service.group_service import (
+    is_main_group,
+    get_group_or_topic_text,
+    add_feature_enabled_disabled,
+    remove_feature_enabled_disabled,
+    feature_is_enabled,
+)
 from src.service.message_service import full_message_send
 
 
@@ -73,10 +78,7 @@ async def manage(
             )
 
             if add_record:
-                enabled_disabled_feature = GroupChatEnabledDisabledFeature()
-                enabled_disabled_feature.group_chat = group_chat
-                enabled_disabled_feature.feature = feature
-                enabled_disabled_feature.save()
+                add_feature_enabled_disabled(group_chat, feature)
 
                 # Delete the feature pin
                 GroupChatEnabledFeaturePin.delete().where(
@@ -84,10 +86,7 @@ async def manage(
                     & (GroupChatEnabledFeaturePin.feature == feature)
                 ).execute()
             else:
-                GroupChatEnabledDisabledFeature.delete().where(
-                    (GroupChatEnabledDisabledFeature.group_chat == group_chat)
-                    & (GroupChatEnabledDisabledFeature.feature == feature)
-                ).execute()
+                remove_feature_enabled_disabled(group_chat, feature)
 
         # Refresh backlinks
         group_chat = GroupChat.get_by_id(group_chat.id)
@@ -131,21 +130,11 @@ def get_features_keyboard(group_chat: GroupChat) -> list[list[Keyboard]]:
         features.remove(pinnable_feature)
         features.append(pinnable_feature)
 
-    # Get all enabled/disabled features, avoids multiple queries, Backref
-    enabled_disabled_features: list[Feature] = [
-        enabled_disabled_feature.feature
-        for enabled_disabled_feature in group_chat.enabled_disabled_features
-    ]
-
     keyboard: list[list[Keyboard]] = [[]]
     keyboard_row: list[Keyboard] = []
 
     for feature in features:
-        is_enabled_feature = (
-            feature.is_enabled_by_default()
-            if feature not in enabled_disabled_features
-            else not feature.is_enabled_by_default()
-        )
+        is_enabled_feature = feature_is_enabled(group_chat, feature)
 
         emoji = Emoji.ENABLED if is_enabled_feature else Emoji.DISABLED_EMPTY
         button_info: dict = {
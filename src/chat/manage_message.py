@@ -3,7 +3,7 @@ import logging
 import traceback
 from datetime import datetime
 
-from peewee import MySQLDatabase, DoesNotExist
+from peewee import DoesNotExist
 from telegram import Update, User as TelegramUser
 from telegram.error import BadRequest, TimedOut, NetworkError
 from telegram.ext import ContextTypes
@@ -11,16 +11,15 @@ from telegram.ext import ContextTypes
 import resources.Environment as Env
 import resources.phrases as phrases
 import src.model.enums.Command as Command
-from resources.Database import Database
 from src.chat.group.group_chat_manager import manage as manage_group_chat
 from src.chat.inline_query.inline_query_manager import manage as manage_inline_query
 from src.chat.private.private_chat_manager import manage as manage_private_chat
 from src.chat.tgrest.tgrest_chat_manager import manage as manage_tgrest_chat
+from src.model.BaseModel import db_obj
 from src.model.Group import Group
 from src.model.GroupChat import GroupChat
-from src.model.GroupUser import GroupUser
 from src.model.User import User
-from src.model.enums.ContextDataKey import ContextDataType, ContextDataKey
+from src.model.enums.ContextDataKey import ContextDataKey
 from src.model.enums.Feature import Feature
 from src.model.enums.MessageSource import MessageSource
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
@@ -35,7 +34,8 @@ from src.model.error.CustomException import (
 from src.model.error.GroupChatError import GroupChatException
 from src.model.error.PrivateChatError import PrivateChatException
 from src.model.pojo.Keyboard import Keyboard
-from src.service.date_service import get_datetime_in_future_seconds
+from src.service.activity_service import track_activity, track_group_user_activity
+from src.service.anti_spam_service import PRIVATE_CHAT_LIMITER, GROUP_CHAT_LIMITER
 from src.service.group_service import feature_is_enabled, get_group_or_topic_text, is_main_group
 from src.service.message_service import (
     full_message_send,
@@ -46,38 +46,17 @@ from src.service.message_service import (
     message_is_reply,
     escape_valid_markdown_chars,
 )
+from src.service.metrics_service import start_update, set_update_command, end_update
 from src.service.user_service import user_is_boss, user_is_muted, get_effective_tg_user_id
 from src.utils.context_utils import (
-    get_context_data,
-    set_context_data,
     get_user_context_data,
     set_user_context_data,
     remove_user_context_data,
 )
+from src.utils.request_cache_utils import start_request_cache, end_request_cache
 from src.utils.string_utils import get_belly_formatted
 
 
-def init() -> MySQLDatabase:
-    """
-    Initializes the group chat manager
-    :return: Database connection
-    :rtype: MySQLDatabase
-    """
-    db_obj = Database()
-    db = db_obj.get_db()
-
-    return db
-
-
-def end(db: MySQLDatabase) -> None:
-    """
-    Ends the group chat manager
-    :param db: Database connection
-    :return: None
-    """
-    db.close()
-
-
 async def manage_regular(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """
     Manage a regular message
@@ -123,9 +102,12 @@ async def manage(update: Update, context: ContextTypes.DEFAULT_TYPE, is_callback
 
         set_user_context_data(context, ContextDataKey.LAST_REQUEST, now)
 
-    db = init()
+    update_metrics = start_update(is_callback)
+    request_cache = start_request_cache()
     try:
-        await manage_after_db(update, context, is_callback)
+        # Connection is checked out for this update only and returned to the pool on exit
+        async with db_obj.connection():
+            await manage_after_db(update, context, is_callback)
     except AnonymousAdminException:  # Wasn't able to infer the user
         pass
     except Exception as e:
@@ -133,8 +115,6 @@ async def manage(update: Update, context: ContextTypes.DEFAULT_TYPE, is_callback
         logging.error(e, exc_info=True)
         # For functions called asynchronously, since the full stacktrace is not printed
         logging.error(traceback.format_stack())
-    finally:
-        end(db)
 
     if is_callback:
         try:
@@ -142,6 +122,9 @@ async def manage(update: Update, context: ContextTypes.DEFAULT_TYPE, is_callback
         except BadRequest:
             pass
 
+    end_request_cache(request_cache)
+    end_update(update_metrics)
+
     if current_tg_user_id is not None:
         remove_current_request(context, now)
 
@@ -194,8 +177,10 @@ async def manage_after_db(
             ):
                 return
 
-        user.private_screen_previous_step = user.private_screen_step
-        user.save()
+        # Activity fields are written by the activity tracker, save only if something else changed
+        if user.id is None or user.private_screen_previous_step != user.private_screen_step:
+            user.private_screen_previous_step = user.private_screen_step
+            await db_obj.run_in_executor(user.save)
 
     # Leave chat if not recognized
     if message_source is MessageSource.ND:
@@ -211,7 +196,7 @@ async def manage_after_db(
         group: Group = await add_or_update_group(
             update, (user if update.effective_user is not None else None)
         )
-        group_chat: GroupChat = add_or_update_group_chat(update, group)
+        group_chat: GroupChat = await add_or_update_group_chat(update, group)
 
     command: Command.Command = Command.ND
     keyboard = None
@@ -276,6 +261,8 @@ async def manage_after_db(
             except AttributeError:
                 pass
 
+        set_update_command(command)
+
         # Start command, reset private screen
         if command is Command.PVT_START:
             user.private_screen_list = None
@@ -388,7 +375,7 @@ async def manage_after_db(
         logging.error(traceback.format_stack())
 
     if user.should_update_model and user.tg_user_id is not None:
-        user.save()
+        await db_obj.run_in_executor(user.save)
 
 
 async def validate(
@@ -635,7 +622,7 @@ async def get_user(
     """
 
     # Insert or update user
-    user = User.get_or_none(User.tg_user_id == tg_user_id)
+    user = await db_obj.run_in_executor(User.get_or_none, User.tg_user_id == tg_user_id)
     if user is None:
         user = User()
         user.tg_user_id = tg_user_id
@@ -649,8 +636,11 @@ async def get_user(
     user.last_message_date = datetime.now()
     user.is_active = True
 
-    if should_save:
-        user.save()
+    if user.id is not None:
+        track_activity(user)
+
+    if should_save and user.is_dirty():
+        await db_obj.run_in_executor(user.save)
 
     return user
 
@@ -662,7 +652,9 @@ async def add_or_update_group(update, user: User) -> Group:
     :param user: User object
     :return: Group object
     """
-    group = Group.get_or_none(Group.tg_group_id == update.effective_chat.id)
+    group = await db_obj.run_in_executor(
+        Group.get_or_none, Group.tg_group_id == update.effective_chat.id
+    )
 
     if group is None:
         group = Group()
@@ -680,25 +672,22 @@ async def add_or_update_group(update, user: User) -> Group:
     group.is_forum = update.effective_chat.is_forum is not None and update.effective_chat.is_forum
     group.last_message_date = datetime.now()
     group.is_active = True
-    group.save()
+
+    if group.id is not None:
+        track_activity(group)
+
+    # New group or migrated id
+    if group.is_dirty():
+        await db_obj.run_in_executor(group.save)
 
     # Add or update the group user
     if user is not None:
-        group_user = GroupUser.get_or_none((GroupUser.group == group) & (GroupUser.user == user))
-        if group_user is None:
-            group_user = GroupUser()
-            group_user.group = group
-            group_user.user = user
-
-        group_user.last_message_date = datetime.now()
-        group_user.is_active = True
-        group_user.is_admin = await user.is_chat_admin(update)
-        group_user.save()
+        await track_group_user_activity(group, user, await user.is_chat_admin(update))
 
     return group
 
 
-def add_or_update_group_chat(update, group: Group) -> GroupChat:
+async def add_or_update_group_chat(update, group: Group) -> GroupChat:
     """
     Adds or updates a group_chat
     :param update: Telegram update
@@ -710,8 +699,8 @@ def add_or_update_group_chat(update, group: Group) -> GroupChat:
     if update.effective_chat.is_forum and update.effective_message.is_topic_message:
         tg_topic_id = update.effective_message.message_thread_id
 
-    group_chat = GroupChat.get_or_none(
-        (GroupChat.group == group) & (GroupChat.tg_topic_id == tg_topic_id)
+    group_chat = await db_obj.run_in_executor(
+        GroupChat.get_or_none, (GroupChat.group == group) & (GroupChat.tg_topic_id == tg_topic_id)
     )
 
     if group_chat is None:
@@ -726,7 +715,11 @@ def add_or_update_group_chat(update, group: Group) -> GroupChat:
 
     group_chat.last_message_date = datetime.now()
     group_chat.is_active = True
-    group_chat.save()
+
+    if group_chat.id is None:
+        await db_obj.run_in_executor(group_chat.save)
+    else:
+        track_activity(group_chat)
 
     return group_chat
 
@@ -749,11 +742,11 @@ async def is_spam(
     """
 
     if message_source is MessageSource.PRIVATE:
-        context_data_type = ContextDataType.USER
-        inner_key = None
+        limiter = PRIVATE_CHAT_LIMITER
+        key = update.effective_user.id
     elif message_source is MessageSource.GROUP:
-        context_data_type = ContextDataType.BOT
-        inner_key = str(update.effective_chat.id)
+        limiter = GROUP_CHAT_LIMITER
+        key = update.effective_chat.id
     else:
         return False  # Not managing spam for other message sources
 
@@ -765,63 +758,20 @@ async def is_spam(
     if command is not None and command.screen is Screen.GRP_RUSSIAN_ROULETTE_GAME:
         return False
 
-    # Get past messages date list
-    try:
-        past_messages_date_list: list[datetime] = get_context_data(
-            context, context_data_type, ContextDataKey.PAST_MESSAGES_DATE, inner_key=inner_key
-        )
-    except CommonChatException:
-        past_messages_date_list = []
+    if not limiter.is_limited(key):
+        return False
 
-    # Remove old messages
-    now = datetime.now()
-    past_messages_date_list = [
-        x
-        for x in past_messages_date_list
-        if now
-        < get_datetime_in_future_seconds(
-            Env.ANTI_SPAM_TIME_INTERVAL_SECONDS.get_int(), start_time=x
+    # In case spam limit was just reached, send warning message just in private chat
+    if message_source is MessageSource.PRIVATE and limiter.is_limit_just_reached(key):
+        await full_message_send(
+            context,
+            phrases.ANTI_SPAM_WARNING,
+            update=update,
+            quote_if_group=False,
+            new_message=True,
         )
-    ]
-
-    # Check if the message is spam
-    spam_limit = (
-        Env.ANTI_SPAM_PRIVATE_CHAT_MESSAGE_LIMIT.get_int()
-        if message_source is MessageSource.PRIVATE
-        else Env.ANTI_SPAM_GROUP_CHAT_MESSAGE_LIMIT.get_int()
-    )
 
-    if len(past_messages_date_list) >= spam_limit:
-        # In case spam limit was just reached, send warning message just in private chat
-        if len(past_messages_date_list) == spam_limit and message_source is MessageSource.PRIVATE:
-            past_messages_date_list.append(now)
-            set_context_data(
-                context,
-                context_data_type,
-                ContextDataKey.PAST_MESSAGES_DATE,
-                past_messages_date_list,
-                inner_key=inner_key,
-            )
-            await full_message_send(
-                context,
-                phrases.ANTI_SPAM_WARNING,
-                update=update,
-                quote_if_group=False,
-                new_message=True,
-            )
-        return True
-
-    # Add the message to the list
-    past_messages_date_list.append(now)
-    set_context_data(
-        context,
-        context_data_type,
-        ContextDataKey.PAST_MESSAGES_DATE,
-        past_messages_date_list,
-        inner_key=inner_key,
-    )
-
-    return False
+    return True
 
 
 async def check_current_requests(context: ContextTypes.DEFAULT_TYPE) -> bool:
@@ -179,6 +179,7 @@ from src.chat.private.screens.screen_settings_timezone import (
     manage as manage_screen_settings_timezone,
 )
 from src.chat.private.screens.screen_start import manage as manage_screen_start
+from src.chat.screen_registry import ScreenRegistry
 from src.model.SystemUpdate import SystemUpdate
 from src.model.SystemUpdateUser import SystemUpdateUser
 from src.model.User import User
@@ -195,6 +196,293 @@ from src.service.message_service import (
 )
 
 
+# Screen managers, called with the update, the context and the listed arguments
+SCREENS = ScreenRegistry("private", ("command", "user", "inbound_keyboard"))
+SCREENS.register(Screen.PVT_START, manage_screen_start)
+SCREENS.register(Screen.PVT_SETTINGS, manage_screen_settings, "inbound_keyboard")
+SCREENS.register(
+    Screen.PVT_USER_STATUS, manage_screen_status, "command", "user", "inbound_keyboard"
+)
+SCREENS.register(Screen.PVT_CREW, manage_screen_crew, "inbound_keyboard", "user")
+SCREENS.register(Screen.PVT_CREW_ABILITY, manage_screen_crew_ability, "inbound_keyboard", "user")
+SCREENS.register(
+    Screen.PVT_CREW_ABILITY_ACTIVATE,
+    manage_screen_crew_ability_activate,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_ABILITY_ACTIVATE_CONFIRM,
+    manage_screen_crew_ability_activate_confirm,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_CREATE_OR_EDIT, manage_screen_crew_create_or_edit, "inbound_keyboard", "user"
+)
+SCREENS.register(Screen.PVT_CREW_POWERUP, manage_screen_crew_powerup, "inbound_keyboard", "user")
+SCREENS.register(Screen.PVT_CREW_LEVEL, manage_screen_crew_level, "inbound_keyboard", "user")
+SCREENS.register(Screen.PVT_CREW_LEVEL_UP, manage_screen_crew_level_up, "inbound_keyboard", "user")
+SCREENS.register(Screen.PVT_CREW_MODIFY, manage_screen_crew_edit, "inbound_keyboard", "user")
+SCREENS.register(Screen.PVT_CREW_LEAVE, manage_screen_crew_leave, "inbound_keyboard", "user")
+SCREENS.register(Screen.PVT_CREW_DISBAND, manage_screen_crew_disband, "inbound_keyboard", "user")
+SCREENS.register(Screen.PVT_CREW_MEMBER, manage_screen_crew_member, "inbound_keyboard", "user")
+SCREENS.register(
+    Screen.PVT_CREW_MEMBER_DETAIL, manage_screen_crew_member_detail, "inbound_keyboard", "user"
+)
+SCREENS.register(
+    Screen.PVT_CREW_MEMBER_DETAIL_REMOVE,
+    manage_screen_crew_member_detail_remove,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_MEMBER_DETAIL_FIRST_MATE_PROMOTE,
+    manage_screen_crew_member_detail_first_mate_promote,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_MEMBER_DETAIL_FIRST_MATE_DEMOTE,
+    manage_screen_crew_member_detail_first_mate_demote,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(Screen.PVT_POST_BAIL, manage_screen_post_bail, "inbound_keyboard", "user")
+SCREENS.register(Screen.PVT_CREW_SEARCH, manage_screen_crew_search, "inbound_keyboard", "user")
+SCREENS.register(
+    Screen.PVT_CREW_SEARCH_DETAIL, manage_screen_crew_search_detail, "inbound_keyboard", "user"
+)
+SCREENS.register(
+    Screen.PVT_CREW_SEARCH_DETAIL_JOIN,
+    manage_screen_crew_search_detail_join,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_JOIN_REQUEST_RECEIVED,
+    manage_screen_crew_join_request_received,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_REQUEST,
+    manage_screen_crew_davy_back_fight_request,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_REQUEST_RECEIVED,
+    manage_screen_crew_davy_back_fight_request_received,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_SETTINGS_NOTIFICATIONS, manage_screen_settings_notifications, "inbound_keyboard"
+)
+SCREENS.register(
+    Screen.PVT_SETTINGS_NOTIFICATIONS_TYPE,
+    manage_screen_settings_notifications_type,
+    "inbound_keyboard",
+)
+SCREENS.register(
+    Screen.PVT_SETTINGS_NOTIFICATIONS_TYPE_EDIT,
+    manage_screen_settings_notifications_type_edit,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(Screen.PVT_LOGS, manage_screen_logs, "inbound_keyboard", "user")
+SCREENS.register(Screen.PVT_LOGS_TYPE, manage_screen_logs_type, "inbound_keyboard", "user")
+SCREENS.register(
+    Screen.PVT_LOGS_TYPE_DETAIL, manage_screen_logs_type_detail, "inbound_keyboard", "user"
+)
+SCREENS.register(Screen.PVT_PREDICTION, manage_screen_prediction, "inbound_keyboard", "user")
+SCREENS.register(
+    Screen.PVT_PREDICTION_DETAIL, manage_screen_prediction_detail, "inbound_keyboard", "user"
+)
+SCREENS.register(
+    Screen.PVT_PREDICTION_DETAIL_PLACE_BET,
+    manage_screen_prediction_detail_place_bet,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_PREDICTION_DETAIL_PLACE_BET_SEND_AMOUNT,
+    manage_screen_prediction_detail_place_bet_send_amount,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_PREDICTION_DETAIL_REMOVE_BET,
+    manage_screen_prediction_detail_remove_bet,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_PREDICTION_DETAIL_REMOVE_BET_CONFIRM,
+    manage_screen_prediction_detail_remove_bet_confirm,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_PREDICTION_DETAIL_SEND_TO_GROUP,
+    manage_screen_prediction_detail_send_to_group,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_PREDICTION_DETAIL_SET_RESULT,
+    manage_screen_prediction_detail_set_result,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_PREDICTION_CREATE, manage_screen_prediction_create, "inbound_keyboard", "user"
+)
+SCREENS.register(Screen.PVT_DEVIL_FRUIT, manage_screen_devil_fruit, "inbound_keyboard", "user")
+SCREENS.register(
+    Screen.PVT_DEVIL_FRUIT_DETAIL, manage_screen_devil_fruit_detail, "inbound_keyboard", "user"
+)
+SCREENS.register(
+    Screen.PVT_DEVIL_FRUIT_DETAIL_EAT,
+    manage_screen_devil_fruit_detail_eat,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_DEVIL_FRUIT_DETAIL_DISCARD,
+    manage_screen_devil_fruit_detail_discard,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_DEVIL_FRUIT_DETAIL_SELL,
+    manage_screen_devil_fruit_detail_sell,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_GAME_GUESS_INPUT, manage_screen_game_guess_input, "inbound_keyboard", "user"
+)
+SCREENS.register(
+    Screen.PVT_LOGS_TYPE_STATS, manage_screen_logs_type_stats, "inbound_keyboard", "user"
+)
+SCREENS.register(
+    Screen.PVT_SETTINGS_TIMEZONE, manage_screen_settings_timezone, "inbound_keyboard", "user"
+)
+SCREENS.register(Screen.PVT_BOUNTY_LOAN, manage_screen_bounty_loan, "inbound_keyboard", "user")
+SCREENS.register(
+    Screen.PVT_BOUNTY_LOAN_DETAIL, manage_screen_bounty_loan_detail, "inbound_keyboard", "user"
+)
+SCREENS.register(
+    Screen.PVT_BOUNTY_LOAN_DETAIL_PAY,
+    manage_screen_bounty_loan_detail_pay,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_BOUNTY_LOAN_DETAIL_FORGIVE,
+    manage_screen_bounty_loan_detail_forgive,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_DAVY_BACK_FIGHT, manage_screen_crew_davy_back_fight, "inbound_keyboard", "user"
+)
+SCREENS.register(
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL,
+    manage_screen_crew_davy_back_fight_detail,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL_PARTICIPANTS_SELECT,
+    manage_screen_crew_davy_back_fight_detail_participants_select,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL_PARTICIPANTS_VIEW,
+    manage_screen_crew_davy_back_fight_detail_participants_view,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL_CONSCRIPT_OPPONENT,
+    manage_screen_crew_davy_back_fight_detail_conscript_opponent,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_MODIFY_DAVY_BACK_FIGHT_DEFAULT_PARTICIPANTS,
+    manage_screen_crew_modify_davy_back_fight_default_participants,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_DEVIL_FRUIT_SHOP, manage_screen_devil_fruit_shop, "inbound_keyboard", "user"
+)
+SCREENS.register(
+    Screen.PVT_DEVIL_FRUIT_SHOP_DETAIL,
+    manage_screen_devil_fruit_shop_detail,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_DEVIL_FRUIT_SHOP_DETAIL_BUY,
+    manage_screen_devil_fruit_shop_detail_buy,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_DEVIL_FRUIT_SHOP_DETAIL_REMOVE,
+    manage_screen_devil_fruit_shop_detail_remove,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_CREW_MEMBER_DETAIL_CAPTAIN_PROMOTE,
+    manage_screen_crew_member_detail_captain_promote,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(Screen.PVT_FIGHT, manage_screen_fight, "user", "inbound_keyboard")
+SCREENS.register(Screen.PVT_PLUNDER, manage_screen_plunder, "user", "inbound_keyboard")
+SCREENS.register(Screen.PVT_DOC_Q_GAME, manage_screen_doc_q_game, "user", "inbound_keyboard")
+SCREENS.register(Screen.PVT_DAILY_REWARD, manage_screen_daily_reward, "user")
+SCREENS.register(
+    Screen.PVT_DAILY_REWARD_PRIZE, manage_screen_daily_reward_prize, "inbound_keyboard"
+)
+SCREENS.register(
+    Screen.PVT_GAME_GLOBAL_LIST, manage_screen_game_global_list, "inbound_keyboard", "user"
+)
+SCREENS.register(Screen.PVT_GAME, manage_screen_game, "user", "command")
+SCREENS.register(
+    Screen.PVT_GAME_SELECTION, manage_screen_game_selection, "user", "inbound_keyboard"
+)
+SCREENS.register(
+    Screen.PVT_GAME_GLOBAL_START_CHALLENGER,
+    manage_screen_game_global_start_challenger,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_GAME_GLOBAL_START_OPPONENT,
+    manage_screen_game_global_start_opponent,
+    "inbound_keyboard",
+    "user",
+)
+SCREENS.register(
+    Screen.PVT_ROCK_PAPER_SCISSORS_GAME, manage_screen_game_rps, "user", "inbound_keyboard"
+)
+SCREENS.register(
+    Screen.PVT_RUSSIAN_ROULETTE_GAME, manage_screen_game_rr, "user", "inbound_keyboard"
+)
+SCREENS.register(
+    Screen.PVT_CHANGE_REGION, manage_screen_change_region, "user", "inbound_keyboard", "command"
+)
+
+
 async def manage(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -306,317 +594,11 @@ async def dispatch_screens(
             ):
                 user.clear_context_filters(context)
 
-        match screen:
-            case Screen.PVT_START:  # Start
-                await manage_screen_start(update, context)
-
-            case Screen.PVT_SETTINGS:  # Settings
-                await manage_screen_settings(update, context, inbound_keyboard)
-
-            case Screen.PVT_USER_STATUS:  # Status
-                await manage_screen_status(update, context, command, user, inbound_keyboard)
-
-            case Screen.PVT_CREW:  # Crew
-                await manage_screen_crew(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_ABILITY:  # Crew Ability
-                await manage_screen_crew_ability(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_ABILITY_ACTIVATE:  # Crew Ability Activate
-                await manage_screen_crew_ability_activate(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_ABILITY_ACTIVATE_CONFIRM:  # Crew Ability Activate Confirm
-                await manage_screen_crew_ability_activate_confirm(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_CREW_CREATE_OR_EDIT:  # Crew Create or Edit
-                await manage_screen_crew_create_or_edit(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_POWERUP:  # Crew Powerup
-                await manage_screen_crew_powerup(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_LEVEL:  # Crew Level
-                await manage_screen_crew_level(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_LEVEL_UP:  # Crew Level Up
-                await manage_screen_crew_level_up(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_MODIFY:  # Crew Edit
-                await manage_screen_crew_edit(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_LEAVE:  # Crew Leave
-                await manage_screen_crew_leave(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_DISBAND:  # Crew Disband
-                await manage_screen_crew_disband(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_MEMBER:  # Crew Member
-                await manage_screen_crew_member(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_MEMBER_DETAIL:  # Crew Member Detail
-                await manage_screen_crew_member_detail(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_MEMBER_DETAIL_REMOVE:  # Crew Member Remove
-                await manage_screen_crew_member_detail_remove(
-                    update, context, inbound_keyboard, user
-                )
-
-            case (
-                Screen.PVT_CREW_MEMBER_DETAIL_FIRST_MATE_PROMOTE
-            ):  # Crew Member First Mate Promote
-                await manage_screen_crew_member_detail_first_mate_promote(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_CREW_MEMBER_DETAIL_FIRST_MATE_DEMOTE:  # Crew Member First Mate Demote
-                await manage_screen_crew_member_detail_first_mate_demote(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_POST_BAIL:  # Crew Member Post Bail
-                await manage_screen_post_bail(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_SEARCH:  # Crew Search
-                await manage_screen_crew_search(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_SEARCH_DETAIL:  # Crew Search Detail
-                await manage_screen_crew_search_detail(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_SEARCH_DETAIL_JOIN:  # Crew Search Detail Join
-                await manage_screen_crew_search_detail_join(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_CREW_JOIN_REQUEST_RECEIVED:  # Crew Join Request Received
-                await manage_screen_crew_join_request_received(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_CREW_DAVY_BACK_FIGHT_REQUEST:  # Crew Davy Back Fight Request
-                await manage_screen_crew_davy_back_fight_request(
-                    update, context, inbound_keyboard, user
-                )
-
-            # Crew Davy Back Fight Request Received
-            case Screen.PVT_CREW_DAVY_BACK_FIGHT_REQUEST_RECEIVED:
-                await manage_screen_crew_davy_back_fight_request_received(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_SETTINGS_NOTIFICATIONS:  # Notifications
-                await manage_screen_settings_notifications(update, context, inbound_keyboard)
-
-            case Screen.PVT_SETTINGS_NOTIFICATIONS_TYPE:  # Notifications Type
-                await manage_screen_settings_notifications_type(update, context, inbound_keyboard)
-
-            case Screen.PVT_SETTINGS_NOTIFICATIONS_TYPE_EDIT:  # Notifications Type Edit
-                await manage_screen_settings_notifications_type_edit(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_LOGS:  # Logs
-                await manage_screen_logs(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_LOGS_TYPE:  # Logs Type
-                await manage_screen_logs_type(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_LOGS_TYPE_DETAIL:  # Logs Type Detail
-                await manage_screen_logs_type_detail(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_PREDICTION:  # Prediction
-                await manage_screen_prediction(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_PREDICTION_DETAIL:  # Prediction Detail
-                await manage_screen_prediction_detail(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_PREDICTION_DETAIL_PLACE_BET:  # Prediction Detail Place Bet
-                await manage_screen_prediction_detail_place_bet(
-                    update, context, inbound_keyboard, user
-                )
-
-            case (
-                Screen.PVT_PREDICTION_DETAIL_PLACE_BET_SEND_AMOUNT
-            ):  # Prediction Detail Place Bet Send Amount
-                await manage_screen_prediction_detail_place_bet_send_amount(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_PREDICTION_DETAIL_REMOVE_BET:  # Prediction Detail Remove Bet
-                await manage_screen_prediction_detail_remove_bet(
-                    update, context, inbound_keyboard, user
-                )
-
-            case (
-                Screen.PVT_PREDICTION_DETAIL_REMOVE_BET_CONFIRM
-            ):  # Prediction Detail Remove Bet Confirm
-                await manage_screen_prediction_detail_remove_bet_confirm(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_PREDICTION_DETAIL_SEND_TO_GROUP:  # Prediction Detail Send To Group
-                await manage_screen_prediction_detail_send_to_group(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_PREDICTION_DETAIL_SET_RESULT:  # Prediction Detail Set Result
-                await manage_screen_prediction_detail_set_result(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_PREDICTION_CREATE:  # Prediction Create
-                await manage_screen_prediction_create(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_DEVIL_FRUIT:  # Devil Fruit
-                await manage_screen_devil_fruit(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_DEVIL_FRUIT_DETAIL:  # Devil Fruit Detail
-                await manage_screen_devil_fruit_detail(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_DEVIL_FRUIT_DETAIL_EAT:  # Devil Fruit Detail Eat
-                await manage_screen_devil_fruit_detail_eat(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_DEVIL_FRUIT_DETAIL_DISCARD:  # Devil Fruit Detail Discard
-                await manage_screen_devil_fruit_detail_discard(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_DEVIL_FRUIT_DETAIL_SELL:  # Devil Fruit Detail Sell
-                await manage_screen_devil_fruit_detail_sell(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_GAME_GUESS_INPUT:  # Guess game input
-                await manage_screen_game_guess_input(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_LOGS_TYPE_STATS:  # Logs Type Stats
-                await manage_screen_logs_type_stats(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_SETTINGS_TIMEZONE:  # Settings Timezone
-                await manage_screen_settings_timezone(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_BOUNTY_LOAN:  # Bounty Loan
-                await manage_screen_bounty_loan(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_BOUNTY_LOAN_DETAIL:  # Bounty Loan Detail
-                await manage_screen_bounty_loan_detail(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_BOUNTY_LOAN_DETAIL_PAY:  # Bounty Loan Detail Pay
-                await manage_screen_bounty_loan_detail_pay(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_BOUNTY_LOAN_DETAIL_FORGIVE:  # Bounty Loan Detail Forgive
-                await manage_screen_bounty_loan_detail_forgive(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_CREW_DAVY_BACK_FIGHT:  # Crew Davy Back Fight
-                await manage_screen_crew_davy_back_fight(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL:  # Crew Davy Back Fight Detail
-                await manage_screen_crew_davy_back_fight_detail(
-                    update, context, inbound_keyboard, user
-                )
-
-            # Crew Davy Back Fight Detail Participants Select
-            case Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL_PARTICIPANTS_SELECT:
-                await manage_screen_crew_davy_back_fight_detail_participants_select(
-                    update, context, inbound_keyboard, user
-                )
-
-            # Crew Davy Back Fight Detail Participants View
-            case Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL_PARTICIPANTS_VIEW:
-                await manage_screen_crew_davy_back_fight_detail_participants_view(
-                    update, context, inbound_keyboard, user
-                )
-
-            # Crew Davy Back Fight Detail Conscript Opponent
-            case Screen.PVT_CREW_DAVY_BACK_FIGHT_DETAIL_CONSCRIPT_OPPONENT:
-                await manage_screen_crew_davy_back_fight_detail_conscript_opponent(
-                    update, context, inbound_keyboard, user
-                )
-
-            # Crew Modify Davy Back Fight Default Participants
-            case Screen.PVT_CREW_MODIFY_DAVY_BACK_FIGHT_DEFAULT_PARTICIPANTS:
-                await manage_screen_crew_modify_davy_back_fight_default_participants(
-                    update, context, inbound_keyboard, user
-                )
-
-            # Devil Fruit Shop
-            case Screen.PVT_DEVIL_FRUIT_SHOP:
-                await manage_screen_devil_fruit_shop(update, context, inbound_keyboard, user)
-
-            # Devil Fruit Shop detail
-            case Screen.PVT_DEVIL_FRUIT_SHOP_DETAIL:
-                await manage_screen_devil_fruit_shop_detail(
-                    update, context, inbound_keyboard, user
-                )
-
-            # Devil Fruit Shop detail buy
-            case Screen.PVT_DEVIL_FRUIT_SHOP_DETAIL_BUY:
-                await manage_screen_devil_fruit_shop_detail_buy(
-                    update, context, inbound_keyboard, user
-                )
-
-            # Devil Fruit Shop detail remove
-            case Screen.PVT_DEVIL_FRUIT_SHOP_DETAIL_REMOVE:
-                await manage_screen_devil_fruit_shop_detail_remove(
-                    update, context, inbound_keyboard, user
-                )
-
-            # Crew Member Detail Captain Promote
-            case Screen.PVT_CREW_MEMBER_DETAIL_CAPTAIN_PROMOTE:
-                await manage_screen_crew_member_detail_captain_promote(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_FIGHT:
-                await manage_screen_fight(update, context, user, inbound_keyboard)
-
-            case Screen.PVT_PLUNDER:
-                await manage_screen_plunder(update, context, user, inbound_keyboard)
-
-            case Screen.PVT_DOC_Q_GAME:
-                await manage_screen_doc_q_game(update, context, user, inbound_keyboard)
-
-            case Screen.PVT_DAILY_REWARD:
-                await manage_screen_daily_reward(update, context, user)
-
-            case Screen.PVT_DAILY_REWARD_PRIZE:
-                await manage_screen_daily_reward_prize(update, context, inbound_keyboard)
-
-            case Screen.PVT_GAME_GLOBAL_LIST:
-                await manage_screen_game_global_list(update, context, inbound_keyboard, user)
-
-            case Screen.PVT_GAME:
-                await manage_screen_game(update, context, user, command)
-
-            case Screen.PVT_GAME_SELECTION:
-                await manage_screen_game_selection(update, context, user, inbound_keyboard)
-
-            case Screen.PVT_GAME_GLOBAL_START_CHALLENGER:
-                await manage_screen_game_global_start_challenger(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_GAME_GLOBAL_START_OPPONENT:
-                await manage_screen_game_global_start_opponent(
-                    update, context, inbound_keyboard, user
-                )
-
-            case Screen.PVT_ROCK_PAPER_SCISSORS_GAME:
-                await manage_screen_game_rps(update, context, user, inbound_keyboard)
-
-            case Screen.PVT_RUSSIAN_ROULETTE_GAME:
-                await manage_screen_game_rr(update, context, user, inbound_keyboard)
-
-            case Screen.PVT_CHANGE_REGION:  # Change region
-                await manage_screen_change_region(
-                    update, context, user, keyboard=inbound_keyboard, command=command
-                )
-
-            case _:  # Unknown screen
-                if update.callback_query is not None or screen is not None:
-                    raise PrivateChatException(PrivateChatError.UNRECOGNIZED_SCREEN)
+        if not await SCREENS.dispatch(
+            screen, update, context, command=command, user=user, inbound_keyboard=inbound_keyboard
+        ):  # Unknown screen
+            if update.callback_query is not None or screen is not None:
+                raise PrivateChatException(PrivateChatError.UNRECOGNIZED_SCREEN)
 
         user.last_system_interaction_date = datetime.now()
         await send_system_update_message(update, context, user)
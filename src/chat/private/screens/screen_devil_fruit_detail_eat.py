@@ -24,6 +24,7 @@ from src.service.devil_fruit_service import (
 )
 from src.service.message_service import full_message_send, get_yes_no_keyboard
 from src.utils.math_utils import get_random_win
+from src.utils.request_cache_utils import invalidate_request_facts
 
 
 class DevilFruitEatReservedKeys(StrEnum):
@@ -108,6 +109,7 @@ async def manage(
         devil_fruit.expiration_date = None
 
     devil_fruit.save()
+    invalidate_request_facts()
 
     # Delete all pending trades
     DevilFruitTrade.delete_pending_trades(devil_fruit)
@@ -8,7 +8,6 @@ from src.chat.common.screens.screen_game_gol import (
     run_game as run_game_gol,
     validate_answer as validate_answer_gol,
 )
-from src.chat.common.screens.screen_game_manage import restart_hint_thread_if_down
 from src.chat.common.screens.screen_game_pr import (
     run_game as run_game_pr,
     validate_answer as validate_answer_pr,
@@ -112,6 +111,3 @@ async def manage(
             await validate_answer_pr(update, context, game, user)
         case _:
             await guess_game_validate_answer(update, context, game, user)
-
-    # Try restarting the run game thread if it's down
-    context.application.create_task(restart_hint_thread_if_down(context, game, user))
@@ -0,0 +1,73 @@
+from typing import Any, Awaitable, Callable
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from src.model.enums.Screen import Screen
+
+
+class ScreenRegistry:
+    """
+    Maps each screen to the function that manages it, so dispatching costs the same no matter how
+    many screens there are
+    """
+
+    def __init__(self, name: str, arg_names: tuple[str, ...]):
+        """
+        Constructor
+        :param name: The name of the registry
+        :param arg_names: The names of the arguments that can be passed to the managers, other
+        than the update and the context
+        """
+        self.name = name
+        self.arg_names = arg_names
+        self.managers: dict[Screen, tuple[Callable[..., Awaitable[None]], tuple[str, ...]]] = {}
+
+    def register(
+        self, screen: Screen, manager: Callable[..., Awaitable[None]], *arg_names: str
+    ) -> None:
+        """
+        Register the manager of a screen
+        :param screen: The screen
+        :param manager: The manager, called with the update, the context and the given arguments
+        :param arg_names: The names of the arguments to pass after the update and the context,
+        in order
+        :return: None
+        """
+
+        if screen in self.managers:
+            raise ValueError(f"Screen {screen} already registered in {self.name} screens")
+
+        for arg_name in arg_names:
+            if arg_name not in self.arg_names:
+                raise ValueError(f"Unknown argument {arg_name} for {self.name} screen {screen}")
+
+        self.managers[screen] = (manager, arg_names)
+
+    def is_registered(self, screen: Screen) -> bool:
+        """
+        Check if a screen has a manager
+        :param screen: The screen
+        :return: True if the screen has a manager
+        """
+
+        return screen in self.managers
+
+    async def dispatch(
+        self, screen: Screen, update: Update, context: ContextTypes.DEFAULT_TYPE, **args: Any
+    ) -> bool:
+        """
+        Call the manager of a screen
+        :param screen: The screen
+        :param update: Telegram update
+        :param context: Telegram context
+        :param args: The arguments that can be passed to the manager
+        :return: False if the screen has no manager
+        """
+
+        if screen not in self.managers:
+            return False
+
+        manager, arg_names = self.managers[screen]
+        await manager(update, context, *(args[arg_name] for arg_name in arg_names))
+        return True
@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from peewee import *
+from peewee import Expression
 
 from resources.Database import Database
 
@@ -19,3 +20,74 @@ class BaseModel(Model):
     class Meta:
         database = db_obj.get_db()
         only_save_dirty = True
+
+    @classmethod
+    def create_missing_indexes(cls) -> None:
+        """
+        Create the indexes of the model that are missing in the database, since create_table
+        skips them if the table already exists
+        :return: None
+        """
+
+        database = cls._meta.database
+        existing_names = {index.name for index in database.get_indexes(cls._meta.table_name)}
+        for index in cls._meta.fields_to_index():
+            # Checked by name since MySQL doesn't support CREATE INDEX IF NOT EXISTS
+            if index._name not in existing_names:
+                database.execute(cls._schema._create_index(index, safe=False))
+
+    @classmethod
+    def from_data(cls, data: dict) -> "BaseModel":
+        """
+        Create an instance from the field values of a row, as if selected, so that only the fields
+        changed afterward are saved
+        :param data: Field name -> value, as in __data__ of a selected instance
+        :return: The instance
+        """
+
+        instance = cls(__no_default__=True, **data)
+        instance._dirty.clear()
+        return instance
+
+    def save_increments(self, condition: Expression = None, **amounts: int) -> bool:
+        """
+        Save fields that were changed by the given amounts, adding the amounts in the database
+        instead of writing the values, so changes made at the same time by others are not lost.
+        The fields of the instance must already include the amounts, and are not saved again by
+        a later save()
+        :param condition: Extra condition the row must satisfy, for example a minimum balance
+        :param amounts: Field name -> amount added
+        :return: False if the row didn't satisfy the condition, so nothing was saved
+        """
+
+        fields = self._meta.fields
+        update = {fields[name]: fields[name] + amount for name, amount in amounts.items()}
+        if len(update) > 0:
+            query = self.update(update).where(self._meta.primary_key == self.get_id())
+            if condition is not None:
+                query = query.where(condition)
+
+            if query.execute() == 0:
+                return False
+
+        for name in amounts:
+            self._dirty.discard(name)
+
+        return True
+
+    def increment(self, condition: Expression = None, **amounts: int) -> bool:
+        """
+        Add the given amounts to fields, both in the database, without reading them first, and in
+        the instance
+        :param condition: Extra condition the row must satisfy, for example a minimum balance
+        :param amounts: Field name -> amount to add
+        :return: False if the row didn't satisfy the condition, so nothing was changed
+        """
+
+        if not self.save_increments(condition, **amounts):
+            return False
+
+        for name, amount in amounts.items():
+            self.__data__[name] = getattr(self, name) + amount
+
+        return True
@@ -70,15 +70,19 @@ class BountyLoan(BaseModel):
         # Subtract from borrower's bounty
         # noinspection PyTypeChecker
         await add_or_remove_bounty(
-            self.borrower, amount, add=False, update=update, raise_error_if_negative_bounty=False
+            self.borrower,
+            amount,
+            add=False,
+            update=update,
+            should_save=True,
+            raise_error_if_negative_bounty=False,
         )
 
         # Add to loaner's bounty
         # noinspection PyTypeChecker
-        await add_or_remove_bounty(self.loaner, amount, check_for_loan=False, update=update)
-
-        self.borrower.save()
-        self.loaner.save()
+        await add_or_remove_bounty(
+            self.loaner, amount, check_for_loan=False, update=update, should_save=True
+        )
 
         # If N days since expiration and at least double the amount repaid, set forgiven
         if (
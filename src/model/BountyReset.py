@@ -0,0 +1,43 @@
+import datetime
+
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+from src.model.enums.BountyResetPhase import BountyResetPhase
+
+
+class BountyReset(BaseModel):
+    """
+    BountyReset class, the progress of a bounty reset so it can be resumed if interrupted
+    """
+
+    phase: int | SmallIntegerField = SmallIntegerField(default=BountyResetPhase.STARTED)
+    end_date: datetime.datetime | DateTimeField = DateTimeField(null=True)
+
+    class Meta:
+        db_table = "bounty_reset"
+
+    @staticmethod
+    def get_unfinished() -> "BountyReset | None":
+        """
+        Get the bounty reset that was started but not completed
+        :return: The bounty reset, None if there is none
+        """
+
+        return (
+            BountyReset.select()
+            .where(BountyReset.end_date.is_null())
+            .order_by(BountyReset.id.desc())
+            .get_or_none()
+        )
+
+    def get_phase(self) -> BountyResetPhase:
+        """
+        Get the last completed phase
+        :return: The phase
+        """
+
+        return BountyResetPhase(self.phase)
+
+
+BountyReset.create_table()
@@ -10,6 +10,7 @@ from src.model.enums.crew.CrewChestSpendingReason import CrewChestSpendingReason
 from src.model.enums.crew.CrewLevelUpgradeType import CrewLevelUpgradeType
 from src.model.enums.crew.CrewRole import CrewRole
 from src.model.enums.devil_fruit.DevilFruitAbilityType import DevilFruitAbilityType
+from src.utils.request_cache_utils import get_request_fact
 
 
 class Crew(BaseModel):
@@ -221,8 +222,14 @@ class Crew(BaseModel):
 
         from src.model.CrewAbility import CrewAbility
 
-        return self.crew_abilities.select().where(
-            CrewAbility.expiration_date > datetime.datetime.now()
+        return get_request_fact(
+            "crew_active_abilities",
+            self.id,
+            lambda: list(
+                self.crew_abilities.select().where(
+                    CrewAbility.expiration_date > datetime.datetime.now()
+                )
+            ),
         )
 
     def get_active_abilities_types(self) -> list[DevilFruitAbilityType]:
@@ -242,12 +249,11 @@ class Crew(BaseModel):
         :return: The crew active ability
         """
 
-        from src.model.CrewAbility import CrewAbility
-
-        return self.crew_abilities.select().where(
-            (CrewAbility.expiration_date > datetime.datetime.now())
-            & (CrewAbility.ability_type == ability_type.value)
-        )
+        return [
+            crew_ability
+            for crew_ability in self.get_active_abilities()
+            if crew_ability.ability_type == ability_type.value
+        ]
 
     def get_next_level_upgrade_type(self) -> CrewLevelUpgradeType:
         """
@@ -310,7 +316,9 @@ class Crew(BaseModel):
         case_stmt = Case(None, conditions, Crew.level / 2)
         Crew.update(level=case_stmt).execute()
 
-        # Reset max allowed members and abilities
+        # Reset max allowed members and abilities from the new level. In its own update, since
+        # peewee orders the assignments by field declaration and MySQL evaluates them with the
+        # values assigned before, so the order can't be relied on
         Crew.update(
             max_members=(Env.CREW_MAX_MEMBERS.get_int() + fn.ROUND((Crew.level - 1) / 2)),
             max_abilities=(Env.CREW_MAX_ABILITIES.get_int() + fn.FLOOR((Crew.level - 1) / 2)),
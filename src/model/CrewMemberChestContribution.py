@@ -19,6 +19,42 @@ class CrewMemberChestContribution(BaseModel):
 
     class Meta:
         db_table = "crew_member_chest_contribution"
+        # One contribution per member, so the amounts can be added with a single upsert
+        indexes = ((("crew", "user"), True),)
+
+    @staticmethod
+    def merge_duplicates() -> None:
+        """
+        Merge the contributions of the same member saved more than once, before the unique index
+        could prevent it, else the index can't be created
+        :return: None
+        """
+
+        duplicates = (
+            CrewMemberChestContribution.select(
+                CrewMemberChestContribution.crew,
+                CrewMemberChestContribution.user,
+                fn.MIN(CrewMemberChestContribution.id),
+                fn.SUM(CrewMemberChestContribution.amount),
+                fn.MAX(CrewMemberChestContribution.last_contribution_date),
+            )
+            .group_by(CrewMemberChestContribution.crew, CrewMemberChestContribution.user)
+            .having(fn.COUNT(CrewMemberChestContribution.id) > 1)
+            .tuples()
+        )
+
+        for crew_id, user_id, kept_id, amount, last_contribution_date in list(duplicates):
+            with CrewMemberChestContribution._meta.database.atomic():
+                CrewMemberChestContribution.update(
+                    amount=amount, last_contribution_date=last_contribution_date
+                ).where(CrewMemberChestContribution.id == kept_id).execute()
+                CrewMemberChestContribution.delete().where(
+                    (CrewMemberChestContribution.crew == crew_id)
+                    & (CrewMemberChestContribution.user == user_id)
+                    & (CrewMemberChestContribution.id != kept_id)
+                ).execute()
 
 
 CrewMemberChestContribution.create_table()
+CrewMemberChestContribution.merge_duplicates()
+CrewMemberChestContribution.create_missing_indexes()
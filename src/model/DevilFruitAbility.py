@@ -7,6 +7,7 @@ from src.model.BaseModel import BaseModel
 from src.model.DevilFruit import DevilFruit
 from src.model.enums.devil_fruit.DevilFruitAbilityType import DevilFruitAbilityType
 from src.model.enums.devil_fruit.DevilFruitStatus import DevilFruitStatus
+from src.utils.request_cache_utils import get_request_fact
 
 
 class DevilFruitAbility(BaseModel):
@@ -36,17 +37,35 @@ class DevilFruitAbility(BaseModel):
         :return: The ability, if any
         """
 
-        return (
-            DevilFruitAbility.select()
-            .join(DevilFruit)
-            .where(
-                (DevilFruit.owner == user)
-                & (DevilFruit.is_defective == False)
-                & (DevilFruit.status == DevilFruitStatus.EATEN)
-                & (DevilFruitAbility.ability_type == ability_type)
-            )
-            .get_or_none()
-        )
+        return DevilFruitAbility.get_user_abilities(user).get(ability_type)
+
+    @staticmethod
+    def get_user_abilities(user: User) -> dict[int, "DevilFruitAbility"]:
+        """
+        Get the abilities of the non-defective Devil Fruits eaten by the user, loaded once per
+        update
+
+        :param user: The user
+        :return: The abilities by ability type
+        """
+
+        def load() -> dict[int, "DevilFruitAbility"]:
+            abilities: dict[int, DevilFruitAbility] = {}
+            for ability in (
+                DevilFruitAbility.select()
+                .join(DevilFruit)
+                .where(
+                    (DevilFruit.owner == user)
+                    & (DevilFruit.is_defective == False)
+                    & (DevilFruit.status == DevilFruitStatus.EATEN)
+                )
+                .order_by(DevilFruitAbility.id)
+            ):
+                abilities.setdefault(ability.ability_type, ability)
+
+            return abilities
+
+        return get_request_fact("devil_fruit_abilities", user.id, load)
 
 
 DevilFruitAbility.create_table()
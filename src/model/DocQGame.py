@@ -29,6 +29,7 @@ class DocQGame(BaseModel):
 
     class Meta:
         db_table = "doc_q_game"
+        indexes = ((("user", "date"), False),)
 
     @staticmethod
     def get_total_win_or_loss(user: User, status: GameStatus) -> int:
@@ -96,3 +97,4 @@ class DocQGame(BaseModel):
 
 
 DocQGame.create_table()
+DocQGame.create_missing_indexes()
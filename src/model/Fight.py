@@ -51,6 +51,7 @@ class Fight(BaseModel):
 
     class Meta:
         db_table = "fight"
+        indexes = ((("challenger", "date"), False), (("opponent", "date"), False))
 
     def get_win_probability(self, user: User) -> float:
         """
@@ -65,105 +66,6 @@ class Fight(BaseModel):
         else:
             return 100 - self.win_probability
 
-    @staticmethod
-    def get_total_win_or_loss(user: User, status: GameStatus) -> int:
-        """
-        Get the total amount of wins or losses a user has
-        param user: The user
-        param status: The status (won or lost)
-        return: The total amount of wins or losses
-        """
-
-        return (
-            Fight().select().where((Fight.challenger == user) & (Fight.status == status)).count()
-            + Fight()
-            .select()
-            .where((Fight.opponent == user) & (Fight.status == status.get_opposite_status()))
-            .count()
-        )
-
-    @staticmethod
-    def get_total_belly_won_or_lost(user: User, status: GameStatus) -> int:
-        """
-        Get the total amount of belly a user has won or lost
-        param user: The user
-        param status: The status (won or lost)
-        return: The total amount of belly
-        """
-
-        return (
-            Fight.select(fn.SUM(Fight.belly)).where(
-                (Fight.challenger == user) & (Fight.status == status)
-            )
-        ).scalar() + (
-            Fight.select(fn.SUM(Fight.belly)).where(
-                (Fight.opponent == user) & (Fight.status == status.get_opposite_status())
-            )
-        ).scalar()
-
-    @staticmethod
-    def get_max_won_or_lost(user: User, status: GameStatus) -> "Fight":
-        """
-        Get the fight with the max belly won or lost
-        param user: The user
-        param status: The status (won or lost)
-        return: The fight
-        """
-
-        # Max fight as challenger
-        max_fight_as_challenger: Fight = (
-            Fight()
-            .select()
-            .where((Fight.challenger == user) & (Fight.status == status))
-            .order_by(Fight.belly.desc())
-            .first()
-        )
-
-        # Max fight as opponent
-        max_fight_as_opponent: Fight = (
-            Fight()
-            .select()
-            .where((Fight.opponent == user) & (Fight.status == status.get_opposite_status()))
-            .order_by(Fight.belly.desc())
-            .first()
-        )
-
-        # The max fight
-        return max(max_fight_as_challenger, max_fight_as_opponent, key=lambda f: f.belly)
-
-    @staticmethod
-    def get_most_fought_user(user: User) -> (User, int):
-        """
-        Get the most fought user and the amount of fights
-        param user: The user
-        return: The most fought user and the amount of fights
-        """
-
-        most_fought_user_as_challenger = (
-            Fight()
-            .select(Fight.opponent, fn.COUNT(Fight.opponent).alias("count"))
-            .where(Fight.challenger == user)
-            .group_by(Fight.opponent)
-            .order_by(SQL("count").desc())
-            .first()
-        )
-        amount_as_challenger = most_fought_user_as_challenger.count
-
-        most_fought_user_as_opponent = (
-            Fight()
-            .select(Fight.challenger, fn.COUNT(Fight.challenger).alias("count"))
-            .where(Fight.opponent == user)
-            .group_by(Fight.challenger)
-            .order_by(SQL("count").desc())
-            .first()
-        )
-        amount_as_opponent = most_fought_user_as_opponent.count
-
-        if amount_as_opponent > amount_as_challenger:
-            return most_fought_user_as_opponent.challenger, amount_as_opponent
-
-        return most_fought_user_as_challenger.opponent, amount_as_challenger
-
     def get_opponent(self, user: User) -> User:
         """
         Get the other opponent
@@ -232,3 +134,4 @@ class Fight(BaseModel):
 
 
 Fight.create_table()
+Fight.create_missing_indexes()
@@ -0,0 +1,51 @@
+import datetime
+import json
+
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+from src.model.Game import Game
+from src.model.User import User
+from src.model.enums.GameScheduledEventType import GameScheduledEventType
+
+
+class GameScheduledEvent(BaseModel):
+    """
+    GameScheduledEvent class, a game action to run at a later time, kept so it survives restarts
+    """
+
+    game: Game | ForeignKeyField = ForeignKeyField(
+        Game, backref="game_scheduled_events", on_delete="CASCADE", on_update="CASCADE"
+    )
+    user: User | ForeignKeyField = ForeignKeyField(
+        User, backref="game_scheduled_events", on_delete="CASCADE", on_update="CASCADE"
+    )
+    type: GameScheduledEventType | SmallIntegerField = SmallIntegerField()
+    due_date: datetime.datetime | DateTimeField = DateTimeField(index=True)
+    data: str | TextField = TextField(null=True)
+    # Failed runs, to wait longer before each retry
+    attempts: int | IntegerField = IntegerField(default=0)
+
+    class Meta:
+        db_table = "game_scheduled_event"
+        indexes = ((("game", "user", "type"), True),)
+
+    def get_type(self) -> GameScheduledEventType:
+        """
+        Get the type of the event
+        :return: The type
+        """
+
+        return GameScheduledEventType(self.type)
+
+    def get_data(self) -> dict:
+        """
+        Get the data the event needs to run
+        :return: The data
+        """
+
+        return json.loads(self.data) if self.data is not None else {}
+
+
+GameScheduledEvent.create_table()
+GameScheduledEvent.create_missing_indexes()
@@ -3,6 +3,7 @@ import datetime
 from peewee import *
 
 from src.model.BaseModel import BaseModel
+from src.model.Group import Group
 from src.model.GroupChat import GroupChat
 
 
@@ -15,10 +16,58 @@ class GroupChatAutoDelete(BaseModel):
         GroupChat, backref="auto_delete", on_delete="CASCADE"
     )
     message_id: int | IntegerField = IntegerField()
-    delete_date: datetime.datetime | DateTimeField = DateTimeField()
+    delete_date: datetime.datetime | DateTimeField = DateTimeField(index=True)
 
     class Meta:
         db_table = "group_chat_auto_delete"
 
+    @staticmethod
+    def get_due(now: datetime.datetime, limit: int) -> list["GroupChatAutoDelete"]:
+        """
+        Get the messages to delete, with their group chat and group
+        :param now: The current date
+        :param limit: The maximum number of messages
+        :return: The messages to delete, the ones that should have been deleted first at the top
+        """
+
+        return list(
+            GroupChatAutoDelete.select(GroupChatAutoDelete, GroupChat, Group)
+            .join(GroupChat)
+            .join(Group)
+            .where(GroupChatAutoDelete.delete_date < now)
+            .order_by(GroupChatAutoDelete.delete_date)
+            .limit(limit)
+        )
+
+    @staticmethod
+    def get_backlog(now: datetime.datetime) -> tuple[int, datetime.datetime | None]:
+        """
+        Get how many messages should have already been deleted
+        :param now: The current date
+        :return: The number of messages and the delete date of the oldest one
+        """
+
+        return (
+            GroupChatAutoDelete.select(
+                fn.COUNT(GroupChatAutoDelete.id), fn.MIN(GroupChatAutoDelete.delete_date)
+            )
+            .where(GroupChatAutoDelete.delete_date < now)
+            .scalar(as_tuple=True)
+        )
+
+    @staticmethod
+    def delete_by_ids(ids: list[int]) -> None:
+        """
+        Delete the given rows
+        :param ids: The ids
+        :return: None
+        """
+
+        if len(ids) == 0:
+            return
+
+        GroupChatAutoDelete.delete().where(GroupChatAutoDelete.id.in_(ids)).execute()
+
 
 GroupChatAutoDelete.create_table()
+GroupChatAutoDelete.create_missing_indexes()
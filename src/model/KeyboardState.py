@@ -0,0 +1,23 @@
+import datetime
+
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+
+
+class KeyboardState(BaseModel):
+    """
+    KeyboardState class, the data of a keyboard too long to be sent, referenced by its key
+    """
+
+    # Hash of the data, so the same keyboard is saved only once
+    state_key: str | CharField = CharField(max_length=16, unique=True)
+    data: str | TextField = TextField()
+    expiry_date: datetime.datetime | DateTimeField = DateTimeField(index=True)
+
+    class Meta:
+        db_table = "keyboard_state"
+
+
+KeyboardState.create_table()
+KeyboardState.create_missing_indexes()
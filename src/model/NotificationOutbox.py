@@ -0,0 +1,95 @@
+import datetime
+import hashlib
+
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+from src.model.User import User
+from src.model.pojo.NotificationMessage import NotificationMessage
+
+
+class NotificationOutbox(BaseModel):
+    """
+    NotificationOutbox class, a notification waiting to be sent
+    """
+
+    user: User | ForeignKeyField = ForeignKeyField(
+        User, backref="notification_outbox_users", on_delete="CASCADE", on_update="CASCADE"
+    )
+    type: int | SmallIntegerField = SmallIntegerField()
+    # The notification as json, see NotificationMessage.get_json
+    message: str | TextField = TextField()
+    # The same notification is kept only once while waiting
+    dedupe_key: str | CharField = CharField(max_length=40, unique=True)
+    attempts: int | IntegerField = IntegerField(default=0)
+    next_attempt_date: datetime.datetime | DateTimeField = DateTimeField(
+        default=datetime.datetime.now, index=True
+    )
+
+    class Meta:
+        db_table = "notification_outbox"
+
+    @staticmethod
+    def get_row(user: User, notification_message: NotificationMessage) -> dict:
+        """
+        Get the row of a notification to insert
+        :param user: The user to send the notification to
+        :param notification_message: The notification
+        :return: The row
+        """
+
+        dedupe_key = hashlib.sha1(
+            f"{user.id}:{notification_message.type}:{notification_message.text}".encode()
+        ).hexdigest()
+
+        return {
+            NotificationOutbox.user: user,
+            NotificationOutbox.type: notification_message.type,
+            NotificationOutbox.message: notification_message.get_json(),
+            NotificationOutbox.dedupe_key: dedupe_key,
+        }
+
+    @staticmethod
+    def get_due(now: datetime.datetime, limit: int) -> list["NotificationOutbox"]:
+        """
+        Get the notifications to send, with their user
+        :param now: The current date
+        :param limit: The maximum number of notifications
+        :return: The notifications, in the order they should be sent
+        """
+
+        return list(
+            NotificationOutbox.select(NotificationOutbox, User)
+            .join(User)
+            .where(NotificationOutbox.next_attempt_date <= now)
+            .order_by(NotificationOutbox.id)
+            .limit(limit)
+        )
+
+    @staticmethod
+    def hold_back(user: User, from_id: int, next_attempt_date: datetime.datetime) -> None:
+        """
+        Delay the notifications of a user starting from one, so they are still sent in order
+        :param user: The user
+        :param from_id: The id of the first notification to delay
+        :param next_attempt_date: When the notifications can be sent
+        :return: None
+        """
+
+        NotificationOutbox.update(next_attempt_date=next_attempt_date).where(
+            (NotificationOutbox.user == user)
+            & (NotificationOutbox.id >= from_id)
+            & (NotificationOutbox.next_attempt_date < next_attempt_date)
+        ).execute()
+
+    def get_message(self) -> NotificationMessage:
+        """
+        Get the notification to send
+        :return: The notification
+        """
+
+        return NotificationMessage.from_json(self.message)
+
+
+NotificationOutbox.create_table()
+NotificationOutbox.create_missing_indexes()
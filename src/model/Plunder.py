@@ -51,6 +51,7 @@ class Plunder(BaseModel):
 
     class Meta:
         db_table = "plunder"
+        indexes = ((("challenger", "date"), False), (("opponent", "date"), False))
 
     def get_win_probability(self, user: User) -> float:
         """
@@ -65,125 +66,6 @@ class Plunder(BaseModel):
         else:
             return 100 - self.win_probability
 
-    @staticmethod
-    def get_total_win_or_loss(user: User, status: GameStatus) -> int:
-        """
-        Get the total amount of wins or losses a user has
-        param user: The user
-        param status: The status (won or lost)
-        return: The total amount of wins or losses
-        """
-
-        return (
-            Plunder()
-            .select()
-            .where((Plunder.challenger == user) & (Plunder.status == status))
-            .count()
-            + Plunder()
-            .select()
-            .where((Plunder.opponent == user) & (Plunder.status == status.get_opposite_status()))
-            .count()
-        )
-
-    @staticmethod
-    def get_total_belly_won_or_lost(user: User, status: GameStatus) -> int:
-        """
-        Get the total amount of belly a user has won or lost
-        param user: The user
-        param status: The status (won or lost)
-        return: The total amount of belly
-        """
-
-        return (
-            Plunder.select(fn.SUM(Plunder.belly)).where(
-                (Plunder.challenger == user) & (Plunder.status == status)
-            )
-        ).scalar() + (
-            Plunder.select(fn.SUM(Plunder.belly)).where(
-                (Plunder.opponent == user) & (Plunder.status == status.get_opposite_status())
-            )
-        ).scalar()
-
-    @staticmethod
-    def get_max_won_or_lost(user: User, status: GameStatus) -> "Plunder":
-        """
-        Get the plunder with the max belly won or lost
-        param user: The user
-        param status: The status (won or lost)
-        return: The plunder
-        """
-
-        # Max plunder as challenger
-        max_plunder_as_challenger: Plunder = (
-            Plunder()
-            .select()
-            .where((Plunder.challenger == user) & (Plunder.status == status))
-            .order_by(Plunder.belly.desc())
-            .first()
-        )
-
-        # Max plunder as opponent
-        max_plunder_as_opponent: Plunder = (
-            Plunder()
-            .select()
-            .where((Plunder.opponent == user) & (Plunder.status == status.get_opposite_status()))
-            .order_by(Plunder.belly.desc())
-            .first()
-        )
-
-        # The max plunder
-        return max(max_plunder_as_challenger, max_plunder_as_opponent, key=lambda f: f.belly)
-
-    @staticmethod
-    def get_most_plundered_user(user: User) -> (User, int):
-        """
-        Get the most plundered user and the amount of plunders
-        param user: The user
-        return: The most plundered user and the amount of plunders
-        """
-
-        most_plundered_user_as_challenger = (
-            Plunder()
-            .select(Plunder.opponent, fn.COUNT(Plunder.opponent).alias("count"))
-            .where(Plunder.challenger == user)
-            .group_by(Plunder.opponent)
-            .order_by(SQL("count").desc())
-            .first()
-        )
-        amount_as_challenger = most_plundered_user_as_challenger.count
-
-        most_plundered_user_as_opponent = (
-            Plunder()
-            .select(Plunder.challenger, fn.COUNT(Plunder.challenger).alias("count"))
-            .where(Plunder.opponent == user)
-            .group_by(Plunder.challenger)
-            .order_by(SQL("count").desc())
-            .first()
-        )
-        amount_as_opponent = most_plundered_user_as_opponent.count
-
-        if amount_as_opponent > amount_as_challenger:
-            return most_plundered_user_as_opponent.challenger, amount_as_opponent
-
-        return most_plundered_user_as_challenger.opponent, amount_as_challenger
-
-    @staticmethod
-    def get_max_sentence(user: User) -> "Plunder":
-        """
-        Get the plunder with the max sentence
-        param user: The user
-        return: The plunder
-        """
-
-        # Max plunder as challenger
-        return (
-            Plunder()
-            .select()
-            .where(((Plunder.challenger == user) & (Plunder.status == GameStatus.LOST)))
-            .order_by(Plunder.sentence_duration.desc())
-            .first()
-        )
-
     def get_opponent(self, user: User) -> User:
         """
         Get the other opponent
@@ -262,3 +144,4 @@ class Plunder(BaseModel):
 
 
 Plunder.create_table()
+Plunder.create_missing_indexes()
@@ -28,6 +28,7 @@ from src.utils.context_utils import (
     remove_context_data,
 )
 from src.utils.math_utils import get_cumulative_percentage_sum
+from src.utils.request_cache_utils import get_request_fact
 
 
 class User(BaseModel):
@@ -775,7 +776,9 @@ class User(BaseModel):
         :return: True if the user is a Legendary Pirate
         """
 
-        return self.legendary_pirates.count() > 0
+        return get_request_fact(
+            "is_legendary_pirate", self.id, lambda: self.legendary_pirates.count() > 0
+        )
 
     def is_warlord(self) -> bool:
         """
@@ -784,7 +787,11 @@ class User(BaseModel):
         """
         from src.model.Warlord import Warlord
 
-        return self.warlords.where(Warlord.end_date > datetime.datetime.now()).count() > 0
+        return get_request_fact(
+            "is_warlord",
+            self.id,
+            lambda: self.warlords.where(Warlord.end_date > datetime.datetime.now()).count() > 0,
+        )
 
     def get_mention_url(self) -> str:
         """
@@ -0,0 +1,159 @@
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+from src.model.BountyGift import BountyGift
+from src.model.Fight import Fight
+from src.model.Game import Game
+from src.model.Plunder import Plunder
+from src.model.User import User
+from src.model.game.GameType import GameType
+
+
+class UserStats(BaseModel):
+    """
+    UserStats class, the totals of a user's fights, plunders, games and bounty gifts, updated
+    when each one ends
+    """
+
+    user: User | ForeignKeyField = ForeignKeyField(
+        User, unique=True, backref="user_stats", on_delete="CASCADE", on_update="CASCADE"
+    )
+
+    # Fights
+    fight_wins: int | IntegerField = IntegerField(default=0)
+    fight_losses: int | IntegerField = IntegerField(default=0)
+    fight_belly_won: int | BigIntegerField = BigIntegerField(default=0)
+    fight_belly_lost: int | BigIntegerField = BigIntegerField(default=0)
+    fight_max_won: Fight | ForeignKeyField = ForeignKeyField(
+        Fight, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    fight_max_won_belly: int | BigIntegerField = BigIntegerField(null=True)
+    fight_max_lost: Fight | ForeignKeyField = ForeignKeyField(
+        Fight, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    fight_max_lost_belly: int | BigIntegerField = BigIntegerField(null=True)
+    fight_most_fought_user: User | ForeignKeyField = ForeignKeyField(
+        User, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    fight_most_fought_count: int | IntegerField = IntegerField(default=0)
+
+    # Plunders
+    plunder_wins: int | IntegerField = IntegerField(default=0)
+    plunder_losses: int | IntegerField = IntegerField(default=0)
+    plunder_belly_won: int | BigIntegerField = BigIntegerField(default=0)
+    plunder_belly_lost: int | BigIntegerField = BigIntegerField(default=0)
+    plunder_max_won: Plunder | ForeignKeyField = ForeignKeyField(
+        Plunder, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    plunder_max_won_belly: int | BigIntegerField = BigIntegerField(null=True)
+    plunder_max_lost: Plunder | ForeignKeyField = ForeignKeyField(
+        Plunder, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    plunder_max_lost_belly: int | BigIntegerField = BigIntegerField(null=True)
+    plunder_max_sentence: Plunder | ForeignKeyField = ForeignKeyField(
+        Plunder, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    plunder_max_sentence_duration: int | IntegerField = IntegerField(null=True)
+    plunder_most_plundered_user: User | ForeignKeyField = ForeignKeyField(
+        User, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    plunder_most_plundered_count: int | IntegerField = IntegerField(default=0)
+
+    # Games
+    game_wins: int | IntegerField = IntegerField(default=0)
+    game_losses: int | IntegerField = IntegerField(default=0)
+    game_draws: int | IntegerField = IntegerField(default=0)
+    game_belly_won: int | BigIntegerField = BigIntegerField(default=0)
+    game_belly_lost: int | BigIntegerField = BigIntegerField(default=0)
+    game_max_won: Game | ForeignKeyField = ForeignKeyField(
+        Game, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    game_max_won_wager: int | BigIntegerField = BigIntegerField(null=True)
+    game_max_lost: Game | ForeignKeyField = ForeignKeyField(
+        Game, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    game_max_lost_wager: int | BigIntegerField = BigIntegerField(null=True)
+    game_most_challenged_user: User | ForeignKeyField = ForeignKeyField(
+        User, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    game_most_challenged_count: int | IntegerField = IntegerField(default=0)
+    game_most_played_type: int | SmallIntegerField = SmallIntegerField(null=True)
+    game_most_played_count: int | IntegerField = IntegerField(default=0)
+
+    # Bounty gifts
+    bounty_gifts_sent: int | IntegerField = IntegerField(default=0)
+    bounty_gifts_received: int | IntegerField = IntegerField(default=0)
+    bounty_gift_belly_sent: int | BigIntegerField = BigIntegerField(default=0)
+    bounty_gift_belly_received: int | BigIntegerField = BigIntegerField(default=0)
+    bounty_gift_max_sent: BountyGift | ForeignKeyField = ForeignKeyField(
+        BountyGift, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    bounty_gift_max_sent_amount: int | BigIntegerField = BigIntegerField(null=True)
+    bounty_gift_max_received: BountyGift | ForeignKeyField = ForeignKeyField(
+        BountyGift, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    bounty_gift_max_received_amount: int | BigIntegerField = BigIntegerField(null=True)
+    bounty_gift_top_receiver: User | ForeignKeyField = ForeignKeyField(
+        User, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    bounty_gift_top_receiver_amount: int | BigIntegerField = BigIntegerField(default=0)
+    bounty_gift_top_sender: User | ForeignKeyField = ForeignKeyField(
+        User, null=True, backref="+", on_delete="SET NULL", on_update="CASCADE"
+    )
+    bounty_gift_top_sender_amount: int | BigIntegerField = BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "user_stats"
+
+    @staticmethod
+    def get_by_user(user: User) -> "UserStats | None":
+        """
+        Get the stats of a user
+        :param user: The user
+        :return: The stats, None if the user has none yet
+        """
+
+        return UserStats.get_or_none(UserStats.user == user)
+
+    def get_fight_total(self) -> int:
+        """
+        Get the total fights
+        :return: The total fights
+        """
+
+        return self.fight_wins + self.fight_losses
+
+    def get_plunder_total(self) -> int:
+        """
+        Get the total plunders
+        :return: The total plunders
+        """
+
+        return self.plunder_wins + self.plunder_losses
+
+    def get_game_total(self) -> int:
+        """
+        Get the total games with an outcome
+        :return: The total games
+        """
+
+        return self.game_wins + self.game_losses + self.game_draws
+
+    def get_game_most_played_type(self) -> GameType:
+        """
+        Get the most played game type
+        :return: The game type
+        """
+
+        return GameType(self.game_most_played_type)
+
+    def get_bounty_gift_total(self) -> int:
+        """
+        Get the total bounty gifts sent or received
+        :return: The total bounty gifts
+        """
+
+        return self.bounty_gifts_sent + self.bounty_gifts_received
+
+
+UserStats.create_table()
@@ -0,0 +1,26 @@
+from peewee import *
+
+from src.model.BaseModel import BaseModel
+from src.model.User import User
+from src.model.enums.UserStatsCounterType import UserStatsCounterType
+
+
+class UserStatsCounter(BaseModel):
+    """
+    UserStatsCounter class, a user's total by user or game type, to find the top one of the stats
+    """
+
+    user: User | ForeignKeyField = ForeignKeyField(
+        User, backref="user_stats_counters", on_delete="CASCADE", on_update="CASCADE"
+    )
+    type: UserStatsCounterType | SmallIntegerField = SmallIntegerField()
+    key: int | BigIntegerField = BigIntegerField()
+    value: int | BigIntegerField = BigIntegerField(default=0)
+
+    class Meta:
+        db_table = "user_stats_counter"
+        indexes = ((("user", "type", "key"), True),)
+
+
+UserStatsCounter.create_table()
+UserStatsCounter.create_missing_indexes()
@@ -38,7 +38,7 @@ class Warlord(BaseModel):
         """
 
         return (
-            Warlord.select()
+            Warlord.select(Warlord, User)
             .join(User)
             .where(Warlord.end_date > datetime.datetime.now())
             .order_by(User.bounty.desc())
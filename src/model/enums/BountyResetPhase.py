@@ -0,0 +1,39 @@
+from enum import IntEnum
+
+
+class BountyResetPhase(IntEnum):
+    """
+    The phases of a bounty reset, in the order they are run
+    """
+
+    STARTED = 0
+    GAMES_ENDED = 1
+    BETS_REMOVED = 2
+    USERS_RESET = 3
+    PENDING_ACTIONS_DELETED = 4
+    CREWS_RESET = 5
+    INACTIVE_CREWS_DISBANDED = 6
+
+    def is_repeatable(self) -> bool:
+        """
+        Check if the phase can be run again with the same result, so it doesn't need to be in the
+        same transaction as its checkpoint
+        :return: True if the phase can be run again
+        """
+
+        return self in (
+            BountyResetPhase.GAMES_ENDED,
+            BountyResetPhase.BETS_REMOVED,
+            BountyResetPhase.PENDING_ACTIONS_DELETED,
+            BountyResetPhase.INACTIVE_CREWS_DISBANDED,
+        )
+
+    def get_next(self) -> "BountyResetPhase | None":
+        """
+        Get the phase that follows this one
+        :return: The next phase, None if this is the last one
+        """
+
+        phases = list(BountyResetPhase)
+        index = phases.index(self)
+        return phases[index + 1] if index + 1 < len(phases) else None
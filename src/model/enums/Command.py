@@ -410,7 +410,7 @@ GRP_SETTINGS_FEATURES = Command(
     answer_callback=True,
     send_message_if_error=False,
 )
-COMMANDS.append(GRP_SETTINGS)
+COMMANDS.append(GRP_SETTINGS_FEATURES)
 
 GRP_DAILY_REWARD = Command(
     CommandName.DAILY_REWARD,
@@ -421,30 +421,57 @@ GRP_DAILY_REWARD = Command(
 COMMANDS.append(GRP_DAILY_REWARD)
 
 
+# (lowercase name, message source prefix) -> command, None prefix matches any message source
+COMMANDS_BY_NAME: dict[tuple[str, str | None], Command] = {}
+# Screen -> command, the first command of a screen wins when more share it
+COMMANDS_BY_SCREEN: dict[Screen, Command] = {}
+
+
+def index_commands() -> None:
+    """
+    Index the commands by name and by screen, raising an error if two commands with the same
+    name are available in the same message source
+    :return: None
+    """
+
+    COMMANDS_BY_NAME.clear()
+    COMMANDS_BY_SCREEN.clear()
+
+    for command in COMMANDS:
+        if command is None:
+            continue
+
+        name = command.name.lower()
+        source_key = (name, command.screen[0])
+        if source_key in COMMANDS_BY_NAME and command.name != CommandName.EMPTY:
+            raise ValueError(f"Duplicate command {name} for screen {command.screen}")
+
+        COMMANDS_BY_NAME.setdefault(source_key, command)
+        COMMANDS_BY_NAME.setdefault((name, None), command)
+        COMMANDS_BY_SCREEN.setdefault(command.screen, command)
+
+
 def get_by_name(name: str, message_source: MessageSource = MessageSource.ND):
     """
     Returns the Command object with the given name.
     """
-    for command in COMMANDS:
-        if command is not None and command.name.lower() == name.lower():
-            if message_source is not MessageSource.ND:
-                if command.screen[0] == message_source[0]:
-                    return command
-            else:
-                return command
 
-    raise ValueError("Command not found: {}".format(name))
+    source_prefix = message_source[0] if message_source is not MessageSource.ND else None
+    try:
+        return COMMANDS_BY_NAME[(name.lower(), source_prefix)]
+    except KeyError:
+        raise ValueError("Command not found: {}".format(name))
 
 
 def get_by_screen(screen: Screen):
     """
     Returns the Command object with the given screen.
     """
-    for command in COMMANDS:
-        if command is not None and command.screen is screen:
-            return command
 
-    raise ValueError("Command not found: {}".format(screen))
+    try:
+        return COMMANDS_BY_SCREEN[screen]
+    except KeyError:
+        raise ValueError("Command not found: {}".format(screen))
 
 
 def get_other_region_command_name(current_location_level: int) -> CommandName:
@@ -460,3 +487,6 @@ def get_other_region_command_name(current_location_level: int) -> CommandName:
         return CommandName.PARADISE
 
     return CommandName.NEW_WORLD
+
+
+index_commands()
@@ -0,0 +1,12 @@
+from enum import IntEnum
+
+
+class GameScheduledEventType(IntEnum):
+    """
+    The game actions that are run at a later time
+    """
+
+    HINT = 1
+    COUNTDOWN_TO_START = 2
+    OPPONENT_TIMEOUT = 3
+    AUTO_MOVE = 4
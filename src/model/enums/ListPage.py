@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import StrEnum
+from typing import Hashable
 
 import constants as c
 from resources import phrases
@@ -127,6 +128,16 @@ class ListPage(ABC):
 
         pass
 
+    def set_object_from_item(self, item: BaseModel) -> None:
+        """
+        Set the object of the list from an item already loaded by get_items
+
+        :param item: The item
+        :return: None
+        """
+
+        self.set_object(item.id)
+
     @abstractmethod
     def get_items(self, page: int, limit: int = DEFAULT_LIMIT) -> list[BaseModel]:
         """
@@ -138,6 +149,41 @@ class ListPage(ABC):
         """
         pass
 
+    def is_keyset_paginated(self) -> bool:
+        """
+        If the pages can be got by cursor, starting from an item of the previous page instead of
+        skipping all the items before
+
+        :return: True if the list supports cursor pagination
+        """
+
+        return False
+
+    def get_items_by_cursor(
+        self, cursor_id: int, backward: bool = False, limit: int = DEFAULT_LIMIT
+    ) -> list[BaseModel] | None:
+        """
+        Get the items that come after an item in the list, or before it if backward
+
+        :param cursor_id: The id of the item
+        :param backward: If to get the items before the item
+        :param limit: The limit
+        :return: The items in list order, None if the item doesn't exist anymore or the list
+        doesn't support cursor pagination, so the page number is used instead
+        """
+
+        return None
+
+    def get_count_cache_key(self) -> Hashable | None:
+        """
+        Get what identifies the items count of the list, so it can be reused while browsing its
+        pages
+
+        :return: The key, None if the count should not be cached
+        """
+
+        return None
+
     def get_all_items(self):
         """
         Get all items for the log
@@ -165,7 +211,7 @@ class ListPage(ABC):
 
         active_filters = self.filter_list_active.copy()
         self.filter_list_active = []
-        count = len(self.get_all_items())
+        count = self.get_total_items_count()
         self.filter_list_active = active_filters
 
         return count
@@ -186,11 +232,11 @@ class ListPage(ABC):
 
         :return: The details
         """
-        if self.object not in self.get_all_items():
+        all_items = list(self.get_all_items())
+        if self.object not in all_items:
             raise UnauthorizedToViewItemException()
 
         # Set previous and next items
-        all_items = list(self.get_all_items())
         current_item_index = all_items.index(self.object)
         self.previous_object = (
             all_items[current_item_index - 1] if current_item_index > 0 else None
@@ -1,6 +1,8 @@
 from abc import abstractmethod
 from datetime import datetime
-from typing import Any
+from typing import Any, Hashable
+
+from peewee import ForeignKeyField
 
 import resources.phrases as phrases
 from src.model.BaseModel import BaseModel
@@ -15,8 +17,8 @@ from src.model.LeaderboardUser import LeaderboardUser
 from src.model.LegendaryPirate import LegendaryPirate
 from src.model.Plunder import Plunder
 from src.model.User import User
+from src.model.UserStats import UserStats
 from src.model.Warlord import Warlord
-from src.model.enums.BountyGiftRole import BountyGiftRole
 from src.model.enums.BountyGiftStatus import BountyGiftStatus
 from src.model.enums.Emoji import Emoji
 from src.model.enums.GameStatus import GameStatus, GAME_STATUS_DESCRIPTIONS
@@ -121,6 +123,166 @@ class Log(ListPage):
         """
         pass
 
+    def get_participant_fields(self) -> list[ForeignKeyField]:
+        """
+        Get the fields of the users taking part in the items, for logs of the items the user took
+        part in. Each field is queried on its own, so each query is served by the index on
+        (field, date), and the other participants are loaded by the same query
+
+        :return: The fields, empty if the log is not by participant
+        """
+
+        return []
+
+    def get_items_condition(self) -> Any:
+        """
+        Get the condition the items must satisfy other than the user taking part in them, for
+        logs by participant
+
+        :return: The condition
+        """
+
+        return self.get_active_filter_list_condition()
+
+    def get_participant_condition(self, field_index: int) -> Any:
+        """
+        Get the condition of the items the user took part in as a participant field, excluding
+        the ones already matched by a previous field, so an item where the user is more than one
+        participant is listed and counted once
+
+        :param field_index: The index of the field in get_participant_fields
+        :return: The condition
+        """
+
+        participant_fields = self.get_participant_fields()
+        condition = participant_fields[field_index] == self.user
+        for previous_field in participant_fields[:field_index]:
+            condition &= previous_field.is_null() | (previous_field != self.user)
+
+        return condition
+
+    def get_participant_items(
+        self, limit: int, offset: int = 0, cursor: BaseModel = None, backward: bool = False
+    ) -> list[BaseModel]:
+        """
+        Get the items the user took part in, newest first
+
+        :param limit: The limit
+        :param offset: How many items to skip
+        :param cursor: Only get the items after this one, None to start from the newest
+        :param backward: If to get the items before the cursor instead
+        :return: The items
+        """
+
+        model: type[BaseModel] = type(self.object)
+        participant_fields = self.get_participant_fields()
+        if backward:
+            order_by = (model.date.asc(), model.id.asc())
+        else:
+            order_by = (model.date.desc(), model.id.desc())
+
+        # Start from the cursor instead of skipping all the items before it
+        keyset_condition = True
+        if cursor is not None and backward:
+            keyset_condition = (model.date > cursor.date) | (
+                (model.date == cursor.date) & (model.id > cursor.id)
+            )
+        elif cursor is not None:
+            keyset_condition = (model.date < cursor.date) | (
+                (model.date == cursor.date) & (model.id < cursor.id)
+            )
+
+        items: list[BaseModel] = []
+        for field_index, field in enumerate(participant_fields):
+            # Load the other participants with the items
+            other_fields = [
+                other_field for other_field in participant_fields if other_field is not field
+            ]
+            other_users = [other_field.rel_model.alias() for other_field in other_fields]
+            query = model.select(model, *other_users)
+            for other_field, other_user in zip(other_fields, other_users):
+                query = query.join_from(model, other_user, on=other_field)
+
+            items.extend(
+                query.where(
+                    (self.get_participant_condition(field_index))
+                    & (self.get_items_condition())
+                    & keyset_condition
+                )
+                .order_by(*order_by)
+                .limit(offset + limit)
+            )
+
+        items.sort(key=lambda item: (item.date, item.id), reverse=not backward)
+        items = items[offset : offset + limit]
+        if backward:
+            items.reverse()
+
+        return items
+
+    def is_keyset_paginated(self) -> bool:
+        """
+        If the pages can be got by cursor, true for the logs by participant
+
+        :return: True if the log supports cursor pagination
+        """
+
+        return len(self.get_participant_fields()) > 0
+
+    def get_items_by_cursor(
+        self, cursor_id: int, backward: bool = False, limit: int = ListPage.DEFAULT_LIMIT
+    ) -> list[BaseModel] | None:
+        """
+        Get the items the user took part in that come after an item, or before it if backward
+
+        :param cursor_id: The id of the item
+        :param backward: If to get the items before the item
+        :param limit: The limit
+        :return: The items in list order, None if the item doesn't exist anymore
+        """
+
+        model: type[BaseModel] = type(self.object)
+        cursor = model.select(model.id, model.date).where(model.id == cursor_id).get_or_none()
+        if cursor is None:
+            return None
+
+        return self.get_participant_items(limit, cursor=cursor, backward=backward)
+
+    def get_total_items_count(self) -> int:
+        """
+        Get the total items count, for logs by participant summing the count of each participant
+        field without the items already counted by a previous one
+
+        :return: The total items count
+        """
+
+        if not self.is_keyset_paginated():
+            return super().get_total_items_count()
+
+        model: type[BaseModel] = type(self.object)
+        return sum(
+            model.select()
+            .where((self.get_participant_condition(field_index)) & (self.get_items_condition()))
+            .count()
+            for field_index in range(len(self.get_participant_fields()))
+        )
+
+    def get_count_cache_key(self) -> Hashable | None:
+        """
+        Get what identifies the items count of the log: its type, its user and the active filters
+
+        :return: The key
+        """
+
+        return (
+            self.type,
+            self.user.id,
+            tuple(
+                (list_filter.description, list_filter.value)
+                for list_filter in self.filter_list_active
+            ),
+        )
+
     @abstractmethod
     def get_item_text(self) -> str:
         """
@@ -217,22 +379,24 @@ class FightLog(Log):
         self.effective_status: GameStatus = GameStatus.ND
 
     def set_object(self, object_id: int) -> None:
-        self.object = Fight.get(Fight.id == object_id)
-        self.user_is_challenger = self.object.challenger == self.user
-        self.opponent = self.object.get_opponent(self.user)
+        self.set_object_from_item(Fight.get(Fight.id == object_id))
+
+    def set_object_from_item(self, item: Fight) -> None:
+        self.object = item
+        self.user_is_challenger = self.object.challenger_id == self.user.id
+        self.opponent = self.object.opponent if self.user_is_challenger else self.object.challenger
         self.legend = self.get_emoji_legend()
         self.effective_status = self.legend.get_game_status()
 
     def get_items(self, page, limit=ListPage.DEFAULT_LIMIT) -> list[Fight]:
-        return (
-            self.object.select()
-            .where(
-                ((Fight.challenger == self.user) | (Fight.opponent == self.user))
-                & (Fight.status.in_([GameStatus.WON, GameStatus.LOST]))
-                & (self.get_active_filter_list_condition())
-            )
-            .order_by(Fight.date.desc())
-            .paginate(page, limit)
+        return self.get_participant_items(limit, offset=(page - 1) * limit)
+
+    def get_participant_fields(self) -> list[ForeignKeyField]:
+        return [Fight.challenger, Fight.opponent]
+
+    def get_items_condition(self) -> Any:
+        return (Fight.status.in_([GameStatus.WON, GameStatus.LOST])) & (
+            self.get_active_filter_list_condition()
         )
 
     def get_item_text(self) -> str:
@@ -291,34 +455,26 @@ class FightLog(Log):
         return ot_text
 
     def get_stats_text(self) -> str:
-        total_fights = self.get_total_items_count()
-        total_wins = self.object.get_total_win_or_loss(self.user, GameStatus.WON)
-        total_wins_percentage = int(get_percentage_from_value(total_wins, total_fights))
-        total_losses = self.object.get_total_win_or_loss(self.user, GameStatus.LOST)
-        total_losses_percentage = int(get_percentage_from_value(total_losses, total_fights))
-        max_won_fight = self.object.get_max_won_or_lost(self.user, GameStatus.WON)
-        max_lost_fight = self.object.get_max_won_or_lost(self.user, GameStatus.LOST)
-        most_fought_user, most_fought_count = self.object.get_most_fought_user(self.user)
+        stats: UserStats = UserStats.get_by_user(self.user)
+        total_fights = stats.get_fight_total()
+        max_won_fight: Fight = stats.fight_max_won
+        max_lost_fight: Fight = stats.fight_max_lost
         return phrases.FIGHT_LOG_STATS_TEXT.format(
             total_fights,
-            total_wins,
-            total_wins_percentage,
-            total_losses,
-            total_losses_percentage,
-            get_belly_formatted(
-                self.object.get_total_belly_won_or_lost(self.user, GameStatus.WON)
-            ),
-            get_belly_formatted(
-                self.object.get_total_belly_won_or_lost(self.user, GameStatus.LOST)
-            ),
-            get_belly_formatted(max_won_fight.belly),
+            stats.fight_wins,
+            int(get_percentage_from_value(stats.fight_wins, total_fights)),
+            stats.fight_losses,
+            int(get_percentage_from_value(stats.fight_losses, total_fights)),
+            get_belly_formatted(stats.fight_belly_won),
+            get_belly_formatted(stats.fight_belly_lost),
+            get_belly_formatted(stats.fight_max_won_belly),
             max_won_fight.get_opponent(self.user).get_markdown_mention(),
             self.get_deeplink(max_won_fight.id),
-            get_belly_formatted(max_lost_fight.belly),
+            get_belly_formatted(stats.fight_max_lost_belly),
             max_lost_fight.get_opponent(self.user).get_markdown_mention(),
             self.get_deeplink(max_lost_fight.id),
-            most_fought_user.get_markdown_mention(),
-            most_fought_count,
+            stats.fight_most_fought_user.get_markdown_mention(),
+            stats.fight_most_fought_count,
         )
 
     def get_emoji_legend_list(self) -> list[EmojiLegend]:
@@ -377,19 +533,21 @@ class DocQGameLog(Log):
         self.object: DocQGame = DocQGame()
 
     def set_object(self, object_id: int) -> None:
-        self.object = DocQGame.get(DocQGame.id == object_id)
+        self.set_object_from_item(DocQGame.get(DocQGame.id == object_id))
+
+    def set_object_from_item(self, item: DocQGame) -> None:
+        self.object = item
         self.legend = self.get_emoji_legend()
 
     def get_items(self, page, limit=ListPage.DEFAULT_LIMIT) -> list[DocQGame]:
-        return (
-            self.object.select()
-            .where(
-                (DocQGame.user == self.user)
-                & (DocQGame.status.in_([GameStatus.WON, GameStatus.LOST]))
-                & (self.get_active_filter_list_condition())
-            )
-            .order_by(DocQGame.date.desc())
-            .paginate(page, limit)
+        return self.get_participant_items(limit, offset=(page - 1) * limit)
+
+    def get_participant_fields(self) -> list[ForeignKeyField]:
+        return [DocQGame.user]
+
+    def get_items_condition(self) -> Any:
+        return (DocQGame.status.in_([GameStatus.WON, GameStatus.LOST])) & (
+            self.get_active_filter_list_condition()
         )
 
     def get_item_text(self) -> str:
@@ -483,8 +641,11 @@ class GameLog(Log):
         self.effective_wager = None
 
     def set_object(self, object_id: int) -> None:
-        self.object = Game.get(Game.id == object_id)
-        self.user_is_challenger = self.object.challenger == self.user
+        self.set_object_from_item(Game.get(Game.id == object_id))
+
+    def set_object_from_item(self, item: Game) -> None:
+        self.object = item
+        self.user_is_challenger = self.object.challenger_id == self.user.id
         self.opponent = self.object.opponent if self.user_is_challenger else self.object.challenger
         self.legend = self.get_emoji_legend()
         self.effective_status = self.legend.get_game_status()
@@ -495,17 +656,17 @@ class GameLog(Log):
         )
 
     def get_items(self, page, limit=ListPage.DEFAULT_LIMIT) -> list[Game]:
+        return self.get_participant_items(limit, offset=(page - 1) * limit)
+
+    def get_participant_fields(self) -> list[ForeignKeyField]:
+        return [Game.challenger, Game.opponent]
+
+    def get_items_condition(self) -> Any:
         return (
-            self.object.select()
-            .where(
-                ((Game.challenger == self.user) | (Game.opponent == self.user))
-                & (Game.status.in_(GameStatus.get_finished() + [GameStatus.IN_PROGRESS]))
-                & (Game.opponent.is_null(False))
-                & (self.get_active_filter_list_condition())
-            )  # Exclude because they don't have a type
-            .order_by(Game.date.desc())
-            .paginate(page, limit)
-        )
+            (Game.status.in_(GameStatus.get_finished() + [GameStatus.IN_PROGRESS]))
+            & (Game.opponent.is_null(False))
+            & (self.get_active_filter_list_condition())
+        )  # Exclude because they don't have a type
 
     def get_item_text(self) -> str:
         return phrases.GAME_LOG_ITEM_TEXT.format(
@@ -554,44 +715,31 @@ class GameLog(Log):
         )
 
     def get_stats_text(self) -> str:
-        total_games = self.get_total_items_count()
-        total_wins = self.object.get_total_win_or_loss_or_draw(self.user, GameStatus.WON)
-        total_wins_percentage = int(get_percentage_from_value(total_wins, total_games))
-        total_losses = self.object.get_total_win_or_loss_or_draw(self.user, GameStatus.LOST)
-        total_losses_percentage = int(get_percentage_from_value(total_losses, total_games))
-        total_draws = self.object.get_total_win_or_loss_or_draw(self.user, GameStatus.DRAW)
-        total_draws_percentage = int(get_percentage_from_value(total_draws, total_games))
-        max_won_game = self.object.get_max_won_or_lost(self.user, GameStatus.WON)
-        max_lost_game = self.object.get_max_won_or_lost(self.user, GameStatus.LOST)
-        most_challenged_user, most_challenged_count = self.object.get_most_challenged_user(
-            self.user
-        )
-        most_played_game, most_played_count = self.object.get_most_played_game(self.user)
+        stats: UserStats = UserStats.get_by_user(self.user)
+        total_games = stats.get_game_total()
+        max_won_game: Game = stats.game_max_won
+        max_lost_game: Game = stats.game_max_lost
 
         return phrases.GAME_LOG_STATS_TEXT.format(
             total_games,
-            total_wins,
-            total_wins_percentage,
-            total_losses,
-            total_losses_percentage,
-            total_draws,
-            total_draws_percentage,
-            get_belly_formatted(
-                self.object.get_total_belly_won_or_lost(self.user, GameStatus.WON)
-            ),
-            get_belly_formatted(
-                self.object.get_total_belly_won_or_lost(self.user, GameStatus.LOST)
-            ),
-            get_belly_formatted(max_won_game.wager),
+            stats.game_wins,
+            int(get_percentage_from_value(stats.game_wins, total_games)),
+            stats.game_losses,
+            int(get_percentage_from_value(stats.game_losses, total_games)),
+            stats.game_draws,
+            int(get_percentage_from_value(stats.game_draws, total_games)),
+            get_belly_formatted(stats.game_belly_won),
+            get_belly_formatted(stats.game_belly_lost),
+            get_belly_formatted(stats.game_max_won_wager),
             max_won_game.get_name(),
             self.get_deeplink(max_won_game.id),
-            get_belly_formatted(max_lost_game.wager // 2),
+            get_belly_formatted(stats.game_max_lost_wager // 2),
             max_lost_game.get_name(),
             self.get_deeplink(max_lost_game.id),
-            most_challenged_user.get_markdown_mention(),
-            most_challenged_count,
-            most_played_game.get_name(),
-            most_played_count,
+            stats.game_most_challenged_user.get_markdown_mention(),
+            stats.game_most_challenged_count,
+            stats.get_game_most_played_type().get_name(),
+            stats.game_most_played_count,
         )
 
     def get_emoji_legend_list(self) -> list[EmojiLegend]:
@@ -651,20 +799,22 @@ class BountyGiftLog(Log):
         self.user_is_sender: bool = False
 
     def set_object(self, object_id: int) -> None:
-        self.object: BountyGift = BountyGift.get(BountyGift.id == object_id)
-        self.user_is_sender = self.object.sender == self.user
+        self.set_object_from_item(BountyGift.get(BountyGift.id == object_id))
+
+    def set_object_from_item(self, item: BountyGift) -> None:
+        self.object: BountyGift = item
+        self.user_is_sender = self.object.sender_id == self.user.id
         self.other_user = self.object.receiver if self.user_is_sender else self.object.sender
 
     def get_items(self, page, limit=ListPage.DEFAULT_LIMIT) -> list[BountyGift]:
-        return (
-            self.object.select()
-            .where(
-                ((BountyGift.sender == self.user) | (BountyGift.receiver == self.user))
-                & (BountyGift.status == BountyGiftStatus.CONFIRMED)
-                & (self.get_active_filter_list_condition())
-            )
-            .order_by(BountyGift.date.desc())
-            .paginate(page, limit)
+        return self.get_participant_items(limit, offset=(page - 1) * limit)
+
+    def get_participant_fields(self) -> list[ForeignKeyField]:
+        return [BountyGift.sender, BountyGift.receiver]
+
+    def get_items_condition(self) -> Any:
+        return (BountyGift.status == BountyGiftStatus.CONFIRMED) & (
+            self.get_active_filter_list_condition()
         )
 
     def get_item_text(self) -> str:
@@ -704,45 +854,24 @@ class BountyGiftLog(Log):
         )
 
     def get_stats_text(self) -> str:
-        highest_sent_gift = self.object.get_highest_belly_sent_or_received(
-            self.user, BountyGiftRole.SENDER
-        )
-        highest_sent_user, highest_sent_amount = (
-            highest_sent_gift.receiver,
-            highest_sent_gift.amount,
-        )
-        highest_received_gift = self.object.get_highest_belly_sent_or_received(
-            self.user, BountyGiftRole.RECEIVER
-        )
-        highest_received_user, highest_received_amount = (
-            highest_received_gift.sender,
-            highest_received_gift.amount,
-        )
-        most_sent_user, most_sent_amount = self.object.get_top_givers_or_receiver(
-            self.user, BountyGiftRole.SENDER
-        )
-        most_received_user, most_received_amount = self.object.get_top_givers_or_receiver(
-            self.user, BountyGiftRole.RECEIVER
-        )
+        stats: UserStats = UserStats.get_by_user(self.user)
+        highest_sent_gift: BountyGift = stats.bounty_gift_max_sent
+        highest_received_gift: BountyGift = stats.bounty_gift_max_received
 
         return phrases.BOUNTY_GIFT_LOG_STATS_TEXT.format(
-            self.get_total_items_count(),
-            get_belly_formatted(
-                self.object.get_total_belly_sent_or_received(self.user, BountyGiftRole.SENDER)
-            ),
-            get_belly_formatted(
-                self.object.get_total_belly_sent_or_received(self.user, BountyGiftRole.RECEIVER)
-            ),
-            get_belly_formatted(highest_sent_amount),
-            highest_sent_user.get_markdown_name(),
+            stats.get_bounty_gift_total(),
+            get_belly_formatted(stats.bounty_gift_belly_sent),
+            get_belly_formatted(stats.bounty_gift_belly_received),
+            get_belly_formatted(stats.bounty_gift_max_sent_amount),
+            highest_sent_gift.receiver.get_markdown_name(),
             self.get_deeplink(highest_sent_gift.id),
-            get_belly_formatted(highest_received_amount),
-            highest_received_user.get_markdown_name(),
+            get_belly_formatted(stats.bounty_gift_max_received_amount),
+            highest_received_gift.sender.get_markdown_name(),
             self.get_deeplink(highest_received_gift.id),
-            most_sent_user.get_markdown_mention(),
-            get_belly_formatted(most_sent_amount),
-            most_received_user.get_markdown_mention(),
-            get_belly_formatted(most_received_amount),
+            stats.bounty_gift_top_receiver.get_markdown_mention(),
+            get_belly_formatted(stats.bounty_gift_top_receiver_amount),
+            stats.bounty_gift_top_sender.get_markdown_mention(),
+            get_belly_formatted(stats.bounty_gift_top_sender_amount),
         )
 
     def get_emoji_legend_list(self) -> list[EmojiLegend]:
@@ -1171,9 +1300,12 @@ class PlunderLog(Log):
         self.effective_belly = None
 
     def set_object(self, object_id: int) -> None:
-        self.object: Plunder = Plunder.get(Plunder.id == object_id)
-        self.user_is_challenger = self.object.challenger == self.user
-        self.opponent = self.object.get_opponent(self.user)
+        self.set_object_from_item(Plunder.get(Plunder.id == object_id))
+
+    def set_object_from_item(self, item: Plunder) -> None:
+        self.object: Plunder = item
+        self.user_is_challenger = self.object.challenger_id == self.user.id
+        self.opponent = self.object.opponent if self.user_is_challenger else self.object.challenger
         self.legend = self.get_emoji_legend()
         self.effective_status = self.legend.get_game_status()
 
@@ -1183,15 +1315,14 @@ class PlunderLog(Log):
             self.effective_belly = self.object.belly
 
     def get_items(self, page, limit=ListPage.DEFAULT_LIMIT) -> list[Plunder]:
-        return (
-            self.object.select()
-            .where(
-                ((Plunder.challenger == self.user) | (Plunder.opponent == self.user))
-                & (Plunder.status.in_([GameStatus.WON, GameStatus.LOST]))
-                & (self.get_active_filter_list_condition())
-            )
-            .order_by(Plunder.date.desc())
-            .paginate(page, limit)
+        return self.get_participant_items(limit, offset=(page - 1) * limit)
+
+    def get_participant_fields(self) -> list[ForeignKeyField]:
+        return [Plunder.challenger, Plunder.opponent]
+
+    def get_items_condition(self) -> Any:
+        return (Plunder.status.in_([GameStatus.WON, GameStatus.LOST])) & (
+            self.get_active_filter_list_condition()
         )
 
     def get_item_text(self) -> str:
@@ -1272,37 +1403,28 @@ class PlunderLog(Log):
         return ot_text
 
     def get_stats_text(self) -> str:
-        total_plunders = self.get_total_items_count()
-        total_wins = self.object.get_total_win_or_loss(self.user, GameStatus.WON)
-        total_wins_percentage = int(get_percentage_from_value(total_wins, total_plunders))
-        total_losses = self.object.get_total_win_or_loss(self.user, GameStatus.LOST)
-        total_losses_percentage = int(get_percentage_from_value(total_losses, total_plunders))
-        max_won_plunder = self.object.get_max_won_or_lost(self.user, GameStatus.WON)
-        max_lost_plunder = self.object.get_max_won_or_lost(self.user, GameStatus.LOST)
-        most_plundered_user, most_plundered_count = self.object.get_most_plundered_user(self.user)
-        max_sentence = self.object.get_max_sentence(self.user)
+        stats: UserStats = UserStats.get_by_user(self.user)
+        total_plunders = stats.get_plunder_total()
+        max_won_plunder: Plunder = stats.plunder_max_won
+        max_lost_plunder: Plunder = stats.plunder_max_lost
         return phrases.PLUNDER_LOG_STATS_TEXT.format(
             total_plunders,
-            total_wins,
-            total_wins_percentage,
-            total_losses,
-            total_losses_percentage,
-            get_belly_formatted(
-                self.object.get_total_belly_won_or_lost(self.user, GameStatus.WON)
-            ),
-            get_belly_formatted(
-                self.object.get_total_belly_won_or_lost(self.user, GameStatus.LOST)
-            ),
-            get_belly_formatted(max_won_plunder.belly),
+            stats.plunder_wins,
+            int(get_percentage_from_value(stats.plunder_wins, total_plunders)),
+            stats.plunder_losses,
+            int(get_percentage_from_value(stats.plunder_losses, total_plunders)),
+            get_belly_formatted(stats.plunder_belly_won),
+            get_belly_formatted(stats.plunder_belly_lost),
+            get_belly_formatted(stats.plunder_max_won_belly),
             max_won_plunder.get_opponent(self.user).get_markdown_mention(),
             self.get_deeplink(max_won_plunder.id),
-            get_belly_formatted(max_lost_plunder.belly),
+            get_belly_formatted(stats.plunder_max_lost_belly),
             max_lost_plunder.get_opponent(self.user).get_markdown_mention(),
             self.get_deeplink(max_lost_plunder.id),
-            convert_hours_to_duration(self.object.sentence_duration, show_full=True),
-            self.get_deeplink(max_sentence.id),
-            most_plundered_user.get_markdown_mention(),
-            most_plundered_count,
+            convert_hours_to_duration(stats.plunder_max_sentence_duration, show_full=True),
+            self.get_deeplink(stats.plunder_max_sentence.id),
+            stats.plunder_most_plundered_user.get_markdown_mention(),
+            stats.plunder_most_plundered_count,
         )
 
     def get_emoji_legend_list(self) -> list[EmojiLegend]:
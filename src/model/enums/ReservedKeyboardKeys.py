@@ -16,7 +16,9 @@ class ReservedKeyboardKeys(StrEnum):
     FILTER = "s"
     NUMBER = "r"
     DIRECT_ITEM = "q"
-    CONTEXT = "ctx"
+    CURSOR = "p"
+    CONTEXT = "ctx"  # Deprecated, data of long keyboards saved in context
+    KEYBOARD_STATE = "ks"
 
     # Not unique
     DEFAULT_PRIMARY_KEY = "a"
@@ -196,3 +196,43 @@ FIGHT_PLUNDER_SCOUT_COUNT_DECREASE = Timer(
     Env.SHOULD_RUN_ON_STARTUP_FIGHT_PLUNDER_SCOUT_COUNT_DECREASE.get_bool(),
 )
 TIMERS.append(FIGHT_PLUNDER_SCOUT_COUNT_DECREASE)
+
+# Write the tracked user and group activity
+FLUSH_ACTIVITY = Timer(
+    "flush_activity",
+    Env.CRON_FLUSH_ACTIVITY.get(),
+    Env.ENABLE_TIMER_FLUSH_ACTIVITY.get_bool(),
+    Env.SHOULD_LOG_TIMER_FLUSH_ACTIVITY.get_bool(),
+    Env.SHOULD_RUN_ON_STARTUP_FLUSH_ACTIVITY.get_bool(),
+)
+TIMERS.append(FLUSH_ACTIVITY)
+
+# Remove expired context data and unload inactive users from memory
+CLEAN_CONTEXT_DATA = Timer(
+    "clean_context_data",
+    Env.CRON_CLEAN_CONTEXT_DATA.get(),
+    Env.ENABLE_TIMER_CLEAN_CONTEXT_DATA.get_bool(),
+    Env.SHOULD_LOG_TIMER_CLEAN_CONTEXT_DATA.get_bool(),
+    Env.SHOULD_RUN_ON_STARTUP_CLEAN_CONTEXT_DATA.get_bool(),
+)
+TIMERS.append(CLEAN_CONTEXT_DATA)
+
+# Delete the expired keyboard states
+CLEAN_KEYBOARD_STATES = Timer(
+    "clean_keyboard_states",
+    Env.CRON_CLEAN_KEYBOARD_STATES.get(),
+    Env.ENABLE_TIMER_CLEAN_KEYBOARD_STATES.get_bool(),
+    Env.SHOULD_LOG_TIMER_CLEAN_KEYBOARD_STATES.get_bool(),
+    Env.SHOULD_RUN_ON_STARTUP_CLEAN_KEYBOARD_STATES.get_bool(),
+)
+TIMERS.append(CLEAN_KEYBOARD_STATES)
+
+# Log a summary of the metrics
+LOG_METRICS = Timer(
+    "log_metrics",
+    Env.CRON_LOG_METRICS.get(),
+    Env.ENABLE_TIMER_LOG_METRICS.get_bool(),
+    Env.SHOULD_LOG_TIMER_LOG_METRICS.get_bool(),
+    Env.SHOULD_RUN_ON_STARTUP_LOG_METRICS.get_bool(),
+)
+TIMERS.append(LOG_METRICS)
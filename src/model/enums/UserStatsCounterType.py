@@ -0,0 +1,14 @@
+from enum import IntEnum
+
+
+class UserStatsCounterType(IntEnum):
+    """
+    What a user stats counter counts, by key
+    """
+
+    FIGHT_OPPONENT = 1  # Fights against a user
+    PLUNDER_OPPONENT = 2  # Plunders against a user
+    GAME_OPPONENT = 3  # Games against a user
+    GAME_TYPE = 4  # Games of a type
+    BOUNTY_GIFT_RECEIVER = 5  # Belly gifted to a user
+    BOUNTY_GIFT_SENDER = 6  # Belly received from a user
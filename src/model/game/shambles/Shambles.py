@@ -1,14 +1,16 @@
 import random
 import string
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
 
 import resources.Environment as Env
-from src.model.enums.AssetPath import AssetPath
 from src.model.game.GameBoard import GameBoard
 from src.model.game.GameDifficulty import GameDifficulty
 from src.model.wiki.Terminology import Terminology
-from src.utils.download_utils import generate_temp_file_path
+from src.service.image_render_service import (
+    get_shambles_grid_image,
+    get_shambles_grid_image_async,
+)
 
 
 class Shambles(GameBoard):
@@ -128,63 +130,24 @@ class Shambles(GameBoard):
     def set_grid_image(self, highlight_answer: bool = False):
         """
         Set the grid image
+        :param highlight_answer: Whether to highlight the letters of the answer
         :return: None
         """
 
-        # Open the crossword puzzle template image
-        with Image.open(AssetPath.GAME_BACKGROUND) as image:
-            # Get the box size of the image
-            left, upper, right, lower = image.getbbox()
-            width = right - left
-            height = lower - upper
-
-            # Calculate the width and height of each cell in the grid
-            cell_width = width / self.grid_size
-            cell_height = height / self.grid_size
-
-            # Get the font size based on the cell size, 8/10 of the cell width
-            font_size = int(cell_width * 8 / 10)
-            stroke_width = int(font_size / 25)
-
-            # Get the font
-            font = ImageFont.truetype(AssetPath.FONT_BLOGGER_SANS_BOLD, font_size)
-
-            # Write the word in the grid on the image, with an outline for each letter
-            for y in range(self.grid_size):
-                for x in range(self.grid_size):
-                    letter = self.grid[y][x]
-
-                    if letter != " ":
-                        # Calculate the position of the letter on the image
-                        x_pos = x * cell_width + cell_width / 2
-                        y_pos = y * cell_height + cell_height / 2
-
-                        # Get the width and height of the letter
-                        letter_width, letter_height = font.getlength(letter), font_size
-
-                        # Calculate the position of the letter on the image
-                        x_pos -= letter_width / 2
-                        y_pos -= letter_height / 2
-
-                        fill_color = "white"
-                        if highlight_answer and [x, y] in self.word_coordinates:
-                            fill_color = "#39FF14"  # Neon green
-
-                        # Draw the letter on the image
-                        draw = ImageDraw.Draw(image)
-                        draw.text(
-                            (x_pos, y_pos),
-                            letter,
-                            font=font,
-                            fill=fill_color,
-                            stroke_width=stroke_width,
-                            stroke_fill="black",
-                        )
-
-            # Save the image
-            save_path = generate_temp_file_path("jpg")
-            image.save(save_path)
-            self.image_path = save_path
+        self.image_path = get_shambles_grid_image(
+            self.grid, self.word_coordinates if highlight_answer else []
+        )
+
+    async def set_grid_image_async(self, highlight_answer: bool = False):
+        """
+        Set the grid image, rendering it outside the event loop
+        :param highlight_answer: Whether to highlight the letters of the answer
+        :return: None
+        """
+
+        self.image_path = await get_shambles_grid_image_async(
+            self.grid, self.word_coordinates if highlight_answer else []
+        )
 
     def is_correct(self, answer: str) -> bool:
         """
@@ -1,8 +1,9 @@
-from PIL import Image, ImageFilter
+from PIL import Image
 
 from src.model.game.GameBoard import GameBoard
 from src.model.wiki.Character import Character
-from src.utils.download_utils import generate_temp_file_path, download_temp_file
+from src.service.image_render_service import get_blurred_image, get_blurred_image_async
+from src.utils.download_utils import download_temp_file
 
 
 class WhosWho(GameBoard):
@@ -57,21 +58,31 @@ class WhosWho(GameBoard):
         :return: None
         """
 
-        with Image.open(self.image_path) as image:
-            image = image.convert("RGB")
-            image = image.filter(ImageFilter.GaussianBlur((self.level - 1) * 10))
-            save_path = generate_temp_file_path("jpg")
-            image.save(save_path)
-            self.latest_blurred_image = save_path
+        self.latest_blurred_image = get_blurred_image(
+            self.character.anime_image_url, self.image_path, self.level
+        )
 
-    def reduce_level(self):
+    async def set_blurred_image_async(self):
+        """
+        Set the blurred image, rendering it outside the event loop
+        :return: None
+        """
+
+        self.latest_blurred_image = await get_blurred_image_async(
+            self.character.anime_image_url, self.image_path, self.level
+        )
+
+    def reduce_level(self, should_set_image: bool = True):
         """
         Reduce the level
+        :param should_set_image: Whether to set the image
         :return: None
         """
         if self.level > 0:
             self.level -= 1
-            self.set_blurred_image()
+
+            if should_set_image:
+                self.set_blurred_image()
 
     def can_reduce_level(self) -> bool:
         """
@@ -0,0 +1,22 @@
+import os
+
+
+class BountyPoster:
+    """
+    A rendered bounty poster of a user, with what it shows
+    """
+
+    def __init__(self, user_id: int, key: tuple, path: str):
+        """
+        Constructor
+        :param user_id: The user id
+        :param key: What the poster shows
+        :param path: The rendered poster path
+        """
+
+        self.user_id = user_id
+        self.key = key
+        self.path: str | None = path
+        self.size: int = os.path.getsize(path)
+        # Set after the first upload, so the poster can be sent again by id
+        self.file_id: str | None = None
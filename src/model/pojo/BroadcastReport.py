@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from src.model.enums.Feature import Feature
+
+
+class BroadcastReport:
+    """
+    Progress and outcome of a feature broadcast
+    """
+
+    def __init__(self, feature: Feature, total: int):
+        self.feature = feature
+        self.total = total
+        self.sent = 0
+        self.pinned = 0
+        self.pin_failed = 0  # Sent but not pinned
+        self.failed = 0  # Not sent
+        self.errors: dict[int, str] = {}  # Group chat id -> error, of the send or of the pin
+        self.start_date = datetime.now()
+        self.end_date: datetime | None = None
+
+    def is_done(self) -> bool:
+        """Whether all the group chats have been processed"""
+        return self.end_date is not None
+
+    def get_processed(self) -> int:
+        """Get the number of group chats processed so far"""
+        return self.sent + self.failed
+
+    def get_duration_seconds(self) -> float:
+        """Get the duration of the broadcast so far"""
+        end_date = self.end_date if self.end_date is not None else datetime.now()
+        return (end_date - self.start_date).total_seconds()
+
+    def __str__(self) -> str:
+        return (
+            f"Broadcast {self.feature.name}: {self.get_processed()}/{self.total} processed,"
+            f" {self.sent} sent, {self.pinned} pinned, {self.pin_failed} pin failed,"
+            f" {self.failed} failed in"
+            f" {self.get_duration_seconds():.1f}s"
+        )
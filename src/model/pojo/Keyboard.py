@@ -1,5 +1,3 @@
-import hashlib
-import json
 import logging
 
 from telegram import CallbackQuery
@@ -11,6 +9,11 @@ from src.model.enums.ContextDataKey import ContextDataKey
 from src.model.enums.MessageSource import MessageSource
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
 from src.model.enums.Screen import Screen
+from src.service.keyboard_state_service import save_keyboard_state, get_keyboard_state
+from src.utils.callback_data_utils import encode_callback_data, decode_callback_data
+
+# Callback data of a keyboard with no info
+EMPTY_CALLBACK_DATA = encode_callback_data({})
 
 
 class Keyboard:
@@ -126,7 +129,7 @@ class Keyboard:
                 set(info_with_screen[ReservedKeyboardKeys.AUTHORIZED_USERS])
             )
 
-        return json.dumps(info_with_screen, separators=(",", ":"))
+        return encode_callback_data(info_with_screen)
 
     def refresh_callback_data(self):
         """
@@ -134,22 +137,26 @@ class Keyboard:
         """
         self.callback_data = self.create_callback_data()
 
-    def set_and_get_callback_data_in_context(self, context: ContextTypes.DEFAULT_TYPE) -> str:
+    def has_callback_data(self) -> bool:
         """
-        Get the callback data in the context if longer than allowed
-        :param context: The context
+        Check if the keyboard has any info in its callback data
+        :return: If the callback data is not empty
+        """
+
+        return self.callback_data != EMPTY_CALLBACK_DATA
+
+    def get_callback_data_to_send(self) -> str:
+        """
+        Get the callback data to send, saving it as keyboard state if longer than allowed
+        :return: The callback data, or the reference to the keyboard state
         """
 
-        if len(self.callback_data) < c.TG_KEYBOARD_DATA_MAX_LEN:
+        if len(self.callback_data) <= c.TG_KEYBOARD_DATA_MAX_LEN:
             return self.callback_data
 
-        # Inner key is md5 hash of the callback data
-        inner_key = hashlib.md5(self.callback_data.encode()).hexdigest()
-        User.set_context_data(
-            context, ContextDataKey.KEYBOARD_DATA, self.callback_data, inner_key=inner_key
-        )
-        logging.debug(f"Keyboard data too long, saved in context with inner key {inner_key}")
-        return json.dumps({ReservedKeyboardKeys.CONTEXT: inner_key}, separators=(",", ":"))
+        state_key = save_keyboard_state(self.callback_data)
+        logging.debug(f"Keyboard data too long, saved as keyboard state {state_key}")
+        return encode_callback_data({ReservedKeyboardKeys.KEYBOARD_STATE: state_key})
 
     @staticmethod
     def get_from_callback_query_or_info(
@@ -173,11 +180,17 @@ class Keyboard:
             raise ValueError("Either callback_query or info must be provided")
 
         if info_str is not None:
-            info: dict = json.loads(info_str)
+            info: dict = decode_callback_data(info_str)
         else:
-            info: dict = json.loads(callback_query.data)
+            info: dict = decode_callback_data(callback_query.data)
+
+        # Data was too long, so get it from the keyboard states
+        if ReservedKeyboardKeys.KEYBOARD_STATE in info:
+            info = decode_callback_data(
+                get_keyboard_state(info[ReservedKeyboardKeys.KEYBOARD_STATE])
+            )
 
-        # Data was too long, so get it from context
+        # Data was too long and saved in context, by keyboards sent before keyboard states
         if ReservedKeyboardKeys.CONTEXT in info:
             info_str_from_context = User.get_context_data(
                 context,
@@ -188,7 +201,7 @@ class Keyboard:
             User.remove_context_data(
                 context, ContextDataKey.KEYBOARD_DATA, info[ReservedKeyboardKeys.CONTEXT]
             )
-            info = json.loads(info_str_from_context)
+            info = decode_callback_data(info_str_from_context)
 
         try:
             if ReservedKeyboardKeys.SCREEN in info:
@@ -279,3 +292,47 @@ class Keyboard:
         """
 
         return key in self.info
+
+    def to_dict(self) -> dict:
+        """
+        Get the keyboard as a JSON serializable dict, with what is needed to send it
+        :return: The dict
+        """
+
+        return {
+            "text": self.text,
+            "info": self.info,
+            "screen": self.screen,
+            "previous_screen_list": self.previous_screen_list,
+            "url": self.url,
+            "inherit_authorized_users": self.inherit_authorized_users,
+            "authorized_users": [user.id for user in self.authorized_users],
+            "only_authorized_users_can_interact": self.only_authorized_users_can_interact,
+            "switch_inline_query": self.switch_inline_query,
+        }
+
+    @staticmethod
+    def from_dict(keyboard_dict: dict) -> "Keyboard":
+        """
+        Create a keyboard from the dict of Keyboard.to_dict
+        :param keyboard_dict: The dict
+        :return: The keyboard
+        """
+
+        authorized_users: list[User] = (
+            list(User.select().where(User.id.in_(keyboard_dict["authorized_users"])))
+            if len(keyboard_dict["authorized_users"]) > 0
+            else None
+        )
+
+        return Keyboard(
+            keyboard_dict["text"],
+            info=keyboard_dict["info"],
+            screen=Screen(keyboard_dict["screen"]) if keyboard_dict["screen"] else None,
+            previous_screen_list=[Screen(s) for s in keyboard_dict["previous_screen_list"]],
+            url=keyboard_dict["url"],
+            inherit_authorized_users=keyboard_dict["inherit_authorized_users"],
+            authorized_users=authorized_users,
+            only_authorized_users_can_interact=keyboard_dict["only_authorized_users_can_interact"],
+            switch_inline_query=keyboard_dict["switch_inline_query"],
+        )
@@ -0,0 +1,40 @@
+from src.model.Leaderboard import Leaderboard
+from src.model.LeaderboardUser import LeaderboardUser
+
+
+class LeaderboardSnapshot:
+    """
+    The current leaderboard of a group, or the global one, with its users by user id. Kept as
+    field values instead of instances, so each caller gets its own instances and changes made to
+    them by one update are not seen by the others
+    """
+
+    def __init__(self, leaderboard: Leaderboard, leaderboard_users: list[LeaderboardUser]):
+        self.leaderboard_data: dict = dict(leaderboard.__data__)
+        self.leaderboard_users_data: dict[int, dict] = {
+            leaderboard_user.user_id: dict(leaderboard_user.__data__)
+            for leaderboard_user in leaderboard_users
+        }
+
+    def get_leaderboard(self) -> Leaderboard:
+        """
+        Get the leaderboard
+        :return: The leaderboard
+        """
+
+        return Leaderboard.from_data(self.leaderboard_data)
+
+    def get_leaderboard_user(self, user_id: int) -> LeaderboardUser | None:
+        """
+        Get the leaderboard user of a user, with its leaderboard
+        :param user_id: The user id
+        :return: The leaderboard user, None if the user is not in the leaderboard
+        """
+
+        leaderboard_user_data = self.leaderboard_users_data.get(user_id)
+        if leaderboard_user_data is None:
+            return None
+
+        leaderboard_user: LeaderboardUser = LeaderboardUser.from_data(leaderboard_user_data)
+        leaderboard_user.leaderboard = self.get_leaderboard()
+        return leaderboard_user
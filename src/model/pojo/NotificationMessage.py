@@ -0,0 +1,65 @@
+import json
+
+from src.model.enums.Notification import Notification, NotificationCategory, NotificationType
+from src.model.pojo.Keyboard import Keyboard
+
+
+class NotificationMessage:
+    """
+    A notification built for sending, so it can be kept until it's sent
+    """
+
+    def __init__(self, notification: Notification):
+        """
+        Constructor
+        :param notification: The notification
+        """
+
+        self.category: NotificationCategory = notification.category
+        self.type: NotificationType = notification.type
+        self.text: str = notification.build()
+        self.keyboard: list[list[Keyboard]] = notification.get_keyboard()
+        self.disable_notification: bool = notification.disable_notification
+        self.disable_web_page_preview: bool = notification.disable_web_page_preview
+
+    def get_json(self) -> str:
+        """
+        Get the json representation of the notification
+        :return: The json
+        """
+
+        return json.dumps(
+            {
+                "category": self.category,
+                "type": self.type,
+                "text": self.text,
+                "keyboard": [[button.to_dict() for button in row] for row in self.keyboard],
+                "disable_notification": self.disable_notification,
+                "disable_web_page_preview": self.disable_web_page_preview,
+            },
+            separators=(",", ":"),
+        )
+
+    @staticmethod
+    def from_json(notification_json: str) -> "NotificationMessage":
+        """
+        Create a notification from its json representation
+        :param notification_json: The json
+        :return: The notification
+        """
+
+        notification_dict: dict = json.loads(notification_json)
+
+        notification_message = NotificationMessage.__new__(NotificationMessage)
+        notification_message.category = NotificationCategory(notification_dict["category"])
+        notification_message.type = NotificationType(notification_dict["type"])
+        notification_message.text = notification_dict["text"]
+        notification_message.keyboard = [
+            [Keyboard.from_dict(button) for button in row] for row in notification_dict["keyboard"]
+        ]
+        notification_message.disable_notification = notification_dict["disable_notification"]
+        notification_message.disable_web_page_preview = notification_dict[
+            "disable_web_page_preview"
+        ]
+
+        return notification_message
@@ -0,0 +1,20 @@
+from src.model.PredictionOption import PredictionOption
+from src.model.User import User
+
+
+class PredictionSettlement:
+    """
+    What a user gets back from the bets on a prediction, summed over all their bets
+    """
+
+    def __init__(self, user: User):
+        self.user = user
+        self.prediction_options: list[PredictionOption] = []
+        # Gross win of the bets on correct options, and how much of it was wagered
+        self.win_amount = 0
+        self.won_wager = 0
+        # Refund of the bets, and how much was wagered on them
+        self.refund_amount = 0
+        self.refunded_wager = 0
+        # Win net of the wagers on wrong options, as shown to the user
+        self.total_win = 0
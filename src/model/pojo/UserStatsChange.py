@@ -0,0 +1,61 @@
+from src.model.enums.UserStatsCounterType import UserStatsCounterType
+
+
+class UserStatsChange:
+    """
+    What an ended fight, plunder, game or bounty gift adds to the stats of one of its users
+    """
+
+    def __init__(self, user_id: int):
+        """
+        Constructor
+        :param user_id: The user id
+        """
+
+        self.user_id: int = user_id
+        # Field name -> amount added
+        self.amounts: dict[str, int] = {}
+        # (item field name, value field name, item id, value), kept if higher than the current
+        self.maxima: list[tuple[str, str, int, int]] = []
+        # (counter type, key, amount added)
+        self.counters: list[tuple[UserStatsCounterType, int, int]] = []
+
+    def add(self, field_name: str, amount: int) -> "UserStatsChange":
+        """
+        Add an amount to a field
+        :param field_name: The field name
+        :param amount: The amount
+        :return: The change
+        """
+
+        self.amounts[field_name] = self.amounts.get(field_name, 0) + amount
+        return self
+
+    def add_max(
+        self, item_field_name: str, value_field_name: str, item_id: int, value: int
+    ) -> "UserStatsChange":
+        """
+        Set an item as the max of a stat, if its value is higher than the current max
+        :param item_field_name: The field name of the item
+        :param value_field_name: The field name of the value
+        :param item_id: The item id
+        :param value: The value
+        :return: The change
+        """
+
+        self.maxima.append((item_field_name, value_field_name, item_id, value))
+        return self
+
+    def add_to_counter(
+        self, counter_type: UserStatsCounterType, key: int, amount: int = 1
+    ) -> "UserStatsChange":
+        """
+        Add an amount to a counter
+        :param counter_type: The counter type
+        :param key: The key of the counter, a user id or a game type
+        :param amount: The amount
+        :return: The change
+        """
+
+        self.counters.append((counter_type, key, amount))
+        return self
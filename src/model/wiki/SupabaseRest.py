@@ -1,15 +1,16 @@
 import logging
-import random
+import threading
+import time
 from enum import StrEnum
 
 import requests
 
 import resources.Environment as Env
 from src.model.enums.AssetPath import AssetPath
-from src.model.error.CustomException import WikiException
 from src.model.game.GameDifficulty import GameDifficulty
 from src.model.wiki.Character import Character
 from src.model.wiki.Terminology import Terminology
+from src.model.wiki.WikiData import WikiData
 from src.utils.file_utils import get_list_from_json
 
 
@@ -35,27 +36,33 @@ class SupabaseRest:
         self.rest_url = Env.SUPABASE_REST_URL.get()
         self.api_key = Env.SUPABASE_API_KEY.get()
 
-    def make_get_request(self, table: SupabaseTableName) -> list[dict]:
+    def make_get_request(self, table: SupabaseTableName) -> list[dict] | None:
         """
         Make a request to the Supabase REST API
         :param table: The table of the resource
-        :return: The response
+        :return: The response, None if Supabase is not set up or the request failed
         """
 
-        # If Supabase is not set up, use local file resource instead
+        # Supabase is not set up
         if not self.rest_url or not self.api_key:
-            return get_list_from_json(table.get_asset_path())
+            return None
 
         full_path = f"{self.rest_url}{table}"
         # Make request
-        response = requests.get(
-            url=full_path, headers={"apikey": self.api_key, "Content-Type": "application/json"}
-        )
+        try:
+            response = requests.get(
+                url=full_path,
+                headers={"apikey": self.api_key, "Content-Type": "application/json"},
+                timeout=Env.SUPABASE_REQUEST_TIMEOUT_SECONDS.get_int(),
+            )
+        except requests.RequestException as e:
+            logging.error(f"Error making request to {full_path}: {e}")
+            return None
 
         # Check response
         if response.status_code != 200:
-            logging.error(f"Error making request to {full_path}, using local resource")
-            return get_list_from_json(table.get_asset_path())
+            logging.error(f"Error making request to {full_path}: {response.status_code}")
+            return None
 
         # Return response
         return response.json()
@@ -68,22 +75,7 @@ class SupabaseRest:
         :return: A random character
         """
 
-        # Get a random character
-        response: list[dict] = SupabaseRest().make_get_request(SupabaseTableName.CHARACTER)
-
-        if len(response) == 0:
-            raise WikiException("No characters found")
-
-        random.shuffle(response)
-
-        if difficulty is None:
-            return Character(**response[0])
-
-        for char in response:
-            if char["difficulty"] == difficulty.value:
-                return Character(**char)
-
-        raise WikiException(f"No characters found with difficulty {difficulty} or lower")
+        return get_wiki_data().get_random_character(difficulty)
 
     @staticmethod
     def get_random_terminology(
@@ -106,34 +98,104 @@ class SupabaseRest:
         :return: A random terminology
         """
 
-        # Get a random terminology
-        response: list[dict] = SupabaseRest().make_get_request(SupabaseTableName.TERMINOLOGY)
-        random.shuffle(response)
-
-        for term in response:
-            if max_len is not None and len(term["name"]) > max_len:
-                if not (
-                    consider_len_without_space
-                    and len(str(term["name"]).replace(" ", "")) <= max_len
-                ):
-                    continue
-
-            if only_letters and not str(term["name"]).isalpha():
-                if not (allow_spaces and str(term["name"]).replace(" ", "").isalpha()):
-                    continue
-
-            if (
-                min_unique_characters is not None
-                and len(set(term["name"])) < min_unique_characters
-            ):
-                continue
-
-            if (
-                max_unique_characters is not None
-                and len(set(term["name"])) > max_unique_characters
-            ):
-                continue
-
-            return Terminology(**term)
-
-        raise WikiException("No terminologies found")
+        return get_wiki_data().get_random_terminology(
+            max_len=max_len,
+            only_letters=only_letters,
+            consider_len_without_space=consider_len_without_space,
+            allow_spaces=allow_spaces,
+            min_unique_characters=min_unique_characters,
+            max_unique_characters=max_unique_characters,
+        )
+
+
+# Local resources, used until the wiki is loaded or if it can't be reached
+_local_wiki_data: WikiData | None = None
+_wiki_data: WikiData | None = None
+_wiki_data_load_time = 0.0
+_wiki_data_refresh_lock = threading.Lock()
+
+
+def load_local_wiki_data() -> WikiData:
+    """
+    Load the wiki data from the local resources, only the first time
+    :return: The wiki data
+    """
+
+    global _local_wiki_data
+
+    if _local_wiki_data is None:
+        _local_wiki_data = WikiData(
+            get_list_from_json(SupabaseTableName.CHARACTER.get_asset_path()),
+            get_list_from_json(SupabaseTableName.TERMINOLOGY.get_asset_path()),
+        )
+
+    return _local_wiki_data
+
+
+def refresh_wiki_data() -> None:
+    """
+    Load the wiki data from Supabase. Tables that can't be loaded keep the data loaded before,
+    or the local resources
+    :return: None
+    """
+
+    global _wiki_data, _wiki_data_load_time
+
+    if not _wiki_data_refresh_lock.acquire(blocking=False):
+        return
+
+    try:
+        previous_wiki_data = _wiki_data if _wiki_data is not None else load_local_wiki_data()
+        supabase_rest = SupabaseRest()
+
+        characters = supabase_rest.make_get_request(SupabaseTableName.CHARACTER)
+        if characters is None:
+            characters = previous_wiki_data.characters
+
+        terminologies = supabase_rest.make_get_request(SupabaseTableName.TERMINOLOGY)
+        if terminologies is None:
+            terminologies = previous_wiki_data.terminologies
+
+        _wiki_data = WikiData(characters, terminologies)
+        _wiki_data_load_time = time.monotonic()
+    finally:
+        _wiki_data_refresh_lock.release()
+
+
+def get_wiki_data() -> WikiData:
+    """
+    Get the wiki data. Until it's loaded the local resources are used, and once it expires it's
+    refreshed in the background while the current data keeps being used
+    :return: The wiki data
+    """
+
+    if _wiki_data is None:
+        start_wiki_data_refresh()
+        return load_local_wiki_data()
+
+    if time.monotonic() - _wiki_data_load_time > Env.SUPABASE_CACHE_TTL_SECONDS.get_int():
+        start_wiki_data_refresh()
+
+    return _wiki_data
+
+
+def start_wiki_data_refresh() -> None:
+    """
+    Refresh the wiki data in a background thread, if not already refreshing
+    :return: None
+    """
+
+    if _wiki_data_refresh_lock.locked():
+        return
+
+    threading.Thread(target=refresh_wiki_data, name="wiki_data_refresh", daemon=True).start()
+
+
+def preload_wiki_data() -> None:
+    """
+    Load the local resources and start loading the wiki data, to be called at startup
+    :return: None
+    """
+
+    load_local_wiki_data()
+    start_wiki_data_refresh()
@@ -0,0 +1,180 @@
+import random
+from bisect import bisect_right
+from itertools import accumulate
+
+from src.model.error.CustomException import WikiException
+from src.model.game.GameDifficulty import GameDifficulty
+from src.model.wiki.Character import Character
+from src.model.wiki.Terminology import Terminology
+
+
+class TerminologyKey:
+    """
+    The properties of a terminology name that random picks can filter on
+    """
+
+    def __init__(self, name: str):
+        name_without_spaces = name.replace(" ", "")
+
+        self.length = len(name)
+        self.length_without_spaces = len(name_without_spaces)
+        self.is_only_letters = name.isalpha()
+        self.is_only_letters_without_spaces = name_without_spaces.isalpha()
+        self.unique_characters_count = len(set(name))
+
+    def as_tuple(self) -> tuple:
+        """
+        Get the properties as a tuple, to group terminologies with the same properties
+        :return: The properties
+        """
+
+        return (
+            self.length,
+            self.length_without_spaces,
+            self.is_only_letters,
+            self.is_only_letters_without_spaces,
+            self.unique_characters_count,
+        )
+
+
+class WikiData:
+    """
+    Characters and terminologies of the wiki, indexed so a random pick doesn't need to go
+    through all of them
+    """
+
+    def __init__(self, characters: list[dict], terminologies: list[dict]):
+        """
+        Constructor
+        :param characters: The characters, as returned by the wiki
+        :param terminologies: The terminologies, as returned by the wiki
+        """
+
+        self.characters = characters
+        self.characters_by_difficulty: dict[int, list[dict]] = {}
+        for character in characters:
+            self.characters_by_difficulty.setdefault(character["difficulty"], []).append(character)
+
+        self.terminologies = terminologies
+        # Terminologies with the same properties, by properties
+        self.terminologies_by_key: dict[tuple, list[dict]] = {}
+        self.terminology_keys: dict[tuple, TerminologyKey] = {}
+        for terminology in terminologies:
+            key = TerminologyKey(str(terminology["name"]))
+            self.terminologies_by_key.setdefault(key.as_tuple(), []).append(terminology)
+            self.terminology_keys[key.as_tuple()] = key
+
+        # Matching groups of terminologies and their cumulative sizes, by filter
+        self.terminology_candidates: dict[tuple, tuple[list[list[dict]], list[int]]] = {}
+
+    def get_random_character(self, difficulty: GameDifficulty = None) -> Character:
+        """
+        Get a random character
+        :param difficulty: The difficulty level, None for any
+        :return: A random character
+        """
+
+        if len(self.characters) == 0:
+            raise WikiException("No characters found")
+
+        if difficulty is None:
+            return Character(**random.choice(self.characters))
+
+        characters = self.characters_by_difficulty.get(difficulty.value)
+        if characters is None:
+            raise WikiException(f"No characters found with difficulty {difficulty} or lower")
+
+        return Character(**random.choice(characters))
+
+    def get_random_terminology(
+        self,
+        max_len: int = None,
+        only_letters: bool = False,
+        consider_len_without_space: bool = False,
+        allow_spaces: bool = True,
+        min_unique_characters: int = None,
+        max_unique_characters: int = None,
+    ) -> Terminology:
+        """
+        Get a random terminology
+        :param max_len: The maximum length of the terminology
+        :param only_letters: Whether the terminology should only contain letters
+        :param consider_len_without_space: Whether the length of the terminology should be
+        considered without spaces
+        :param allow_spaces: Whether the terminology can contain spaces if only_letters is True
+        :param min_unique_characters: The minimum amount of unique characters in the terminology
+        :param max_unique_characters: The maximum amount of unique characters in the terminology
+        :return: A random terminology
+        """
+
+        terminology_filter = (
+            max_len,
+            only_letters,
+            consider_len_without_space,
+            allow_spaces,
+            min_unique_characters,
+            max_unique_characters,
+        )
+
+        candidates = self.terminology_candidates.get(terminology_filter)
+        if candidates is None:
+            groups = [
+                self.terminologies_by_key[key]
+                for key, terminology_key in self.terminology_keys.items()
+                if terminology_key_matches(terminology_key, *terminology_filter)
+            ]
+            candidates = self.terminology_candidates[terminology_filter] = (
+                groups,
+                list(accumulate(len(group) for group in groups)),
+            )
+
+        groups, cumulative_sizes = candidates
+        if len(groups) == 0:
+            raise WikiException("No terminologies found")
+
+        # Pick uniformly among all the matching terminologies
+        index = random.randrange(cumulative_sizes[-1])
+        group_index = bisect_right(cumulative_sizes, index)
+        group = groups[group_index]
+        start = cumulative_sizes[group_index - 1] if group_index > 0 else 0
+
+        return Terminology(**group[index - start])
+
+
+def terminology_key_matches(
+    key: TerminologyKey,
+    max_len: int | None,
+    only_letters: bool,
+    consider_len_without_space: bool,
+    allow_spaces: bool,
+    min_unique_characters: int | None,
+    max_unique_characters: int | None,
+) -> bool:
+    """
+    Check if terminologies with the given properties match a filter
+    :param key: The properties of the terminologies
+    :param max_len: The maximum length of the terminology
+    :param only_letters: Whether the terminology should only contain letters
+    :param consider_len_without_space: Whether the length of the terminology should be
+    considered without spaces
+    :param allow_spaces: Whether the terminology can contain spaces if only_letters is True
+    :param min_unique_characters: The minimum amount of unique characters in the terminology
+    :param max_unique_characters: The maximum amount of unique characters in the terminology
+    :return: True if they match
+    """
+
+    if max_len is not None and key.length > max_len:
+        if not (consider_len_without_space and key.length_without_spaces <= max_len):
+            return False
+
+    if only_letters and not key.is_only_letters:
+        if not (allow_spaces and key.is_only_letters_without_spaces):
+            return False
+
+    if min_unique_characters is not None and key.unique_characters_count < min_unique_characters:
+        return False
+
+    if max_unique_characters is not None and key.unique_characters_count > max_unique_characters:
+        return False
+
+    return True
@@ -0,0 +1,115 @@
+import logging
+import threading
+from datetime import datetime
+
+from peewee import Field
+
+from src.model.BaseModel import BaseModel, db_obj
+from src.model.Group import Group
+from src.model.GroupChat import GroupChat
+from src.model.GroupUser import GroupUser
+from src.model.User import User
+
+# Fields refreshed on every message, written in bulk by flush_activity instead of on each update
+TRACKED_FIELDS: dict[type[BaseModel], list[Field]] = {
+    User: [
+        User.tg_first_name,
+        User.tg_last_name,
+        User.tg_username,
+        User.last_message_date,
+        User.is_active,
+    ],
+    Group: [
+        Group.tg_group_name,
+        Group.tg_group_username,
+        Group.is_forum,
+        Group.last_message_date,
+        Group.is_active,
+    ],
+    GroupChat: [GroupChat.tg_topic_name, GroupChat.last_message_date, GroupChat.is_active],
+    GroupUser: [GroupUser.last_message_date, GroupUser.is_active, GroupUser.is_admin],
+}
+
+FLUSH_BATCH_SIZE = 500
+
+_pending: dict[type[BaseModel], dict[int, dict]] = {model: {} for model in TRACKED_FIELDS}
+_pending_lock = threading.Lock()
+
+# (group id, user id) -> group user id, group users are never deleted
+_group_user_ids: dict[tuple[int, int], int] = {}
+
+
+def track_activity(item: BaseModel) -> None:
+    """
+    Save the activity fields of an existing item for the next flush, and remove them from the
+    item dirty fields so that saving the item doesn't write them again
+    :param item: The item, must already be saved
+    :return: None
+    """
+
+    model = type(item)
+    fields = TRACKED_FIELDS[model]
+    values = {field.name: getattr(item, field.name) for field in fields}
+
+    with _pending_lock:
+        _pending[model][item.id] = values
+
+    item._dirty.difference_update(field.name for field in fields)
+
+
+async def track_group_user_activity(group: Group, user: User, is_admin: bool) -> None:
+    """
+    Save the activity of a user in a group for the next flush, creating the group user if it
+    doesn't exist yet
+    :param group: The group
+    :param user: The user
+    :param is_admin: If the user is an admin of the group
+    :return: None
+    """
+
+    key = (group.id, user.id)
+    group_user_id = _group_user_ids.get(key)
+
+    if group_user_id is None:
+        group_user = await db_obj.run_in_executor(
+            GroupUser.get_or_none, (GroupUser.group == group) & (GroupUser.user == user)
+        )
+        if group_user is None:
+            group_user = GroupUser()
+            group_user.group = group
+            group_user.user = user
+            group_user.is_admin = is_admin
+            await db_obj.run_in_executor(group_user.save)
+
+        group_user_id = _group_user_ids[key] = group_user.id
+
+    with _pending_lock:
+        _pending[GroupUser][group_user_id] = {
+            GroupUser.last_message_date.name: datetime.now(),
+            GroupUser.is_active.name: True,
+            GroupUser.is_admin.name: is_admin,
+        }
+
+
+def flush_activity() -> None:
+    """
+    Write all the pending activity, with one update statement per model and batch
+    :return: None
+    """
+
+    for model, fields in TRACKED_FIELDS.items():
+        with _pending_lock:
+            pending = _pending[model]
+            _pending[model] = {}
+
+        if len(pending) == 0:
+            continue
+
+        items = [model(id=item_id, **values) for item_id, values in pending.items()]
+        try:
+            model.bulk_update(items, fields=fields, batch_size=FLUSH_BATCH_SIZE)
+        except Exception as e:
+            logging.error(f"Failed to flush activity of {len(items)} {model.__name__}: {e}")
+            # Put back the values for the next flush, unless newer ones were tracked meanwhile
+            with _pending_lock:
+                _pending[model] = pending | _pending[model]
@@ -0,0 +1,150 @@
+import time
+from collections import deque
+
+import resources.Environment as Env
+
+
+class SlidingWindowLimiter:
+    """
+    Limits the events of each key in a sliding time window.
+    Each key keeps a ring buffer of at most limit + 1 timestamps, so checking costs O(1) amortized
+    and memory doesn't grow with the traffic. Keys idle for a whole window are evicted
+    """
+
+    def __init__(self, limit: int, window_seconds: int):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.windows: dict[int, deque[float]] = {}
+        self.last_eviction = time.monotonic()
+
+        self.checks_count = 0
+        self.limited_count = 0
+        self.evicted_count = 0
+
+    def get_window(self, key: int, now: float) -> deque[float] | None:
+        """
+        Get the timestamps of a key that are still in the window
+        :param key: The key
+        :param now: The current monotonic time
+        :return: The timestamps, None if the key has none
+        """
+
+        self.evict_idle_keys(now)
+
+        window = self.windows.get(key)
+        if window is None:
+            return None
+
+        expire_time = now - self.window_seconds
+        while len(window) > 0 and window[0] <= expire_time:
+            window.popleft()
+
+        return window
+
+    def record(self, key: int, now: float) -> None:
+        """
+        Record an event for a key
+        :param key: The key
+        :param now: The current monotonic time
+        :return: None
+        """
+
+        window = self.windows.get(key)
+        if window is None:
+            window = self.windows[key] = deque(maxlen=self.limit + 1)
+
+        window.append(now)
+
+    def is_limited(self, key: int) -> bool:
+        """
+        Check if a key reached the limit in the window, else record the event
+        :param key: The key
+        :return: True if the key is limited
+        """
+
+        now = time.monotonic()
+        window = self.get_window(key, now)
+        self.checks_count += 1
+
+        if window is not None and len(window) >= self.limit:
+            self.limited_count += 1
+            return True
+
+        self.record(key, now)
+        return False
+
+    def is_limit_just_reached(self, key: int) -> bool:
+        """
+        Check if a limited key just reached the limit, so this is its first limited event in the
+        window. The event is recorded, so following events return False
+        :param key: The key
+        :return: True if the limit was just reached
+        """
+
+        window = self.windows.get(key)
+        if window is None or len(window) != self.limit:
+            return False
+
+        self.record(key, time.monotonic())
+        return True
+
+    def evict_idle_keys(self, now: float) -> None:
+        """
+        Remove the keys without events in the window, at most once per window
+        :param now: The current monotonic time
+        :return: None
+        """
+
+        if now - self.last_eviction < self.window_seconds:
+            return
+
+        expire_time = now - self.window_seconds
+        # Windows emptied when their old events were dropped are idle too
+        idle_keys = [
+            key
+            for key, window in self.windows.items()
+            if len(window) == 0 or window[-1] <= expire_time
+        ]
+        for key in idle_keys:
+            self.windows.pop(key)
+
+        self.evicted_count += len(idle_keys)
+        self.last_eviction = now
+
+    def get_metrics(self) -> dict[str, int]:
+        """
+        Get the limiter metrics
+        :return: The metrics
+        """
+
+        return {
+            "keys": len(self.windows),
+            "checks": self.checks_count,
+            "limited": self.limited_count,
+            "evicted": self.evicted_count,
+        }
+
+
+# Keyed by user id
+PRIVATE_CHAT_LIMITER = SlidingWindowLimiter(
+    Env.ANTI_SPAM_PRIVATE_CHAT_MESSAGE_LIMIT.get_int(),
+    Env.ANTI_SPAM_TIME_INTERVAL_SECONDS.get_int(),
+)
+
+# Keyed by chat id
+GROUP_CHAT_LIMITER = SlidingWindowLimiter(
+    Env.ANTI_SPAM_GROUP_CHAT_MESSAGE_LIMIT.get_int(),
+    Env.ANTI_SPAM_TIME_INTERVAL_SECONDS.get_int(),
+)
+
+
+def get_anti_spam_metrics() -> dict[str, dict[str, int]]:
+    """
+    Get the metrics of the anti spam limiters
+    :return: The metrics of each limiter
+    """
+
+    return {
+        "private_chat": PRIVATE_CHAT_LIMITER.get_metrics(),
+        "group_chat": GROUP_CHAT_LIMITER.get_metrics(),
+    }
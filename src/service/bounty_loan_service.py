@@ -8,7 +8,7 @@ from src.model.User import User
 from src.model.enums.BountyLoanSource import BountyLoanSource
 from src.model.enums.BountyLoanStatus import BountyLoanStatus
 from src.model.enums.Notification import BountyLoanExpiredNotification
-from src.service.notification_service import send_notification
+from src.service.notification_service import send_notifications
 
 
 async def set_expired_bounty_loans(context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -23,18 +23,19 @@ async def set_expired_bounty_loans(context: ContextTypes.DEFAULT_TYPE) -> None:
         & (BountyLoan.deadline_date < datetime.now())
     )
 
+    notifications = []
     for expired_bounty_loan in expired_bounty_loans:
         # Set expired
         expired_bounty_loan.status = BountyLoanStatus.EXPIRED
         expired_bounty_loan.save()
 
         # Send notification to the borrower
-        await send_notification(
-            context,
-            expired_bounty_loan.borrower,
-            BountyLoanExpiredNotification(expired_bounty_loan),
+        notifications.append(
+            (expired_bounty_loan.borrower, BountyLoanExpiredNotification(expired_bounty_loan))
         )
 
+    send_notifications(context, notifications)
+
 
 def add_loan(
     loaner: User,
@@ -1,37 +1,38 @@
-from telegram import Update
-from wantedposter.wantedposter import (
-    WantedPoster,
-    VerticalAlignment,
-    CaptureCondition,
-    Effect,
-    Stamp,
-)
+import os
+from collections import OrderedDict
+
+from telegram import Update, PhotoSize
+from wantedposter.wantedposter import CaptureCondition, Effect, Stamp
 
 import constants as c
+import resources.Environment as Env
 from src.model.Leaderboard import Leaderboard
 from src.model.LeaderboardUser import LeaderboardUser
 from src.model.User import User
 from src.model.enums.BossType import BossType
 from src.model.enums.LeaderboardRank import LeaderboardRank, get_rank_by_index
+from src.model.pojo.BountyPoster import BountyPoster
 from src.service.devil_fruit_service import user_has_eaten_devil_fruit
+from src.service.image_render_service import render_in_pool
 from src.utils.download_utils import generate_temp_file_path
+from src.utils.image_render_utils import render_bounty_poster
+
+# Last rendered poster of each user, least recently used first
+_bounty_posters: OrderedDict[int, BountyPoster] = OrderedDict()
 
 
-async def get_bounty_poster(update: Update, user: User) -> str:
+async def get_bounty_poster(update: Update, user: User) -> BountyPoster:
     """
-    Gets the bounty poster of a user
+    Gets the bounty poster of a user, rendering it only if what it shows changed
     :param update: Telegram update
     :param user: The user to get the poster of
-    :return: The path to the poster
+    :return: The poster
     """
 
-    from src.service.user_service import get_user_profile_photo, get_boss_type
-
-    wanted_poster = WantedPoster(
-        portrait=await get_user_profile_photo(update),
-        first_name=user.tg_first_name,
-        last_name=user.tg_last_name,
-        bounty=user.bounty,
+    from src.service.user_service import (
+        get_user_profile_photo_size,
+        download_profile_photo,
+        get_boss_type,
     )
 
     capture_condition: CaptureCondition = CaptureCondition.DEAD_OR_ALIVE
@@ -63,14 +64,136 @@ async def get_bounty_poster(update: Update, user: User) -> str:
             else:
                 stamp = Stamp.DO_NOT_ENGAGE
 
-    return wanted_poster.generate(
-        output_poster_path=generate_temp_file_path(c.BOUNTY_POSTER_EXTENSION),
-        portrait_vertical_align=VerticalAlignment.TOP,
-        capture_condition=capture_condition,
-        effects=effects,
-        stamp=stamp,
+    # Only the photo metadata is needed to know if the poster changed
+    photo_size: PhotoSize | None = await get_user_profile_photo_size(update)
+    key = (
+        user.bounty,
+        photo_size.file_unique_id if photo_size is not None else None,
+        user.tg_first_name,
+        user.tg_last_name,
+        capture_condition,
+        tuple(effects),
+        stamp,
+    )
+
+    bounty_poster = get_cached_bounty_poster(user.id, key)
+    if bounty_poster is not None:
+        return bounty_poster
+
+    portrait_path = None
+    if photo_size is not None:
+        portrait_path = await download_profile_photo(photo_size)
+
+    poster_path = await render_in_pool(
+        render_bounty_poster,
+        str(portrait_path) if portrait_path is not None else None,
+        user.tg_first_name,
+        user.tg_last_name,
+        user.bounty,
+        capture_condition,
+        effects,
+        stamp,
+        generate_temp_file_path(c.BOUNTY_POSTER_EXTENSION),
     )
 
+    if portrait_path is not None:
+        remove_file(portrait_path)
+
+    bounty_poster = BountyPoster(user.id, key, poster_path)
+    set_cached_bounty_poster(bounty_poster)
+    return bounty_poster
+
+
+def get_cached_bounty_poster(user_id: int, key: tuple) -> BountyPoster | None:
+    """
+    Get the cached poster of a user, if it still shows the same
+    :param user_id: The user id
+    :param key: What the poster should show
+    :return: The poster, None if not cached or outdated
+    """
+
+    bounty_poster = _bounty_posters.get(user_id)
+    if bounty_poster is None or bounty_poster.key != key:
+        return None
+
+    if bounty_poster.path is not None and not os.path.exists(bounty_poster.path):
+        bounty_poster.path = None  # Temp dir was cleaned up
+
+    if bounty_poster.path is None and bounty_poster.file_id is None:
+        _bounty_posters.pop(user_id)
+        return None
+
+    _bounty_posters.move_to_end(user_id)
+    return bounty_poster
+
+
+def set_cached_bounty_poster(bounty_poster: BountyPoster) -> None:
+    """
+    Cache the poster of a user, replacing the previous one and evicting the least recently used
+    ones while over the cache limits
+    :param bounty_poster: The poster
+    :return: None
+    """
+
+    previous_bounty_poster = _bounty_posters.pop(bounty_poster.user_id, None)
+    if previous_bounty_poster is not None and previous_bounty_poster.path != bounty_poster.path:
+        remove_poster_file(previous_bounty_poster)
+
+    _bounty_posters[bounty_poster.user_id] = bounty_poster
+
+    while len(_bounty_posters) > Env.BOUNTY_POSTER_CACHE_SIZE.get_int():
+        _, evicted_bounty_poster = _bounty_posters.popitem(last=False)
+        remove_poster_file(evicted_bounty_poster)
+
+    # Posters already uploaded are sent by id, so only not yet uploaded ones take disk space
+    max_disk_size = Env.BOUNTY_POSTER_CACHE_MAX_DISK_SIZE_MB.get_int() * 1024 * 1024
+    disk_size = sum(p.size for p in _bounty_posters.values() if p.path is not None)
+    for user_id, cached_bounty_poster in list(_bounty_posters.items()):
+        if disk_size <= max_disk_size or cached_bounty_poster is bounty_poster:
+            break
+
+        if cached_bounty_poster.path is not None:
+            disk_size -= cached_bounty_poster.size
+            remove_poster_file(cached_bounty_poster)
+            _bounty_posters.pop(user_id)
+
+
+def set_bounty_poster_file_id(bounty_poster: BountyPoster, file_id: str) -> None:
+    """
+    Save the id of an uploaded poster, so it's sent by id from now on and its file can be removed
+    :param bounty_poster: The poster
+    :param file_id: The Telegram file id
+    :return: None
+    """
+
+    bounty_poster.file_id = file_id
+    remove_poster_file(bounty_poster)
+
+
+def remove_poster_file(bounty_poster: BountyPoster) -> None:
+    """
+    Remove the file of a poster
+    :param bounty_poster: The poster
+    :return: None
+    """
+
+    if bounty_poster.path is not None:
+        remove_file(bounty_poster.path)
+        bounty_poster.path = None
+
+
+def remove_file(path: str) -> None:
+    """
+    Remove a file, if not already removed by the temp dir cleanup
+    :param path: The file path
+    :return: None
+    """
+
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
 
 def get_bounty_poster_limit(leaderboard_user: LeaderboardUser) -> int:
     """
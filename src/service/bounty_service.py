@@ -1,17 +1,21 @@
+import asyncio
 import datetime
 import logging
 import traceback
+from contextlib import nullcontext
 from math import ceil
 
-from peewee import Case
+from peewee import Case, fn
 from telegram import Update
 from telegram.ext import ContextTypes
 
 import constants as c
 import resources.Environment as Env
 import resources.phrases as phrases
+from src.model.BaseModel import db_obj
 from src.model.BountyGift import BountyGift
 from src.model.BountyLoan import BountyLoan
+from src.model.BountyReset import BountyReset
 from src.model.Crew import Crew
 from src.model.CrewMemberChestContribution import CrewMemberChestContribution
 from src.model.DavyBackFight import DavyBackFight
@@ -20,6 +24,7 @@ from src.model.User import User
 from src.model.enums.BossType import BossType
 from src.model.enums.BountyGiftStatus import BountyGiftStatus
 from src.model.enums.BountyLoanStatus import BountyLoanStatus
+from src.model.enums.BountyResetPhase import BountyResetPhase
 from src.model.enums.Location import get_first_new_world
 from src.model.enums.Screen import Screen
 from src.model.enums.devil_fruit.DevilFruitAbilityType import DevilFruitAbilityType
@@ -39,7 +44,7 @@ from src.service.income_tax_service import (
     add_contribution,
     user_has_complete_tax_deduction,
 )
-from src.service.location_service import reset_location
+from src.service.location_service import get_location_level_case
 from src.service.message_service import full_message_or_media_send_or_edit
 from src.service.user_service import get_boss_type, user_is_boss
 from src.utils.math_utils import subtract_percentage_from_value
@@ -49,10 +54,63 @@ from src.utils.string_utils import (
     get_belly_formatted,
 )
 
+_reset_bounty_lock = asyncio.Lock()
+
 
 async def reset_bounty(context: ContextTypes.DEFAULT_TYPE) -> None:
     """
-    Resets the bounty for all users
+    Resets the bounty for all users, resuming the previous reset if it was interrupted.
+    Each phase is saved as completed in the same transaction as its changes, or can be run
+    again, so an interrupted reset is never applied twice
+    :return: None
+    """
+
+    if _reset_bounty_lock.locked():
+        logging.warning("Bounty reset already in progress")
+        return
+
+    async with _reset_bounty_lock:
+        bounty_reset: BountyReset = BountyReset.get_unfinished()
+        if bounty_reset is None:
+            bounty_reset = BountyReset()
+            bounty_reset.save()
+        else:
+            logging.info(
+                f"Resuming bounty reset {bounty_reset.id} after phase {bounty_reset.get_phase()}"
+            )
+
+        while (phase := bounty_reset.get_phase().get_next()) is not None:
+            # Phases that can be run again don't hold a transaction while messaging chats
+            with nullcontext() if phase.is_repeatable() else db_obj.get_db().atomic():
+                await run_reset_bounty_phase(context, phase)
+
+                bounty_reset.phase = phase
+                if phase.get_next() is None:
+                    bounty_reset.end_date = datetime.datetime.now()
+                bounty_reset.save()
+
+            logging.info(f"Bounty reset {bounty_reset.id}: completed phase {phase}")
+
+
+async def resume_reset_bounty(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """
+    Resume the bounty reset that was interrupted, if any
+    :param context: Telegram context
+    :return: None
+    """
+
+    async with db_obj.connection():
+        if BountyReset.get_unfinished() is not None:
+            await reset_bounty(context)
+
+
+async def run_reset_bounty_phase(
+    context: ContextTypes.DEFAULT_TYPE, phase: BountyResetPhase
+) -> None:
+    """
+    Run a phase of the bounty reset
+    :param context: Telegram context
+    :param phase: The phase
     :return: None
     """
     # Avoid circular import
@@ -62,92 +120,98 @@ async def reset_bounty(context: ContextTypes.DEFAULT_TYPE) -> None:
     )
     from src.service.crew_service import disband_inactive_crews
 
-    # End all active games
-    force_end_all_active_games()
-
-    # Remove bets from all prediction which result have not been set
-    await remove_all_bets(context)
-
-    # Return all pending bounty
-    User.update(bounty=User.bounty + User.pending_bounty, pending_bounty=0).execute()
-
-    # If the bounty / 2 is higher than the required bounty for the first new world location, cap it
-    # If the bounty / 2 is lower than base daily belly reward, set it to 0
-    # Else divide by 2
-    conditions: list[tuple[bool, int]] = [
-        (
-            (User.bounty / 2) > get_first_new_world().required_bounty,
-            get_first_new_world().required_bounty,
-        ),
-        ((User.bounty / 2) < Env.DAILY_REWARD_BONUS_BASE_AMOUNT.get_int(), 0),
-    ]
-    case_stmt = Case(None, conditions, User.bounty / 2)
-    User.update(bounty=case_stmt).execute()
-
-    # Reset location
-    reset_location()
-
-    # Reset can create crew flag
-    User.update(can_create_crew=True).execute()
-
-    # Delete all pending bounty gifts
-    BountyGift.delete().where(
-        BountyGift.status == BountyGiftStatus.AWAITING_CONFIRMATION
-    ).execute()
-
-    # Delete all pending bounty loans
-    BountyLoan.delete().where(
-        BountyLoan.status.in_(BountyLoanStatus.get_not_confirmed_statuses())
-    ).execute()
-
-    # Reset bounty gift tax
-    User.update(bounty_gift_tax=0).execute()
-
-    # Reset total gained bounty
-    User.update(total_gained_bounty=0).execute()
-
-    # Delete tax events
-    IncomeTaxEvent.delete().execute()
-
-    # If Crew chest is higher than allowed amount, cap it. Else, keep it
-    conditions: list[tuple[bool, int]] = [
-        (
-            Crew.chest_amount > Env.CREW_MAX_CHEST_AMOUNT_RESET.get_int(),
-            Env.CREW_MAX_CHEST_AMOUNT_RESET.get_int(),
-        )
-    ]
-    case_stmt = Case(None, conditions, Crew.chest_amount)
-    Crew.update(
-        chest_amount=case_stmt, from_reset_chest_amount=case_stmt, total_gained_chest_amount=0
-    ).execute()
-
-    # Delete all contributions from previous crew members
-    # For some reason a direct delete query does not work, had to first get all valid contributions
-    # and then delete
-
-    # Still valid contributions
-    valid_contributions = CrewMemberChestContribution.select().where(
-        CrewMemberChestContribution.crew
-        == User.select(User.crew).where(User.id == CrewMemberChestContribution.user)
-    )
-
-    # Delete all contributions that are not valid
-    CrewMemberChestContribution.delete().where(
-        (
-            CrewMemberChestContribution.id.not_in(
-                [contribution.id for contribution in valid_contributions]
-            )
-        )
-    ).execute()
+    match phase:
+        case BountyResetPhase.GAMES_ENDED:
+            # End all active games
+            force_end_all_active_games()
+
+        case BountyResetPhase.BETS_REMOVED:
+            # Remove bets from all prediction which result have not been set
+            await remove_all_bets(context)
+
+        case BountyResetPhase.USERS_RESET:
+            # Return all pending bounty, then:
+            # If the bounty / 2 is higher than the required bounty for the first new world
+            # location, cap it
+            # If the bounty / 2 is lower than base daily belly reward, set it to 0
+            # Else divide by 2
+            half_bounty = (User.bounty + User.pending_bounty) / 2
+            conditions: list[tuple[bool, int]] = [
+                (
+                    half_bounty > get_first_new_world().required_bounty,
+                    get_first_new_world().required_bounty,
+                ),
+                (half_bounty < Env.DAILY_REWARD_BONUS_BASE_AMOUNT.get_int(), 0),
+            ]
+            bounty_case = Case(None, conditions, half_bounty)
+
+            User.update(
+                {
+                    User.bounty: bounty_case,
+                    User.pending_bounty: 0,
+                    User.should_propose_new_world: True,
+                    User.can_create_crew: True,
+                    User.bounty_gift_tax: 0,
+                    User.total_gained_bounty: 0,
+                }
+            ).execute()
+
+            # Reset location from the new bounty. In its own update, since peewee orders the
+            # assignments by field declaration and MySQL evaluates them with the values assigned
+            # before, so the order can't be relied on
+            User.update(location_level=get_location_level_case(User.bounty)).execute()
+
+        case BountyResetPhase.PENDING_ACTIONS_DELETED:
+            # Delete all pending bounty gifts
+            BountyGift.delete().where(
+                BountyGift.status == BountyGiftStatus.AWAITING_CONFIRMATION
+            ).execute()
+
+            # Delete all pending bounty loans
+            BountyLoan.delete().where(
+                BountyLoan.status.in_(BountyLoanStatus.get_not_confirmed_statuses())
+            ).execute()
+
+            # Delete tax events
+            IncomeTaxEvent.delete().execute()
+
+        case BountyResetPhase.CREWS_RESET:
+            # If Crew chest is higher than allowed amount, cap it. Else, keep it
+            conditions: list[tuple[bool, int]] = [
+                (
+                    Crew.chest_amount > Env.CREW_MAX_CHEST_AMOUNT_RESET.get_int(),
+                    Env.CREW_MAX_CHEST_AMOUNT_RESET.get_int(),
+                )
+            ]
+            case_stmt = Case(None, conditions, Crew.chest_amount)
+            Crew.update(
+                {
+                    Crew.from_reset_chest_amount: case_stmt,
+                    Crew.chest_amount: case_stmt,
+                    Crew.total_gained_chest_amount: 0,
+                    Crew.can_promote_captain: True,
+                }
+            ).execute()
+
+            # Delete all contributions from users that are no longer in the crew
+            CrewMemberChestContribution.delete().where(
+                ~fn.EXISTS(
+                    User.select(User.id).where(
+                        (User.id == CrewMemberChestContribution.user)
+                        & (User.crew == CrewMemberChestContribution.crew)
+                    )
+                )
+            ).execute()
 
-    # Reset level
-    Crew.reset_level()
+            # Reset level
+            Crew.reset_level()
 
-    # Reset can promote to Captain
-    Crew.update(can_promote_captain=True).execute()
+        case BountyResetPhase.INACTIVE_CREWS_DISBANDED:
+            # Disband inactive crews
+            await disband_inactive_crews(context)
 
-    # Disband inactive crews
-    context.application.create_task(disband_inactive_crews(context))
+        case _:
+            raise ValueError(f"Invalid bounty reset phase: {phase}")
 
 
 async def add_or_remove_bounty(
@@ -205,26 +269,38 @@ async def add_or_remove_bounty(
     elif should_affect_pending_bounty:
         pending_belly_amount = amount
 
-    from src.chat.manage_message import init
-
-    db = init()
+    db = db_obj.get_db()
 
     with db.atomic():
-        # Refresh user, only bounty and pending bounty is needed
-        refreshed_user: User = User.get_by_id(user.id)
+        # Refresh user, only bounty and pending bounty is needed.
+        # Taxes depend on the total gained bounty, so it's locked until the gain is saved
+        query = User.select(
+            User.bounty,
+            User.pending_bounty,
+            User.total_gained_bounty,
+            User.total_gained_bounty_unmodified,
+        ).where(User.id == user.id)
+        if should_save and add and amount is not None and amount > 0 and should_tax:
+            query = query.for_update()
+
+        refreshed_user: User = query.get()
         user.bounty = refreshed_user.bounty
         user.pending_bounty = refreshed_user.pending_bounty
         user.total_gained_bounty = refreshed_user.total_gained_bounty
         user.total_gained_bounty_unmodified = refreshed_user.total_gained_bounty_unmodified
         previous_pending_bounty = user.pending_bounty
 
+        # Amounts added to each field, saved as increments so concurrent changes are not lost
+        changes: dict[str, int] = {}
+
         # Should remove bounty
         if not add:
             user.bounty -= amount
+            changes["bounty"] = -amount
             if should_affect_pending_bounty:
-                user.pending_bounty += (
-                    amount if pending_belly_amount is None else pending_belly_amount
-                )
+                pending_amount = amount if pending_belly_amount is None else pending_belly_amount
+                user.pending_bounty += pending_amount
+                changes["pending_bounty"] = pending_amount
 
             if user.bounty < 0 and raise_error_if_negative_bounty:
                 logging.exception(
@@ -237,11 +313,16 @@ async def add_or_remove_bounty(
                 raise CommonChatException("Negative bounty after requested action")
 
             if should_save:
-                user.save()
+                condition = (User.bounty >= amount) if raise_error_if_negative_bounty else None
+                if not user.save_increments(condition, **changes):
+                    # Bounty was spent by another action in the meantime
+                    raise CommonChatException("Negative bounty after requested action")
             return
 
         if should_affect_pending_bounty:
-            user.pending_bounty -= amount if pending_belly_amount is None else pending_belly_amount
+            pending_amount = amount if pending_belly_amount is None else pending_belly_amount
+            user.pending_bounty -= pending_amount
+            changes["pending_bounty"] = -pending_amount
 
             if user.pending_bounty < 0 and previous_pending_bounty >= 0:
                 logging.exception(
@@ -253,7 +334,8 @@ async def add_or_remove_bounty(
                 )
 
             if should_save:
-                user.save()
+                user.save_increments(**changes)
+                changes.clear()
 
         if amount <= 0 and not should_update_location:
             return
@@ -308,7 +390,11 @@ async def add_or_remove_bounty(
 
             user.total_gained_bounty += net_amount_after_tax
             user.total_gained_bounty_unmodified += net_amount_after_tax
+            changes["total_gained_bounty"] = net_amount_after_tax
+            changes["total_gained_bounty_unmodified"] = net_amount_after_tax
 
+            # Loan payments are saved right away, so they are not part of the saved change
+            amount_repaid = 0
             if check_for_loan:
                 # If user has an expired bounty loan, use n% of the bounty to repay the loan
                 expired_loans = user.get_expired_bounty_loans()
@@ -326,11 +412,13 @@ async def add_or_remove_bounty(
                     # Subtract from amount
                     amount_to_add -= amount_for_repay
                     amount_for_loans -= amount_for_repay
+                    amount_repaid += amount_for_repay
 
             user.bounty += amount_to_add
+            changes["bounty"] = amount_to_add + amount_repaid
 
             if should_save:
-                user.save()
+                user.save_increments(**changes)
 
             # Active Davy Back Fight, add net amount to participant contribution
             if tax_event_type in DavyBackFight.get_contribution_events():
@@ -345,6 +433,24 @@ async def add_or_remove_bounty(
         await update_location(user, context, update)
 
 
+async def add_bounty_to_users(
+    context: ContextTypes.DEFAULT_TYPE, payouts: list[tuple[User, int]], **kwargs
+) -> None:
+    """
+    Add bounty to many users in a single transaction, instead of one transaction per user
+    :param context: Telegram context
+    :param payouts: The users and the amount to add to each of them
+    :param kwargs: Other arguments of add_or_remove_bounty, the same for all users
+    :return: None
+    """
+
+    with db_obj.get_db().atomic():
+        for user, amount in payouts:
+            await add_or_remove_bounty(
+                user, amount=amount, context=context, should_save=True, **kwargs
+            )
+
+
 def get_amount_from_string(amount: str, user: User) -> int:
     """
     Get the wager amount
@@ -0,0 +1,117 @@
+import time
+from collections import OrderedDict
+
+from telegram import Chat, ChatMember, ChatMemberUpdated, Update
+from telegram.constants import ChatMemberStatus
+from telegram.ext import ContextTypes
+
+import resources.Environment as Env
+
+ADMIN_STATUSES = (ChatMemberStatus.OWNER, ChatMemberStatus.ADMINISTRATOR)
+
+# Chat members as (member, expiry), by (chat id, user id), least recently used first. A None member
+# means the user could not be found in the chat
+_chat_members: OrderedDict[tuple[str, str], tuple[ChatMember | None, float]] = OrderedDict()
+# Chat administrators as (administrators, expiry), by chat id
+_chat_administrators: dict[str, tuple[tuple[ChatMember, ...], float]] = {}
+
+
+def get_cached_chat_member(
+    chat_id: int | str, user_id: int | str
+) -> tuple[bool, ChatMember | None]:
+    """
+    Get a cached chat member
+    :param chat_id: The chat id
+    :param user_id: The user id
+    :return: If the member was cached and not expired, and the member
+    """
+
+    key = (str(chat_id), str(user_id))
+    cached = _chat_members.get(key)
+    if cached is None:
+        return False, None
+
+    chat_member, expiry = cached
+    if expiry < time.monotonic():
+        _chat_members.pop(key)
+        return False, None
+
+    _chat_members.move_to_end(key)
+    return True, chat_member
+
+
+def set_cached_chat_member(
+    chat_id: int | str, user_id: int | str, chat_member: ChatMember | None
+) -> None:
+    """
+    Cache a chat member, evicting the least recently used ones if the cache is full
+    :param chat_id: The chat id
+    :param user_id: The user id
+    :param chat_member: The member, None if the user could not be found in the chat
+    :return: None
+    """
+
+    key = (str(chat_id), str(user_id))
+    _chat_members[key] = (
+        chat_member,
+        time.monotonic() + Env.CHAT_MEMBER_CACHE_TTL_SECONDS.get_int(),
+    )
+    _chat_members.move_to_end(key)
+
+    while len(_chat_members) > Env.CHAT_MEMBER_CACHE_SIZE.get_int():
+        _chat_members.popitem(last=False)
+
+
+async def get_chat_administrators(chat: Chat) -> tuple[ChatMember, ...]:
+    """
+    Get the administrators of a chat, requesting them only if not cached
+    :param chat: The chat
+    :return: The administrators
+    """
+
+    key = str(chat.id)
+    cached = _chat_administrators.get(key)
+    if cached is not None and cached[1] >= time.monotonic():
+        return cached[0]
+
+    chat_administrators = await chat.get_administrators()
+    _chat_administrators[key] = (
+        chat_administrators,
+        time.monotonic() + Env.CHAT_ADMINISTRATORS_CACHE_TTL_SECONDS.get_int(),
+    )
+
+    return chat_administrators
+
+
+async def update_chat_member_cache(update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
+    """
+    Keep the cache up to date with the membership changes sent by Telegram, for any user or for
+    the bot itself
+    :param update: The update
+    :param _context: The context
+    :return: None
+    """
+
+    chat_member_updated: ChatMemberUpdated = update.chat_member or update.my_chat_member
+    if chat_member_updated is None:
+        return
+
+    chat_id = str(chat_member_updated.chat.id)
+    old_status = chat_member_updated.old_chat_member.status
+    new_chat_member = chat_member_updated.new_chat_member
+
+    # The bot can't see the chat anymore, its members will be requested again if it comes back
+    if update.my_chat_member is not None and new_chat_member.status in (
+        ChatMemberStatus.LEFT,
+        ChatMemberStatus.BANNED,
+    ):
+        for key in [key for key in _chat_members if key[0] == chat_id]:
+            _chat_members.pop(key)
+        _chat_administrators.pop(chat_id, None)
+        return
+
+    set_cached_chat_member(chat_id, new_chat_member.user.id, new_chat_member)
+
+    # Administrators changed
+    if old_status in ADMIN_STATUSES or new_chat_member.status in ADMIN_STATUSES:
+        _chat_administrators.pop(chat_id, None)
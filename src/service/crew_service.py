@@ -3,6 +3,7 @@ from datetime import datetime
 from telegram.ext import ContextTypes
 
 from resources import phrases as phrases, Environment as Env
+from src.model.BaseModel import db_obj
 from src.model.Crew import Crew
 from src.model.CrewAbility import CrewAbility
 from src.model.CrewChestSpendingRecord import CrewChestSpendingRecord
@@ -36,6 +37,7 @@ from src.service.location_service import update_location
 from src.service.message_service import get_deeplink
 from src.service.notification_service import send_notification
 from src.utils.math_utils import get_value_from_percentage
+from src.utils.request_cache_utils import invalidate_request_facts
 from src.utils.string_utils import get_belly_formatted
 
 
@@ -277,53 +279,49 @@ def add_to_crew_chest(user: User, amount: int) -> None:
 
     crew: Crew = user.crew
 
-    crew.chest_amount += amount
-    crew.total_gained_chest_amount += amount
-    crew.save()
-
-    # Save contribution
-    contribution: CrewMemberChestContribution = CrewMemberChestContribution.get_or_none(
-        (CrewMemberChestContribution.crew == crew) & (CrewMemberChestContribution.user == user)
-    )
-
-    if contribution is None:
-        contribution = CrewMemberChestContribution()
-        contribution.crew = crew
-        contribution.user = user
-
-    contribution.amount += amount
-    contribution.last_contribution_date = datetime.now()
-    contribution.save()
-
-    # Crew in an active Davy Back Fight, add half to that
-    active_dbf: DavyBackFight = crew.get_in_progress_davy_back_fight()
-    if active_dbf is not None:
-        amount_to_freeze = amount // 2
-        if active_dbf.challenger_crew == crew:
-            active_dbf.challenger_chest += amount_to_freeze
+    # Amounts are added in the database, so concurrent contributions to the same chest are not lost
+    with db_obj.get_db().atomic():
+        # Save contribution, in a single statement so concurrent first contributions of the same
+        # member are added to the same row
+        now = datetime.now()
+        CrewMemberChestContribution.insert(
+            crew=crew, user=user, amount=amount, last_contribution_date=now
+        ).on_conflict(
+            update={
+                CrewMemberChestContribution.amount: CrewMemberChestContribution.amount + amount,
+                CrewMemberChestContribution.last_contribution_date: now,
+            }
+        ).execute()
+
+        chest_amount = amount
+
+        # Crew in an active Davy Back Fight, add half to that
+        active_dbf: DavyBackFight = crew.get_in_progress_davy_back_fight()
+        if active_dbf is not None:
+            amount_to_freeze = amount // 2
+            if active_dbf.challenger_crew == crew:
+                active_dbf.increment(challenger_chest=amount_to_freeze)
+            else:
+                active_dbf.increment(opponent_chest=amount_to_freeze)
+
+            chest_amount -= amount_to_freeze
         else:
-            active_dbf.opponent_chest += amount_to_freeze
-        active_dbf.save()
+            # Crew has penalty DBF, pay the opponent Crew
+            penalty_dbf: DavyBackFight = crew.get_penalty_davy_back_fight()
+            if penalty_dbf is not None:
+                penalty_amount = get_value_from_percentage(
+                    amount, Env.DAVY_BACK_FIGHT_LOSER_CHEST_PERCENTAGE.get_int()
+                )
 
-        crew.chest_amount -= amount_to_freeze
-        crew.save()
-    else:
-        # Crew has penalty DBF, pay the opponent Crew
-        penalty_dbf: DavyBackFight = crew.get_penalty_davy_back_fight()
-        if penalty_dbf is not None:
-            penalty_amount = get_value_from_percentage(
-                amount, Env.DAVY_BACK_FIGHT_LOSER_CHEST_PERCENTAGE.get_int()
-            )
+                opponent_crew = penalty_dbf.get_opponent_crew(crew)
+                opponent_crew.increment(
+                    chest_amount=penalty_amount, total_gained_chest_amount=penalty_amount
+                )
+                penalty_dbf.increment(penalty_payout=penalty_amount)
 
-            opponent_crew = penalty_dbf.get_opponent_crew(crew)
-            opponent_crew.chest_amount += penalty_amount
-            opponent_crew.total_gained_chest_amount += penalty_amount
-            crew.chest_amount -= penalty_amount
-            penalty_dbf.penalty_payout += penalty_amount
+                chest_amount -= penalty_amount
 
-            crew.save()
-            opponent_crew.save()
-            penalty_dbf.save()
+        crew.increment(chest_amount=chest_amount, total_gained_chest_amount=amount)
 
 
 def get_crew_abilities_text(
@@ -417,6 +415,7 @@ async def add_crew_ability(
         Env.CREW_ABILITY_DURATION_DAYS.get_int(), start_time=now
     )
     ability.save()
+    invalidate_request_facts()
 
     # Notify crew members
     await notify_crew_members(
@@ -445,7 +444,7 @@ def add_powerup(
         for member in crew.get_members():
             member.reduce_tax_bracket()
 
-    crew.chest_amount -= price
+    crew.increment(chest_amount=-price)
     crew.save()
 
     # Add spending record
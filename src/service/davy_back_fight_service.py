@@ -16,7 +16,7 @@ from src.model.enums.income_tax.IncomeTaxEventType import IncomeTaxEventType
 from src.model.error.CustomException import CrewValidationException
 from src.model.game.GameOutcome import GameOutcome
 from src.service.date_service import get_datetime_in_future_days
-from src.service.notification_service import send_notification
+from src.service.notification_service import send_notifications
 
 
 def add_participant(user: User, davy_back_fight: DavyBackFight):
@@ -123,14 +123,18 @@ async def start(context: CallbackContext, davy_back_fight: DavyBackFight):
     davy_back_fight.save()
 
     # Send notification to players
-    for participant in davy_back_fight.get_participants():
-        await send_notification(
-            context,
-            participant.user,
-            DavyBackFightStartNotification(
-                davy_back_fight.get_opponent_crew(participant.crew), davy_back_fight
-            ),
-        )
+    send_notifications(
+        context,
+        [
+            (
+                participant.user,
+                DavyBackFightStartNotification(
+                    davy_back_fight.get_opponent_crew(participant.crew), davy_back_fight
+                ),
+            )
+            for participant in davy_back_fight.get_participants()
+        ],
+    )
 
 
 async def add_contribution(user: User, amount: int, opponent: User = None):
@@ -173,8 +177,7 @@ async def add_contribution(user: User, amount: int, opponent: User = None):
         if dbf.is_participant(opponent):
             amount *= 2
 
-    participant.contribution += amount
-    participant.save()
+    participant.increment(contribution=amount)
 
 
 async def end_all(context: ContextTypes.DEFAULT_TYPE):
@@ -198,7 +201,7 @@ async def end(context: CallbackContext, davy_back_fight: DavyBackFight):
     :param davy_back_fight: The Davy Back Fight object
     :return: None
     """
-    from src.service.bounty_service import add_or_remove_bounty
+    from src.service.bounty_service import add_bounty_to_users
 
     outcome: GameOutcome = davy_back_fight.get_outcome()
     if outcome is GameOutcome.CHALLENGER_WON:
@@ -213,29 +216,36 @@ async def end(context: CallbackContext, davy_back_fight: DavyBackFight):
     )
     davy_back_fight.save()
 
-    # Send notification to players
     participants: list[DavyBackFightParticipant] = davy_back_fight.get_participants()
     for participant in participants:
         if participant.crew == winner_crew:
             participant.win_amount = participant.get_win_amount()
             participant.save()
 
-        # Add amount
-        context.application.create_task(
-            add_or_remove_bounty(
-                participant.user,
-                amount=participant.win_amount,
-                context=context,
-                should_save=True,
-                tax_event_type=IncomeTaxEventType.DAVY_BACK_FIGHT,
-                event_id=davy_back_fight.id,
-            )
-        )
-
-        await send_notification(
+    # Add amounts, all in a single task
+    context.application.create_task(
+        add_bounty_to_users(
             context,
-            participant.user,
-            DavyBackFightEndNotification(
-                davy_back_fight.get_opponent_crew(participant.crew), participant
-            ),
+            [
+                (participant.user, participant.win_amount)
+                for participant in participants
+                if participant.win_amount is not None and participant.win_amount > 0
+            ],
+            tax_event_type=IncomeTaxEventType.DAVY_BACK_FIGHT,
+            event_id=davy_back_fight.id,
         )
+    )
+
+    # Send notification to players
+    send_notifications(
+        context,
+        [
+            (
+                participant.user,
+                DavyBackFightEndNotification(
+                    davy_back_fight.get_opponent_crew(participant.crew), participant
+                ),
+            )
+            for participant in participants
+        ],
+    )
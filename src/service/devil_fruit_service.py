@@ -7,6 +7,7 @@ from telegram.ext import ContextTypes
 
 import resources.Environment as Env
 from resources import phrases
+from src.model.BaseModel import db_obj
 from src.model.Crew import Crew
 from src.model.DevilFruit import DevilFruit
 from src.model.DevilFruitAbility import DevilFruitAbility
@@ -45,7 +46,7 @@ from src.service.date_service import (
     default_datetime_format,
 )
 from src.service.message_service import log_error, escape_valid_markdown_chars, full_media_send
-from src.service.notification_service import send_notification
+from src.service.notification_service import send_notification, send_notifications
 from src.utils.file_utils import get_random_item_from_txt
 from src.utils.math_utils import (
     add_percentage_to_value,
@@ -260,10 +261,9 @@ async def release_devil_fruit_to_user(
     :return: None
     """
 
-    from src.chat.manage_message import init
     from src.service.bounty_service import get_next_bounty_reset_time
 
-    db = init()
+    db = db_obj.get_db()
 
     if not datetime_is_before(user.devil_fruit_collection_cooldown_end_date):
         return
@@ -488,13 +488,14 @@ async def warn_inactive_users_with_eaten_devil_fruit(
         Env.DEVIL_FRUIT_MAINTAIN_MIN_LATEST_LEADERBOARD_APPEARANCE.get_int() - 1
     )
 
-    for devil_fruit in inactive_users_devil_fruits:
-        if users is None or (users is not None and devil_fruit.owner in users):
-            await send_notification(
-                context,
-                devil_fruit.owner,
-                DevilFruitRevokeWarningNotification(devil_fruit=devil_fruit),
-            )
+    send_notifications(
+        context,
+        [
+            (devil_fruit.owner, DevilFruitRevokeWarningNotification(devil_fruit=devil_fruit))
+            for devil_fruit in inactive_users_devil_fruits
+            if users is None or (users is not None and devil_fruit.owner in users)
+        ],
+    )
 
 
 def get_inactive_users_with_eaten_devil_fruits(
@@ -53,6 +53,7 @@ from src.service.message_service import (
     mention_markdown_user,
 )
 from src.service.notification_service import send_notification
+from src.service.user_stats_service import add_fight_stats, add_plunder_stats
 from src.utils.math_utils import (
     add_percentage_to_value,
     get_value_from_percentage,
@@ -949,6 +950,7 @@ async def fight_confirm_request(
     # Save info
     opponent.save()
     fight.save()
+    add_fight_stats(fight)
 
     # Send notification to opponent
     await send_notification(context, fight.opponent, FightAttackNotification(fight))
@@ -1417,6 +1419,7 @@ async def plunder_confirm_request(
     # Save info
     opponent.save()
     plunder.save()
+    add_plunder_stats(plunder)
 
     # Send notification to opponent
     await send_notification(context, plunder.opponent, PlunderAttackNotification(plunder))
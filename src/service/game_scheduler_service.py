@@ -0,0 +1,271 @@
+import asyncio
+import datetime
+import heapq
+import json
+import logging
+
+from telegram.ext import Application, CallbackContext
+
+import resources.Environment as Env
+from src.model.BaseModel import db_obj
+from src.model.Game import Game
+from src.model.GameScheduledEvent import GameScheduledEvent
+from src.model.User import User
+from src.model.enums.GameScheduledEventType import GameScheduledEventType
+from src.model.enums.GameStatus import GameStatus
+from src.model.game.GameType import GameType
+from src.service.date_service import get_datetime_in_future_seconds
+
+# Scheduled events as (due timestamp, event id), the next due first. Events cancelled or replaced
+# in the meantime are skipped when due
+_due_events: list[tuple[float, int]] = []
+# Set when an event is scheduled, so the dispatcher can wait for it if it's the next due
+_event_scheduled: asyncio.Event | None = None
+_dispatcher_task: asyncio.Task | None = None
+
+
+def schedule_game_event(
+    game: Game,
+    user: User,
+    event_type: GameScheduledEventType,
+    seconds: int,
+    data: dict = None,
+) -> None:
+    """
+    Schedule a game event, replacing the one of the same type already scheduled for the user
+    :param game: The game
+    :param user: The user the event is for
+    :param event_type: The event type
+    :param seconds: In how many seconds the event should run
+    :param data: The data the event needs to run, must be JSON serializable
+    :return: None
+    """
+
+    with db_obj.get_db().atomic():
+        cancel_game_events(game, user=user, event_type=event_type)
+        event: GameScheduledEvent = GameScheduledEvent.create(
+            game=game,
+            user=user,
+            type=event_type,
+            due_date=get_datetime_in_future_seconds(seconds),
+            data=json.dumps(data) if data is not None else None,
+        )
+
+    push_due_event(event)
+
+
+def cancel_game_events(
+    game: Game, user: User = None, event_type: GameScheduledEventType = None
+) -> None:
+    """
+    Cancel the scheduled events of a game
+    :param game: The game
+    :param user: Only cancel the events of this user, None for all users
+    :param event_type: Only cancel the events of this type, None for all types
+    :return: None
+    """
+
+    query = GameScheduledEvent.delete().where(GameScheduledEvent.game == game)
+    if user is not None:
+        query = query.where(GameScheduledEvent.user == user)
+    if event_type is not None:
+        query = query.where(GameScheduledEvent.type == event_type)
+
+    query.execute()
+
+
+def push_due_event(event: GameScheduledEvent) -> None:
+    """
+    Add an event to the ones the dispatcher waits for
+    :param event: The event
+    :return: None
+    """
+
+    heapq.heappush(_due_events, (event.due_date.timestamp(), event.id))
+
+    # New next due event, the dispatcher should wake up earlier
+    if _event_scheduled is not None and _due_events[0][1] == event.id:
+        _event_scheduled.set()
+
+
+def start_game_scheduler(application: Application) -> None:
+    """
+    Start the dispatcher of the game events, to be called at startup
+    :param application: The application
+    :return: None
+    """
+
+    global _dispatcher_task
+
+    if _dispatcher_task is None:
+        # Not an application task, else stopping the application would wait for it forever
+        _dispatcher_task = asyncio.create_task(run_game_scheduler(application))
+
+
+def stop_game_scheduler() -> None:
+    """
+    Stop the dispatcher of the game events. Events not yet run stay scheduled for the next start
+    :return: None
+    """
+
+    global _dispatcher_task
+
+    if _dispatcher_task is not None:
+        _dispatcher_task.cancel()
+        _dispatcher_task = None
+
+
+async def run_game_scheduler(application: Application) -> None:
+    """
+    Run each game event when it's due, including the ones scheduled before a restart
+    :param application: The application
+    :return: None
+    """
+
+    global _event_scheduled
+
+    _event_scheduled = asyncio.Event()
+    context = CallbackContext(application)
+
+    async with db_obj.connection():
+        for event in GameScheduledEvent.select(GameScheduledEvent.id, GameScheduledEvent.due_date):
+            push_due_event(event)
+
+    application.create_task(schedule_missing_guess_game_events(context))
+
+    while True:
+        _event_scheduled.clear()
+
+        now = datetime.datetime.now().timestamp()
+        while len(_due_events) > 0 and _due_events[0][0] <= now:
+            _, event_id = heapq.heappop(_due_events)
+            application.create_task(run_game_event(context, event_id))
+
+        # Sleep till the next due event, or till an earlier one is scheduled
+        timeout = _due_events[0][0] - now if len(_due_events) > 0 else None
+        try:
+            await asyncio.wait_for(_event_scheduled.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_game_event(context: CallbackContext, event_id: int) -> None:
+    """
+    Run a due game event, if it was not cancelled or replaced in the meantime. The event is
+    deleted once run, or scheduled again later if it failed
+    :param context: The context
+    :param event_id: The event id
+    :return: None
+    """
+
+    from src.chat.common.screens.screen_game_manage import run_scheduled_event
+
+    async with db_obj.connection():
+        event: GameScheduledEvent = GameScheduledEvent.get_or_none(
+            GameScheduledEvent.id == event_id
+        )
+        if event is None:
+            return
+
+        try:
+            await run_scheduled_event(context, event)
+        except Exception as e:
+            logging.exception(f"Failed to run game event {event_id}: {e}")
+            retry_game_event(event)
+            return
+
+        # Already deleted if the event scheduled its replacement
+        GameScheduledEvent.delete().where(GameScheduledEvent.id == event_id).execute()
+
+
+def retry_game_event(event: GameScheduledEvent) -> None:
+    """
+    Schedule a failed game event again, waiting longer at each failure
+    :param event: The event
+    :return: None
+    """
+
+    retry_seconds = min(
+        Env.GAME_SCHEDULED_EVENT_RETRY_SECONDS.get_int() * 2**event.attempts,
+        Env.GAME_SCHEDULED_EVENT_MAX_RETRY_SECONDS.get_int(),
+    )
+    event.attempts += 1
+    event.due_date = get_datetime_in_future_seconds(retry_seconds)
+
+    # Not replaced or cancelled while running
+    if (
+        GameScheduledEvent.update(attempts=event.attempts, due_date=event.due_date)
+        .where(GameScheduledEvent.id == event.id)
+        .execute()
+        > 0
+    ):
+        push_due_event(event)
+
+
+async def schedule_missing_guess_game_events(context: CallbackContext) -> None:
+    """
+    Schedule the next hint and the opponent timeout of the guess games in progress that have
+    none, like the ones started before game events were saved
+    :param context: The context
+    :return: None
+    """
+
+    from src.service.game_service import enqueue_timeout_opponent_guess_game
+
+    async with db_obj.connection():
+        games: list[Game] = list(
+            Game.select().where(
+                (Game.status == GameStatus.IN_PROGRESS)
+                & (Game.type.in_(GameType.get_guess_based_list()))
+            )
+        )
+        if len(games) == 0:
+            return
+
+        scheduled_events: set[tuple[int, int, GameScheduledEventType]] = {
+            (event.game_id, event.user_id, event.get_type())
+            for event in GameScheduledEvent.select(
+                GameScheduledEvent.game, GameScheduledEvent.user, GameScheduledEvent.type
+            ).where(GameScheduledEvent.game.in_([game.id for game in games]))
+        }
+
+        for game in games:
+            try:
+                players: list[tuple[User, datetime.datetime | None]] = [
+                    (game.challenger, game.last_hint_date)
+                ]
+                if game.is_global() and game.has_opponent():
+                    players.append((game.opponent, game.last_hint_opponent_date))
+
+                for user, last_hint_date in players:
+                    # Not started yet, or challenger of a global game that has finished
+                    if last_hint_date is None or (
+                        game.is_global()
+                        and game.is_challenger(user)
+                        and game.challenger_has_finished()
+                    ):
+                        continue
+
+                    if (game.id, user.id, GameScheduledEventType.HINT) in scheduled_events:
+                        continue
+
+                    # Due at its original time, missed hints are issued if already past
+                    next_hint_date = last_hint_date + datetime.timedelta(
+                        seconds=game.get_seconds_for_every_hint()
+                    )
+                    schedule_game_event(
+                        game,
+                        user,
+                        GameScheduledEventType.HINT,
+                        max(int((next_hint_date - datetime.datetime.now()).total_seconds()), 0),
+                    )
+
+                if (
+                    game.is_global()
+                    and game.has_opponent()
+                    and (game.id, game.opponent_id, GameScheduledEventType.OPPONENT_TIMEOUT)
+                    not in scheduled_events
+                ):
+                    await enqueue_timeout_opponent_guess_game(context, game)
+            except Exception as e:
+                logging.exception(f"Failed to schedule the missing events of game {game.id}: {e}")
@@ -16,6 +16,7 @@ from src.model.GroupChat import GroupChat
 from src.model.User import User
 from src.model.enums.ContextDataKey import ContextDataKey
 from src.model.enums.Emoji import Emoji
+from src.model.enums.GameScheduledEventType import GameScheduledEventType
 from src.model.enums.GameStatus import GameStatus
 from src.model.enums.Notification import GameTurnNotification, GameOutcomeNotification
 from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
@@ -44,6 +45,7 @@ from src.service.date_service import (
     get_elapsed_duration,
 )
 from src.service.devil_fruit_service import get_ability_adjusted_datetime
+from src.service.game_scheduler_service import schedule_game_event
 from src.service.message_service import (
     mention_markdown_user,
     delete_message,
@@ -54,9 +56,8 @@ from src.service.message_service import (
     get_deeplink,
 )
 from src.service.notification_service import send_notification
+from src.service.user_stats_service import add_game_stats
 from src.utils.context_utils import (
-    get_bot_context_data,
-    set_bot_context_data,
     get_random_user_context_inner_query_key,
 )
 from src.utils.phrase_utils import get_outcome_text
@@ -156,6 +157,9 @@ async def end_game(
         opponent.save()
     game.save()
 
+    if not previous_status.is_finished():
+        add_game_stats(game)
+
     if is_forced_end:
         # No notification or message edits required
         return
@@ -529,11 +533,9 @@ def force_end_all_active() -> None:
     :return: None
     """
 
-    active_games = Game.select().where(Game.status.not_in(GameStatus.get_finished()))
-
-    for game in active_games:
-        game.status = GameStatus.FORCED_END
-        game.save()
+    Game.update(status=GameStatus.FORCED_END).where(
+        Game.status.not_in(GameStatus.get_finished())
+    ).execute()
 
 
 async def end_inactive_games(context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -716,7 +718,7 @@ async def set_user_private_screen(
     return
 
 
-def get_guess_game_final_image_path(game: Game) -> str:
+async def get_guess_game_final_image_path(game: Game) -> str:
     """
     Get the path of the final image of a guess game
 
@@ -732,7 +734,7 @@ def get_guess_game_final_image_path(game: Game) -> str:
 
         case GameType.SHAMBLES:
             shambles: Shambles = Shambles(**json_dict)
-            shambles.set_grid_image(highlight_answer=True)
+            await shambles.set_grid_image_async(highlight_answer=True)
 
             return shambles.image_path
 
@@ -813,16 +815,17 @@ async def guess_game_countdown_to_start(
 
     # Update every 10 seconds if remaining time is more than 10 seconds, otherwise
     # update every 5 seconds
-    if remaining_seconds > 10:
-        await asyncio.sleep(10)
-        await guess_game_countdown_to_start(
-            update, context, game, remaining_seconds - 10, run_game_function, player
-        )
-    else:
-        await asyncio.sleep(5)
-        await guess_game_countdown_to_start(
-            update, context, game, remaining_seconds - 5, run_game_function, player
-        )
+    wait_seconds = 10 if remaining_seconds > 10 else 5
+    schedule_game_event(
+        game,
+        player,
+        GameScheduledEventType.COUNTDOWN_TO_START,
+        wait_seconds,
+        data={
+            "remaining_seconds": remaining_seconds - wait_seconds,
+            "update": update.to_dict() if update is not None else None,
+        },
+    )
 
 
 async def get_guess_game_users_to_send_message_to(
@@ -889,7 +892,7 @@ async def guess_game_validate_answer(
 
     terminology: Terminology = game.get_terminology()
     term_text_addition = get_guess_game_result_term_text(terminology)
-    image_path: str = get_guess_game_final_image_path(game)
+    image_path: str = await get_guess_game_final_image_path(game)
 
     # Send message to winner
     await set_user_private_screen(user, should_reset=True)
@@ -1233,38 +1236,35 @@ def get_auto_move_warning(add_turn_notification_time: bool = False) -> str:
     )
 
 
-async def enqueue_auto_move(
+def enqueue_auto_move(
     update: Update,
-    context: ContextTypes.DEFAULT_TYPE,
     game: Game,
     user: User,
-    auto_move_function: Callable,
     message_id: int,
     extra_wait_time: int = 0,
 ) -> None:
     """
-    Enqueue auto move
+    Enqueue auto move, run if the board is unchanged when the time is up
     :param update: The update
-    :param context: The context
     :param game: The game
     :param user: The user
-    :param auto_move_function: The auto move function
     :param message_id: Identifier of the message that will be updated in auto move
     :param extra_wait_time: Extra time to wait
     :return: None
     """
-    await asyncio.sleep(get_auto_move_seconds(not game.is_global()))
-
-    if extra_wait_time > 0:
-        await asyncio.sleep(extra_wait_time)
 
-    updated_game = Game.get_by_id(game.id)
-
-    # Game already ended
-    if game.is_finished():
-        return
-
-    await auto_move_function(update, context, updated_game, user, message_id, game)
+    schedule_game_event(
+        game,
+        user,
+        GameScheduledEventType.AUTO_MOVE,
+        get_auto_move_seconds(not game.is_global()) + extra_wait_time,
+        data={
+            "update": update.to_dict() if update is not None else None,
+            "message_id": message_id,
+            "board": game.board,
+            "opponent_board": game.opponent_board,
+        },
+    )
 
 
 async def edit_other_player_message(
@@ -1350,8 +1350,8 @@ async def enqueue_timeout_opponent_guess_game(
     context: ContextTypes.DEFAULT_TYPE, game: Game
 ) -> None:
     """
-    Enqueue timeout opponent guess game. If the game is not finished and timeout is not yet enqueued, waits till as much
-    time has passed as the challenger took to guess, and if the game is still ongoing, it means the opponent has lost
+    Enqueue timeout opponent guess game. If the game is not finished, schedules a timeout for when as much time has
+    passed as the challenger took to guess, and if the game is then still ongoing, it means the opponent has lost
     :param context: The context
     :param game: The game
     :return: None
@@ -1378,30 +1378,11 @@ async def enqueue_timeout_opponent_guess_game(
         await timeout_opponent_guess_game(context, game)
         return
 
-    # Already enqueued a timeout, do not enqueue more
-    try:
-        get_bot_context_data(
-            context,
-            ContextDataKey.GAME_OPPONENT_TIMEOUT,
-            inner_key=str(game.id),
-            tolerate_key_exception=False,
-        )
-        # Key exists, no error, so timeout already enqueued
-        return
-    except KeyError:
-        set_bot_context_data(
-            context, ContextDataKey.GAME_OPPONENT_TIMEOUT, game.id, inner_key=str(game.id)
-        )
-
-    # Wait for the remaining time, then try ending if game is not yet finished
-    await asyncio.sleep(remaining_seconds)
-    updated_game = Game.get_by_id(game.id)
-
-    # Game already ended
-    if game.is_finished():
-        return
-
-    await timeout_opponent_guess_game(context, updated_game)
+    # When the remaining time is up, try ending if game is not yet finished. Replaces the timeout
+    # already enqueued, if any
+    schedule_game_event(
+        game, game.opponent, GameScheduledEventType.OPPONENT_TIMEOUT, remaining_seconds
+    )
 
 
 async def end_global_game_player(
@@ -1461,23 +1442,6 @@ async def challenger_has_finished_or_opponent_timeout(
     return False
 
 
-async def restart_hint_thread_if_down_all_games(context: ContextTypes.DEFAULT_TYPE) -> None:
-    """
-    Restart the hint thread if it's down for all games
-    :param context: The context object
-    :return: None
-    """
-    from src.chat.common.screens.screen_game_manage import restart_hint_thread_if_down
-
-    # Get all guess games in progress
-    games = Game.select().where(
-        (Game.status == GameStatus.IN_PROGRESS) & (Game.type.in_(GameType.get_guess_based_list()))
-    )
-
-    for game in games:
-        context.application.create_task(restart_hint_thread_if_down(context, game))
-
-
 def get_generic_boards_for_guess_game(
     game: Game, max_len: int = None, only_letters: bool = False
 ) -> [GameBoard, GameBoard]:
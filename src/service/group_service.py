@@ -1,12 +1,17 @@
+import asyncio
+import logging
+import time
 from datetime import datetime, timedelta
+from typing import Awaitable, Callable, TypeVar
 
 from telegram import Message
-from telegram.error import TelegramError
+from telegram.error import BadRequest, Forbidden, RetryAfter, TelegramError
 from telegram.ext import ContextTypes
 
+import constants as c
 import resources.Environment as Env
 from resources import phrases
-from src.model.BaseModel import BaseModel
+from src.model.BaseModel import BaseModel, db_obj
 from src.model.Group import Group
 from src.model.GroupChat import GroupChat
 from src.model.GroupChatAutoDelete import GroupChatAutoDelete
@@ -15,12 +20,15 @@ from src.model.GroupChatEnabledFeaturePin import GroupChatEnabledFeaturePin
 from src.model.GroupChatFeaturePinMessage import GroupChatFeaturePinMessage
 from src.model.GroupUser import GroupUser
 from src.model.Leaderboard import Leaderboard
-from src.model.Prediction import Prediction
 from src.model.PredictionGroupChatMessage import PredictionGroupChatMessage
 from src.model.User import User
 from src.model.enums.Feature import Feature
+from src.model.pojo.BroadcastReport import BroadcastReport
 from src.model.pojo.Keyboard import Keyboard
-from src.service.message_service import full_message_send, delete_message
+from src.service.activity_service import flush_activity
+from src.service.message_service import full_message_send
+
+T = TypeVar("T")
 
 
 def is_main_group(group_chat: GroupChat) -> bool:
@@ -38,24 +46,88 @@ def is_main_group(group_chat: GroupChat) -> bool:
     return int(group.tg_group_id) == int(main_group_id)
 
 
-def feature_is_enabled(group_chat: GroupChat, feature: Feature) -> bool:
+# Feature -> ids of the group chats in which the feature is not in its default state, mirrors
+# GroupChatEnabledDisabledFeature. Sets are replaced instead of modified, so they can be safely
+# read from the database executor
+_toggled_feature_index: dict[Feature, frozenset[int]] | None = None
+
+
+def load_feature_index() -> None:
     """
-    Checks if a feature is enabled
+    Load the enabled/disabled features of all the group chats in memory
+    :return: None
+    """
+
+    global _toggled_feature_index
+
+    index: dict[Feature, set[int]] = {feature: set() for feature in Feature}
+    for row in GroupChatEnabledDisabledFeature.select(
+        GroupChatEnabledDisabledFeature.group_chat, GroupChatEnabledDisabledFeature.feature
+    ).tuples():
+        group_chat_id, feature_value = row
+        try:
+            index[Feature(feature_value)].add(group_chat_id)
+        except ValueError:  # Feature no longer existing
+            continue
+
+    _toggled_feature_index = {feature: frozenset(ids) for feature, ids in index.items()}
+
+
+def get_toggled_feature_group_chat_ids(feature: Feature) -> frozenset[int]:
+    """
+    Get the ids of the group chats in which a feature is not in its default state
+    :param feature: The feature
+    :return: The group chat ids
+    """
+
+    if _toggled_feature_index is None:
+        load_feature_index()
+
+    return _toggled_feature_index[feature]
+
+
+def add_feature_enabled_disabled(group_chat: GroupChat, feature: Feature) -> None:
+    """
+    Save a feature as not in its default state for a group chat
     :param group_chat: The group chat
     :param feature: The feature
-    :return: True if the feature is enabled, False otherwise
+    :return: None
     """
 
-    group_chat_enabled_disabled_feature = GroupChatEnabledDisabledFeature.get_or_none(
+    enabled_disabled_feature = GroupChatEnabledDisabledFeature()
+    enabled_disabled_feature.group_chat = group_chat
+    enabled_disabled_feature.feature = feature
+    enabled_disabled_feature.save()
+
+    _toggled_feature_index[feature] = get_toggled_feature_group_chat_ids(feature) | {group_chat.id}
+
+
+def remove_feature_enabled_disabled(group_chat: GroupChat, feature: Feature) -> None:
+    """
+    Restore a feature to its default state for a group chat
+    :param group_chat: The group chat
+    :param feature: The feature
+    :return: None
+    """
+
+    GroupChatEnabledDisabledFeature.delete().where(
         (GroupChatEnabledDisabledFeature.group_chat == group_chat)
         & (GroupChatEnabledDisabledFeature.feature == feature)
-    )
+    ).execute()
 
-    return (
-        feature.is_enabled_by_default()
-        if group_chat_enabled_disabled_feature is None
-        else not feature.is_enabled_by_default()
-    )
+    _toggled_feature_index[feature] = get_toggled_feature_group_chat_ids(feature) - {group_chat.id}
+
+
+def feature_is_enabled(group_chat: GroupChat, feature: Feature) -> bool:
+    """
+    Checks if a feature is enabled
+    :param group_chat: The group chat
+    :param feature: The feature
+    :return: True if the feature is enabled, False otherwise
+    """
+
+    is_toggled = group_chat.id in get_toggled_feature_group_chat_ids(feature)
+    return feature.is_enabled_by_default() != is_toggled
 
 
 def get_group_or_topic_text(group_chat: GroupChat) -> str:
@@ -95,32 +167,14 @@ def get_group_chats_with_feature_enabled(
     if excluded_group_chats is None:
         excluded_group_chats = []
 
-    # Would be better to use some join, couldn't get it to work though
-    group_chats_enabled_disabled_feature: list[
-        GroupChatEnabledDisabledFeature
-    ] = GroupChatEnabledDisabledFeature.select().where(
-        GroupChatEnabledDisabledFeature.feature == feature
-    )
-
+    toggled_group_chat_ids = get_toggled_feature_group_chat_ids(feature)
     if feature.is_enabled_by_default():
-        group_chats_with_feature_disabled: list[GroupChat] = [
-            gcf.group_chat for gcf in group_chats_enabled_disabled_feature
-        ]
-    else:  # Find all group_chats that don't have a record
-        group_chats_with_feature_disabled: list[GroupChat] = [
-            gc
-            for gc in GroupChat.select().where(
-                (GroupChat.is_active == True)
-                & (
-                    GroupChat.id.not_in(
-                        [gcf.group_chat.id for gcf in group_chats_enabled_disabled_feature]
-                    )
-                )
-            )
-        ]
+        feature_filter = GroupChat.id.not_in(list(toggled_group_chat_ids))
+    else:
+        feature_filter = GroupChat.id.in_(list(toggled_group_chat_ids))
 
     return (
-        GroupChat.select()
+        GroupChat.select(GroupChat, Group)
         .distinct()
         .join(Group, on=(Group.id == GroupChat.group))
         .where(
@@ -128,7 +182,7 @@ def get_group_chats_with_feature_enabled(
             & (GroupChat.is_active == True)
             & group_filter
             & (GroupChat.id.not_in([egc.id for egc in excluded_group_chats]))
-            & (GroupChat.id.not_in([c.id for c in group_chats_with_feature_disabled]))
+            & feature_filter
         )
     )
 
@@ -166,6 +220,19 @@ async def broadcast_to_chats_with_feature_enabled_dispatch(
     )
 
 
+# Broadcasts that are still running, to report their progress
+_active_broadcasts: list[BroadcastReport] = []
+
+
+def get_active_broadcasts() -> list[BroadcastReport]:
+    """
+    Gets the reports of the broadcasts that are still running
+    :return: The broadcast reports
+    """
+
+    return list(_active_broadcasts)
+
+
 async def broadcast_to_chats_with_feature_enabled(
     context: ContextTypes.DEFAULT_TYPE,
     feature: Feature,
@@ -174,9 +241,11 @@ async def broadcast_to_chats_with_feature_enabled(
     excluded_group_chats: list[GroupChat] = None,
     external_item: BaseModel = None,
     filter_by_groups: list[Group] = None,
-) -> None:
+) -> BroadcastReport:
     """
-    Broadcasts a message to all the chats with a feature enabled
+    Broadcasts a message to all the chats with a feature enabled.
+    Messages are sent concurrently, up to BROADCAST_MAX_CONCURRENCY at a time, while the
+    application rate limiter keeps them within the Telegram global and per-chat limits
     :param context: The context
     :param feature: The feature
     :param text: The message
@@ -184,6 +253,7 @@ async def broadcast_to_chats_with_feature_enabled(
     :param excluded_group_chats: The chats to exclude from the broadcast
     :param external_item: The external item to save the group chat message
     :param filter_by_groups: The groups to filter by
+    :return: The broadcast report
     """
 
     if feature in [Feature.PREDICTION, Feature.LEADERBOARD] and external_item is None:
@@ -194,62 +264,175 @@ async def broadcast_to_chats_with_feature_enabled(
     if filter_by_groups is None:
         filter_by_groups = []
 
-    group_chats: list[GroupChat] = get_group_chats_with_feature_enabled(
-        feature, excluded_group_chats=excluded_group_chats, filter_by_groups=filter_by_groups
+    group_chats: list[GroupChat] = await db_obj.run_in_executor(
+        lambda: list(
+            get_group_chats_with_feature_enabled(
+                feature,
+                excluded_group_chats=excluded_group_chats,
+                filter_by_groups=filter_by_groups,
+            )
+        )
     )
     feature_is_pinnable = feature.is_pinnable()
 
-    # Unpin all previous messages of this feature
+    pin_group_chat_ids: set[int] = set()
     if feature_is_pinnable:
         # Get all messages to unpin to avoid unpinning messages that are just pinned due to async
         # call
-        messages_to_unpin: list[GroupChatFeaturePinMessage] = list(
-            GroupChatFeaturePinMessage.select().where(
-                GroupChatFeaturePinMessage.feature == feature
+        messages_to_unpin: list[GroupChatFeaturePinMessage] = await db_obj.run_in_executor(
+            lambda: list(
+                GroupChatFeaturePinMessage.select().where(
+                    GroupChatFeaturePinMessage.feature == feature
+                )
             )
         )
         await unpin_feature_messages_dispatch(context, messages_to_unpin)
 
-    for group_chat in group_chats:
-        group_chat: GroupChat = group_chat
+        # Group chats in which the message should be pinned, loaded at once instead of per chat
+        pin_group_chat_ids = await db_obj.run_in_executor(
+            lambda: {
+                group_chat_id
+                for (group_chat_id,) in GroupChatEnabledFeaturePin.select(
+                    GroupChatEnabledFeaturePin.group_chat
+                )
+                .where(GroupChatEnabledFeaturePin.feature == feature)
+                .tuples()
+            }
+        )
+
+    report = BroadcastReport(feature, len(group_chats))
+    _active_broadcasts.append(report)
+
+    semaphore = asyncio.Semaphore(Env.BROADCAST_MAX_CONCURRENCY.get_int())
+    sent_messages: list[tuple[GroupChat, Message]] = []
+    pinned_messages: list[tuple[GroupChat, Message]] = []
+    failed_group_chats: list[tuple[GroupChat, str]] = []
+
+    async def send(group_chat: GroupChat) -> None:
+        async with semaphore:
+            try:
+                message: Message = await send_with_retry(
+                    lambda: full_message_send(
+                        context, text, keyboard=inline_keyboard, group_chat=group_chat
+                    )
+                )
+            except TelegramError as te:
+                failed_group_chats.append((group_chat, str(te)))
+                report.failed += 1
+                report.errors[group_chat.id] = str(te)
+                return
+
+            sent_messages.append((group_chat, message))
+            report.sent += 1
+
+            if group_chat.id not in pin_group_chat_ids:
+                return
+
+            try:
+                await send_with_retry(lambda: message.pin(disable_notification=True))
+                pinned_messages.append((group_chat, message))
+                report.pinned += 1
+            except TelegramError as te:
+                # The message was still sent, so not counted as failed
+                failed_group_chats.append((group_chat, str(te)))
+                report.pin_failed += 1
+                report.errors[group_chat.id] = str(te)
+
+    try:
+        # Sending doesn't touch the database (the groups are joined in the query), everything
+        # is saved at the end in this task
+        await asyncio.gather(*(send(group_chat) for group_chat in group_chats))
+    finally:
+        report.end_date = datetime.now()
+        _active_broadcasts.remove(report)
+
+        await db_obj.run_in_executor(
+            save_broadcast_results,
+            feature,
+            external_item,
+            sent_messages,
+            pinned_messages,
+            failed_group_chats,
+        )
+
+        logging.info(str(report))
+
+    return report
+
+
+async def send_with_retry(send_function: Callable[[], Awaitable[T]]) -> T:
+    """
+    Calls a Telegram method, waiting and retrying when flood control is hit
+    :param send_function: The function that calls the method
+    :return: The result of the method
+    """
+
+    max_retries = Env.BROADCAST_MAX_RETRIES.get_int()
+    for attempt in range(max_retries + 1):
         try:
-            message: Message = await full_message_send(
-                context, text, keyboard=inline_keyboard, group_chat=group_chat
+            return await send_function()
+        except RetryAfter as ra:
+            if attempt == max_retries:
+                raise
+
+            retry_after = (
+                ra.retry_after
+                if isinstance(ra.retry_after, (int, float))
+                else ra.retry_after.total_seconds()
             )
+            await asyncio.sleep(retry_after)
 
-            if feature is Feature.PREDICTION:  # Save Prediction Group Chat Message
-                prediction_group_chat_message: PredictionGroupChatMessage = (
-                    PredictionGroupChatMessage()
-                )
-                external_item: Prediction = external_item
-                prediction_group_chat_message.prediction = external_item
-                prediction_group_chat_message.group_chat = group_chat
-                prediction_group_chat_message.message_id = message.message_id
-                prediction_group_chat_message.save()
+
+def save_broadcast_results(
+    feature: Feature,
+    external_item: BaseModel | None,
+    sent_messages: list[tuple[GroupChat, Message]],
+    pinned_messages: list[tuple[GroupChat, Message]],
+    failed_group_chats: list[tuple[GroupChat, str]],
+) -> None:
+    """
+    Saves the sent and pinned messages and the errors of a broadcast
+    :param feature: The feature
+    :param external_item: The external item to save the group chat message
+    :param sent_messages: The sent messages with their group chat
+    :param pinned_messages: The pinned messages with their group chat
+    :param failed_group_chats: The group chats that failed with their error
+    :return: None
+    """
+
+    with db_obj.get_db().atomic():
+        if len(sent_messages) > 0:
+            if feature is Feature.PREDICTION:  # Save Prediction Group Chat Messages
+                PredictionGroupChatMessage.insert_many(
+                    [
+                        {
+                            PredictionGroupChatMessage.prediction: external_item,
+                            PredictionGroupChatMessage.group_chat: group_chat,
+                            PredictionGroupChatMessage.message_id: message.message_id,
+                            PredictionGroupChatMessage.date: datetime.now(),
+                        }
+                        for group_chat, message in sent_messages
+                    ]
+                ).execute()
             elif feature is Feature.LEADERBOARD:  # Save Leaderboard message id
                 external_item: Leaderboard = external_item
-                external_item.message_id = message.message_id
+                external_item.message_id = sent_messages[-1][1].message_id
                 external_item.save()
 
-            if feature_is_pinnable:
-                should_pin = (
-                    GroupChatEnabledFeaturePin.get_or_none(
-                        (GroupChatEnabledFeaturePin.group_chat == group_chat)
-                        & (GroupChatEnabledFeaturePin.feature == feature)
-                    )
-                    is not None
-                )
-
-                if should_pin:
-                    await message.pin(disable_notification=True)
-                    pin_message: GroupChatFeaturePinMessage = GroupChatFeaturePinMessage()
-                    pin_message.group_chat = group_chat
-                    pin_message.feature = feature
-                    pin_message.message_id = message.message_id
-                    pin_message.save()
+        if len(pinned_messages) > 0:
+            GroupChatFeaturePinMessage.insert_many(
+                [
+                    {
+                        GroupChatFeaturePinMessage.group_chat: group_chat,
+                        GroupChatFeaturePinMessage.feature: feature,
+                        GroupChatFeaturePinMessage.message_id: message.message_id,
+                    }
+                    for group_chat, message in pinned_messages
+                ]
+            ).execute()
 
-        except TelegramError as te:
-            save_group_chat_error(group_chat, str(te))
+    for group_chat, error in failed_group_chats:
+        save_group_chat_error(group_chat, error)
 
 
 async def unpin_feature_messages_dispatch(
@@ -274,14 +457,14 @@ async def unpin_feature_messages(
     """
 
     for pin_message in messages_to_unpin:
-        group_chat: GroupChat = pin_message.group_chat
-        group: Group = group_chat.group
+        group_chat: GroupChat = await db_obj.run_in_executor(lambda: pin_message.group_chat)
+        group: Group = await db_obj.run_in_executor(lambda: group_chat.group)
         try:
             await context.bot.unpin_chat_message(group.tg_group_id, pin_message.message_id)
         except TelegramError as te:
-            save_group_chat_error(group_chat, str(te))
+            await db_obj.run_in_executor(save_group_chat_error, group_chat, str(te))
 
-        pin_message.delete_instance()
+        await db_obj.run_in_executor(pin_message.delete_instance)
 
 
 def deactivate_inactive_group_chats() -> None:
@@ -289,6 +472,9 @@ def deactivate_inactive_group_chats() -> None:
     Deactivates the inactive groups and group chats
     """
 
+    # Write pending activity first, so recently active groups and users are not deactivated
+    flush_activity()
+
     inactive_days = Env.INACTIVE_GROUP_DAYS.get_int()
 
     (
@@ -344,41 +530,115 @@ def save_group_chat_error(group_chat: GroupChat, error: str) -> None:
     group.save()
 
 
+_auto_delete_lock = asyncio.Lock()
+_auto_delete_metrics: dict[str, float] = {
+    "backlog": 0,  # Messages due at the start of the last run
+    "oldest_delay_seconds": 0,  # How late the oldest due message was at the start of the last run
+    "deleted": 0,
+    "failed": 0,
+    "last_run_seconds": 0,
+}
+
+
+def get_auto_delete_metrics() -> dict[str, float]:
+    """
+    Get the auto delete metrics
+    :return: The metrics
+    """
+
+    return dict(_auto_delete_metrics)
+
+
 async def auto_delete(context: ContextTypes.DEFAULT_TYPE) -> None:
     """
-    Auto delete messages
+    Auto delete all the due messages, in batches by chat
     :param context: The context
     """
 
-    # Get maximum 20 messages to auto delete
-    auto_deletes: list[GroupChatAutoDelete] = (
-        GroupChatAutoDelete.select()
-        .where(GroupChatAutoDelete.delete_date < datetime.now())
-        .limit(20)
-    )
+    # Previous run still deleting
+    if _auto_delete_lock.locked():
+        return
+
+    async with _auto_delete_lock:
+        start = time.perf_counter()
+        now = datetime.now()
+
+        backlog, oldest_delete_date = await db_obj.run_in_executor(
+            GroupChatAutoDelete.get_backlog, now
+        )
+        _auto_delete_metrics["backlog"] = backlog
+        _auto_delete_metrics["oldest_delay_seconds"] = (
+            (now - oldest_delete_date).total_seconds() if oldest_delete_date is not None else 0
+        )
+
+        semaphore = asyncio.Semaphore(Env.AUTO_DELETE_MAX_CONCURRENCY.get_int())
+        fetch_size = Env.AUTO_DELETE_FETCH_SIZE.get_int()
+        while True:
+            auto_deletes: list[GroupChatAutoDelete] = await db_obj.run_in_executor(
+                GroupChatAutoDelete.get_due, now, fetch_size
+            )
+            if len(auto_deletes) == 0:
+                break
+
+            # Messages of all the topics of a group are deleted together
+            auto_deletes_by_chat: dict[str, list[GroupChatAutoDelete]] = {}
+            for auto_delete_item in auto_deletes:
+                auto_deletes_by_chat.setdefault(
+                    auto_delete_item.group_chat.group.tg_group_id, []
+                ).append(auto_delete_item)
+
+            batch_size = c.TG_DELETE_MESSAGES_MAX_COUNT
+            await asyncio.gather(
+                *[
+                    auto_delete_batch(
+                        context, semaphore, chat_id, chat_auto_deletes[i : i + batch_size]
+                    )
+                    for chat_id, chat_auto_deletes in auto_deletes_by_chat.items()
+                    for i in range(0, len(chat_auto_deletes), batch_size)
+                ]
+            )
+
+            # Removed also if failed, as before, so a chat that can't be cleaned doesn't block
+            await db_obj.run_in_executor(
+                GroupChatAutoDelete.delete_by_ids, [item.id for item in auto_deletes]
+            )
+
+            if len(auto_deletes) < fetch_size:
+                break
 
-    for auto_delete_item in auto_deletes:
-        context.application.create_task(auto_delete_process(context, auto_delete_item))
+        _auto_delete_metrics["last_run_seconds"] = time.perf_counter() - start
 
 
-async def auto_delete_process(
-    context: ContextTypes.DEFAULT_TYPE, auto_delete_item: GroupChatAutoDelete
+async def auto_delete_batch(
+    context: ContextTypes.DEFAULT_TYPE,
+    semaphore: asyncio.Semaphore,
+    chat_id: str,
+    auto_deletes: list[GroupChatAutoDelete],
 ) -> None:
     """
-    Auto delete process
+    Delete a batch of messages of the same chat with a single request
     :param context: The context
-    :param auto_delete_item: The message
+    :param semaphore: Limits the requests running at the same time
+    :param chat_id: The chat id
+    :param auto_deletes: The messages to delete, at most TG_DELETE_MESSAGES_MAX_COUNT
+    :return: None
     """
 
-    group_chat: GroupChat = auto_delete_item.group_chat
-    try:
-        await delete_message(
-            context=context,
-            group_chat=group_chat,
-            message_id=auto_delete_item.message_id,
-            is_auto_delete=True,
-        )
-    except TelegramError as te:
-        save_group_chat_error(group_chat, str(te))
-
-    auto_delete_item.delete_instance()
+    async with semaphore:
+        try:
+            # Messages that can't be deleted, for example already deleted, are skipped
+            await send_with_retry(
+                lambda: context.bot.delete_messages(
+                    chat_id, [auto_delete_item.message_id for auto_delete_item in auto_deletes]
+                )
+            )
+            _auto_delete_metrics["deleted"] += len(auto_deletes)
+        except (BadRequest, Forbidden):
+            # Expected, for example if the bot is no longer in the chat or can't delete messages,
+            # so not saved as group chat error
+            _auto_delete_metrics["failed"] += len(auto_deletes)
+        except TelegramError as te:
+            _auto_delete_metrics["failed"] += len(auto_deletes)
+            logging.warning(
+                f"Failed to auto delete {len(auto_deletes)} messages in chat {chat_id}: {te}"
+            )
@@ -0,0 +1,202 @@
+import asyncio
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Hashable, TypeVar
+
+import resources.Environment as Env
+from src.utils.download_utils import generate_temp_file_path
+from src.utils.image_render_utils import render_shambles_grid, render_blur_levels
+
+T = TypeVar("T")
+
+# Levels of a Who's Who game, all rendered at once
+WHOS_WHO_LEVELS = range(1, 6)
+
+_render_pool: ProcessPoolExecutor | None = None
+# Rendered images by what they show, least recently used first
+_rendered_images: OrderedDict[Hashable, str | dict[int, str]] = OrderedDict()
+
+
+def start_render_pool() -> None:
+    """
+    Start the processes that render images, to be called at startup
+    :return: None
+    """
+
+    global _render_pool
+
+    if _render_pool is None:
+        # Workers are not forked from this process, since its threads could be holding locks
+        # that would never be released in the children
+        _render_pool = ProcessPoolExecutor(
+            max_workers=Env.IMAGE_RENDER_PROCESS_POOL_SIZE.get_int(),
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+
+
+def stop_render_pool() -> None:
+    """
+    Stop the processes that render images
+    :return: None
+    """
+
+    global _render_pool
+
+    if _render_pool is not None:
+        _render_pool.shutdown(cancel_futures=True)
+        _render_pool = None
+
+
+def get_rendered(key: Hashable) -> str | dict[int, str] | None:
+    """
+    Get a rendered image, if it was not deleted in the meantime
+    :param key: What the image shows
+    :return: The image path, or the image paths by level. None if not rendered
+    """
+
+    rendered = _rendered_images.get(key)
+    if rendered is None:
+        return None
+
+    paths = rendered.values() if isinstance(rendered, dict) else (rendered,)
+    if not all(os.path.exists(path) for path in paths):  # Temp dir was cleaned up
+        _rendered_images.pop(key)
+        return None
+
+    _rendered_images.move_to_end(key)
+    return rendered
+
+
+def set_rendered(key: Hashable, rendered: str | dict[int, str]) -> None:
+    """
+    Save a rendered image for reuse
+    :param key: What the image shows
+    :param rendered: The image path, or the image paths by level
+    :return: None
+    """
+
+    _rendered_images[key] = rendered
+    _rendered_images.move_to_end(key)
+    while len(_rendered_images) > Env.IMAGE_RENDER_CACHE_SIZE.get_int():
+        _rendered_images.popitem(last=False)
+
+
+async def render_in_pool(render: Callable[..., T], *args) -> T:
+    """
+    Render in the render processes, or in this process if they are not started
+    :param render: The render function
+    :param args: The arguments of the render function
+    :return: The result of the render function
+    """
+
+    if _render_pool is None:
+        return render(*args)
+
+    return await asyncio.get_running_loop().run_in_executor(_render_pool, render, *args)
+
+
+def get_shambles_grid_key(grid: list[list[str]], highlighted_coordinates: list) -> Hashable:
+    """
+    Get what a Shambles grid image shows
+    :param grid: The grid of letters
+    :param highlighted_coordinates: The coordinates of the highlighted letters
+    :return: The key of the image
+    """
+
+    return (
+        "shambles",
+        tuple(tuple(row) for row in grid),
+        tuple(sorted(tuple(coordinate) for coordinate in highlighted_coordinates)),
+    )
+
+
+def get_shambles_grid_image(grid: list[list[str]], highlighted_coordinates: list) -> str:
+    """
+    Get the image of a Shambles grid, rendering it in this process if not already rendered
+    :param grid: The grid of letters
+    :param highlighted_coordinates: The coordinates of the letters to highlight
+    :return: The image path
+    """
+
+    key = get_shambles_grid_key(grid, highlighted_coordinates)
+    image_path = get_rendered(key)
+    if image_path is None:
+        image_path = render_shambles_grid(
+            grid, highlighted_coordinates, generate_temp_file_path("jpg")
+        )
+        set_rendered(key, image_path)
+
+    return image_path
+
+
+async def get_shambles_grid_image_async(
+    grid: list[list[str]], highlighted_coordinates: list
+) -> str:
+    """
+    Get the image of a Shambles grid, rendering it in the render processes if not already
+    rendered
+    :param grid: The grid of letters
+    :param highlighted_coordinates: The coordinates of the letters to highlight
+    :return: The image path
+    """
+
+    key = get_shambles_grid_key(grid, highlighted_coordinates)
+    image_path = get_rendered(key)
+    if image_path is None:
+        image_path = await render_in_pool(
+            render_shambles_grid, grid, highlighted_coordinates, generate_temp_file_path("jpg")
+        )
+        set_rendered(key, image_path)
+
+    return image_path
+
+
+def get_blur_levels_save_paths() -> dict[int, str]:
+    """
+    Get where to save the blurred images of each level
+    :return: The save path of each level
+    """
+
+    return {level: generate_temp_file_path("jpg") for level in WHOS_WHO_LEVELS}
+
+
+def get_blurred_image(image_url: str, image_path: str, level: int) -> str:
+    """
+    Get the blurred image of a level, rendering all levels in this process if not already
+    rendered
+    :param image_url: The original image url, what the image shows across downloads
+    :param image_path: The original image path
+    :param level: The level
+    :return: The blurred image path
+    """
+
+    key = ("blur", image_url)
+    blurred_images = get_rendered(key)
+    if blurred_images is None:
+        blurred_images = render_blur_levels(image_path, get_blur_levels_save_paths())
+        set_rendered(key, blurred_images)
+
+    return blurred_images[max(level, WHOS_WHO_LEVELS.start)]
+
+
+async def get_blurred_image_async(image_url: str, image_path: str, level: int) -> str:
+    """
+    Get the blurred image of a level, rendering all levels in the render processes if not
+    already rendered
+    :param image_url: The original image url, what the image shows across downloads
+    :param image_path: The original image path
+    :param level: The level
+    :return: The blurred image path
+    """
+
+    key = ("blur", image_url)
+    blurred_images = get_rendered(key)
+    if blurred_images is None:
+        blurred_images = await render_in_pool(
+            render_blur_levels, image_path, get_blur_levels_save_paths()
+        )
+        set_rendered(key, blurred_images)
+
+    return blurred_images[max(level, WHOS_WHO_LEVELS.start)]
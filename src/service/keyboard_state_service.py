@@ -0,0 +1,125 @@
+import base64
+import datetime
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+
+import resources.Environment as Env
+from resources import phrases
+from src.model.KeyboardState import KeyboardState
+from src.model.error.CommonChatError import CommonChatException
+
+# Keyboard states as (data, expiry), by key, least recently used first. The expiry is the one
+# saved, so a state is saved again only when it's closer to expire than half of its TTL
+_keyboard_states: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+
+def get_keyboard_state_key(data: str) -> str:
+    """
+    Get the key of a keyboard state, a hash of its data
+    :param data: The data
+    :return: The key
+    """
+
+    return base64.urlsafe_b64encode(
+        hashlib.blake2b(data.encode(), digest_size=12).digest()
+    ).decode()
+
+
+def set_cached_keyboard_state(key: str, data: str, expiry: float) -> None:
+    """
+    Cache a keyboard state, evicting the least recently used ones if the cache is full
+    :param key: The key
+    :param data: The data
+    :param expiry: When the saved state expires, as monotonic time
+    :return: None
+    """
+
+    _keyboard_states[key] = (data, expiry)
+    _keyboard_states.move_to_end(key)
+
+    while len(_keyboard_states) > Env.KEYBOARD_STATE_CACHE_SIZE.get_int():
+        _keyboard_states.popitem(last=False)
+
+
+def save_keyboard_state(data: str) -> str:
+    """
+    Save the data of a keyboard too long to be sent, or extend its expiry if already saved
+    :param data: The data
+    :return: The key to send instead of the data
+    """
+
+    key = get_keyboard_state_key(data)
+    ttl_seconds = Env.KEYBOARD_STATE_TTL_SECONDS.get_int()
+
+    cached = _keyboard_states.get(key)
+    if cached is not None and cached[1] - time.monotonic() > ttl_seconds / 2:
+        _keyboard_states.move_to_end(key)
+        return key
+
+    expiry_date = datetime.datetime.now() + datetime.timedelta(seconds=ttl_seconds)
+    if (
+        KeyboardState.update(expiry_date=expiry_date)
+        .where(KeyboardState.state_key == key)
+        .execute()
+        == 0
+    ):
+        KeyboardState.insert(
+            state_key=key, data=data, expiry_date=expiry_date
+        ).on_conflict_ignore().execute()
+
+    set_cached_keyboard_state(key, data, time.monotonic() + ttl_seconds)
+    return key
+
+
+def get_keyboard_state(key: str) -> str:
+    """
+    Get the data of a keyboard too long to be sent
+    :param key: The key
+    :return: The data
+    """
+
+    cached = _keyboard_states.get(key)
+    if cached is not None and cached[1] > time.monotonic():
+        _keyboard_states.move_to_end(key)
+        return cached[0]
+
+    now = datetime.datetime.now()
+    keyboard_state: KeyboardState = KeyboardState.get_or_none(
+        (KeyboardState.state_key == key) & (KeyboardState.expiry_date > now)
+    )
+    if keyboard_state is None:
+        logging.debug(f"Keyboard state {key} not found, it might be expired")
+        raise CommonChatException(phrases.RESTART_BOT, only_message=True)
+
+    set_cached_keyboard_state(
+        key,
+        keyboard_state.data,
+        time.monotonic() + (keyboard_state.expiry_date - now).total_seconds(),
+    )
+    return keyboard_state.data
+
+
+def clean_keyboard_states() -> None:
+    """
+    Delete the expired keyboard states, and the ones expiring first if they are more than
+    KEYBOARD_STATE_MAX_COUNT
+    :return: None
+    """
+
+    KeyboardState.delete().where(KeyboardState.expiry_date <= datetime.datetime.now()).execute()
+
+    first_excess: KeyboardState = (
+        KeyboardState.select(KeyboardState.expiry_date)
+        .order_by(KeyboardState.expiry_date.desc())
+        .offset(Env.KEYBOARD_STATE_MAX_COUNT.get_int())
+        .first()
+    )
+    if first_excess is None:
+        return
+
+    KeyboardState.delete().where(KeyboardState.expiry_date <= first_excess.expiry_date).execute()
+
+    # Cached states might not be saved anymore
+    _keyboard_states.clear()
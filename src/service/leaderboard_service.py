@@ -1,23 +1,29 @@
 import datetime
 import logging
 
+from peewee import chunked, fn, JOIN
 from telegram import Message
 from telegram.error import TelegramError
 from telegram.ext import ContextTypes
 
 import src.model.enums.LeaderboardRank as LeaderboardRank
 from resources import phrases as phrases, Environment as Env
+from src.model.BaseModel import db_obj
 from src.model.Crew import Crew
 from src.model.Group import Group
 from src.model.GroupChat import GroupChat
+from src.model.GroupUser import GroupUser
 from src.model.Leaderboard import Leaderboard
 from src.model.LeaderboardCrew import LeaderboardCrew
 from src.model.LeaderboardUser import LeaderboardUser
 from src.model.User import User
+from src.model.UserStats import UserStats
 from src.model.Warlord import Warlord
 from src.model.enums.Feature import Feature
+from src.model.enums.crew.CrewRole import CrewRole
 from src.model.enums.LeaderboardRank import LeaderboardRankIndex
 from src.model.enums.Location import get_first_new_world, get_last_paradise
+from src.model.pojo.LeaderboardSnapshot import LeaderboardSnapshot
 from src.service.bounty_poster_service import reset_bounty_poster_limit
 from src.service.crew_service import warn_inactive_captains
 from src.service.date_service import (
@@ -40,6 +46,12 @@ from src.service.message_service import (
     escape_valid_markdown_chars,
 )
 
+LEADERBOARD_INSERT_BATCH_SIZE = 500
+
+# Group id, None for the global leaderboard -> snapshot of the current leaderboard, None if the
+# group has no leaderboard. Loaded lazily and replaced as a whole when new leaderboards are created
+_leaderboard_snapshots: dict[int | None, LeaderboardSnapshot | None] = {}
+
 
 def get_leaderboard_message(
     leaderboard: Leaderboard, global_leaderboard_message_id: int = None
@@ -177,305 +189,436 @@ async def manage_leaderboard(context: ContextTypes.DEFAULT_TYPE, is_bounty_reset
     :return: None
     """
 
-    # Create and send global leaderboard
-    global_leaderboard = await create_and_send_leaderboard(context, is_bounty_reset)
-
-    # Get all active groups
-    groups: list[Group] = Group.select().where(Group.is_active == True).order_by(Group.id.asc())
+    # Create all the leaderboards before sending them, so they are completed before an eventual
+    # bounty reset
+    leaderboards: list[Leaderboard] = await db_obj.run_in_executor(
+        create_leaderboards, is_bounty_reset
+    )
 
-    # Create and send local leaderboards
-    for group in groups:
-        context.application.create_task(
-            create_and_send_leaderboard(context, is_bounty_reset, group, global_leaderboard)
+    if not Env.SEND_MESSAGE_LEADERBOARD.get_bool():
+        return
+
+    # Send global leaderboard
+    global_leaderboard = leaderboards[0]
+    global_leaderboard_message_id = None
+    try:
+        message: Message = await full_message_send(
+            context,
+            await db_obj.run_in_executor(get_leaderboard_message, global_leaderboard),
+            chat_id=Env.UPDATES_CHAT_ID.get(),
+        )
+        global_leaderboard.message_id = global_leaderboard_message_id = message.message_id
+        await db_obj.run_in_executor(global_leaderboard.save)
+    except TelegramError:
+        logging.exception(f"Failed to send global leaderboard to {Env.UPDATES_CHAT_ID.get()}")
+
+    # Send local leaderboards
+    for leaderboard in leaderboards[1:]:
+        ot_text = await db_obj.run_in_executor(
+            get_leaderboard_message, leaderboard, global_leaderboard_message_id
+        )
+        await broadcast_to_chats_with_feature_enabled_dispatch(
+            context,
+            Feature.LEADERBOARD,
+            ot_text,
+            external_item=leaderboard,
+            filter_by_groups=[leaderboard.group],
         )
 
 
-async def create_and_send_leaderboard(
-    context: ContextTypes,
-    is_bounty_reset: bool,
-    group: Group = None,
-    global_leaderboard: Leaderboard = None,
-) -> Leaderboard | None:
+def create_leaderboards(is_bounty_reset: bool) -> list[Leaderboard]:
     """
-    Creates a leaderboard list and sends it to the group chat
-    :param context: Context of callback
+    Creates the global leaderboard and the local leaderboard of every eligible active group.
+    Users are ranked by bounty once, and every leaderboard is derived from that ranking
     :param is_bounty_reset: Whether the bounty is reset
-    :param group: The group to create the leaderboard for
-    :param global_leaderboard: The global leaderboard
-    :return: The leaderboard
+    :return: The leaderboards, the global one first
     """
 
-    if group is not None and global_leaderboard is None:
-        raise ValueError(
-            "In order to create a local leaderboard, a global leaderboard must be provided"
+    year, week = datetime.datetime.now().isocalendar()[0:2]
+
+    # All users that can appear in a leaderboard, ordered by bounty and, on ties, by total wins
+    ranked_users: list[User] = list(
+        User.select(
+            User.id,
+            User.bounty,
+            User.location_level,
+            User.is_active,
+            User.is_exempt_from_global_leaderboard_requirements,
+        )
+        .join(UserStats, JOIN.LEFT_OUTER, on=(UserStats.user == User.id))
+        .where(
+            (User.get_is_not_arrested_statement_condition())
+            & (User.is_admin == False)
+            & (User.bounty > 0)
+        )
+        .order_by(
+            User.bounty.desc(),
+            fn.COALESCE(
+                UserStats.fight_wins + UserStats.plunder_wins + UserStats.game_wins, 0
+            ).desc(),
+            User.id.asc(),
         )
+    )
+    ranking: dict[int, int] = {user.id: index for index, user in enumerate(ranked_users)}
+
+    pirate_king_eligible_user_ids = get_pirate_king_eligible_user_ids(year, week)
+    warlords: list[Warlord] = list(Warlord.get_active_order_by_bounty())
+    warlord_user_ids = {warlord.user.id for warlord in warlords}
+    crews = get_leaderboard_crews_with_captain()
+
+    # Active users of every active group
+    group_user_ids: dict[int, set[int]] = {}
+    for group_id, user_id in (
+        GroupUser.select(GroupUser.group, GroupUser.user)
+        .join(Group)
+        .where((Group.is_active == True) & (GroupUser.is_active == True))
+        .tuples()
+    ):
+        group_user_ids.setdefault(group_id, set()).add(user_id)
 
-    # Local leaderboard checks
-    if group is not None:
-        # Group does not have enough active users
-        if len(group.get_active_users()) < Env.LEADERBOARD_MIN_ACTIVE_USERS.get_int():
-            return
+    # Active group chats of every active group
+    group_chats: dict[int, list[GroupChat]] = {}
+    for group_chat in GroupChat.select().where(
+        (GroupChat.is_active == True) & (GroupChat.group.in_(list(group_user_ids.keys())))
+    ):
+        group_chats.setdefault(group_chat.group_id, []).append(group_chat)
+
+    leaderboards: list[Leaderboard] = []
+    leaderboard_users_rows: list[dict] = []
+    leaderboard_crews_rows: list[dict] = []
+
+    with db_obj.get_db().atomic():
+        # Delete the leaderboards of this week if they exist
+        Leaderboard.delete().where(
+            (Leaderboard.year == year) & (Leaderboard.week == week)
+        ).execute()
+
+        # Global leaderboard, excluding users that are exempted from its requirements
+        leaderboard = save_leaderboard(year, week, None, is_bounty_reset)
+        leaderboards.append(leaderboard)
+        leaderboard_users_rows.extend(
+            get_leaderboard_users_rows(
+                leaderboard,
+                [
+                    user
+                    for user in ranked_users
+                    if user.is_active
+                    and not user.is_exempt_from_global_leaderboard_requirements
+                    and user.id not in warlord_user_ids
+                ],
+                pirate_king_eligible_user_ids.get(None, set()),
+                warlords,
+            )
+        )
+        leaderboard_crews_rows.extend(get_leaderboard_crews_rows(leaderboard, crews))
+
+        # Local leaderboards
+        for group_id in sorted(group_user_ids.keys()):
+            user_ids = group_user_ids[group_id]
+
+            # Group does not have enough active users
+            if len(user_ids) < Env.LEADERBOARD_MIN_ACTIVE_USERS.get_int():
+                continue
+
+            # Feature is disabled in all active group chats
+            if all(
+                not feature_is_enabled(gc, Feature.LEADERBOARD)
+                for gc in group_chats.get(group_id, [])
+            ):
+                continue
+
+            leaderboard = save_leaderboard(year, week, group_id, is_bounty_reset)
+            leaderboards.append(leaderboard)
+            leaderboard_users_rows.extend(
+                get_leaderboard_users_rows(
+                    leaderboard,
+                    [
+                        ranked_users[index]
+                        for index in sorted(
+                            ranking[user_id] for user_id in user_ids if user_id in ranking
+                        )
+                    ],
+                    pirate_king_eligible_user_ids.get(group_id, set()),
+                )
+            )
+            leaderboard_crews_rows.extend(get_leaderboard_crews_rows(leaderboard, crews))
 
-        group_chats: list[GroupChat] = [gc for gc in group.group_chats if gc.is_active]
-        # Feature is disabled in all active group chats
-        if all(not feature_is_enabled(gc, Feature.LEADERBOARD) for gc in group_chats):
-            return
+        for batch in chunked(leaderboard_users_rows, LEADERBOARD_INSERT_BATCH_SIZE):
+            LeaderboardUser.insert_many(batch).execute()
 
-    leaderboard = Leaderboard()
+        for batch in chunked(leaderboard_crews_rows, LEADERBOARD_INSERT_BATCH_SIZE):
+            LeaderboardCrew.insert_many(batch).execute()
 
-    # If global leaderboard is provided, use its data
-    if global_leaderboard is not None:
-        year = global_leaderboard.year
-        week = global_leaderboard.week
-    else:
-        year = datetime.datetime.now().isocalendar()[0]
-        week = datetime.datetime.now().isocalendar()[1]
-
-    # Delete the leaderboard if it exists
-    Leaderboard.delete().where(
-        Leaderboard.year == year, Leaderboard.week == week, Leaderboard.group == group
-    ).execute()
-
-    # Create a leaderboard for the current week and year and group
-    leaderboard.year = datetime.datetime.now().isocalendar()[0]
-    leaderboard.week = datetime.datetime.now().isocalendar()[1]
-    leaderboard.group = group
-    leaderboard.is_bounty_reset = is_bounty_reset
+    reload_leaderboard_snapshots(leaderboards)
 
-    leaderboard.save()
+    return leaderboards
 
-    # Create the leaderboard users and crew
-    create_leaderboard_users(leaderboard, group)
-    create_leaderboard_crews(leaderboard)
 
-    # Send message to chats
-    if Env.SEND_MESSAGE_LEADERBOARD.get_bool():
-        ot_text = get_leaderboard_message(
-            leaderboard,
-            (global_leaderboard.message_id if global_leaderboard is not None else None),
-        )
-        if group is not None:
-            await broadcast_to_chats_with_feature_enabled_dispatch(
-                context,
-                Feature.LEADERBOARD,
-                ot_text,
-                external_item=leaderboard,
-                filter_by_groups=[group],
-            )
-        else:
-            try:
-                message: Message = await full_message_send(
-                    context, ot_text, chat_id=Env.UPDATES_CHAT_ID.get()
-                )
-                leaderboard.message_id = message.message_id
-                leaderboard.save()
-            except TelegramError:
-                logging.exception(
-                    f"Failed to send global leaderboard to {Env.UPDATES_CHAT_ID.get()}"
-                )
+def reload_leaderboard_snapshots(leaderboards: list[Leaderboard]) -> None:
+    """
+    Replace the snapshots of the current leaderboards with the given leaderboards. The snapshots
+    of the other groups are loaded again when requested
+    :param leaderboards: The new leaderboards
+    :return: None
+    """
 
-    return leaderboard
+    global _leaderboard_snapshots
 
+    leaderboard_users: dict[int, list[LeaderboardUser]] = {}
+    for leaderboard_user in get_leaderboard_users_for_snapshot(
+        [leaderboard.id for leaderboard in leaderboards]
+    ):
+        leaderboard_users.setdefault(leaderboard_user.leaderboard_id, []).append(leaderboard_user)
 
-def get_leaderboard_rank_message(index: int) -> str:
+    _leaderboard_snapshots = {
+        leaderboard.group_id: LeaderboardSnapshot(
+            leaderboard, leaderboard_users.get(leaderboard.id, [])
+        )
+        for leaderboard in leaderboards
+    }
+
+
+def get_leaderboard_users_for_snapshot(leaderboard_ids: list[int]) -> list[LeaderboardUser]:
     """
-    Gets the rank message of a leaderboard rank
-    :param index: The leaderboard rank index
-    :return: The leaderboard rank message
+    Get the users of the given leaderboards, with only the fields needed by the snapshots
+    :param leaderboard_ids: The leaderboard ids
+    :return: The leaderboard users
     """
-    leaderboard_rank: LeaderboardRank = LeaderboardRank.get_rank_by_index(index)
-    return leaderboard_rank.get_emoji_and_rank_message()
+
+    if len(leaderboard_ids) == 0:
+        return []
+
+    return list(
+        LeaderboardUser.select(
+            LeaderboardUser.id,
+            LeaderboardUser.leaderboard,
+            LeaderboardUser.user,
+            LeaderboardUser.position,
+            LeaderboardUser.bounty,
+            LeaderboardUser.rank_index,
+        ).where(LeaderboardUser.leaderboard.in_(leaderboard_ids))
+    )
 
 
-def create_leaderboard_users(
-    leaderboard: Leaderboard, group: Group | None
-) -> list[LeaderboardUser]:
+def get_leaderboard_snapshot(group_id: int | None) -> LeaderboardSnapshot | None:
     """
-    Creates a leaderboard list
-    :param leaderboard: The leaderboard to create the users for
-    :param group: The group to create the users for
-    :return: The leaderboard users
+    Get the snapshot of the current leaderboard of a group, loading it if necessary
+    :param group_id: The group id, None for the global leaderboard
+    :return: The snapshot, None if the group has no leaderboard
     """
 
-    leaderboard_users: list[LeaderboardUser] = []
-    position = 1
+    # Kept even if replaced while loading, so a snapshot loaded before new leaderboards are
+    # created doesn't end up with the new ones
+    snapshots = _leaderboard_snapshots
+    try:
+        return snapshots[group_id]
+    except KeyError:
+        pass
 
-    # If global leaderboard, exclude users that are exempted from global leaderboard requirements
-    excluded_user_ids: list[int] = []
-    if group is None:
-        excluded_user_ids: list[int] = list(
-            User.select(User.id)
-            .where(User.is_exempt_from_global_leaderboard_requirements == True)
-            .execute()
+    leaderboard: Leaderboard = (
+        Leaderboard.select()
+        .where(Leaderboard.group == group_id)
+        .order_by(Leaderboard.year.desc(), Leaderboard.week.desc())
+        .first()
+    )
+
+    snapshot = None
+    if leaderboard is not None:
+        snapshot = LeaderboardSnapshot(
+            leaderboard, get_leaderboard_users_for_snapshot([leaderboard.id])
         )
 
-        # Add warlords
-        excluded_user_ids.extend(Warlord.get_active_user_ids())
+    snapshots[group_id] = snapshot
+    return snapshot
 
-    # Get previous leaderboard users who were Emperors or higher
-    previous_leaderboard: Leaderboard = get_leaderboard(1, group)
-    if previous_leaderboard is None:
-        previous_leaderboard_users = []
-    else:
-        previous_leaderboard_users = previous_leaderboard.leaderboard_users
 
-    # Ids of eligible users for the leaderboard
-    if group is None:
-        eligible_leaderboard_user_ids: list[int] = User.select(User.id).where(
-            User.is_active == True
-        )
-    else:
-        eligible_leaderboard_user_ids: list[int] = User.select(User.id).where(
-            User.id.in_(group.get_active_users_ids())
-        )
+def save_leaderboard(
+    year: int, week: int, group_id: int | None, is_bounty_reset: bool
+) -> Leaderboard:
+    """
+    Saves a leaderboard
+    :param year: The year
+    :param week: The week
+    :param group_id: The group id, None for the global leaderboard
+    :param is_bounty_reset: Whether the bounty is reset
+    :return: The leaderboard
+    """
 
-    # Eligible users for Pirate King position - Those who were Emperor or higher in the previous
-    # leaderboard
-    eligible_pk_users: list[User] = [
-        leaderboard_user.user
-        for leaderboard_user in previous_leaderboard_users
-        if leaderboard_user.rank_index <= LeaderboardRank.EMPEROR.index
-    ]
+    leaderboard = Leaderboard()
+    leaderboard.year = year
+    leaderboard.week = week
+    leaderboard.group = group_id
+    leaderboard.is_bounty_reset = is_bounty_reset
+    leaderboard.save()
 
-    # Get current New World users, excluding arrested users and Admins
-    new_world_users: list[User] = list(
-        User.select()
-        .where(
-            (User.location_level >= get_first_new_world().level)
-            & (User.get_is_not_arrested_statement_condition())
-            & (User.is_admin == False)
-            & (User.id.in_(eligible_leaderboard_user_ids))
-            & (User.id.not_in(excluded_user_ids))
-            & (User.bounty > 0)
-        )
-        .order_by(User.bounty.desc())
+    return leaderboard
+
+
+def get_pirate_king_eligible_user_ids(year: int, week: int) -> dict[int | None, set[int]]:
+    """
+    Gets the users eligible for the Pirate King position, those who were Emperor or higher in the
+    previous leaderboard, of every group
+    :param year: The year of the leaderboard being created
+    :param week: The week of the leaderboard being created
+    :return: Group id (None for global) -> ids of the eligible users
+    """
+
+    year_week = Leaderboard.year * 100 + Leaderboard.week
+    group_key = fn.COALESCE(Leaderboard.group, 0)
+
+    previous_leaderboards = (
+        Leaderboard.select(group_key.alias("group_key"), fn.MAX(year_week).alias("year_week"))
+        .where(year_week < year * 100 + week)
+        .group_by(group_key)
     )
 
-    # Save Pirate King, if available
-    for user in new_world_users:
-        if user in eligible_pk_users:
-            leaderboard_user: LeaderboardUser = save_leaderboard_user(
-                leaderboard, user, position, LeaderboardRank.PIRATE_KING
-            )
-            leaderboard_users.append(leaderboard_user)
-            position += 1
-            break
-
-    # Save Emperors, next 4 users
-    added_users_count = 0
-    for user in new_world_users:
-        if not any(lu for lu in leaderboard_users if lu.user == user):
-            leaderboard_user: LeaderboardUser = save_leaderboard_user(
-                leaderboard, user, position, LeaderboardRank.EMPEROR
-            )
-            leaderboard_users.append(leaderboard_user)
-            position += 1
-            added_users_count += 1
-            if added_users_count == 4:
-                break
-
-    # Save First Mates, next 4 users
-    added_users_count = 0
-    for user in new_world_users:
-        if not any(lu for lu in leaderboard_users if lu.user == user):
-            leaderboard_user: LeaderboardUser = save_leaderboard_user(
-                leaderboard, user, position, LeaderboardRank.FIRST_MATE
-            )
-            leaderboard_users.append(leaderboard_user)
-            position += 1
-            added_users_count += 1
-            if added_users_count == 4:
-                break
-
-    # Get current Paradise users, excluding arrested users and Admins
-    paradise_users: list[User] = list(
-        User.select()
-        .where(
-            (User.location_level <= get_last_paradise().level)
-            & (User.get_is_not_arrested_statement_condition())
-            & (User.is_admin == False)
-            & (User.id.in_(eligible_leaderboard_user_ids))
-            & (User.id.not_in(excluded_user_ids))
-            & (User.bounty > 0)
+    eligible_user_ids: dict[int | None, set[int]] = {}
+    for user_id, group_id in (
+        LeaderboardUser.select(LeaderboardUser.user, Leaderboard.group)
+        .join(Leaderboard)
+        .join(
+            previous_leaderboards,
+            on=(
+                (group_key == previous_leaderboards.c.group_key)
+                & (year_week == previous_leaderboards.c.year_week)
+            ),
         )
-        .order_by(User.bounty.desc())
+        .where(LeaderboardUser.rank_index <= LeaderboardRank.EMPEROR.index)
+        .tuples()
+    ):
+        eligible_user_ids.setdefault(group_id, set()).add(user_id)
+
+    return eligible_user_ids
+
+
+def get_leaderboard_users_rows(
+    leaderboard: Leaderboard,
+    users: list[User],
+    pirate_king_eligible_user_ids: set[int],
+    warlords: list[Warlord] = None,
+) -> list[dict]:
+    """
+    Gets the leaderboard users of a leaderboard, to be inserted
+    :param leaderboard: The leaderboard
+    :param users: The eligible users, ordered by bounty
+    :param pirate_king_eligible_user_ids: The ids of the users eligible for Pirate King
+    :param warlords: The active warlords ordered by bounty, only for the global leaderboard
+    :return: The leaderboard users rows
+    """
+
+    first_new_world_level = get_first_new_world().level
+    last_paradise_level = get_last_paradise().level
+
+    new_world_users = [user for user in users if user.location_level >= first_new_world_level]
+    paradise_users = [user for user in users if user.location_level <= last_paradise_level]
+
+    ranked_users: list[tuple[User, LeaderboardRank.LeaderboardRank]] = []
+
+    # Pirate King, if available
+    pirate_king = next(
+        (user for user in new_world_users if user.id in pirate_king_eligible_user_ids), None
     )
+    if pirate_king is not None:
+        ranked_users.append((pirate_king, LeaderboardRank.PIRATE_KING))
+        new_world_users.remove(pirate_king)
 
-    # Save Supernovas, next 11 users
-    added_users_count = 0
-    for user in paradise_users:
-        if not any(lu for lu in leaderboard_users if lu.user == user):
-            leaderboard_user: LeaderboardUser = save_leaderboard_user(
-                leaderboard, user, position, LeaderboardRank.SUPERNOVA
-            )
-            leaderboard_users.append(leaderboard_user)
-            position += 1
-            added_users_count += 1
-            if added_users_count == 11:
-                break
-
-    # Save Warlords, if global leaderboard
-    if group is None:
-        for index, warlord in enumerate(Warlord.get_active_order_by_bounty()):
-            leaderboard_user: LeaderboardUser = save_leaderboard_user(
-                leaderboard, warlord.user, index + 1, LeaderboardRank.WARLORD
-            )
-            leaderboard_users.append(leaderboard_user)
+    # Emperors and First Mates, next 4 users each
+    ranked_users.extend((user, LeaderboardRank.EMPEROR) for user in new_world_users[:4])
+    ranked_users.extend((user, LeaderboardRank.FIRST_MATE) for user in new_world_users[4:8])
 
-        return leaderboard_users
+    # Supernovas, next 11 users
+    ranked_users.extend((user, LeaderboardRank.SUPERNOVA) for user in paradise_users[:11])
+
+    rows = [
+        get_leaderboard_user_row(leaderboard, user, index + 1, rank)
+        for index, (user, rank) in enumerate(ranked_users)
+    ]
+
+    # Warlords
+    if warlords is not None:
+        rows.extend(
+            get_leaderboard_user_row(leaderboard, warlord.user, index + 1, LeaderboardRank.WARLORD)
+            for index, warlord in enumerate(warlords)
+        )
 
+    return rows
 
-def create_leaderboard_crews(leaderboard: Leaderboard) -> list[LeaderboardCrew]:
+
+def get_leaderboard_user_row(
+    leaderboard: Leaderboard, user: User, position: int, rank: LeaderboardRank.LeaderboardRank
+) -> dict:
     """
-    Creates a leaderboard list
-    :param leaderboard: The leaderboard to create the crews for
-    :return: The leaderboard crews
+    Gets a leaderboard user row
+    :param leaderboard: The leaderboard
+    :param user: The user
+    :param position: The position
+    :param rank: The rank
+    :return: The leaderboard user row
     """
 
-    leaderboard_crews: list[LeaderboardCrew] = []
+    return {
+        LeaderboardUser.leaderboard: leaderboard,
+        LeaderboardUser.user: user,
+        LeaderboardUser.position: position,
+        LeaderboardUser.rank_index: rank.index,
+        LeaderboardUser.bounty: user.bounty,
+    }
+
+
+def get_leaderboard_crews_with_captain() -> list[tuple[Crew, int]]:
+    """
+    Gets the crews to show in the leaderboards with the id of their captain
+    :return: The crews, ordered by level and total chest, with their captain id
+    """
 
     # Get active crews that are visible in search, ordered by level and total chest
-    crews: list[Crew] = (
+    crews: list[Crew] = list(
         Crew.select()
         .where((Crew.is_active == True) & (Crew.allow_view_in_search == True))
         .order_by(Crew.level.desc(), Crew.total_gained_chest_amount.desc())
         .limit(Env.LEADERBOARD_CREW_LIMIT.get_int())
     )
 
-    for index, crew in enumerate(crews):
-        leaderboard_crew: LeaderboardCrew = LeaderboardCrew()
-        leaderboard_crew.leaderboard = leaderboard
-        leaderboard_crew.crew = crew
-        leaderboard_crew.captain = crew.get_captain()
-        leaderboard_crew.position = index + 1
-        leaderboard_crew.level = crew.level
-        leaderboard_crew.total_chest_amount = crew.total_gained_chest_amount
-        leaderboard_crew.save()
-
-        leaderboard_crews.append(leaderboard_crew)
+    captain_ids: dict[int, int] = dict(
+        User.select(User.crew, User.id)
+        .where((User.crew.in_(crews)) & (User.crew_role == CrewRole.CAPTAIN))
+        .tuples()
+    )
 
-    return leaderboard_crews
+    return [(crew, captain_ids[crew.id]) for crew in crews if crew.id in captain_ids]
 
 
-def save_leaderboard_user(
-    leaderboard: Leaderboard, user: User, position: int, rank: LeaderboardRank.LeaderboardRank
-) -> LeaderboardUser:
+def get_leaderboard_crews_rows(
+    leaderboard: Leaderboard, crews: list[tuple[Crew, int]]
+) -> list[dict]:
     """
-    Saves a leaderboard user
+    Gets the leaderboard crews of a leaderboard, to be inserted
     :param leaderboard: The leaderboard
-    :param user: The user
-    :param position: The position
-    :param rank: The rank
+    :param crews: The crews with their captain id
+    :return: The leaderboard crews rows
     """
-    leaderboard_user = LeaderboardUser()
-    leaderboard_user.leaderboard = leaderboard
-    leaderboard_user.user = user
-    leaderboard_user.position = position
-    leaderboard_user.rank_index = rank.index
-    leaderboard_user.bounty = user.bounty
-    leaderboard_user.save()
 
-    return leaderboard_user
+    return [
+        {
+            LeaderboardCrew.leaderboard: leaderboard,
+            LeaderboardCrew.crew: crew,
+            LeaderboardCrew.captain: captain_id,
+            LeaderboardCrew.position: index + 1,
+            LeaderboardCrew.level: crew.level,
+            LeaderboardCrew.total_chest_amount: crew.total_gained_chest_amount,
+        }
+        for index, (crew, captain_id) in enumerate(crews)
+    ]
+
+
+def get_leaderboard_rank_message(index: int) -> str:
+    """
+    Gets the rank message of a leaderboard rank
+    :param index: The leaderboard rank index
+    :return: The leaderboard rank message
+    """
+    leaderboard_rank: LeaderboardRank = LeaderboardRank.get_rank_by_index(index)
+    return leaderboard_rank.get_emoji_and_rank_message()
 
 
 def get_leaderboard(
@@ -489,6 +632,15 @@ def get_leaderboard(
     :return: The leaderboard
     """
 
+    if not index:  # Current leaderboard
+        if group_chat is not None:
+            group_id = group_chat.group_id
+        else:
+            group_id = group.id if group is not None else None
+
+        snapshot = get_leaderboard_snapshot(group_id)
+        return snapshot.get_leaderboard() if snapshot is not None else None
+
     if group_chat is not None:
         group = group_chat.group
 
@@ -514,6 +666,15 @@ def get_leaderboard_user(
     :return: The leaderboard user
     """
 
+    if not index:  # Current leaderboard
+        snapshot = None
+        if group_chat is not None:
+            snapshot = get_leaderboard_snapshot(group_chat.group_id)  # Local
+        if snapshot is None:
+            snapshot = get_leaderboard_snapshot(None)
+
+        return snapshot.get_leaderboard_user(user.id) if snapshot is not None else None
+
     leaderboard = get_leaderboard(index, group_chat=group_chat)  # Local
     if leaderboard is None and group_chat is not None:
         leaderboard = get_leaderboard(index)
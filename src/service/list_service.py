@@ -1,9 +1,13 @@
+import time
+from collections import OrderedDict
 from enum import StrEnum
+from typing import Hashable
 
 from telegram import Update
 from telegram.ext import ContextTypes
 
 import constants as c
+import resources.Environment as Env
 import resources.phrases as phrases
 from src.model.BaseModel import BaseModel
 from src.model.User import User
@@ -16,12 +20,19 @@ from src.model.error.CustomException import NavigationLimitReachedException
 from src.model.pojo.Keyboard import Keyboard
 from src.utils.english_phrase_utils import determine_article
 
+# Items counts of lists as (total, total without filters, expiry), least recently used first
+_list_items_counts: OrderedDict[Hashable, tuple[int, int, float]] = OrderedDict()
 
-def get_navigation_buttons(inbound_keyboard: Keyboard, current_page: int) -> list[Keyboard]:
+
+def get_navigation_buttons(
+    inbound_keyboard: Keyboard, current_page: int, items: list[BaseModel] = None
+) -> list[Keyboard]:
     """
     Returns the navigation buttons for the crew member list
     :param inbound_keyboard: The inbound keyboard
     :param current_page: The current page
+    :param items: The items of the current page, to get the other pages starting from them. None
+    if the list doesn't support cursor pagination
     :return: The navigation buttons
     """
 
@@ -29,6 +40,9 @@ def get_navigation_buttons(inbound_keyboard: Keyboard, current_page: int) -> lis
 
     # Previous page
     previous_page_button_info = {ReservedKeyboardKeys.PAGE: current_page - 1}
+    if items:
+        # Negative, the items before the first one
+        previous_page_button_info[ReservedKeyboardKeys.CURSOR] = -items[0].id
     keyboard_line.append(
         Keyboard(
             phrases.PVT_KEY_PREVIOUS_PAGE,
@@ -39,6 +53,8 @@ def get_navigation_buttons(inbound_keyboard: Keyboard, current_page: int) -> lis
 
     # Next page
     next_page_button_info = {ReservedKeyboardKeys.PAGE: current_page + 1}
+    if items:
+        next_page_button_info[ReservedKeyboardKeys.CURSOR] = items[-1].id
     keyboard_line.append(
         Keyboard(
             phrases.PVT_KEY_NEXT_PAGE,
@@ -67,6 +83,55 @@ def get_page(inbound_keyboard: Keyboard) -> int:
     return 1
 
 
+def get_cursor(inbound_keyboard: Keyboard, list_page: ListPage, page: int) -> int | None:
+    """
+    Get the id of the item to start the page from, positive to get the items after it and
+    negative for the ones before it
+    :param inbound_keyboard: The inbound keyboard
+    :param list_page: The list page object
+    :param page: The page number
+    :return: The cursor, None if the page should be got by number
+    """
+
+    # The first page is always got from the start
+    if page == 1 or not list_page.is_keyset_paginated():
+        return None
+
+    return inbound_keyboard.info.get(ReservedKeyboardKeys.CURSOR)
+
+
+def get_items_counts(list_page: ListPage, refresh: bool) -> tuple[int, int]:
+    """
+    Get the total number of items and all items without filter count, reusing the ones of the
+    list if cached
+    :param list_page: The list page object
+    :param refresh: If to count the items again even if cached
+    :return: The total number of items and all items without filter count
+    """
+
+    key = list_page.get_count_cache_key()
+    if key is not None and not refresh:
+        cached = _list_items_counts.get(key)
+        if cached is not None and cached[2] >= time.monotonic():
+            _list_items_counts.move_to_end(key)
+            return cached[0], cached[1]
+
+    total_items: int = list_page.get_total_items_count()
+    all_items_count: int = list_page.get_total_items_no_filter_count()
+
+    if key is not None:
+        _list_items_counts[key] = (
+            total_items,
+            all_items_count,
+            time.monotonic() + Env.LIST_COUNT_CACHE_TTL_SECONDS.get_int(),
+        )
+        _list_items_counts.move_to_end(key)
+        while len(_list_items_counts) > Env.LIST_COUNT_CACHE_SIZE.get_int():
+            _list_items_counts.popitem(last=False)
+
+    return total_items, all_items_count
+
+
 def get_items_paginate(
     inbound_keyboard: Keyboard, list_page: ListPage
 ) -> [list[BaseModel], int, int, int, int, int]:
@@ -82,8 +147,16 @@ def get_items_paginate(
     # Get the page number
     page = get_page(inbound_keyboard)
 
-    # Get the items
-    items = list_page.get_items(page)
+    # Get the items, starting from the cursor if available so the previous ones are not scanned
+    items = None
+    cursor = get_cursor(inbound_keyboard, list_page, page)
+    if cursor is not None:
+        items = list_page.get_items_by_cursor(abs(cursor), backward=cursor < 0)
+
+    # Cursor item doesn't exist anymore, or the list doesn't support cursors
+    if items is None:
+        cursor = None
+        items = list_page.get_items(page)
 
     # Items 0 and page > 1, raise limit error
     if len(items) == 0 and page > 1:
@@ -94,11 +167,9 @@ def get_items_paginate(
     # Get the end index
     end_number: int = start_number + len(items) - 1
 
-    # Get the total number of items
-    total_items: int = list_page.get_total_items_count()
-
-    # Get all items count, without any filter
-    all_items_count: int = list_page.get_total_items_no_filter_count()
+    # Get the total number of items and all items count, without any filter. Counted again when
+    # the list is opened, then reused while browsing its pages
+    total_items, all_items_count = get_items_counts(list_page, refresh=cursor is None)
 
     return items, page, start_number, end_number, total_items, all_items_count
 
@@ -188,7 +259,7 @@ def get_items_text_keyboard(
 
     for index, item in enumerate(items):
         current_number = start_number + index
-        list_page.set_object(item.id)
+        list_page.set_object_from_item(item)
         items_text += phrases.LIST_ITEM_TEXT.format(current_number, list_page.get_item_text())
 
         if item_detail_screen is not None:
@@ -213,7 +284,11 @@ def get_items_text_keyboard(
 
     # Add navigation buttons if needed
     if total_count > c.STANDARD_LIST_SIZE:
-        inline_keyboard.append(get_navigation_buttons(inbound_keyboard, page))
+        inline_keyboard.append(
+            get_navigation_buttons(
+                inbound_keyboard, page, items if list_page.is_keyset_paginated() else None
+            )
+        )
 
     # Add filters button
     string_filter: ListFilter | None = None
@@ -1,4 +1,4 @@
-from peewee import Case
+from peewee import Case, Expression
 from telegram import Update
 from telegram.ext import ContextTypes
 
@@ -91,23 +91,19 @@ async def update_location(
         user.should_propose_new_world = False
 
 
-def reset_location() -> None:
+def get_location_level_case(bounty: Expression) -> Case:
     """
-    Reset the user's location
-    :return: None
+    Get the statement that computes the location level of users from their bounty, to reset
+    the location of all users in a single update
+    :param bounty: The bounty of the users
+    :return: The statement
     """
 
-    # Update user location
     conditions: list[tuple[bool, int]] = []
     for location in reversed(Location.LOCATIONS):
-        conditions.append((User.bounty >= location.required_bounty, location.level))
-    case_stmt = Case(None, conditions)
-    User.update(location_level=case_stmt).execute()
-
-    # Reset new world proposal
-    User.update(should_propose_new_world=True).where(
-        User.should_propose_new_world is False
-    ).execute()
+        conditions.append((bounty >= location.required_bounty, location.level))
+
+    return Case(None, conditions)
 
 
 def reset_can_change_region() -> None:
@@ -173,12 +173,7 @@ async def get_keyboard(
                     else:
                         # Already has some callback_data. If it has no data, nothing should be
                         # added
-                        # callback_data is a string initialized for an empty dict,
-                        # so even if empty the string will have value '{}'.
-                        # So, to confirm that it is empty, we first revert to a dictionary and
-                        # check if the
-                        # dict is empty.
-                        if json.loads(button.callback_data):
+                        if button.has_callback_data():
                             # Add information about previous screen
                             if (
                                 len(button.previous_screen_list) == 0
@@ -231,9 +226,7 @@ async def get_keyboard(
                             keyboard_row.append(
                                 InlineKeyboardButton(
                                     button.text,
-                                    callback_data=button.set_and_get_callback_data_in_context(
-                                        context
-                                    ),
+                                    callback_data=button.get_callback_data_to_send(),
                                 )
                             )
                         except AttributeError:
@@ -251,7 +244,7 @@ async def get_keyboard(
                 [
                     InlineKeyboardButton(
                         delete_button.text,
-                        callback_data=delete_button.set_and_get_callback_data_in_context(context),
+                        callback_data=delete_button.get_callback_data_to_send(),
                     )
                 ]
             )
@@ -268,7 +261,7 @@ async def get_keyboard(
                 [
                     InlineKeyboardButton(
                         back_button.text,
-                        callback_data=back_button.set_and_get_callback_data_in_context(context),
+                        callback_data=back_button.get_callback_data_to_send(),
                     )
                 ]
             )
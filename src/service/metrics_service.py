@@ -0,0 +1,423 @@
+import asyncio
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Coroutine
+
+from telegram.ext import AIORateLimiter, Application
+
+import src.model.enums.Command as Command
+from src.model.BaseModel import db_obj
+from src.service.anti_spam_service import get_anti_spam_metrics
+from src.service.group_service import get_active_broadcasts, get_auto_delete_metrics
+
+# Upper bounds of the duration buckets, in seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+# Upper bounds of the queries per update buckets
+QUERIES_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    """
+    Counts observations in fixed buckets, Prometheus style
+    """
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Add an observation
+        :param value: The value
+        :return: None
+        """
+
+        self.count += 1
+        self.sum += value
+        for index, bucket in enumerate(self.buckets):
+            if value <= bucket:
+                self.bucket_counts[index] += 1
+                break
+
+    def get_percentile(self, percentile: float) -> float:
+        """
+        Get the upper bound of the bucket containing a percentile
+        :param percentile: The percentile, between 0 and 1
+        :return: The upper bound, infinity if beyond the last bucket
+        """
+
+        target = self.count * percentile
+        cumulative = 0
+        for bucket, bucket_count in zip(self.buckets, self.bucket_counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return bucket
+
+        return float("inf")
+
+
+class UpdateMetrics:
+    """
+    Metrics of the update being processed
+    """
+
+    def __init__(self, update_type: str):
+        self.update_type = update_type
+        self.start = time.perf_counter()
+        self.command = "none"
+        self.screen = "none"
+        self.queries_count = 0
+        self.queries_seconds = 0.0
+
+
+# Shared by the executor threads, since run_in_executor copies the context of the update task
+_update_metrics: ContextVar[UpdateMetrics | None] = ContextVar("update_metrics", default=None)
+
+_lock = threading.Lock()
+_histograms: dict[tuple[str, Labels], Histogram] = {}
+_counters: dict[tuple[str, Labels], float] = {}
+_updates_in_progress = 0
+_metrics_server: asyncio.Server | None = None
+
+HELP: dict[str, str] = {
+    "update_duration_seconds": "Time to process an update, by command and screen",
+    "update_db_queries": "Database queries run to process an update",
+    "update_db_seconds": "Time spent in database queries to process an update",
+    "db_query_duration_seconds": "Time of a database query",
+    "telegram_api_request_duration_seconds": "Time of a Telegram API request",
+    "telegram_api_requests_total": "Telegram API requests, by endpoint and outcome",
+    "timer_duration_seconds": "Time of a timer run",
+    "timer_runs_total": "Timer runs, by outcome",
+}
+
+
+def observe(name: str, value: float, buckets: tuple[float, ...] = DURATION_BUCKETS, **labels):
+    """
+    Add an observation to a histogram
+    :param name: The histogram name
+    :param value: The value
+    :param buckets: The buckets, used if the histogram doesn't exist yet
+    :param labels: The labels
+    :return: None
+    """
+
+    key = (name, tuple(labels.items()))
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = Histogram(buckets)
+
+        histogram.observe(value)
+
+
+def increment(name: str, amount: float = 1, **labels) -> None:
+    """
+    Increment a counter
+    :param name: The counter name
+    :param amount: The amount
+    :param labels: The labels
+    :return: None
+    """
+
+    key = (name, tuple(labels.items()))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def record_query(sql: str, duration: float) -> None:
+    """
+    Record a database query, called by the database after each query
+    :param sql: The query
+    :param duration: The duration in seconds
+    :return: None
+    """
+
+    observe("db_query_duration_seconds", duration)
+
+    update_metrics = _update_metrics.get()
+    if update_metrics is not None:
+        update_metrics.queries_count += 1
+        update_metrics.queries_seconds += duration
+
+
+db_obj.db.query_hooks.append(record_query)
+
+
+def start_update(is_callback: bool) -> UpdateMetrics:
+    """
+    Start tracking the update processed by the current task
+    :param is_callback: True if the update is a callback
+    :return: The update metrics
+    """
+
+    global _updates_in_progress
+
+    update_metrics = UpdateMetrics("callback" if is_callback else "message")
+    _update_metrics.set(update_metrics)
+    _updates_in_progress += 1
+    return update_metrics
+
+
+def set_update_command(command: Command.Command) -> None:
+    """
+    Set the command of the update processed by the current task
+    :param command: The command
+    :return: None
+    """
+
+    update_metrics = _update_metrics.get()
+    if update_metrics is None or command is None:
+        return
+
+    if command.name is not None:
+        update_metrics.command = str(command.name)
+    if command.screen is not None:
+        update_metrics.screen = command.screen.name
+
+
+def end_update(update_metrics: UpdateMetrics) -> None:
+    """
+    Stop tracking an update and record its metrics
+    :param update_metrics: The update metrics
+    :return: None
+    """
+
+    global _updates_in_progress
+
+    _updates_in_progress -= 1
+    labels = {
+        "type": update_metrics.update_type,
+        "command": update_metrics.command,
+        "screen": update_metrics.screen,
+    }
+    observe("update_duration_seconds", time.perf_counter() - update_metrics.start, **labels)
+    observe("update_db_queries", update_metrics.queries_count, QUERIES_COUNT_BUCKETS, **labels)
+    observe("update_db_seconds", update_metrics.queries_seconds, **labels)
+
+
+def record_timer(timer_name: str, duration: float, failed: bool) -> None:
+    """
+    Record a timer run
+    :param timer_name: The timer name
+    :param duration: The duration in seconds
+    :param failed: True if the run raised an exception
+    :return: None
+    """
+
+    observe("timer_duration_seconds", duration, timer=timer_name)
+    increment("timer_runs_total", timer=timer_name, outcome="error" if failed else "ok")
+
+
+class MetricsRateLimiter(AIORateLimiter):
+    """
+    Rate limiter that records the count and the duration of the Telegram API requests.
+    Durations don't include the time spent waiting for the rate limit
+    """
+
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, Any]],
+        args: Any,
+        kwargs: dict[str, Any],
+        endpoint: str,
+        data: dict[str, Any],
+        rate_limit_args: int | None,
+    ) -> Any:
+        async def timed_callback(*callback_args, **callback_kwargs) -> Any:
+            start = time.perf_counter()
+            outcome = "ok"
+            try:
+                return await callback(*callback_args, **callback_kwargs)
+            except Exception as e:
+                outcome = e.__class__.__name__
+                raise
+            finally:
+                observe(
+                    "telegram_api_request_duration_seconds",
+                    time.perf_counter() - start,
+                    endpoint=endpoint,
+                )
+                increment("telegram_api_requests_total", endpoint=endpoint, outcome=outcome)
+
+        return await super().process_request(
+            timed_callback, args, kwargs, endpoint, data, rate_limit_args
+        )
+
+
+def get_gauges(application: Application) -> dict[str, float]:
+    """
+    Get the current values of the gauges
+    :param application: The application
+    :return: The gauges
+    """
+
+    gauges: dict[str, float] = {
+        "updates_in_progress": _updates_in_progress,
+        "update_queue_size": application.update_queue.qsize(),
+        "asyncio_tasks": len(asyncio.all_tasks()),
+        "active_broadcasts": len(get_active_broadcasts()),
+    }
+
+    for key, value in db_obj.get_pool_metrics().items():
+        gauges[f"db_pool_{key}"] = value
+
+    for key, value in get_auto_delete_metrics().items():
+        gauges[f"auto_delete_{key}"] = value
+
+    for limiter_name, limiter_metrics in get_anti_spam_metrics().items():
+        for key, value in limiter_metrics.items():
+            gauges[f"anti_spam_{limiter_name}_{key}"] = value
+
+    return gauges
+
+
+def format_labels(labels: Labels) -> str:
+    """
+    Format labels in the Prometheus text format
+    :param labels: The labels
+    :return: The formatted labels, empty if there are none
+    """
+
+    if len(labels) == 0:
+        return ""
+
+    values = []
+    for key, value in labels:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        values.append(f'{key}="{value}"')
+
+    return "{" + ",".join(values) + "}"
+
+
+def get_prometheus_text(application: Application) -> str:
+    """
+    Get all the metrics in the Prometheus text format
+    :param application: The application
+    :return: The metrics
+    """
+
+    lines: list[str] = []
+    written_names: set[str] = set()
+
+    def write_header(name: str, metric_type: str) -> None:
+        if name in written_names:
+            return
+
+        written_names.add(name)
+        if name in HELP:
+            lines.append(f"# HELP {name} {HELP[name]}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+    with _lock:
+        counters = sorted(_counters.items())
+        histograms = sorted(
+            (key, histogram.buckets, list(histogram.bucket_counts), histogram.count, histogram.sum)
+            for key, histogram in _histograms.items()
+        )
+
+    for (name, labels), value in counters:
+        write_header(name, "counter")
+        lines.append(f"{name}{format_labels(labels)} {value}")
+
+    for (name, labels), buckets, bucket_counts, count, total in histograms:
+        write_header(name, "histogram")
+        cumulative = 0
+        for bucket, bucket_count in zip(buckets, bucket_counts):
+            cumulative += bucket_count
+            lines.append(f"{name}_bucket{format_labels(labels + (('le', bucket),))} {cumulative}")
+        lines.append(f"{name}_bucket{format_labels(labels + (('le', '+Inf'),))} {count}")
+        lines.append(f"{name}_sum{format_labels(labels)} {total}")
+        lines.append(f"{name}_count{format_labels(labels)} {count}")
+
+    for name, value in get_gauges(application).items():
+        write_header(name, "gauge")
+        lines.append(f"{name} {value}")
+
+    return "\n".join(lines) + "\n"
+
+
+def log_metrics(application: Application) -> None:
+    """
+    Log a summary of the metrics
+    :param application: The application
+    :return: None
+    """
+
+    with _lock:
+        histograms = sorted(_histograms.items())
+
+    for (name, labels), histogram in histograms:
+        if histogram.count == 0:
+            continue
+
+        logging.info(
+            f"Metric {name}{format_labels(labels)}: count={histogram.count}"
+            f" avg={histogram.sum / histogram.count:.4f}"
+            f" p50<={histogram.get_percentile(0.5)} p95<={histogram.get_percentile(0.95)}"
+        )
+
+    logging.info(f"Metric gauges: {get_gauges(application)}")
+
+
+async def start_metrics_server(application: Application, host: str, port: int) -> None:
+    """
+    Start an HTTP server that exposes the metrics in the Prometheus text format
+    :param application: The application
+    :param host: The host to listen on
+    :param port: The port to listen on
+    :return: None
+    """
+
+    global _metrics_server
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # Skip the headers
+            while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b""):
+                pass
+
+            parts = request_line.decode(errors="replace").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1] == "/metrics":
+                status = "200 OK"
+                body = get_prometheus_text(application).encode()
+            else:
+                status = "404 Not Found"
+                body = b""
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    _metrics_server = await asyncio.start_server(handle, host, port)
+    logging.info(f"Metrics server listening on {host}:{port}")
+
+
+async def stop_metrics_server() -> None:
+    """
+    Stop the metrics server, if started
+    :return: None
+    """
+
+    global _metrics_server
+
+    if _metrics_server is None:
+        return
+
+    _metrics_server.close()
+    await _metrics_server.wait_closed()
+    _metrics_server = None
@@ -1,19 +1,34 @@
+import asyncio
 import logging
+import time
 import traceback
+from collections import defaultdict
+from datetime import datetime
 
+from peewee import chunked
 from telegram import Update, Message
-from telegram.error import Forbidden
-from telegram.ext import ContextTypes
+from telegram.error import Forbidden, RetryAfter
+from telegram.ext import Application, CallbackContext, ContextTypes
 
 import resources.Environment as Env
 import resources.phrases as phrases
+from src.model.BaseModel import db_obj
 from src.model.DisabledNotification import DisabledNotification
+from src.model.NotificationOutbox import NotificationOutbox
 from src.model.User import User
 from src.model.enums.Notification import Notification
 from src.model.enums.Screen import Screen
 from src.model.pojo.Keyboard import Keyboard
+from src.model.pojo.NotificationMessage import NotificationMessage
+from src.service.date_service import get_datetime_in_future_seconds
 from src.service.message_service import full_message_send
 
+# Set when notifications are added to the outbox, so the sender doesn't wait for the next poll
+_outbox_filled: asyncio.Event | None = None
+_outbox_task: asyncio.Task | None = None
+# When the next notification can be sent, shared by all senders
+_next_send_time: float = 0
+
 
 async def send_notification(
     context: ContextTypes.DEFAULT_TYPE,
@@ -44,10 +59,77 @@ async def send_notification(
             context, user, notification, should_forward_message, update
         )
     else:
-        context.application.create_task(
-            send_notification_execute(context, user, notification, should_forward_message, update)
+        send_notifications(context, [(user, notification)])
+
+
+def send_notifications(
+    _context: ContextTypes.DEFAULT_TYPE, notifications: list[tuple[User, Notification]]
+) -> None:
+    """
+    Sends many notifications, fire and forget. They are added to the outbox, in the current
+    transaction if any, and sent by the outbox senders. Disabled notifications are skipped, loaded
+    with a single query instead of one per user
+    :param _context: The context object
+    :param notifications: The users and the notification to send to each of them
+    :return: None
+    """
+
+    if len(notifications) == 0:
+        return
+
+    disabled: set[tuple[int, int]] = get_disabled_notifications(notifications)
+    rows = [
+        NotificationOutbox.get_row(user, NotificationMessage(notification))
+        for user, notification in notifications
+        if (user.id, notification.type) not in disabled and is_authorized_user(user)
+    ]
+
+    for rows_chunk in chunked(rows, 100):
+        NotificationOutbox.insert_many(rows_chunk).on_conflict_ignore().execute()
+
+    if len(rows) > 0 and _outbox_filled is not None:
+        _outbox_filled.set()
+
+
+def get_disabled_notifications(
+    notifications: list[tuple[User, Notification]],
+) -> set[tuple[int, int]]:
+    """
+    Get which of the notifications are disabled by their user
+    :param notifications: The users and the notification to send to each of them
+    :return: The disabled notifications, as (user id, notification type)
+    """
+
+    disabled: set[tuple[int, int]] = set()
+    for users_chunk in chunked({user.id for user, _ in notifications}, 1000):
+        disabled.update(
+            DisabledNotification.select(DisabledNotification.user, DisabledNotification.type)
+            .where(
+                (DisabledNotification.user.in_(users_chunk))
+                & (
+                    DisabledNotification.type.in_(
+                        {notification.type for _, notification in notifications}
+                    )
+                )
+            )
+            .tuples()
         )
 
+    return disabled
+
+
+def is_authorized_user(user: User) -> bool:
+    """
+    Checks if notifications can be sent to a user, if limited to the authorized users
+    :param user: The user
+    :return: True if notifications can be sent
+    """
+
+    return (
+        not Env.LIMIT_TO_AUTHORIZED_USERS.get_bool()
+        or user.tg_user_id in Env.AUTHORIZED_USERS.get_list()
+    )
+
 
 async def send_notification_execute(
     context: ContextTypes.DEFAULT_TYPE,
@@ -66,10 +148,6 @@ async def send_notification_execute(
     :return: None
     """
 
-    from src.chat.private.screens.screen_settings_notifications_type import (
-        NotificationTypeReservedKeys,
-    )
-
     if should_forward_message and update is None:
         raise ValueError("If should_forward_message is not None, update must be not None")
 
@@ -78,16 +156,47 @@ async def send_notification_execute(
         return
 
     # Not in authorized users
-    if (
-        Env.LIMIT_TO_AUTHORIZED_USERS.get_bool()
-        and user.tg_user_id not in Env.AUTHORIZED_USERS.get_list()
-    ):
+    if not is_authorized_user(user):
         return
 
     # Not in authorized groups
     if Env.LIMIT_TO_AUTHORIZED_GROUPS.get_bool() and not await user.in_authorized_groups(context):
         return
 
+    try:
+        quote_message_id = None
+        if should_forward_message:
+            message: Message = await update.message.forward(
+                user.tg_user_id, disable_notification=True
+            )
+            quote_message_id = message.message_id
+
+        await send_notification_message(
+            context, user, NotificationMessage(notification), quote_message_id
+        )
+    except Forbidden:  # User has blocked the bot
+        pass
+
+
+async def send_notification_message(
+    context: ContextTypes.DEFAULT_TYPE,
+    user: User,
+    notification_message: NotificationMessage,
+    quote_message_id: int = None,
+) -> None:
+    """
+    Sends a built notification, with the button to manage its settings
+    :param context: The context object
+    :param user: User
+    :param notification_message: The notification
+    :param quote_message_id: The message to quote
+    :return: None
+    """
+
+    from src.chat.private.screens.screen_settings_notifications_type import (
+        NotificationTypeReservedKeys,
+    )
+
     # Create Keyboard for notification management
     inline_keyboard: list[list[Keyboard]] = []
     previous_screens = [
@@ -97,11 +206,11 @@ async def send_notification_execute(
         Screen.PVT_SETTINGS_NOTIFICATIONS_TYPE,
     ]
     button_info = {
-        NotificationTypeReservedKeys.CATEGORY: notification.category,
-        NotificationTypeReservedKeys.TYPE: notification.type,
+        NotificationTypeReservedKeys.CATEGORY: notification_message.category,
+        NotificationTypeReservedKeys.TYPE: notification_message.type,
     }
 
-    inline_keyboard += notification.get_keyboard()
+    inline_keyboard += notification_message.keyboard
     inline_keyboard.append(
         [
             Keyboard(
@@ -113,28 +222,202 @@ async def send_notification_execute(
         ]
     )
 
-    try:
-        quote_message_id = None
-        if should_forward_message:
-            message: Message = await update.message.forward(
-                user.tg_user_id, disable_notification=True
-            )
-            quote_message_id = message.message_id
+    await full_message_send(
+        context,
+        notification_message.text,
+        chat_id=user.tg_user_id,
+        keyboard=inline_keyboard,
+        disable_notification=notification_message.disable_notification,
+        reply_to_message_id=quote_message_id,
+        disable_web_page_preview=notification_message.disable_web_page_preview,
+        add_delete_button=True,
+        should_auto_delete=False,
+        authorized_users=[user],
+    )
+
 
-        await full_message_send(
-            context,
-            notification.build(),
-            chat_id=user.tg_user_id,
-            keyboard=inline_keyboard,
-            disable_notification=notification.disable_notification,
-            reply_to_message_id=quote_message_id,
-            disable_web_page_preview=notification.disable_web_page_preview,
-            add_delete_button=True,
-            should_auto_delete=False,
-            authorized_users=[user],
+def start_notification_outbox(application: Application) -> None:
+    """
+    Start sending the notifications of the outbox, to be called at startup
+    :param application: The application
+    :return: None
+    """
+
+    global _outbox_task
+
+    if _outbox_task is None:
+        # Not an application task, else stopping the application would wait for it forever
+        _outbox_task = asyncio.create_task(run_notification_outbox(application))
+
+
+def stop_notification_outbox() -> None:
+    """
+    Stop sending the notifications of the outbox. The ones not yet sent are sent at the next start
+    :return: None
+    """
+
+    global _outbox_task
+
+    if _outbox_task is not None:
+        _outbox_task.cancel()
+        _outbox_task = None
+
+
+async def run_notification_outbox(application: Application) -> None:
+    """
+    Send the notifications of the outbox, grouped by user, each user's in order
+    :param application: The application
+    :return: None
+    """
+
+    global _outbox_filled
+
+    _outbox_filled = asyncio.Event()
+    context = CallbackContext(application)
+    senders = asyncio.Semaphore(Env.NOTIFICATION_OUTBOX_SENDERS.get_int())
+
+    while True:
+        _outbox_filled.clear()
+
+        try:
+            async with db_obj.connection():
+                items: list[NotificationOutbox] = NotificationOutbox.get_due(
+                    datetime.now(), Env.NOTIFICATION_OUTBOX_BATCH_SIZE.get_int()
+                )
+        except Exception as e:
+            # Keep sending once the database is back, else notifications would stop until restart
+            logging.exception(f"Error getting the notifications to send: {e}")
+            await asyncio.sleep(Env.NOTIFICATION_OUTBOX_RETRY_SECONDS.get_int())
+            continue
+
+        if len(items) == 0:
+            try:
+                await asyncio.wait_for(
+                    _outbox_filled.wait(), Env.NOTIFICATION_OUTBOX_POLL_SECONDS.get_int()
+                )
+            except asyncio.TimeoutError:
+                pass
+            continue
+
+        items_by_user: dict[int, list[NotificationOutbox]] = defaultdict(list)
+        for item in items:
+            items_by_user[item.user.id].append(item)
+
+        results = await asyncio.gather(
+            *(
+                send_outbox_notifications(context, user_items, senders)
+                for user_items in items_by_user.values()
+            ),
+            return_exceptions=True,
         )
-    except Forbidden:  # User has blocked the bot
-        pass
+        for result in results:
+            if isinstance(result, Exception):
+                logging.error(f"Error sending the notifications of a user: {result}")
+
+
+async def send_outbox_notifications(
+    context: ContextTypes.DEFAULT_TYPE, items: list[NotificationOutbox], senders: asyncio.Semaphore
+) -> None:
+    """
+    Send the outbox notifications of a user once a sender is free, delaying the ones left if
+    sending fails
+    :param context: The context object
+    :param items: The notifications of the user
+    :param senders: The senders that can be used
+    :return: None
+    """
+
+    async with senders, db_obj.connection():
+        user: User = items[0].user
+        try:
+            await send_user_outbox_notifications(context, user, items)
+        except Exception as e:
+            # For example a network error checking the groups, try again later all the ones left
+            logging.exception(f"Error sending the notifications of user {user.id}: {e}")
+            NotificationOutbox.hold_back(
+                user,
+                items[0].id,
+                get_datetime_in_future_seconds(Env.NOTIFICATION_OUTBOX_RETRY_SECONDS.get_int()),
+            )
+
+
+async def send_user_outbox_notifications(
+    context: ContextTypes.DEFAULT_TYPE, user: User, items: list[NotificationOutbox]
+) -> None:
+    """
+    Send the outbox notifications of a user, removing them once sent
+    :param context: The context object
+    :param user: The user
+    :param items: The notifications of the user
+    :return: None
+    """
+
+    # Not in authorized groups
+    if Env.LIMIT_TO_AUTHORIZED_GROUPS.get_bool() and not await user.in_authorized_groups(context):
+        NotificationOutbox.delete().where(
+            NotificationOutbox.id.in_([item.id for item in items])
+        ).execute()
+        return
+
+    for item in items:
+        await wait_for_send_slot()
+
+        try:
+            await send_notification_message(context, user, item.get_message())
+        except Forbidden:  # User has blocked the bot
+            pass
+        except RetryAfter as e:
+            # Rate limited, pause all senders and try again this and the next notifications
+            pause_sending(e.retry_after)
+            NotificationOutbox.hold_back(
+                user, item.id, get_datetime_in_future_seconds(e.retry_after)
+            )
+            return
+        except Exception as e:
+            item.attempts += 1
+            if item.attempts < Env.NOTIFICATION_OUTBOX_MAX_ATTEMPTS.get_int():
+                # Try again later this and the next notifications, so they keep their order
+                logging.warning(f"Error sending notification {item.id}, will retry: {e}")
+                next_attempt_date = get_datetime_in_future_seconds(
+                    Env.NOTIFICATION_OUTBOX_RETRY_SECONDS.get_int() * 2 ** (item.attempts - 1)
+                )
+                NotificationOutbox.update(attempts=item.attempts).where(
+                    NotificationOutbox.id == item.id
+                ).execute()
+                NotificationOutbox.hold_back(user, item.id, next_attempt_date)
+                return
+
+            logging.exception(f"Error sending notification {item.id} to user {user.id}: {e}")
+
+        NotificationOutbox.delete_by_id(item.id)
+
+
+async def wait_for_send_slot() -> None:
+    """
+    Wait until a notification can be sent without exceeding the notifications per second
+    :return: None
+    """
+
+    global _next_send_time
+
+    now = time.monotonic()
+    send_time = max(now, _next_send_time)
+    _next_send_time = send_time + 1 / Env.NOTIFICATION_OUTBOX_MAX_PER_SECOND.get_float()
+
+    if send_time > now:
+        await asyncio.sleep(send_time - now)
+
+
+def pause_sending(seconds: int) -> None:
+    """
+    Pause sending notifications, after Telegram asked to retry later
+    :param seconds: The seconds to wait
+    :return: None
+    """
+
+    global _next_send_time
+
+    _next_send_time = max(_next_send_time, time.monotonic() + seconds)
 
 
 def is_enabled(user: User, notification: Notification) -> bool:
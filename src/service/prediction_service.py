@@ -5,6 +5,7 @@ from telegram.error import BadRequest, TelegramError
 from telegram.ext import ContextTypes
 
 import resources.phrases as phrases
+from src.model.BaseModel import db_obj
 from src.model.GroupChat import GroupChat
 from src.model.Prediction import Prediction
 from src.model.PredictionGroupChatMessage import PredictionGroupChatMessage
@@ -26,6 +27,7 @@ from src.model.enums.income_tax.IncomeTaxEventType import IncomeTaxEventType
 from src.model.error.CustomException import PredictionException
 from src.model.pojo.ContextDataValue import ContextDataValue
 from src.model.pojo.Keyboard import Keyboard
+from src.model.pojo.PredictionSettlement import PredictionSettlement
 from src.service.bounty_service import round_belly_up, add_or_remove_bounty
 from src.service.date_service import default_datetime_format
 from src.service.devil_fruit_service import get_ability_value
@@ -34,7 +36,7 @@ from src.service.group_service import (
     save_group_chat_error,
 )
 from src.service.message_service import escape_valid_markdown_chars, full_message_send
-from src.service.notification_service import send_notification
+from src.service.notification_service import send_notification, send_notifications
 from src.utils.context_utils import get_random_user_context_inner_query_key
 from src.utils.math_utils import (
     get_percentage_from_value,
@@ -491,50 +493,64 @@ async def set_results(context: ContextTypes.DEFAULT_TYPE, prediction: Prediction
     if PredictionStatus(prediction.status) is not PredictionStatus.BETS_CLOSED:
         raise PredictionException(phrases.PREDICTION_NOT_IN_BETS_CLOSED_STATUS)
 
-    prediction_options: list[PredictionOption] = prediction.prediction_options
+    prediction_options: list[PredictionOption] = list(prediction.prediction_options)
     prediction_options_correct: list[PredictionOption] = [
         prediction_option
         for prediction_option in prediction_options
         if prediction_option.is_correct
     ]
-    prediction_options_users: list[PredictionOptionUser] = get_prediction_options_users(prediction)
 
-    # Dictionary with key: user_id, value: list (user, total_win, list of prediction_options)
-    users_total_win: dict[int, (User, int, list[PredictionOption])] = {}
+    # All bets with their option and user, in a single query
+    prediction_options_users: list[PredictionOptionUser] = list(
+        PredictionOptionUser.select(PredictionOptionUser, PredictionOption, User)
+        .join(PredictionOption)
+        .switch(PredictionOptionUser)
+        .join(User)
+        .where(PredictionOptionUser.prediction == prediction)
+        .order_by(PredictionOptionUser.user, PredictionOption.number.asc())
+    )
+
+    # Pool totals, computed once
+    total_wager = 0
+    total_wager_by_option: dict[int, int] = {}
+    for prediction_option_user in prediction_options_users:
+        option_id = prediction_option_user.prediction_option_id
+        total_wager += prediction_option_user.wager
+        total_wager_by_option[option_id] = (
+            total_wager_by_option.get(option_id, 0) + prediction_option_user.wager
+        )
+
+    total_correct_wager = sum(
+        total_wager_by_option.get(prediction_option.id, 0)
+        for prediction_option in prediction_options_correct
+    )
+
+    should_refund = prediction.refund_wager or len(prediction_options_correct) == 0
+    settlements: dict[int, PredictionSettlement] = {}
 
     for prediction_option_user in prediction_options_users:
         user: User = prediction_option_user.user
 
-        # If user is not in dictionary, add it
-        if user.id not in users_total_win:
-            users_total_win[user.id] = (user, 0, [])
+        settlement = settlements.get(user.id)
+        if settlement is None:
+            settlement = settlements[user.id] = PredictionSettlement(user)
 
-        # Add prediction option to list
         prediction_option: PredictionOption = prediction_option_user.prediction_option
-        users_total_win[user.id][2].append(prediction_option)
+        settlement.prediction_options.append(prediction_option)
 
         # Correct prediction
         if prediction_option.is_correct:
-            win_amount = get_prediction_option_user_win(
-                prediction_option_user, prediction_options_users=prediction_options_users
+            win_amount = get_win_amount(
+                prediction_option_user.wager, total_wager, total_correct_wager
             )
-            # Add to bounty
-            await add_or_remove_bounty(
-                user,
-                win_amount,
-                pending_belly_amount=prediction_option_user.wager,
-                tax_event_type=IncomeTaxEventType.PREDICTION,
-                event_id=prediction.id,
-            )
-
-            # Add to total win
-            users_total_win[user.id][1] += win_amount
+            settlement.win_amount += win_amount
+            settlement.won_wager += prediction_option_user.wager
+            settlement.total_win += win_amount
         else:
-            # Remove from total win
-            users_total_win[user.id][1] -= prediction_option_user.wager
+            settlement.total_win -= prediction_option_user.wager
 
         # Should refund wager or no correct options
-        if prediction.refund_wager or len(prediction_options_correct) == 0:
+        if should_refund:
             if len(prediction_options_correct) == 0:
                 # No correct options, refund full wager
                 refund_amount = prediction_option_user.wager
@@ -542,19 +558,39 @@ async def set_results(context: ContextTypes.DEFAULT_TYPE, prediction: Prediction
                 # Cap refund
                 refund_amount = min(
                     prediction_option_user.wager,
-                    get_max_wager_refund(prediction_option_user=prediction_option_user),
+                    get_max_wager_refund(
+                        prediction_option_user=prediction_option_user, prediction=prediction
+                    ),
                 )
 
-            await add_or_remove_bounty(
-                user, refund_amount, pending_belly_amount=prediction_option_user.wager
-            )
+            settlement.refund_amount += refund_amount
+            settlement.refunded_wager += prediction_option_user.wager
+
+    # Pay all users in a single transaction, one payout and one refund per user
+    with db_obj.get_db().atomic():
+        for settlement in settlements.values():
+            if settlement.won_wager > 0:
+                await add_or_remove_bounty(
+                    settlement.user,
+                    settlement.win_amount,
+                    pending_belly_amount=settlement.won_wager,
+                    should_save=True,
+                    tax_event_type=IncomeTaxEventType.PREDICTION,
+                    event_id=prediction.id,
+                )
 
-        user.save()
+            if settlement.refunded_wager > 0:
+                await add_or_remove_bounty(
+                    settlement.user,
+                    settlement.refund_amount,
+                    pending_belly_amount=settlement.refunded_wager,
+                    should_save=True,
+                )
 
-    # Update status
-    prediction.status = PredictionStatus.RESULT_SET
-    prediction.result_set_date = datetime.now()
-    prediction.save()
+        # Update status
+        prediction.status = PredictionStatus.RESULT_SET
+        prediction.result_set_date = datetime.now()
+        prediction.save()
 
     # Refresh prediction
     await refresh(context, prediction)
@@ -565,16 +601,22 @@ async def set_results(context: ContextTypes.DEFAULT_TYPE, prediction: Prediction
     )
 
     # Send notification to users
-    for user_id, value in users_total_win.items():
-        user: User = value[0]
-        total_win: int = value[1]
-        user_prediction_options: list[PredictionOption] = value[2]
-
-        notification: PredictionResultNotification = PredictionResultNotification(
-            prediction, user_prediction_options, prediction_options_correct, total_win, user
-        )
-
-        await send_notification(context, user, notification)
+    send_notifications(
+        context,
+        [
+            (
+                settlement.user,
+                PredictionResultNotification(
+                    prediction,
+                    settlement.prediction_options,
+                    prediction_options_correct,
+                    settlement.total_win,
+                    settlement.user,
+                ),
+            )
+            for settlement in settlements.values()
+        ],
+    )
 
 
 async def refresh(
@@ -654,10 +696,20 @@ def get_prediction_option_user_win(
             if pou.prediction_option == prediction_option_user.prediction_option
         )
 
+    return get_win_amount(prediction_option_user.wager, total_wager, total_correct_wager)
+
+
+def get_win_amount(wager: int, total_wager: int, total_correct_wager: int) -> int:
+    """
+    Get the win of a wager on a correct option
+    :param wager: The wager
+    :param total_wager: The total wager of the prediction
+    :param total_correct_wager: The total wager on the correct options
+    :return: The win
+    """
+
     # What percent of the total correct wager is this user's wager
-    percentage_of_correct_wager = get_percentage_from_value(
-        prediction_option_user.wager, total_correct_wager
-    )
+    percentage_of_correct_wager = get_percentage_from_value(wager, total_correct_wager)
 
     # How much is this percentage in the total wager
     value_from_total_wager = round_belly_up(
@@ -709,14 +761,13 @@ async def remove_all_bets_from_active_predictions(context: ContextTypes.DEFAULT_
 
     # Select active predictions
     active_statuses = [PredictionStatus.SENT, PredictionStatus.BETS_CLOSED]
-    predictions: list[Prediction] = Prediction.select().where(
-        Prediction.status.in_(active_statuses)
+    predictions: list[Prediction] = list(
+        Prediction.select().where(Prediction.status.in_(active_statuses))
     )
 
+    PredictionOptionUser.delete().where(PredictionOptionUser.prediction.in_(predictions)).execute()
+
     for prediction in predictions:
-        PredictionOptionUser.delete().where(
-            PredictionOptionUser.prediction == prediction
-        ).execute()
         await send_prediction_status_change_message_or_refresh_dispatch(
             context, phrases.PREDICTION_ALL_BETS_REMOVED_FOR_BOUNTY_RESET, prediction
         )
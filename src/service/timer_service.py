@@ -1,12 +1,14 @@
 import logging
+import time
 from datetime import datetime
 
 from apscheduler.triggers.cron import CronTrigger
 from telegram.ext import ContextTypes, Application, Job
 
 import src.model.enums.Timer as Timer
-from src.chat.manage_message import init, end
+from src.model.BaseModel import db_obj
 from src.model.DailyReward import DailyReward
+from src.service.activity_service import flush_activity
 from src.service.bounty_loan_service import set_expired_bounty_loans
 from src.service.bounty_poster_service import reset_bounty_poster_limit
 from src.service.devil_fruit_service import schedule_devil_fruit_release, respawn_devil_fruit
@@ -14,14 +16,17 @@ from src.service.fight_plunder_service import decrease_scout_count
 from src.service.game_service import end_inactive_games
 from src.service.generic_service import run_minute_tasks
 from src.service.group_service import deactivate_inactive_group_chats
+from src.service.keyboard_state_service import clean_keyboard_states
 from src.service.leaderboard_service import send_leaderboard
 from src.service.location_service import reset_can_change_region
+from src.service.metrics_service import record_timer, log_metrics
 from src.service.prediction_service import (
     send_scheduled_predictions,
     close_scheduled_predictions,
     send_prediction_status_change_message_or_refresh_dispatch,
 )
 from src.service.reddit_service import manage as send_reddit_post
+from src.utils.context_utils import clean_context_data
 from src.utils.download_utils import cleanup_temp_dir
 
 
@@ -89,51 +94,64 @@ async def run(context: ContextTypes.DEFAULT_TYPE) -> None:
 
     timer: Timer.Timer = job.data
 
-    db = init()
-
-    if timer.should_log:
-        logging.info(f"Running timer {job.name}")
-
-    match timer:
-        case Timer.REDDIT_POST_ONE_PIECE | Timer.REDDIT_POST_MEME_PIECE:
-            await send_reddit_post(context, timer.info)
-        case Timer.TEMP_DIR_CLEANUP:
-            cleanup_temp_dir()
-        case Timer.TIMER_SEND_LEADERBOARD:
-            await send_leaderboard(context)
-        case Timer.RESET_BOUNTY_POSTER_LIMIT:
-            await reset_bounty_poster_limit()
-        case Timer.RESET_CAN_CHANGE_REGION:
-            reset_can_change_region()
-        case Timer.SEND_SCHEDULED_PREDICTIONS:
-            await send_scheduled_predictions(context)
-        case Timer.CLOSE_SCHEDULED_PREDICTIONS:
-            await close_scheduled_predictions(context)
-        case Timer.REFRESH_ACTIVE_PREDICTIONS_GROUP_MESSAGE:
-            await send_prediction_status_change_message_or_refresh_dispatch(
-                context, should_refresh=True
-            )
-        case Timer.SCHEDULE_DEVIL_FRUIT_ZOAN_RELEASE:
-            await schedule_devil_fruit_release(context)
-        case Timer.RESPAWN_DEVIL_FRUIT:
-            await respawn_devil_fruit(context)
-        case Timer.DEACTIVATE_INACTIVE_GROUP_CHATS:
-            deactivate_inactive_group_chats()
-        case Timer.END_INACTIVE_GAMES:
-            await end_inactive_games(context)
-        case Timer.SET_EXPIRED_BOUNTY_LOANS:
-            await set_expired_bounty_loans(context)
-        case Timer.MINUTE_TASKS:
-            await run_minute_tasks(context)
-        case Timer.DAILY_REWARD:
-            DailyReward.reset()
-        case Timer.FIGHT_PLUNDER_SCOUT_COUNT_DECREASE:
-            decrease_scout_count()
-        case _:
-            raise ValueError(f"Unknown timer {timer.name}")
-
-    if timer.should_log:
-        logging.info(f"Finished timer {context.job.name}")
-    end(db)
+    start = time.perf_counter()
+    failed = True
+    try:
+        async with db_obj.connection():
+            if timer.should_log:
+                logging.info(f"Running timer {job.name}")
+
+            match timer:
+                case Timer.REDDIT_POST_ONE_PIECE | Timer.REDDIT_POST_MEME_PIECE:
+                    await send_reddit_post(context, timer.info)
+                case Timer.TEMP_DIR_CLEANUP:
+                    cleanup_temp_dir()
+                case Timer.TIMER_SEND_LEADERBOARD:
+                    await send_leaderboard(context)
+                case Timer.RESET_BOUNTY_POSTER_LIMIT:
+                    await reset_bounty_poster_limit()
+                case Timer.RESET_CAN_CHANGE_REGION:
+                    reset_can_change_region()
+                case Timer.SEND_SCHEDULED_PREDICTIONS:
+                    await send_scheduled_predictions(context)
+                case Timer.CLOSE_SCHEDULED_PREDICTIONS:
+                    await close_scheduled_predictions(context)
+                case Timer.REFRESH_ACTIVE_PREDICTIONS_GROUP_MESSAGE:
+                    await send_prediction_status_change_message_or_refresh_dispatch(
+                        context, should_refresh=True
+                    )
+                case Timer.SCHEDULE_DEVIL_FRUIT_ZOAN_RELEASE:
+                    await schedule_devil_fruit_release(context)
+                case Timer.RESPAWN_DEVIL_FRUIT:
+                    await respawn_devil_fruit(context)
+                case Timer.DEACTIVATE_INACTIVE_GROUP_CHATS:
+                    deactivate_inactive_group_chats()
+                case Timer.END_INACTIVE_GAMES:
+                    await end_inactive_games(context)
+                case Timer.SET_EXPIRED_BOUNTY_LOANS:
+                    await set_expired_bounty_loans(context)
+                case Timer.MINUTE_TASKS:
+                    await run_minute_tasks(context)
+                case Timer.DAILY_REWARD:
+                    DailyReward.reset()
+                case Timer.FIGHT_PLUNDER_SCOUT_COUNT_DECREASE:
+                    decrease_scout_count()
+                case Timer.FLUSH_ACTIVITY:
+                    await db_obj.run_in_executor(flush_activity)
+                case Timer.CLEAN_CONTEXT_DATA:
+                    clean_context_data(context.application)
+                case Timer.CLEAN_KEYBOARD_STATES:
+                    clean_keyboard_states()
+                case Timer.LOG_METRICS:
+                    log_metrics(context.application)
+                case _:
+                    raise ValueError(f"Unknown timer {timer.name}")
+
+            if timer.should_log:
+                logging.info(f"Finished timer {context.job.name}")
+
+        failed = False
+    finally:
+        record_timer(timer.name, time.perf_counter() - start, failed)
 
     return
@@ -15,15 +15,21 @@ from src.model.User import User
 from src.model.enums.BossType import BossType
 from src.model.enums.LeaderboardRank import PIRATE_KING
 from src.model.error.CustomException import AnonymousAdminException
+from src.service.chat_member_service import (
+    get_cached_chat_member,
+    set_cached_chat_member,
+    get_chat_administrators,
+)
 from src.service.leaderboard_service import get_current_leaderboard_rank
 from src.utils.download_utils import generate_temp_file_path
+from src.utils.request_cache_utils import get_request_fact
 
 
-async def get_user_profile_photo(update: Update) -> str | None:
+async def get_user_profile_photo_size(update: Update) -> PhotoSize | None:
     """
-    Gets the user's profile photo
+    Gets the largest size of the user's last profile photo, without downloading it
     :param update: Telegram update
-    :return: The path of the user's profile photo
+    :return: The photo size, None if no photo is available
     """
 
     # Anonymous admin, no photo available
@@ -31,19 +37,31 @@ async def get_user_profile_photo(update: Update) -> str | None:
         return None
 
     # Get users last photo
-    photo_path: Optional[Path] = None
     try:
         # More verbose to get IDE hints
         user_profile_photos: UserProfilePhotos = await update.effective_user.get_profile_photos(
             limit=1
         )
         last_set_photos: Sequence[PhotoSize] = user_profile_photos.photos[0]
-        last_set_photo: PhotoSize = last_set_photos[-1]
-        file: File = await last_set_photo.get_file()
+        return last_set_photos[-1]
+    except (AttributeError, IndexError):
+        return None
+
+
+async def download_profile_photo(photo_size: PhotoSize) -> str | None:
+    """
+    Downloads a profile photo
+    :param photo_size: The photo size to download
+    :return: The path of the downloaded photo
+    """
+
+    photo_path: Optional[Path] = None
+    try:
+        file: File = await photo_size.get_file()
         photo_path: Path = await file.download_to_drive(
             generate_temp_file_path(c.TG_PROFILE_PHOTO_EXTENSION)
         )
-    except (AttributeError, IndexError):
+    except AttributeError:
         pass
 
     return photo_path
@@ -57,6 +75,22 @@ def get_boss_type(user: User, group_chat: GroupChat = None) -> BossType | None:
     :return: The boss type
     """
 
+    return get_request_fact(
+        "boss_type",
+        user.id,
+        lambda: load_boss_type(user, group_chat),
+        group_chat.id if group_chat is not None else None,
+    )
+
+
+def load_boss_type(user: User, group_chat: GroupChat = None) -> BossType | None:
+    """
+    Load the boss type of the user
+    :param user: The user
+    :param group_chat: The group chat
+    :return: The boss type
+    """
+
     if user.is_admin:
         return BossType.ADMIN
 
@@ -136,18 +170,31 @@ async def get_chat_member(
 
     from telegram.error import Forbidden
 
+    if update is not None:
+        chat_id = update.effective_chat.id
+    elif group_chat is not None:  # To avoid IDE warning
+        group: Group = group_chat.group
+        chat_id = group.tg_group_id
+    elif tg_group_id is not None:
+        chat_id = tg_group_id
+    else:
+        raise ValueError("update or group_chat must be specified")
+
+    # Kept up to date by chat member updates, request only if not cached
+    is_cached, chat_member = get_cached_chat_member(chat_id, user.tg_user_id)
+    if is_cached:
+        return chat_member
+
     try:
         if update is not None:
-            return await update.effective_chat.get_member(int(user.tg_user_id))
-        elif group_chat is not None:  # To avoid IDE warning
-            group: Group = group_chat.group
-            return await context.bot.get_chat_member(group.tg_group_id, str(user.tg_user_id))
-        elif tg_group_id is not None:
-            return await context.bot.get_chat_member(tg_group_id, str(user.tg_user_id))
+            chat_member = await update.effective_chat.get_member(int(user.tg_user_id))
         else:
-            raise ValueError("update or group_chat must be specified")
+            chat_member = await context.bot.get_chat_member(chat_id, str(user.tg_user_id))
     except (Forbidden, BadRequest):  # Bot kicked from the group chat or user not found
-        return None
+        chat_member = None
+
+    set_cached_chat_member(chat_id, user.tg_user_id, chat_member)
+    return chat_member
 
 
 async def user_is_chat_member(
@@ -217,7 +264,9 @@ async def get_effective_tg_user_id(
     # Anonymous admin
     # Get all chat admins
     # noinspection PyTypeChecker
-    chat_admins: list[ChatMemberAdministrator] = await effective_message.chat.get_administrators()
+    chat_admins: tuple[ChatMemberAdministrator, ...] = await get_chat_administrators(
+        effective_message.chat
+    )
 
     if len(chat_admins) == 0:
         raise AnonymousAdminException()
@@ -0,0 +1,427 @@
+import itertools
+import logging
+from typing import Iterable
+
+from peewee import chunked
+
+import resources.Environment as Env
+from src.model.BaseModel import db_obj
+from src.model.BountyGift import BountyGift
+from src.model.Fight import Fight
+from src.model.Game import Game
+from src.model.Plunder import Plunder
+from src.model.UserStats import UserStats
+from src.model.UserStatsCounter import UserStatsCounter
+from src.model.enums.BountyGiftStatus import BountyGiftStatus
+from src.model.enums.GameStatus import GameStatus
+from src.model.enums.UserStatsCounterType import UserStatsCounterType
+from src.model.pojo.UserStatsChange import UserStatsChange
+
+USER_STATS_INSERT_BATCH_SIZE = 500
+
+# Counter type -> (field name of the top key, field name of the top value)
+COUNTER_TOP_FIELDS: dict[UserStatsCounterType, tuple[str, str]] = {
+    UserStatsCounterType.FIGHT_OPPONENT: ("fight_most_fought_user", "fight_most_fought_count"),
+    UserStatsCounterType.PLUNDER_OPPONENT: (
+        "plunder_most_plundered_user",
+        "plunder_most_plundered_count",
+    ),
+    UserStatsCounterType.GAME_OPPONENT: (
+        "game_most_challenged_user",
+        "game_most_challenged_count",
+    ),
+    UserStatsCounterType.GAME_TYPE: ("game_most_played_type", "game_most_played_count"),
+    UserStatsCounterType.BOUNTY_GIFT_RECEIVER: (
+        "bounty_gift_top_receiver",
+        "bounty_gift_top_receiver_amount",
+    ),
+    UserStatsCounterType.BOUNTY_GIFT_SENDER: (
+        "bounty_gift_top_sender",
+        "bounty_gift_top_sender_amount",
+    ),
+}
+
+
+def get_fight_stats_changes(fight: Fight) -> list[UserStatsChange]:
+    """
+    Get what an ended fight adds to the stats of its users
+    :param fight: The fight
+    :return: The changes, empty if the fight has no outcome
+    """
+
+    status = fight.get_status()
+    if status not in (GameStatus.WON, GameStatus.LOST):
+        return []
+
+    changes: list[UserStatsChange] = []
+    for user_id, other_user_id, won in (
+        (fight.challenger_id, fight.opponent_id, status is GameStatus.WON),
+        (fight.opponent_id, fight.challenger_id, status is GameStatus.LOST),
+    ):
+        change = UserStatsChange(user_id).add_to_counter(
+            UserStatsCounterType.FIGHT_OPPONENT, other_user_id
+        )
+        if won:
+            change.add("fight_wins", 1).add("fight_belly_won", fight.belly).add_max(
+                "fight_max_won", "fight_max_won_belly", fight.id, fight.belly
+            )
+        else:
+            change.add("fight_losses", 1).add("fight_belly_lost", fight.belly).add_max(
+                "fight_max_lost", "fight_max_lost_belly", fight.id, fight.belly
+            )
+
+        changes.append(change)
+
+    return changes
+
+
+def get_plunder_stats_changes(plunder: Plunder) -> list[UserStatsChange]:
+    """
+    Get what an ended plunder adds to the stats of its users
+    :param plunder: The plunder
+    :return: The changes, empty if the plunder has no outcome
+    """
+
+    status = plunder.get_status()
+    if status not in (GameStatus.WON, GameStatus.LOST):
+        return []
+
+    changes: list[UserStatsChange] = []
+    for user_id, other_user_id, won in (
+        (plunder.challenger_id, plunder.opponent_id, status is GameStatus.WON),
+        (plunder.opponent_id, plunder.challenger_id, status is GameStatus.LOST),
+    ):
+        change = UserStatsChange(user_id).add_to_counter(
+            UserStatsCounterType.PLUNDER_OPPONENT, other_user_id
+        )
+        if won:
+            change.add("plunder_wins", 1).add("plunder_belly_won", plunder.belly).add_max(
+                "plunder_max_won", "plunder_max_won_belly", plunder.id, plunder.belly
+            )
+        else:
+            change.add("plunder_losses", 1).add("plunder_belly_lost", plunder.belly).add_max(
+                "plunder_max_lost", "plunder_max_lost_belly", plunder.id, plunder.belly
+            )
+
+        changes.append(change)
+
+    # Only the challenger is sentenced if the plunder fails
+    if status is GameStatus.LOST:
+        changes[0].add_max(
+            "plunder_max_sentence",
+            "plunder_max_sentence_duration",
+            plunder.id,
+            plunder.sentence_duration,
+        )
+
+    return changes
+
+
+def get_game_stats_changes(game: Game) -> list[UserStatsChange]:
+    """
+    Get what an ended game adds to the stats of its users
+    :param game: The game
+    :return: The changes, empty if the game has no opponent or no outcome
+    """
+
+    status = game.get_status()
+    if game.opponent_id is None or status not in (
+        GameStatus.WON,
+        GameStatus.LOST,
+        GameStatus.DRAW,
+    ):
+        return []
+
+    # A draw is a draw for both users
+    opponent_status = status if status is GameStatus.DRAW else status.get_opposite_status()
+
+    changes: list[UserStatsChange] = []
+    for user_id, other_user_id, user_status in (
+        (game.challenger_id, game.opponent_id, status),
+        (game.opponent_id, game.challenger_id, opponent_status),
+    ):
+        change = (
+            UserStatsChange(user_id)
+            .add_to_counter(UserStatsCounterType.GAME_OPPONENT, other_user_id)
+            .add_to_counter(UserStatsCounterType.GAME_TYPE, game.type)
+        )
+        if user_status is GameStatus.WON:
+            change.add("game_wins", 1).add("game_belly_won", game.wager).add_max(
+                "game_max_won", "game_max_won_wager", game.id, game.wager
+            )
+        elif user_status is GameStatus.LOST:
+            change.add("game_losses", 1).add("game_belly_lost", game.wager).add_max(
+                "game_max_lost", "game_max_lost_wager", game.id, game.wager
+            )
+        else:
+            change.add("game_draws", 1)
+
+        changes.append(change)
+
+    return changes
+
+
+def get_bounty_gift_stats_changes(bounty_gift: BountyGift) -> list[UserStatsChange]:
+    """
+    Get what a confirmed bounty gift adds to the stats of its users
+    :param bounty_gift: The bounty gift
+    :return: The changes, empty if the bounty gift is not confirmed
+    """
+
+    if bounty_gift.get_status() is not BountyGiftStatus.CONFIRMED:
+        return []
+
+    sender_change = (
+        UserStatsChange(bounty_gift.sender_id)
+        .add("bounty_gifts_sent", 1)
+        .add("bounty_gift_belly_sent", bounty_gift.amount)
+        .add_max(
+            "bounty_gift_max_sent",
+            "bounty_gift_max_sent_amount",
+            bounty_gift.id,
+            bounty_gift.amount,
+        )
+        .add_to_counter(
+            UserStatsCounterType.BOUNTY_GIFT_RECEIVER, bounty_gift.receiver_id, bounty_gift.amount
+        )
+    )
+    receiver_change = (
+        UserStatsChange(bounty_gift.receiver_id)
+        .add("bounty_gifts_received", 1)
+        .add("bounty_gift_belly_received", bounty_gift.amount)
+        .add_max(
+            "bounty_gift_max_received",
+            "bounty_gift_max_received_amount",
+            bounty_gift.id,
+            bounty_gift.amount,
+        )
+        .add_to_counter(
+            UserStatsCounterType.BOUNTY_GIFT_SENDER, bounty_gift.sender_id, bounty_gift.amount
+        )
+    )
+
+    return [sender_change, receiver_change]
+
+
+def save_user_stats_changes(changes: list[UserStatsChange]) -> None:
+    """
+    Add changes to the saved stats, with increments in the database so changes saved at the same
+    time by others are not lost
+    :param changes: The changes
+    :return: None
+    """
+
+    fields = UserStats._meta.fields
+    with db_obj.get_db().atomic():
+        for change in changes:
+            UserStats.insert(user=change.user_id).on_conflict_ignore().execute()
+            stats_condition = UserStats.user == change.user_id
+
+            if len(change.amounts) > 0:
+                UserStats.update(
+                    {
+                        fields[name]: fields[name] + amount
+                        for name, amount in change.amounts.items()
+                    }
+                ).where(stats_condition).execute()
+
+            for item_field_name, value_field_name, item_id, value in change.maxima:
+                value_field = fields[value_field_name]
+                UserStats.update({fields[item_field_name]: item_id, value_field: value}).where(
+                    stats_condition & (value_field.is_null() | (value_field < value))
+                ).execute()
+
+            for counter_type, key, amount in change.counters:
+                counter_condition = (
+                    (UserStatsCounter.user == change.user_id)
+                    & (UserStatsCounter.type == counter_type)
+                    & (UserStatsCounter.key == key)
+                )
+                UserStatsCounter.insert(
+                    user=change.user_id, type=counter_type, key=key
+                ).on_conflict_ignore().execute()
+                UserStatsCounter.update(value=UserStatsCounter.value + amount).where(
+                    counter_condition
+                ).execute()
+                value = (
+                    UserStatsCounter.select(UserStatsCounter.value)
+                    .where(counter_condition)
+                    .scalar()
+                )
+
+                # New top of the counter type
+                key_field_name, value_field_name = COUNTER_TOP_FIELDS[counter_type]
+                value_field = fields[value_field_name]
+                UserStats.update({fields[key_field_name]: key, value_field: value}).where(
+                    stats_condition & (value_field < value)
+                ).execute()
+
+
+def add_fight_stats(fight: Fight) -> None:
+    """
+    Add an ended fight to the stats of its users
+    :param fight: The fight
+    :return: None
+    """
+
+    save_user_stats_changes(get_fight_stats_changes(fight))
+
+
+def add_plunder_stats(plunder: Plunder) -> None:
+    """
+    Add an ended plunder to the stats of its users
+    :param plunder: The plunder
+    :return: None
+    """
+
+    save_user_stats_changes(get_plunder_stats_changes(plunder))
+
+
+def add_game_stats(game: Game) -> None:
+    """
+    Add an ended game to the stats of its users
+    :param game: The game
+    :return: None
+    """
+
+    save_user_stats_changes(get_game_stats_changes(game))
+
+
+def add_bounty_gift_stats(bounty_gift: BountyGift) -> None:
+    """
+    Add a confirmed bounty gift to the stats of its users
+    :param bounty_gift: The bounty gift
+    :return: None
+    """
+
+    save_user_stats_changes(get_bounty_gift_stats_changes(bounty_gift))
+
+
+def get_default_user_stats_row(user_id: int) -> dict:
+    """
+    Get the stats row of a user with no stats yet, to be inserted
+    :param user_id: The user id
+    :return: The row
+    """
+
+    row = {}
+    for field in UserStats._meta.sorted_fields:
+        if field is UserStats.id:
+            continue
+
+        row[field.name] = field.default() if callable(field.default) else field.default
+
+    row["user"] = user_id
+    return row
+
+
+def get_history_stats_changes() -> Iterable[UserStatsChange]:
+    """
+    Get the changes of all the ended fights, plunders, games and bounty gifts, oldest first
+    :return: The changes
+    """
+
+    fights = (
+        Fight.select(Fight.id, Fight.challenger, Fight.opponent, Fight.status, Fight.belly)
+        .where(Fight.status.in_([GameStatus.WON, GameStatus.LOST]))
+        .order_by(Fight.id)
+    )
+    plunders = (
+        Plunder.select(
+            Plunder.id,
+            Plunder.challenger,
+            Plunder.opponent,
+            Plunder.status,
+            Plunder.belly,
+            Plunder.sentence_duration,
+        )
+        .where(Plunder.status.in_([GameStatus.WON, GameStatus.LOST]))
+        .order_by(Plunder.id)
+    )
+    games = (
+        Game.select(Game.id, Game.challenger, Game.opponent, Game.status, Game.type, Game.wager)
+        .where(
+            (Game.status.in_([GameStatus.WON, GameStatus.LOST, GameStatus.DRAW]))
+            & (Game.opponent.is_null(False))
+        )
+        .order_by(Game.id)
+    )
+    bounty_gifts = (
+        BountyGift.select(
+            BountyGift.id,
+            BountyGift.sender,
+            BountyGift.receiver,
+            BountyGift.status,
+            BountyGift.amount,
+        )
+        .where(BountyGift.status == BountyGiftStatus.CONFIRMED)
+        .order_by(BountyGift.id)
+    )
+
+    return itertools.chain(
+        itertools.chain.from_iterable(map(get_fight_stats_changes, fights.iterator())),
+        itertools.chain.from_iterable(map(get_plunder_stats_changes, plunders.iterator())),
+        itertools.chain.from_iterable(map(get_game_stats_changes, games.iterator())),
+        itertools.chain.from_iterable(map(get_bounty_gift_stats_changes, bounty_gifts.iterator())),
+    )
+
+
+def rebuild_user_stats() -> None:
+    """
+    Compute the stats of all users again from the whole history, replacing the saved ones
+    :return: None
+    """
+
+    stats_rows: dict[int, dict] = {}
+    counters: dict[tuple[int, UserStatsCounterType, int], int] = {}
+
+    for change in get_history_stats_changes():
+        row = stats_rows.get(change.user_id)
+        if row is None:
+            row = stats_rows[change.user_id] = get_default_user_stats_row(change.user_id)
+
+        for name, amount in change.amounts.items():
+            row[name] += amount
+
+        for item_field_name, value_field_name, item_id, value in change.maxima:
+            if row[value_field_name] is None or row[value_field_name] < value:
+                row[item_field_name] = item_id
+                row[value_field_name] = value
+
+        for counter_type, key, amount in change.counters:
+            counter_key = (change.user_id, counter_type, key)
+            value = counters[counter_key] = counters.get(counter_key, 0) + amount
+
+            # New top of the counter type, the first one reaching the value if tied
+            key_field_name, value_field_name = COUNTER_TOP_FIELDS[counter_type]
+            if row[value_field_name] < value:
+                row[key_field_name] = key
+                row[value_field_name] = value
+
+    counters_rows = [
+        {"user": user_id, "type": counter_type, "key": key, "value": value}
+        for (user_id, counter_type, key), value in counters.items()
+    ]
+
+    with db_obj.get_db().atomic():
+        UserStatsCounter.delete().execute()
+        UserStats.delete().execute()
+
+        for batch in chunked(stats_rows.values(), USER_STATS_INSERT_BATCH_SIZE):
+            UserStats.insert_many(batch).execute()
+
+        for batch in chunked(counters_rows, USER_STATS_INSERT_BATCH_SIZE):
+            UserStatsCounter.insert_many(batch).execute()
+
+    logging.info(f"Rebuilt the stats of {len(stats_rows)} users")
+
+
+def init_user_stats() -> None:
+    """
+    Build the stats from the whole history if not built yet, or if a rebuild is requested. To be
+    called at startup, before any fight, plunder, game or bounty gift can end
+    :return: None
+    """
+
+    if Env.USER_STATS_REBUILD_ON_STARTUP.get_bool() or not UserStats.select().exists():
+        rebuild_user_stats()
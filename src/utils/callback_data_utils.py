@@ -0,0 +1,264 @@
+import base64
+import json
+import struct
+
+from src.model.enums.ReservedKeyboardKeys import ReservedKeyboardKeys
+
+# Version of the compact format, first byte of the encoded data
+CALLBACK_DATA_VERSION = 1
+
+# Keys encoded as their index, any other key is encoded as text. Only append new keys, else the
+# data of keyboards already sent could not be decoded anymore
+CALLBACK_DATA_KEYS: tuple[str, ...] = (
+    ReservedKeyboardKeys.SCREEN,
+    ReservedKeyboardKeys.PREVIOUS_SCREEN,
+    ReservedKeyboardKeys.AUTHORIZED_USERS,
+    ReservedKeyboardKeys.DEFAULT_PRIMARY_KEY,
+    ReservedKeyboardKeys.DEFAULT_SECONDARY_KEY,
+    "c",
+    "d",
+    "e",
+    "f",
+    ReservedKeyboardKeys.PAGE,
+    ReservedKeyboardKeys.CURSOR,
+    ReservedKeyboardKeys.FILTER,
+    ReservedKeyboardKeys.DIRECT_ITEM,
+    ReservedKeyboardKeys.NUMBER,
+    ReservedKeyboardKeys.CONFIRM,
+    ReservedKeyboardKeys.RESET,
+    ReservedKeyboardKeys.TOGGLE,
+    ReservedKeyboardKeys.SCREEN_STEP,
+    ReservedKeyboardKeys.SCREEN_STEP_NO_INPUT,
+    ReservedKeyboardKeys.IN_EDIT_ID,
+    ReservedKeyboardKeys.DELETE,
+    ReservedKeyboardKeys.CONTEXT,
+    ReservedKeyboardKeys.KEYBOARD_STATE,
+)
+CALLBACK_DATA_KEY_NAMES: tuple[str, ...] = tuple(str(key) for key in CALLBACK_DATA_KEYS)
+CALLBACK_DATA_KEY_INDEXES: dict[str, int] = {
+    key: index for index, key in enumerate(CALLBACK_DATA_KEY_NAMES)
+}
+
+# Value types
+TYPE_NONE = 0
+TYPE_FALSE = 1
+TYPE_TRUE = 2
+TYPE_INT = 3  # Zigzag varint
+TYPE_FLOAT = 4  # 8 bytes double
+TYPE_STR = 5  # Varint length and UTF-8 bytes
+TYPE_LIST = 6  # Varint count and values
+TYPE_DICT = 7  # Varint count, keys and values
+# Non-negative ints up to 255 - TYPE_SMALL_INT, like screens and pages, are the type itself
+TYPE_SMALL_INT = 8
+SMALL_INT_MAX = 255 - TYPE_SMALL_INT
+
+FLOAT_STRUCT = struct.Struct("<d")
+
+
+def encode_callback_data(info: dict) -> str:
+    """
+    Encode the info of a keyboard as compact callback data
+    :param info: The info, with str keys and JSON like values
+    :return: The callback data
+    """
+
+    buffer = bytearray((CALLBACK_DATA_VERSION,))
+    for key, value in info.items():
+        write_key(buffer, key)
+        write_value(buffer, value)
+
+    return base64.urlsafe_b64encode(buffer).rstrip(b"=").decode()
+
+
+def decode_callback_data(callback_data: str) -> dict:
+    """
+    Decode the info of a keyboard from callback data, compact or JSON as it was sent before
+    :param callback_data: The callback data
+    :return: The info
+    """
+
+    if callback_data.startswith("{"):
+        return json.loads(callback_data)
+
+    try:
+        data = base64.urlsafe_b64decode(callback_data + "=" * (-len(callback_data) % 4))
+    except ValueError as e:
+        raise ValueError(f"Invalid callback data: {callback_data}") from e
+
+    if len(data) == 0 or data[0] != CALLBACK_DATA_VERSION:
+        raise ValueError(f"Unknown callback data version: {callback_data}")
+
+    info = {}
+    position = 1
+    try:
+        while position < len(data):
+            key, position = read_key(data, position)
+            info[key], position = read_value(data, position)
+    except IndexError as e:
+        raise ValueError(f"Truncated callback data: {callback_data}") from e
+
+    return info
+
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    """
+    Write a non-negative int, 7 bits per byte
+    :param buffer: The buffer
+    :param value: The value
+    :return: None
+    """
+
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    buffer.append(value)
+
+
+def read_varint(data: bytes, position: int) -> tuple[int, int]:
+    """
+    Read a non-negative int
+    :param data: The data
+    :param position: The position of the int
+    :return: The int and the position after it
+    """
+
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+
+        shift += 7
+
+
+def write_key(buffer: bytearray, key: str) -> None:
+    """
+    Write a key, as its index if known else as its length after the known keys and its text
+    :param buffer: The buffer
+    :param key: The key
+    :return: None
+    """
+
+    index = CALLBACK_DATA_KEY_INDEXES.get(key)
+    if index is not None:
+        buffer.append(index)
+        return
+
+    key_bytes = str(key).encode()
+    write_varint(buffer, len(CALLBACK_DATA_KEY_NAMES) + len(key_bytes))
+    buffer += key_bytes
+
+
+def read_key(data: bytes, position: int) -> tuple[str, int]:
+    """
+    Read a key
+    :param data: The data
+    :param position: The position of the key
+    :return: The key and the position after it
+    """
+
+    index = data[position]
+    if index < len(CALLBACK_DATA_KEY_NAMES):
+        return CALLBACK_DATA_KEY_NAMES[index], position + 1
+
+    index, position = read_varint(data, position)
+    end = position + index - len(CALLBACK_DATA_KEY_NAMES)
+    return data[position:end].decode(), end
+
+
+def write_value(buffer: bytearray, value) -> None:
+    """
+    Write a value with its type
+    :param buffer: The buffer
+    :param value: The value
+    :return: None
+    """
+
+    if value is None:
+        buffer.append(TYPE_NONE)
+    elif isinstance(value, bool):
+        buffer.append(TYPE_TRUE if value else TYPE_FALSE)
+    elif isinstance(value, int):
+        if 0 <= value <= SMALL_INT_MAX:
+            buffer.append(TYPE_SMALL_INT + value)
+        else:
+            buffer.append(TYPE_INT)
+            write_varint(buffer, value * 2 if value >= 0 else -value * 2 - 1)
+    elif isinstance(value, float):
+        buffer.append(TYPE_FLOAT)
+        buffer += FLOAT_STRUCT.pack(value)
+    elif isinstance(value, str):
+        value_bytes = value.encode()
+        buffer.append(TYPE_STR)
+        write_varint(buffer, len(value_bytes))
+        buffer += value_bytes
+    elif isinstance(value, (list, tuple)):
+        buffer.append(TYPE_LIST)
+        write_varint(buffer, len(value))
+        for item in value:
+            write_value(buffer, item)
+    elif isinstance(value, dict):
+        buffer.append(TYPE_DICT)
+        write_varint(buffer, len(value))
+        for key, item in value.items():
+            write_key(buffer, key)
+            write_value(buffer, item)
+    else:
+        raise TypeError(f"Value of type {value.__class__.__name__} can't be in callback data")
+
+
+def read_value(data: bytes, position: int) -> tuple[any, int]:
+    """
+    Read a value
+    :param data: The data
+    :param position: The position of the value type
+    :return: The value and the position after it
+    """
+
+    value_type = data[position]
+    position += 1
+
+    if value_type >= TYPE_SMALL_INT:
+        return value_type - TYPE_SMALL_INT, position
+
+    if value_type == TYPE_NONE:
+        return None, position
+
+    if value_type == TYPE_FALSE:
+        return False, position
+
+    if value_type == TYPE_TRUE:
+        return True, position
+
+    if value_type == TYPE_INT:
+        value, position = read_varint(data, position)
+        return (value >> 1 if value & 1 == 0 else -(value >> 1) - 1), position
+
+    if value_type == TYPE_FLOAT:
+        return FLOAT_STRUCT.unpack_from(data, position)[0], position + FLOAT_STRUCT.size
+
+    if value_type == TYPE_STR:
+        length, position = read_varint(data, position)
+        return data[position : position + length].decode(), position + length
+
+    if value_type == TYPE_LIST:
+        count, position = read_varint(data, position)
+        items = []
+        for _ in range(count):
+            item, position = read_value(data, position)
+            items.append(item)
+        return items, position
+
+    if value_type == TYPE_DICT:
+        count, position = read_varint(data, position)
+        items = {}
+        for _ in range(count):
+            key, position = read_key(data, position)
+            items[key], position = read_value(data, position)
+        return items, position
+
+    raise ValueError(f"Unknown callback data value type: {value_type}")
@@ -1,8 +1,9 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from telegram.ext import CallbackContext, ContextTypes
+from telegram.ext import Application, CallbackContext, ContextTypes
 
+import resources.Environment as Env
 from resources import phrases
 from src.model.enums.ContextDataKey import ContextDataKey, ContextDataType
 from src.model.error.CommonChatError import CommonChatException
@@ -204,3 +205,109 @@ def get_random_user_context_inner_query_key(context: CallbackContext) -> str:
 
     logging.error("Could not find a random inner key for the user context data")
     raise CommonChatException("Failed to generate an inner key")
+
+
+def get_context_data_ttl_seconds(key: ContextDataKey) -> int:
+    """
+    Get after how many seconds unchanged context data of a key expires
+    :param key: The key
+    :return: The time to live in seconds
+    """
+
+    match key:
+        case ContextDataKey.KEYBOARD_DATA | ContextDataKey.INLINE_QUERY:
+            # Referenced by buttons and shared items that can be used long after being sent
+            return Env.CONTEXT_DATA_KEYBOARD_TTL_SECONDS.get_int()
+        case _:
+            return Env.CONTEXT_DATA_TTL_SECONDS.get_int()
+
+
+def get_context_data_max_ttl_seconds() -> int:
+    """
+    Get the maximum time to live of any context data
+    :return: The maximum time to live in seconds
+    """
+
+    return max(get_context_data_ttl_seconds(key) for key in ContextDataKey)
+
+
+def get_context_data_last_updated(data: dict) -> datetime:
+    """
+    Get when context data was last updated
+    :param data: The bot or user context data
+    :return: The most recent update date of its entries, now if there are no dated entries
+    """
+
+    dates: list[datetime] = []
+    for entry in data.values():
+        if "last_updated" in entry:
+            dates.append(entry["last_updated"])
+        elif isinstance(entry["value"], dict):
+            dates.extend(
+                inner_entry["last_updated"]
+                for inner_entry in entry["value"].values()
+                if "last_updated" in inner_entry
+            )
+
+    return max(dates) if len(dates) > 0 else datetime.now()
+
+
+def remove_expired_context_data(data: dict) -> None:
+    """
+    Remove the expired entries from the context data
+    :param data: The bot or user context data
+    :return: None
+    """
+
+    now = datetime.now()
+    for key in list(data.keys()):
+        entry = data[key]
+        expire_date = now - timedelta(seconds=get_context_data_ttl_seconds(key))
+
+        if "last_updated" in entry:
+            if entry["last_updated"] < expire_date:
+                data.pop(key)
+            continue
+
+        # Entry with inner keys
+        inner_data: dict = entry["value"]
+        for inner_key in list(inner_data.keys()):
+            if inner_data[inner_key]["last_updated"] < expire_date:
+                inner_data.pop(inner_key)
+
+        if len(inner_data) == 0:
+            data.pop(key)
+
+
+def clean_context_data(application: Application) -> None:
+    """
+    Remove the expired context data, and unload from memory the least recently active users if
+    they are more than CONTEXT_DATA_MAX_USERS
+    :param application: The application
+    :return: None
+    """
+
+    from resources.ContextPersistence import ContextPersistence
+
+    remove_expired_context_data(application.bot_data)
+
+    users_data: list[tuple[int, dict]] = []
+    for user_id, user_data in application.user_data.items():
+        remove_expired_context_data(user_data)
+        if len(user_data) > 0:
+            users_data.append((user_id, user_data))
+
+    persistence = application.persistence
+    if isinstance(persistence, ContextPersistence):
+        persistence.delete_expired()
+
+    excess_count = len(users_data) - Env.CONTEXT_DATA_MAX_USERS.get_int()
+    if excess_count <= 0:
+        return
+
+    users_data.sort(key=lambda item: get_context_data_last_updated(item[1]))
+    for user_id, user_data in users_data[:excess_count]:
+        if isinstance(persistence, ContextPersistence):
+            persistence.unload_user_data(user_id, user_data)
+        else:
+            user_data.clear()
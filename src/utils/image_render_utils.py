@@ -0,0 +1,151 @@
+from functools import cache
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from wantedposter.wantedposter import (
+    WantedPoster,
+    VerticalAlignment,
+    CaptureCondition,
+    Effect,
+    Stamp,
+)
+
+from src.model.enums.AssetPath import AssetPath
+
+# Kept by each process that renders, so assets are decoded only once per process
+
+
+@cache
+def get_game_background() -> Image.Image:
+    """
+    Get the decoded game background, to be copied before drawing on it
+    :return: The background
+    """
+
+    with Image.open(AssetPath.GAME_BACKGROUND) as image:
+        image.load()
+        return image.copy()
+
+
+@cache
+def get_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Get a loaded font
+    :param font_path: The font path
+    :param size: The font size
+    :return: The font
+    """
+
+    return ImageFont.truetype(font_path, size)
+
+
+def render_shambles_grid(
+    grid: list[list[str]], highlighted_coordinates: list[tuple[int, int]], save_path: str
+) -> str:
+    """
+    Render the grid of a Shambles game on the game background
+    :param grid: The grid of letters
+    :param highlighted_coordinates: The coordinates of the letters to highlight
+    :param save_path: Where to save the image
+    :return: The saved image path
+    """
+
+    image = get_game_background().copy()
+    grid_size = len(grid)
+    highlighted_coordinates = set(tuple(coordinate) for coordinate in highlighted_coordinates)
+
+    # Get the box size of the image
+    left, upper, right, lower = image.getbbox()
+    width = right - left
+    height = lower - upper
+
+    # Calculate the width and height of each cell in the grid
+    cell_width = width / grid_size
+    cell_height = height / grid_size
+
+    # Get the font size based on the cell size, 8/10 of the cell width
+    font_size = int(cell_width * 8 / 10)
+    stroke_width = int(font_size / 25)
+
+    font = get_font(AssetPath.FONT_BLOGGER_SANS_BOLD, font_size)
+    draw = ImageDraw.Draw(image)
+
+    # Write the word in the grid on the image, with an outline for each letter
+    for y in range(grid_size):
+        for x in range(grid_size):
+            letter = grid[y][x]
+
+            if letter == " ":
+                continue
+
+            # Calculate the position of the letter on the image, centered in the cell
+            x_pos = x * cell_width + cell_width / 2 - font.getlength(letter) / 2
+            y_pos = y * cell_height + cell_height / 2 - font_size / 2
+
+            fill_color = "white"
+            if (x, y) in highlighted_coordinates:
+                fill_color = "#39FF14"  # Neon green
+
+            draw.text(
+                (x_pos, y_pos),
+                letter,
+                font=font,
+                fill=fill_color,
+                stroke_width=stroke_width,
+                stroke_fill="black",
+            )
+
+    image.save(save_path)
+    return save_path
+
+
+def render_blur_levels(image_path: str, save_paths: dict[int, str]) -> dict[int, str]:
+    """
+    Render the blurred versions of an image for each level, decoding it only once
+    :param image_path: The image path
+    :param save_paths: Where to save the image of each level
+    :return: The saved image path of each level
+    """
+
+    with Image.open(image_path) as image:
+        image = image.convert("RGB")
+
+    for level, save_path in save_paths.items():
+        image.filter(ImageFilter.GaussianBlur((level - 1) * 10)).save(save_path)
+
+    return save_paths
+
+
+def render_bounty_poster(
+    portrait_path: str | None,
+    first_name: str,
+    last_name: str,
+    bounty: int,
+    capture_condition: CaptureCondition,
+    effects: list[Effect],
+    stamp: Stamp | None,
+    save_path: str,
+) -> str:
+    """
+    Render a bounty poster
+    :param portrait_path: The portrait path, None for no portrait
+    :param first_name: The first name
+    :param last_name: The last name
+    :param bounty: The bounty
+    :param capture_condition: The capture condition
+    :param effects: The effects
+    :param stamp: The stamp, None for no stamp
+    :param save_path: Where to save the poster
+    :return: The saved poster path
+    """
+
+    wanted_poster = WantedPoster(
+        portrait=portrait_path, first_name=first_name, last_name=last_name, bounty=bounty
+    )
+
+    return wanted_poster.generate(
+        output_poster_path=save_path,
+        portrait_vertical_align=VerticalAlignment.TOP,
+        capture_condition=capture_condition,
+        effects=effects,
+        stamp=stamp,
+    )
@@ -0,0 +1,76 @@
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestCache:
+    """
+    Facts about users, crews and other entities computed while processing a single update
+    """
+
+    def __init__(self):
+        self.values: dict[tuple, Any] = {}
+        self.is_active = True
+
+
+# Tasks created while processing the update inherit the cache, it's ignored once the update ends
+_request_cache: ContextVar[RequestCache | None] = ContextVar("request_cache", default=None)
+
+
+def start_request_cache() -> RequestCache:
+    """
+    Start the cache of the update processed by the current task
+    :return: The cache
+    """
+
+    request_cache = RequestCache()
+    _request_cache.set(request_cache)
+    return request_cache
+
+
+def end_request_cache(request_cache: RequestCache) -> None:
+    """
+    End the cache of an update, so tasks that outlive it compute the facts again
+    :param request_cache: The cache
+    :return: None
+    """
+
+    request_cache.is_active = False
+    request_cache.values.clear()
+
+
+def get_request_fact(
+    name: str, owner_id: int | None, compute: Callable[[], T], *args: Hashable
+) -> T:
+    """
+    Get a fact about an entity, computing it only the first time it's requested during the
+    update. Outside an update, or for entities not yet saved, it's always computed
+    :param name: The name of the fact
+    :param owner_id: The id of the entity the fact is about
+    :param compute: The function that computes the fact
+    :param args: Other arguments the fact depends on
+    :return: The fact
+    """
+
+    request_cache = _request_cache.get()
+    if request_cache is None or not request_cache.is_active or owner_id is None:
+        return compute()
+
+    key = (name, owner_id, *args)
+    try:
+        return request_cache.values[key]
+    except KeyError:
+        value = request_cache.values[key] = compute()
+        return value
+
+
+def invalidate_request_facts() -> None:
+    """
+    Forget the facts computed during the current update, to be called after changing any of them
+    :return: None
+    """
+
+    request_cache = _request_cache.get()
+    if request_cache is not None:
+        request_cache.values.clear()
@@ -0,0 +1,19 @@
+import os
+import sys
+
+# The environment is loaded at import from the file passed as first argument, which would be the
+# arguments of pytest
+sys.argv = sys.argv[:1]
+
+for name in ("BOT_TOKEN", "BOT_ID", "BOT_USERNAME", "UPDATES_CHAT_ID"):
+    os.environ.setdefault(name, "1")
+for name in ("DB_NAME", "DB_HOST", "DB_USER", "DB_PASSWORD"):
+    os.environ.setdefault(name, "test")
+os.environ.setdefault("DB_PORT", "3306")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import resources.Database as Database  # noqa: E402
+
+# Tests bind their models to their own database, so don't connect to MySQL on import
+Database.Database.get_db = lambda self: self.db
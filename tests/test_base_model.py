@@ -0,0 +1,36 @@
+from peewee import CharField, IntegerField, SqliteDatabase
+
+from src.model.BaseModel import BaseModel
+
+database = SqliteDatabase(":memory:")
+
+
+class IndexedItem(BaseModel):
+    name: str | CharField = CharField(max_length=10)
+    value: int | IntegerField = IntegerField(index=True)
+
+    class Meta:
+        database = database
+        db_table = "indexed_item"
+
+
+def get_index_names() -> set[str]:
+    return {index.name for index in database.get_indexes(IndexedItem._meta.table_name)}
+
+
+def test_create_missing_indexes_on_table_without_index():
+    database.connect(reuse_if_open=True)
+    database.execute_sql("DROP TABLE IF EXISTS indexed_item")
+    # As created before the index was added
+    database.execute_sql(
+        "CREATE TABLE indexed_item (id INTEGER PRIMARY KEY, date DATETIME, name VARCHAR(10),"
+        " value INTEGER)"
+    )
+    assert "indexeditem_value" not in get_index_names()
+
+    IndexedItem.create_missing_indexes()
+    assert "indexeditem_value" in get_index_names()
+
+    # Nothing to create anymore
+    IndexedItem.create_missing_indexes()
+    assert "indexeditem_value" in get_index_names()